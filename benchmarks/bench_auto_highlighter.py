@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+자동 하이라이트 단락 분류 벤치마크
+- 리포트 페이지에서 추출한 텍스트 블록으로 AutoHighlighter._classify_block과
+  다른 매칭 방식(라인별 루프, 카테고리별 alternation, 전체 lookahead alternation) 비교
+- 기본 코퍼스: tests/fixtures/report_page_blocks.json (추출된 리포트 페이지 블록)
+- --pdf-dir를 주면 해당 폴더의 PDF에서 블록을 추출해서 측정 (예: data/pdf_cache/objects)
+
+실행:
+python benchmarks/bench_auto_highlighter.py [--repeat N] [--pdf-dir DIR]
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.auto_highlighter import AutoHighlighter, CATEGORY_PRIORITY  # noqa: E402
+from src.config import AUTO_HIGHLIGHT_CATEGORIES  # noqa: E402
+
+FIXTURE_PATH = os.path.join(ROOT, 'tests', 'fixtures', 'report_page_blocks.json')
+
+
+def load_fixture_pages() -> list:
+    """저장된 리포트 페이지 블록 로드 (페이지 -> 블록 리스트)"""
+    with open(FIXTURE_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_pdf_pages(pdf_dir: str) -> list:
+    """폴더의 PDF에서 페이지별 텍스트 블록 추출 (PDFHandler와 같은 추출 방식)"""
+    import fitz
+    from src.text_cache import PageText
+
+    pages = []
+    for path in sorted(glob.glob(os.path.join(pdf_dir, '**', '*'), recursive=True)):
+        if not os.path.isfile(path):
+            continue
+        try:
+            doc = fitz.open(path)
+        except Exception:
+            continue  # PDF가 아닌 파일
+        with doc:
+            for page in doc:
+                raw = page.get_text("rawdict", flags=fitz.TEXTFLAGS_TEXT)
+                pages.append(PageText.from_rawdict(raw).blocks)
+    return pages
+
+
+def split_blocks(pages: list) -> list:
+    """analyze_with_rules와 같은 방식으로 블록을 라인 리스트로 변환"""
+    blocks = []
+    for page in pages:
+        for block in page:
+            lines = [l.strip() for l in block.split('\n') if l.strip()]
+            if lines:
+                blocks.append(lines)
+    return blocks
+
+
+def make_line_loop():
+    """이전 구현: 카테고리 -> 라인 -> 패턴 순서로 매번 검색"""
+    compiled = {cat: [re.compile(p, re.IGNORECASE) for p in patterns]
+                for cat, patterns in AUTO_HIGHLIGHT_CATEGORIES.items()}
+
+    def classify(lines):
+        for category in CATEGORY_PRIORITY:
+            for line in lines:
+                for pattern in compiled[category]:
+                    if pattern.search(line):
+                        return category
+        return None
+    return classify
+
+
+def make_category_alternation():
+    """카테고리마다 패턴을 하나의 alternation으로 합쳐 단락을 한 번씩 검색"""
+    combined = [(cat, re.compile('|'.join(f'(?:{p})' for p in AUTO_HIGHLIGHT_CATEGORIES[cat]),
+                                 re.IGNORECASE))
+                for cat in CATEGORY_PRIORITY]
+
+    def classify(lines):
+        text = '\x00'.join(lines)  # 어떤 패턴도 소비하지 않는 구분자
+        for category, pattern in combined:
+            if pattern.search(text):
+                return category
+        return None
+    return classify
+
+
+def make_single_lookahead():
+    """전체 패턴을 명명 그룹 lookahead 하나로 합쳐 단락을 한 번만 스캔"""
+    groups = '|'.join(
+        f"(?P<{cat}>{'|'.join(f'(?:{p})' for p in AUTO_HIGHLIGHT_CATEGORIES[cat])})"
+        for cat in CATEGORY_PRIORITY
+    )
+    combined = re.compile(f'(?={groups})', re.IGNORECASE)
+    rank = {cat: i for i, cat in enumerate(CATEGORY_PRIORITY)}
+
+    def classify(lines):
+        best = None
+        for match in combined.finditer('\x00'.join(lines)):
+            category = match.lastgroup
+            if rank[category] == 0:
+                return category
+            if best is None or rank[category] < rank[best]:
+                best = category
+        return best
+    return classify
+
+
+def bench(classify, blocks: list, pages: int, repeat: int) -> float:
+    """페이지당 평균 분류 시간 (ms)"""
+    def run():
+        for lines in blocks:
+            classify(lines)
+
+    best = min(timeit.repeat(run, number=repeat, repeat=3))
+    return best / (repeat * pages) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=200, help='측정당 반복 횟수')
+    parser.add_argument('--pdf-dir', help='블록을 추출할 PDF 폴더 (없으면 fixture 사용)')
+    args = parser.parse_args()
+
+    pages = load_pdf_pages(args.pdf_dir) if args.pdf_dir else load_fixture_pages()
+    blocks = split_blocks(pages)
+    if not blocks:
+        sys.exit("측정할 텍스트 블록이 없습니다")
+
+    current = AutoHighlighter()._classify_block
+    candidates = [
+        ('라인별 루프 (이전)', make_line_loop()),
+        ('카테고리별 alternation', make_category_alternation()),
+        ('단일 lookahead', make_single_lookahead()),
+        ('단락 단위 스캔 (현재)', current),
+    ]
+
+    # 모든 방식의 분류 결과가 같은지 먼저 확인
+    expected = [candidates[0][1](lines) for lines in blocks]
+    for name, classify in candidates[1:]:
+        if [classify(lines) for lines in blocks] != expected:
+            sys.exit(f"분류 결과 불일치: {name}")
+
+    matched = sum(1 for category in expected if category)
+    print(f"코퍼스: {len(pages)}페이지, {len(blocks)}블록 ({matched}블록 분류됨)")
+
+    baseline = None
+    for name, classify in candidates:
+        ms = bench(classify, blocks, len(pages), args.repeat)
+        baseline = baseline or ms
+        print(f"{name:<22}: {ms:8.4f} ms/페이지 ({baseline / ms:4.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+자동 하이라이트 일괄 분석 벤치마크
+- batch_analyze를 프로세스 수(1, 2, 4, ... CPU 수)별로 실행해 처리 시간과 배율 비교
+- 작업 프로세스에서 돌려받는 결과 크기 비교 (PackedHighlights vs HighlightSpan 객체 리스트)
+- 기본 코퍼스: tests/fixtures/report_page_blocks.json 블록으로 만든 리포트 PDF N개
+- --pdf-dir를 주면 해당 폴더의 PDF로 측정 (예: data/pdf_cache/objects)
+
+실행:
+python benchmarks/bench_highlight_batch.py [--reports N] [--max-workers N] [--pdf-dir DIR]
+"""
+
+import argparse
+import glob
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import fitz  # noqa: E402
+
+from src.highlight_jobs import (  # noqa: E402
+    PackedHighlights, analyze_document_pages, batch_analyze
+)
+
+FIXTURE_PATH = os.path.join(ROOT, 'tests', 'fixtures', 'report_page_blocks.json')
+
+
+def write_fixture_reports(out_dir: str, count: int) -> list:
+    """fixture 블록으로 리포트 PDF 생성 (리포트마다 fixture 전체 페이지)"""
+    with open(FIXTURE_PATH, encoding='utf-8') as f:
+        pages = json.load(f)
+
+    doc = fitz.open()
+    for blocks in pages:
+        page = doc.new_page(width=595, height=842)
+        y = 50
+        for block in blocks:
+            lines = [l for l in block.split('\n') if l.strip()]
+            page.insert_text((40, y), '\n'.join(lines), fontname='korea', fontsize=9)
+            y += 14 * len(lines) + 10
+    data = doc.tobytes()
+    doc.close()
+
+    paths = []
+    for i in range(count):
+        path = os.path.join(out_dir, f'report_{i:03d}.pdf')
+        with open(path, 'wb') as f:
+            f.write(data)
+        paths.append(path)
+    return paths
+
+
+def find_pdfs(pdf_dir: str) -> list:
+    """폴더의 PDF 파일 경로 (확장자 없는 캐시 객체도 포함)"""
+    paths = []
+    for path in sorted(glob.glob(os.path.join(pdf_dir, '**', '*'), recursive=True)):
+        if os.path.isfile(path):
+            with open(path, 'rb') as f:
+                if f.read(5) == b'%PDF-':
+                    paths.append(path)
+    return paths
+
+
+def worker_counts(max_workers: int) -> list:
+    counts = []
+    n = 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reports', type=int, default=96, help='생성할 리포트 수 (fixture 사용 시)')
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1,
+                        help='측정할 최대 프로세스 수')
+    parser.add_argument('--pdf-dir', help='측정할 PDF 폴더 (없으면 fixture로 생성)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.pdf_dir:
+            paths = find_pdfs(args.pdf_dir)
+        else:
+            paths = write_fixture_reports(tmp, args.reports)
+        if not paths:
+            sys.exit("측정할 PDF가 없습니다")
+
+        # 결과 전달 크기: 객체 리스트 vs 압축 배열
+        sample = analyze_document_pages(paths[0])
+        object_size = len(pickle.dumps(sample))
+        packed_size = len(pickle.dumps(PackedHighlights.from_pages(paths[0], sample)))
+        print(f"코퍼스: PDF {len(paths)}개, CPU {os.cpu_count()}개")
+        print(f"결과 크기 (첫 PDF): 객체 {object_size:,} B → 압축 배열 {packed_size:,} B")
+
+        baseline = None
+        for workers in worker_counts(max(1, args.max_workers)):
+            start = time.perf_counter()
+            results = batch_analyze(paths, max_workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            spans = sum(packed.span_count for packed in results)
+            failed = sum(1 for packed in results if packed.error)
+            print(f"프로세스 {workers:>2}개: {elapsed:7.2f} s ({len(paths) / elapsed:6.1f} PDF/s, "
+                  f"{baseline / elapsed:4.2f}x, 스팬 {spans}개, 실패 {failed}개)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+목록 페이지 파서 벤치마크
+- tests/fixtures/company_list_page*.html 저장 페이지로 BeautifulSoup 경로와 lxml XPath 경로 비교
+
+실행:
+python benchmarks/bench_listing_parser.py [--repeat N]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from src.scraper import NaverReportScraper, lxml_html  # noqa: E402
+
+FIXTURE_PATTERN = os.path.join(ROOT, 'tests', 'fixtures', 'company_list_page*.html')
+
+
+def load_fixtures() -> list:
+    """저장된 목록 페이지 HTML 로드"""
+    pages = []
+    for path in sorted(glob.glob(FIXTURE_PATTERN)):
+        with open(path, encoding='utf-8') as f:
+            pages.append(f.read())
+    return pages
+
+
+def bench(parse, pages: list, repeat: int) -> float:
+    """페이지당 평균 파싱 시간 (ms)"""
+    def run():
+        for html in pages:
+            parse(html)
+
+    best = min(timeit.repeat(run, number=repeat, repeat=3))
+    return best / (repeat * len(pages)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=50, help='측정당 반복 횟수')
+    args = parser.parse_args()
+
+    pages = load_fixtures()
+    if not pages:
+        sys.exit(f"fixture 페이지가 없습니다: {FIXTURE_PATTERN}")
+
+    scraper = NaverReportScraper()
+    rows = sum(len(scraper._parse_listing_page_bs4(html) or []) for html in pages)
+    print(f"fixture: {len(pages)}페이지, {rows}행")
+
+    bs4_ms = bench(scraper._parse_listing_page_bs4, pages, args.repeat)
+    print(f"BeautifulSoup : {bs4_ms:8.3f} ms/페이지")
+
+    if lxml_html is None:
+        print("lxml 미설치 — lxml 경로는 측정하지 않음")
+        return
+
+    lxml_ms = bench(scraper._parse_listing_page_lxml, pages, args.repeat)
+    print(f"lxml XPath    : {lxml_ms:8.3f} ms/페이지")
+    print(f"속도 향상     : {bs4_ms / lxml_ms:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,9 +12,11 @@ pip install requests beautifulsoup4 lxml pymupdf pillow
 
 키보드 단축키:
 - Ctrl+F: PDF 텍스트 검색
+- Ctrl+Shift+F: 전체 리포트 텍스트 검색
 - F3/Shift+F3: 다음/이전 검색 결과
 - Ctrl+Z: 되돌리기
 - Ctrl+S: 캡쳐
+- Ctrl+E: 주석 PDF 내보내기
 - Ctrl+R/F5: 새로고침
 - Left/Right/Space: 페이지 이동
 - Ctrl+/Ctrl-: 줌 인/아웃
@@ -22,6 +24,7 @@ pip install requests beautifulsoup4 lxml pymupdf pillow
 """
 
 import logging
+import multiprocessing
 import sys
 import tkinter as tk
 
@@ -80,4 +83,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # 일괄 내보내기 프로세스 풀이 패키징된 실행 파일에서도 동작하도록
+    multiprocessing.freeze_support()
     main()
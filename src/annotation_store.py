@@ -0,0 +1,138 @@
+"""
+어노테이션 저장소 모듈
+- AnnotationStore: SQLite 기반 어노테이션 저장소 (PDF 내용 해시 기준)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List
+
+from .config import ANNOTATION_DB_PATH
+from .models import Annotation
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS annotations (
+    content_hash TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    ann_id INTEGER NOT NULL,
+    type TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    x1 REAL NOT NULL,
+    y1 REAL NOT NULL,
+    x2 REAL NOT NULL,
+    y2 REAL NOT NULL,
+    color TEXT NOT NULL,
+    alpha INTEGER NOT NULL,
+    width INTEGER NOT NULL,
+    zoom REAL NOT NULL,
+    PRIMARY KEY (content_hash, page, seq)
+) WITHOUT ROWID;
+"""
+
+# 검색 하이라이트는 검색할 때마다 새로 만들어지므로 저장하지 않음
+_TRANSIENT_KINDS = ('search',)
+
+
+class AnnotationStore:
+    """
+    SQLite 기반 어노테이션 저장소
+
+    같은 PDF(내용 해시)를 다시 열면 어노테이션을 복원한다.
+    저장은 문서 단위 전체 교체를 한 트랜잭션으로 처리 (호출자가 변경을 모아 한 번에 저장).
+    """
+
+    def __init__(self, db_path: str = ANNOTATION_DB_PATH) -> None:
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # PDF 로드 스레드(조회)와 UI 스레드(저장)에서 함께 사용 (접근은 _lock으로 직렬화)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+        logger.debug(f"AnnotationStore 초기화됨: {db_path}")
+
+    def load(self, content_hash: str) -> Dict[int, List[Annotation]]:
+        """
+        문서의 어노테이션 조회
+
+        Args:
+            content_hash: PDF 내용 해시
+
+        Returns:
+            페이지 -> 어노테이션 리스트 (추가된 순서)
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT page, ann_id, type, kind, x1, y1, x2, y2, color, alpha, width, zoom
+                FROM annotations WHERE content_hash = ? ORDER BY page, seq
+                """,
+                (content_hash,),
+            ).fetchall()
+
+        annotations: Dict[int, List[Annotation]] = {}
+        for page, ann_id, ann_type, kind, x1, y1, x2, y2, color, alpha, width, zoom in rows:
+            annotations.setdefault(page, []).append(Annotation(
+                type=ann_type, coords=(x1, y1, x2, y2), color=color,
+                alpha=alpha, width=width, zoom=zoom, id=ann_id, kind=kind,
+            ))
+        return annotations
+
+    def save(self, content_hash: str, annotations: Dict[int, Iterable[Annotation]]) -> int:
+        """
+        문서의 어노테이션 전체 저장 (기존 내용 교체, 검색 하이라이트 제외)
+
+        Args:
+            content_hash: PDF 내용 해시
+            annotations: 페이지 -> 어노테이션 (추가된 순서)
+
+        Returns:
+            저장한 어노테이션 수
+        """
+        rows = []
+        for page, page_annotations in annotations.items():
+            seq = 0
+            for ann in page_annotations:
+                if ann.kind in _TRANSIENT_KINDS:
+                    continue
+                rows.append((content_hash, page, seq, ann.id, ann.type, ann.kind,
+                             *ann.coords, ann.color, ann.alpha, ann.width, ann.zoom))
+                seq += 1
+
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM annotations WHERE content_hash = ?", (content_hash,))
+            self._conn.executemany(
+                """
+                INSERT INTO annotations (content_hash, page, seq, ann_id, type, kind,
+                                         x1, y1, x2, y2, color, alpha, width, zoom)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+        logger.debug(f"어노테이션 {len(rows)}개 저장: {content_hash[:12]}")
+        return len(rows)
+
+    def count(self, content_hash: str) -> int:
+        """문서의 저장된 어노테이션 수"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM annotations WHERE content_hash = ?", (content_hash,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        """연결 종료"""
+        try:
+            with self._lock:
+                self._conn.close()
+            logger.debug("AnnotationStore 연결 종료됨")
+        except sqlite3.Error as e:
+            logger.warning(f"AnnotationStore 종료 중 오류: {e}")
@@ -7,7 +7,7 @@
 import logging
 import re
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
+from typing import List, Optional, Sequence, Tuple
 
 from .config import (
     AUTO_HIGHLIGHT_CATEGORIES,
@@ -17,27 +17,37 @@ from .config import (
 
 logger = logging.getLogger(__name__)
 
+Rect = Tuple[float, float, float, float]
+
+# 단락 분류 우선순위 (한 단락에 여러 카테고리가 섞이면 앞쪽 카테고리 하나로 통일)
+CATEGORY_PRIORITY = ('target', 'risk', 'financial', 'growth')
+
 
 @dataclass
 class HighlightSpan:
     """자동 하이라이트 대상 텍스트 스팬"""
     category: str          # 'target' | 'financial' | 'growth' | 'risk'
-    snippet: str           # PDF에서 search_for로 다시 찾을 텍스트
+    snippet: str           # PDF 텍스트 캐시에서 다시 찾을 텍스트
     color: str
     alpha: int = AUTO_HIGHLIGHT_ALPHA
+    bbox: Optional[Rect] = None  # 라인 사각형 (PDF 좌표, 블록 추출 시 알려진 경우 — 검색 없이 배치)
 
 
 class AutoHighlighter:
     """투자자 관점 자동 하이라이트 분석기"""
 
     def __init__(self):
-        # 패턴 컴파일 (성능)
-        self._compiled: Dict[str, List[re.Pattern]] = {
-            cat: [re.compile(p, re.IGNORECASE) for p in patterns]
-            for cat, patterns in AUTO_HIGHLIGHT_CATEGORIES.items()
-        }
-
-    def analyze_with_rules(self, page_blocks_or_text) -> List[HighlightSpan]:
+        # 패턴 컴파일 (성능) — 우선순위 순서로 펼쳐 둠
+        # MULTILINE: 라인을 줄바꿈으로 이어 붙인 단락에서도 ^/$가 라인 경계에 맞도록
+        self._matchers: List[Tuple[str, re.Pattern]] = [
+            (cat, re.compile(p, re.IGNORECASE | re.MULTILINE))
+            for cat in CATEGORY_PRIORITY
+            for p in AUTO_HIGHLIGHT_CATEGORIES.get(cat, ())
+        ]
+
+    def analyze_with_rules(self, page_blocks_or_text,
+                           line_boxes: Optional[Sequence[Sequence[Rect]]] = None
+                           ) -> List[HighlightSpan]:
         """
         단락(block) 단위 분석. 단락 내 어떤 라인이라도 패턴에 매칭되면
         그 단락의 모든 라인을 같은 카테고리 색상으로 하이라이트.
@@ -48,17 +58,22 @@ class AutoHighlighter:
             page_blocks_or_text:
                 - List[str]: PDFHandler.get_page_blocks() 결과 (권장)
                 - str: 페이지 전체 텍스트 (fallback — \n\n 단위로 단락 분할)
+            line_boxes: 블록별 라인 사각형 (PageText.line_boxes, 블록 리스트와 같은 순서).
+                주어지면 스팬에 라인 사각형(bbox)을 담아 검색 없이 배치할 수 있음
 
         Returns:
             HighlightSpan 리스트 (카테고리별 색상 적용됨)
         """
-        # 입력 정규화
+        # 입력 정규화: (블록 텍스트, 라인 사각형 리스트 또는 None)
         if isinstance(page_blocks_or_text, str):
             if not page_blocks_or_text:
                 return []
-            blocks = [b for b in re.split(r'\n\s*\n', page_blocks_or_text) if b.strip()]
+            blocks = [(b, None) for b in re.split(r'\n\s*\n', page_blocks_or_text) if b.strip()]
         else:
-            blocks = [b for b in (page_blocks_or_text or []) if b and b.strip()]
+            page_blocks = list(page_blocks_or_text or [])
+            if line_boxes is None or len(line_boxes) != len(page_blocks):
+                line_boxes = [None] * len(page_blocks)
+            blocks = [(b, boxes) for b, boxes in zip(page_blocks, line_boxes) if b and b.strip()]
 
         if not blocks:
             return []
@@ -66,10 +81,16 @@ class AutoHighlighter:
         spans: List[HighlightSpan] = []
         seen_lines: set = set()
 
-        for block_text in blocks:
-            lines = [l.strip() for l in block_text.split('\n') if l.strip()]
-            if not lines:
+        for block_text, boxes in blocks:
+            # (라인 텍스트, 라인 사각형) — 사각형은 블록 텍스트의 라인 순서와 대응
+            located = []
+            for i, raw_line in enumerate(block_text.split('\n')):
+                line = raw_line.strip()
+                if line:
+                    located.append((line, boxes[i] if boxes is not None and i < len(boxes) else None))
+            if not located:
                 continue
+            lines = [line for line, _ in located]
 
             # 단락 단위로 카테고리 결정 (우선순위 기반)
             category = self._classify_block(lines)
@@ -77,18 +98,21 @@ class AutoHighlighter:
                 continue
 
             # 단락 내 모든 라인을 동일 카테고리 색상으로 하이라이트
-            for line in lines:
-                if line in seen_lines:
+            for line, bbox in located:
+                # 위치를 아는 라인은 위치까지 같아야 중복 (같은 문구가 다른 곳에 있어도 각자 배치)
+                key = (line, bbox) if bbox is not None else line
+                if key in seen_lines:
                     continue
-                # 너무 짧거나 너무 긴 라인은 제외 (search_for 적중률 + 노이즈)
+                # 너무 짧거나 너무 긴 라인은 제외 (검색 적중률 + 노이즈)
                 if len(line) < 4 or len(line) > 200:
                     continue
-                seen_lines.add(line)
+                seen_lines.add(key)
                 spans.append(HighlightSpan(
                     category=category,
                     snippet=line,
                     color=AUTO_HIGHLIGHT_CATEGORY_COLORS[category],
                     alpha=AUTO_HIGHLIGHT_ALPHA,
+                    bbox=tuple(bbox) if bbox is not None else None,
                 ))
 
         logger.info(f"룰 기반 분석 완료: {len(blocks)}개 단락 → {len(spans)}개 스팬 발견")
@@ -102,13 +126,21 @@ class AutoHighlighter:
         단락의 라인들을 종합해서 카테고리 결정.
         우선순위 순으로 검사 — 한 단락에 여러 카테고리가 섞여 있어도
         가장 중요한 카테고리 하나로 통일하여 색상 일관성 유지.
+
+        라인마다 패턴을 돌리지 않고 단락 전체를 패턴당 한 번만 스캔한다.
+        (리터럴로 시작하는 패턴은 re의 접두 리터럴 탐색을 그대로 쓰므로
+        하나의 alternation으로 합치는 것보다 빠름 — benchmarks/bench_auto_highlighter.py)
         """
-        priority_order = ['target', 'risk', 'financial', 'growth']
-        for category in priority_order:
-            for line in lines:
-                for pattern in self._compiled[category]:
-                    if pattern.search(line):
-                        return category
+        text = '\n'.join(lines)
+        for category, pattern in self._matchers:
+            match = pattern.search(text)
+            if match is None:
+                continue
+            if '\n' not in match.group():
+                return category
+            # \s 등으로 라인 경계를 넘어 매칭된 경우만 라인별로 다시 확인
+            if any(pattern.search(line) for line in lines):
+                return category
         return None
 
     def _classify_line(self, line: str) -> Optional[str]:
@@ -3,6 +3,8 @@
 - 색상 팔레트, URL 상수, PDF 렌더링 설정 등
 """
 
+import os
+
 # 색상 팔레트 (다크 테마)
 COLORS = {
     'bg_dark': '#0d1117',
@@ -38,6 +40,15 @@ PDF_RENDER_SCALE = 1.5  # 150% 스케일
 ZOOM_MIN = 0.5
 ZOOM_MAX = 2.0
 ZOOM_STEP = 0.25
+PRERENDER_RADIUS = 2  # 페이지 이동 후 백그라운드로 미리 렌더링할 앞뒤 페이지 수
+TILE_SIZE = 512  # 타일 렌더링 시 타일 한 변 크기 (픽셀)
+TILED_RENDER_MIN_ZOOM = 1.5  # 이 줌 이상에서는 전체 페이지 대신 보이는 타일만 렌더링
+ANNOTATION_GRID_CELL_SIZE = 64  # 어노테이션 공간 인덱스 격자 칸 크기 (줌 1.0 픽셀)
+
+# 렌더링 페이지 캐시 (150% A4 RGB 한 장 ≈ 4MB)
+PAGE_CACHE_MAX_BYTES = 64 * 1024 * 1024  # 원본 이미지 계층
+PAGE_CACHE_COMPRESSED_MAX_BYTES = 32 * 1024 * 1024  # 밀려난 페이지 압축 보관 계층
+PAGE_CACHE_COMPRESS_FORMAT = 'PNG'  # 'PNG'(무손실) | 'JPEG' | None(압축 보관 안 함)
 
 # 어노테이션 설정
 HIGHLIGHT_COLORS = ['#FFFF00', '#00FF00', '#FF69B4', '#00FFFF', '#FFA500']
@@ -101,6 +112,13 @@ AUTO_HIGHLIGHT_CATEGORIES = {
     ],
 }
 
+# 문서 전체 자동 하이라이트 (페이지 묶음을 작업 프로세스에서 병렬 분석)
+AUTO_HIGHLIGHT_MAX_WORKERS = 2  # 분석 프로세스 수
+AUTO_HIGHLIGHT_PAGES_PER_TASK = 4  # 작업 하나가 분석할 페이지 수 (작업이 끝날 때마다 결과 표시)
+
+# 여러 리포트 자동 하이라이트 일괄 분석 (파일 하나씩 작업 프로세스에 분배)
+AUTO_HIGHLIGHT_BATCH_MAX_WORKERS = os.cpu_count() or 1  # 분석 프로세스 수
+
 # 창 설정
 WINDOW_TITLE = "JS 네이버 증권 종목 리포트 뷰어"
 WINDOW_GEOMETRY = "1650x1000"
@@ -110,13 +128,60 @@ WINDOW_MIN_SIZE = (1400, 800)
 MAX_PAGES_TO_FETCH = 5
 REQUEST_TIMEOUT = 10
 PDF_DOWNLOAD_TIMEOUT = 30
+PDF_DOWNLOAD_CHUNK_SIZE = 64 * 1024  # PDF 스트리밍 다운로드 청크 크기
+FETCH_MAX_WORKERS = 3  # 목록 페이지 동시 요청 수 (1이면 순차 수집)
+MAX_CONSECUTIVE_ERRORS = 3  # 연속 오류 허용 한계 (도달 시 수집 중단)
+META_FETCH_MAX_WORKERS = 4  # 상세 페이지(투자의견/목표가) 동시 요청 수
+META_FETCH_RATE_LIMIT = 5.0  # 상세 페이지 초당 최대 요청 수
 
 # BeautifulSoup 파서 선택
+# 목록 페이지는 lxml이 있으면 bs4 트리 없이 lxml XPath로 직접 파싱 ('lxml' | 'bs4')
 try:
     import lxml
     PARSER = 'lxml'
+    LISTING_PARSER = 'lxml'
 except ImportError:
     PARSER = 'html.parser'
+    LISTING_PARSER = 'bs4'
+
+# 로컬 데이터 저장 경로 (프로젝트 루트의 data/)
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+REPORT_DB_PATH = os.path.join(DATA_DIR, 'reports.db')
+ANNOTATION_DB_PATH = os.path.join(DATA_DIR, 'annotations.db')
+ANNOTATION_SAVE_DELAY_MS = 1000  # 어노테이션 변경을 모아 저장하기까지 대기 시간
+
+# 주석 PDF 내보내기
+EXPORT_DIR = os.path.join(DATA_DIR, 'export')
+EXPORT_MAX_WORKERS = 2  # 일괄 내보내기 프로세스 수
+
+# 전체 리포트 텍스트 검색 색인 (SQLite FTS5 trigram, 없으면 LIKE 검색)
+SEARCH_INDEX_DB_PATH = os.path.join(DATA_DIR, 'search_index.db')
+SEARCH_INDEX_MAX_RESULTS = 200  # 검색 결과 최대 페이지 수
+SEARCH_INDEX_MAX_WORKERS = 1  # 텍스트 추출 프로세스 수
+
+# 자동 하이라이트 결과 캐시 (PDF 내용 해시 + 규칙 버전 기준, 받은 PDF는 미리 분석)
+HIGHLIGHT_CACHE_DB_PATH = os.path.join(DATA_DIR, 'highlight_cache.db')
+HIGHLIGHT_CACHE_MAX_WORKERS = 1  # 미리 분석 프로세스 수
+
+# HTTP 응답 캐시 (ETag/Last-Modified 조건부 요청)
+HTTP_CACHE_DIR = os.path.join(DATA_DIR, 'http_cache')
+HTTP_CACHE_MAX_BYTES = 200 * 1024 * 1024
+# URL 종류별 캐시 유효 시간(초): 처음 매칭되는 규칙 사용, None이면 영구 보관
+HTTP_CACHE_TTL_RULES = [
+    (r'/research/company_read\.naver', None),  # 상세 페이지 - 게시 후 사실상 불변
+    (r'/research/company_list\.naver', 30),    # 목록 페이지 - 짧게 재사용 후 재검증
+]
+HTTP_CACHE_DEFAULT_TTL = 0  # 그 외 URL은 항상 조건부 재검증
+
+# PDF 디스크 캐시 (내용 해시 기준, LRU 삭제)
+PDF_CACHE_DIR = os.path.join(DATA_DIR, 'pdf_cache')
+PDF_CACHE_MAX_BYTES = 500 * 1024 * 1024
+PDF_CACHE_STALE_PART_AGE = 60 * 60  # 시작 시 이보다 오래된 임시 다운로드 파일(*.part) 삭제 (초)
+
+# PDF 미리 받기 (선택한 리포트 다음 N개)
+PREFETCH_AHEAD = 3  # 목록 순서상 미리 받을 리포트 수
+PREFETCH_MAX_WORKERS = 1  # 사용자 요청보다 낮은 우선순위로 한 번에 하나씩
+PREFETCH_BYTE_BUDGET = 50 * 1024 * 1024  # 선택 한 번당 미리 받을 최대 바이트
 
 # PDF 다운로드 허용 도메인 목록
 ALLOWED_PDF_DOMAINS = [
@@ -0,0 +1,278 @@
+"""
+자동 하이라이트 캐시 모듈
+- ruleset_version: 자동 하이라이트 규칙(패턴/우선순위/색상) 해시
+- HighlightCache: SQLite 기반 페이지별 분석 결과 캐시 (PDF 내용 해시 + 규칙 버전 기준)
+- HighlightCacheWarmer: 받은 PDF를 백그라운드에서 미리 분석해 캐시 채우기
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from .auto_highlighter import CATEGORY_PRIORITY, HighlightSpan
+from .config import (
+    AUTO_HIGHLIGHT_ALPHA,
+    AUTO_HIGHLIGHT_CATEGORIES,
+    AUTO_HIGHLIGHT_CATEGORY_COLORS,
+    HIGHLIGHT_CACHE_DB_PATH,
+    HIGHLIGHT_CACHE_MAX_WORKERS,
+)
+from .highlight_jobs import PageHighlights, ResolvedSpan, analyze_document_pages
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_highlights (
+    content_hash TEXT NOT NULL,
+    ruleset TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    spans TEXT NOT NULL,
+    PRIMARY KEY (content_hash, ruleset, page)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS documents (
+    content_hash TEXT NOT NULL,
+    ruleset TEXT NOT NULL,
+    pages INTEGER NOT NULL,
+    PRIMARY KEY (content_hash, ruleset)
+) WITHOUT ROWID;
+"""
+
+
+def ruleset_version() -> str:
+    """
+    자동 하이라이트 규칙 버전 (패턴, 우선순위, 색상, 투명도 해시)
+
+    규칙을 바꾸면 버전이 바뀌어 이전 규칙으로 계산한 캐시는 쓰지 않는다.
+    """
+    rules = {
+        'categories': AUTO_HIGHLIGHT_CATEGORIES,
+        'priority': list(CATEGORY_PRIORITY),
+        'colors': AUTO_HIGHLIGHT_CATEGORY_COLORS,
+        'alpha': AUTO_HIGHLIGHT_ALPHA,
+    }
+    encoded = json.dumps(rules, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def _encode(resolved: List[ResolvedSpan]) -> str:
+    return json.dumps([[span.category, span.snippet, span.color, span.alpha,
+                        list(span.bbox) if span.bbox is not None else None,
+                        [list(rect) for rect in rects]]
+                       for span, rects in resolved], ensure_ascii=False)
+
+
+def _decode(data: str) -> List[ResolvedSpan]:
+    resolved: List[ResolvedSpan] = []
+    for category, snippet, color, alpha, bbox, rects in json.loads(data):
+        span = HighlightSpan(category=category, snippet=snippet, color=color, alpha=alpha,
+                             bbox=tuple(bbox) if bbox is not None else None)
+        resolved.append((span, [tuple(rect) for rect in rects]))
+    return resolved
+
+
+class HighlightCache:
+    """
+    자동 하이라이트 결과 캐시
+
+    (PDF 내용 해시, 규칙 버전, 페이지)마다 좌표를 찾은 스팬을 저장한다.
+    같은 페이지를 다시 분석할 때 텍스트 추출/분류/좌표 계산 없이 바로 적용할 수 있다.
+    다른 규칙 버전으로 저장된 결과는 열 때 삭제.
+    """
+
+    def __init__(self, db_path: str = HIGHLIGHT_CACHE_DB_PATH,
+                 ruleset: Optional[str] = None) -> None:
+        """
+        Args:
+            db_path: SQLite 파일 경로 (':memory:' 가능)
+            ruleset: 규칙 버전 (None이면 현재 설정의 ruleset_version())
+        """
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.db_path = db_path
+        self.ruleset = ruleset or ruleset_version()
+        self._lock = threading.Lock()
+        # UI 스레드(조회/저장), 분석 작업 콜백, 미리 분석 스레드에서 함께 사용 (_lock으로 직렬화)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute("DELETE FROM page_highlights WHERE ruleset != ?", (self.ruleset,))
+            self._conn.execute("DELETE FROM documents WHERE ruleset != ?", (self.ruleset,))
+
+        logger.debug(f"HighlightCache 초기화됨: {db_path} (규칙 {self.ruleset})")
+
+    def get(self, content_hash: str, page: int) -> Optional[List[ResolvedSpan]]:
+        """
+        페이지 분석 결과 조회
+
+        Returns:
+            좌표를 찾은 스팬 리스트 (분석했지만 스팬이 없으면 빈 리스트), 캐시에 없으면 None
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT spans FROM page_highlights WHERE content_hash = ? AND ruleset = ? AND page = ?",
+                (content_hash, self.ruleset, page),
+            ).fetchone()
+        return _decode(row[0]) if row is not None else None
+
+    def get_document(self, content_hash: str) -> Dict[int, List[ResolvedSpan]]:
+        """문서의 캐시된 페이지 결과 전체 (페이지 -> 좌표를 찾은 스팬 리스트)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT page, spans FROM page_highlights WHERE content_hash = ? AND ruleset = ?",
+                (content_hash, self.ruleset),
+            ).fetchall()
+        return {page: _decode(data) for page, data in rows}
+
+    def cached_pages(self, content_hash: str) -> Set[int]:
+        """캐시된 페이지 번호"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT page FROM page_highlights WHERE content_hash = ? AND ruleset = ?",
+                (content_hash, self.ruleset),
+            ).fetchall()
+        return {page for (page,) in rows}
+
+    def put(self, content_hash: str, page: int, resolved: List[ResolvedSpan]) -> None:
+        """페이지 분석 결과 저장 (기존 결과 교체)"""
+        self.put_pages(content_hash, [(page, resolved)])
+
+    def put_pages(self, content_hash: str, pages: Iterable[PageHighlights],
+                  page_count: Optional[int] = None) -> None:
+        """
+        여러 페이지 분석 결과를 한 트랜잭션으로 저장
+
+        Args:
+            content_hash: PDF 내용 해시
+            pages: (페이지 번호, 좌표를 찾은 스팬 리스트)
+            page_count: 문서 전체를 분석했으면 전체 페이지 수 (is_complete 판정용)
+        """
+        rows = [(content_hash, self.ruleset, page, _encode(resolved)) for page, resolved in pages]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO page_highlights (content_hash, ruleset, page, spans) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            if page_count is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO documents (content_hash, ruleset, pages) VALUES (?, ?, ?)",
+                    (content_hash, self.ruleset, page_count),
+                )
+
+    def is_complete(self, content_hash: str) -> bool:
+        """문서 전체 페이지가 캐시되어 있는지 (미리 분석 완료 여부)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT pages FROM documents WHERE content_hash = ? AND ruleset = ?",
+                (content_hash, self.ruleset),
+            ).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        """연결 종료"""
+        try:
+            with self._lock:
+                self._conn.close()
+            logger.debug("HighlightCache 연결 종료됨")
+        except sqlite3.Error as e:
+            logger.warning(f"HighlightCache 종료 중 오류: {e}")
+
+
+class HighlightCacheWarmer:
+    """
+    자동 하이라이트 캐시 미리 채우기
+
+    미리 받기/다운로드가 끝난 PDF를 분석 스레드 하나가 순서대로 처리한다.
+    분석은 작업 프로세스에서 PDF를 따로 열어 실행하고 (UI의 PyMuPDF 문서와 분리)
+    결과만 받아 캐시에 저장한다. 이미 전체가 캐시된 문서는 건너뛴다.
+    """
+
+    def __init__(self, cache: HighlightCache,
+                 max_workers: int = HIGHLIGHT_CACHE_MAX_WORKERS) -> None:
+        """
+        Args:
+            cache: 채울 캐시
+            max_workers: 분석 프로세스 수
+        """
+        self._cache = cache
+        self._max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='highlight-warm')
+        self._pool: Optional[ProcessPoolExecutor] = None  # 첫 요청 때 생성
+
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._futures: List[Future] = []
+        self._closed = False
+
+        logger.debug("HighlightCacheWarmer 초기화됨")
+
+    def submit(self, content_hash: str, source: Union[str, bytes]) -> bool:
+        """
+        미리 분석 예약 (이미 예약된 문서는 무시)
+
+        Args:
+            content_hash: PDF 내용 해시
+            source: PDF 경로 또는 PDF 바이트
+
+        Returns:
+            예약했으면 True
+        """
+        with self._lock:
+            if self._closed or not content_hash or content_hash in self._pending:
+                return False
+            self._pending.add(content_hash)
+            self._futures = [f for f in self._futures if not f.done()]
+            self._futures.append(self._executor.submit(self._run, content_hash, source))
+        return True
+
+    def _run(self, content_hash: str, source: Union[str, bytes]) -> bool:
+        """문서 하나 분석 (분석 스레드)"""
+        try:
+            if self._cache.is_complete(content_hash):
+                return False
+            pages = self._analyze(source)
+            if pages is None:
+                return False
+            self._cache.put_pages(content_hash, pages, page_count=len(pages))
+            logger.info(f"자동 하이라이트 미리 분석 완료: {content_hash[:12]} ({len(pages)}페이지)")
+            return True
+        except Exception as e:
+            logger.warning(f"자동 하이라이트 미리 분석 실패 ({content_hash[:12]}): {e}")
+            return False
+        finally:
+            with self._lock:
+                self._pending.discard(content_hash)
+
+    def _analyze(self, source: Union[str, bytes]) -> Optional[List[PageHighlights]]:
+        """작업 프로세스에서 전체 페이지 분석 (종료 중이면 None)"""
+        with self._lock:
+            if self._closed:
+                return None
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+            future = self._pool.submit(analyze_document_pages, source)
+        return future.result()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """예약된 분석이 끝날 때까지 대기"""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures, timeout=timeout)
+
+    def close(self) -> None:
+        """분석 중단 및 작업 풀 종료"""
+        with self._lock:
+            self._closed = True
+            pool = self._pool
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        logger.debug("HighlightCacheWarmer 종료됨")
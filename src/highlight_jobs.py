@@ -0,0 +1,355 @@
+"""
+문서 전체 자동 하이라이트 모듈
+- analyze_page_text: 페이지 텍스트에 룰 기반 분석을 적용하고 스팬별 사각형 계산
+- analyze_document_pages: PDF를 직접 열어 여러 페이지 분석 (작업 프로세스에서 실행)
+- DocumentHighlighter: 페이지 묶음을 작업 프로세스에 나눠 병렬 분석, 페이지별 결과 전달
+- batch_analyze: 여러 PDF 파일을 작업 프로세스에 한 파일씩 나눠 분석 (압축 배열로 결과 반환)
+"""
+
+import logging
+import threading
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional, Sequence, Tuple, Union
+
+from .auto_highlighter import AutoHighlighter, CATEGORY_PRIORITY, HighlightSpan
+from .config import (
+    AUTO_HIGHLIGHT_ALPHA,
+    AUTO_HIGHLIGHT_BATCH_MAX_WORKERS,
+    AUTO_HIGHLIGHT_CATEGORY_COLORS,
+    AUTO_HIGHLIGHT_MAX_WORKERS,
+    AUTO_HIGHLIGHT_PAGES_PER_TASK,
+)
+from .text_cache import PageText, Rect
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+# 좌표를 찾은 스팬: (스팬, 사각형 리스트 — PDF 포인트)
+ResolvedSpan = Tuple[HighlightSpan, List[Rect]]
+# 페이지 분석 결과: (페이지 번호, 좌표를 찾은 스팬 리스트)
+PageHighlights = Tuple[int, List[ResolvedSpan]]
+
+# 작업 프로세스마다 한 번만 만드는 분석기 (패턴 컴파일 재사용)
+_worker_highlighter: Optional[AutoHighlighter] = None
+
+
+def analyze_page_text(highlighter: AutoHighlighter, page_text: PageText) -> List[ResolvedSpan]:
+    """
+    페이지 텍스트 룰 기반 분석 후 스팬마다 하이라이트 사각형 계산
+
+    블록(단락) 단위로 분석하고, 블록이 없으면 전체 텍스트로 분석 (\\n\\n 단위로 단락 분할).
+    블록 분석 결과는 라인 사각형을 함께 가지므로 검색 없이 바로 배치한다.
+
+    Args:
+        highlighter: 룰 기반 분석기
+        page_text: 페이지 텍스트 (TextCache 항목)
+
+    Returns:
+        사각형을 하나 이상 찾은 스팬만 (스팬 순서 유지)
+    """
+    if page_text.blocks:
+        spans = highlighter.analyze_with_rules(page_text.blocks, page_text.line_boxes)
+    else:
+        spans = highlighter.analyze_with_rules(page_text.text)
+
+    resolved: List[ResolvedSpan] = []
+    for span in spans:
+        rects = [span.bbox] if span.bbox is not None else page_text.search(span.snippet)
+        if rects:
+            resolved.append((span, rects))
+    return resolved
+
+
+def analyze_document_pages(source: Union[str, bytes],
+                           page_numbers: Optional[Sequence[int]] = None) -> List[PageHighlights]:
+    """
+    PDF를 따로 열어 지정한 페이지들 분석 (작업 프로세스에서 실행)
+
+    Args:
+        source: PDF 경로 또는 PDF 바이트
+        page_numbers: 분석할 페이지 번호 (범위 밖은 건너뜀, None이면 전체 페이지)
+
+    Returns:
+        페이지 순서대로 (페이지 번호, 좌표를 찾은 스팬 리스트)
+    """
+    global _worker_highlighter
+    if fitz is None:
+        raise RuntimeError("PDF 지원 라이브러리가 설치되지 않음")
+    if _worker_highlighter is None:
+        _worker_highlighter = AutoHighlighter()
+
+    if isinstance(source, bytes):
+        doc = fitz.open(stream=source, filetype="pdf")
+    else:
+        doc = fitz.open(source)
+    try:
+        if page_numbers is None:
+            page_numbers = range(len(doc))
+        results: List[PageHighlights] = []
+        for page_num in page_numbers:
+            if not 0 <= page_num < len(doc):
+                continue
+            raw = doc[page_num].get_text("rawdict", flags=fitz.TEXTFLAGS_TEXT)
+            page_text = PageText.from_rawdict(raw)
+            results.append((page_num, analyze_page_text(_worker_highlighter, page_text)))
+        return results
+    finally:
+        doc.close()
+
+
+class DocumentHighlighter:
+    """
+    문서 전체 자동 하이라이트 작업자
+
+    페이지를 AUTO_HIGHLIGHT_PAGES_PER_TASK개씩 묶어 작업 프로세스에 나눠 주고, 각 프로세스는
+    PDF를 직접 열어 분석한다 (PyMuPDF 문서는 스레드 간 공유 불가, 정규식 분석은 GIL에 묶임).
+    묶음이 끝날 때마다 on_page(페이지, 결과)를 페이지별로 호출하고 모두 끝나면 on_done()을 호출.
+    콜백은 작업 풀의 스레드에서 호출되므로 UI는 root.after로 넘겨 처리해야 한다.
+    start()를 다시 호출하거나 cancel()하면 이전 작업의 남은 묶음은 취소되고 결과도 버려진다.
+    """
+
+    def __init__(self, max_workers: int = AUTO_HIGHLIGHT_MAX_WORKERS,
+                 pages_per_task: int = AUTO_HIGHLIGHT_PAGES_PER_TASK) -> None:
+        """
+        Args:
+            max_workers: 분석 프로세스 수
+            pages_per_task: 작업 하나가 분석할 페이지 수
+        """
+        self._max_workers = max(1, max_workers)
+        self._pages_per_task = max(1, pages_per_task)
+        self._pool: Optional[ProcessPoolExecutor] = None  # 첫 작업 때 생성
+
+        self._lock = threading.Lock()
+        self._job = 0  # start/cancel마다 증가 (이전 작업 결과 무시)
+        self._futures: List[Future] = []
+        self._remaining = 0
+        self._closed = False
+
+        logger.debug(f"DocumentHighlighter 초기화됨: workers={self._max_workers}")
+
+    def start(self, source: Union[str, bytes], page_count: int,
+              on_page: Callable[[int, List[ResolvedSpan]], None],
+              on_done: Optional[Callable[[], None]] = None,
+              first_page: int = 0, pages: Optional[Sequence[int]] = None) -> Optional[int]:
+        """
+        문서 전체 분석 시작 (진행 중인 작업은 취소)
+
+        Args:
+            source: PDF 경로 또는 PDF 바이트
+            page_count: 전체 페이지 수
+            on_page: 페이지 결과 콜백 (페이지 번호, 좌표를 찾은 스팬 리스트)
+            on_done: 모든 페이지 분석이 끝났을 때 콜백 (취소된 작업은 호출하지 않음)
+            first_page: 먼저 분석할 페이지 (보통 현재 페이지, 이후 순서대로 돌아감)
+            pages: 분석할 페이지만 지정 (None이면 전체, 캐시에 없는 페이지만 분석할 때 사용)
+
+        Returns:
+            작업 번호 (종료된 작업자거나 분석할 페이지가 없으면 None)
+        """
+        if page_count <= 0:
+            return None
+        first_page = min(max(first_page, 0), page_count - 1)
+        order = [(first_page + i) % page_count for i in range(page_count)]
+        if pages is not None:
+            wanted = set(pages)
+            order = [page for page in order if page in wanted]
+            if not order:
+                return None
+        chunks = [order[i:i + self._pages_per_task]
+                  for i in range(0, len(order), self._pages_per_task)]
+
+        with self._lock:
+            if self._closed:
+                return None
+            self._cancel_locked()
+            job = self._job
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+            self._remaining = len(chunks)
+            self._futures = [self._pool.submit(analyze_document_pages, source, chunk)
+                             for chunk in chunks]
+            futures = list(self._futures)
+
+        # 콜백 등록은 락 밖에서 (이미 끝난 작업이면 바로 호출됨)
+        for future in futures:
+            future.add_done_callback(
+                lambda f: self._on_chunk_done(job, f, on_page, on_done))
+        logger.info(f"문서 전체 자동 하이라이트 시작: {len(order)}페이지, {len(chunks)}개 작업")
+        return job
+
+    def _on_chunk_done(self, job: int, future: Future,
+                       on_page: Callable[[int, List[ResolvedSpan]], None],
+                       on_done: Optional[Callable[[], None]]) -> None:
+        """페이지 묶음 완료 (작업 풀 스레드)"""
+        if future.cancelled():
+            return
+        try:
+            results = future.result()
+        except Exception as e:
+            logger.warning(f"자동 하이라이트 작업 실패: {e}")
+            results = []
+
+        with self._lock:
+            if job != self._job:
+                return
+        for page_num, resolved in results:
+            try:
+                on_page(page_num, resolved)
+            except Exception as e:
+                logger.error(f"자동 하이라이트 결과 처리 실패 (페이지 {page_num}): {e}")
+
+        with self._lock:
+            if job != self._job:
+                return
+            self._remaining -= 1
+            finished = self._remaining == 0
+        if finished:
+            logger.info("문서 전체 자동 하이라이트 완료")
+            if on_done:
+                on_done()
+
+    def is_current(self, job: Optional[int]) -> bool:
+        """작업이 취소되지 않은 최신 작업인지"""
+        with self._lock:
+            return job is not None and job == self._job and not self._closed
+
+    @property
+    def running(self) -> bool:
+        """진행 중인 작업이 있는지"""
+        with self._lock:
+            return self._remaining > 0
+
+    def _cancel_locked(self) -> None:
+        self._job += 1
+        self._remaining = 0
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
+
+    def cancel(self) -> None:
+        """진행 중인 작업 취소 (이미 실행 중인 묶음의 결과도 버림)"""
+        with self._lock:
+            self._cancel_locked()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """현재 작업의 묶음이 모두 끝날 때까지 대기"""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures, timeout=timeout)
+
+    def close(self) -> None:
+        """작업 취소 및 작업 풀 종료"""
+        with self._lock:
+            self._cancel_locked()
+            self._closed = True
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        logger.debug("DocumentHighlighter 종료됨")
+
+
+@dataclass
+class PackedHighlights:
+    """
+    PDF 파일 하나의 자동 하이라이트 결과 (작업 프로세스 → 주 프로세스 전달용)
+
+    스팬마다 객체를 만드는 대신 배열 몇 개에 담아 피클 크기와 주 프로세스의
+    역직렬화 비용을 줄인다. 스팬 i의 사각형은 rects[4 * start : 4 * (start + rect_counts[i])]
+    (start는 앞 스팬들의 rect_counts 합).
+    """
+    path: str
+    page_count: int = 0
+    pages: array = field(default_factory=lambda: array('i'))        # 스팬별 페이지 번호
+    categories: bytearray = field(default_factory=bytearray)        # 스팬별 CATEGORY_PRIORITY 인덱스
+    has_bbox: bytearray = field(default_factory=bytearray)          # 스팬별 라인 사각형 보유 여부
+    snippets: List[str] = field(default_factory=list)
+    rect_counts: array = field(default_factory=lambda: array('i'))  # 스팬별 사각형 개수
+    rects: array = field(default_factory=lambda: array('d'))        # x0, y0, x1, y1 반복 (PDF 포인트)
+    error: Optional[str] = None  # 분석 실패 시 메시지
+
+    @classmethod
+    def from_pages(cls, path: str, results: List[PageHighlights]) -> 'PackedHighlights':
+        """analyze_document_pages 결과(전체 페이지)를 배열로 압축"""
+        packed = cls(path, page_count=len(results))
+        for page_num, resolved in results:
+            for span, rects in resolved:
+                packed.pages.append(page_num)
+                packed.categories.append(CATEGORY_PRIORITY.index(span.category))
+                packed.has_bbox.append(span.bbox is not None)
+                packed.snippets.append(span.snippet)
+                packed.rect_counts.append(len(rects))
+                for rect in rects:
+                    packed.rects.extend(rect)
+        return packed
+
+    @property
+    def span_count(self) -> int:
+        return len(self.snippets)
+
+    def unpack(self) -> List[PageHighlights]:
+        """
+        페이지별 결과로 복원 (HighlightCache.put_pages/add_resolved_highlights에 그대로 사용)
+
+        Returns:
+            전체 페이지의 (페이지 번호, 좌표를 찾은 스팬 리스트), 스팬이 없는 페이지는 빈 리스트
+        """
+        by_page: List[List[ResolvedSpan]] = [[] for _ in range(self.page_count)]
+        offset = 0
+        for i, snippet in enumerate(self.snippets):
+            values = self.rects[offset * 4:(offset + self.rect_counts[i]) * 4]
+            offset += self.rect_counts[i]
+            rects = [tuple(values[j:j + 4]) for j in range(0, len(values), 4)]
+            category = CATEGORY_PRIORITY[self.categories[i]]
+            span = HighlightSpan(category=category, snippet=snippet,
+                                 color=AUTO_HIGHLIGHT_CATEGORY_COLORS[category],
+                                 alpha=AUTO_HIGHLIGHT_ALPHA,
+                                 bbox=rects[0] if self.has_bbox[i] else None)
+            by_page[self.pages[i]].append((span, rects))
+        return list(enumerate(by_page))
+
+
+def analyze_pdf_file(path: str) -> PackedHighlights:
+    """
+    PDF 파일 하나의 전체 페이지 분석 (batch_analyze 작업 프로세스에서 실행)
+
+    열 수 없는 파일은 예외 대신 error를 채운 결과를 반환 (배치 전체가 멈추지 않도록).
+    """
+    try:
+        results = analyze_document_pages(path)
+    except Exception as e:
+        return PackedHighlights(path, error=str(e))
+    return PackedHighlights.from_pages(path, results)
+
+
+def batch_analyze(paths: Sequence[str],
+                  max_workers: int = AUTO_HIGHLIGHT_BATCH_MAX_WORKERS) -> List[PackedHighlights]:
+    """
+    여러 PDF 파일 자동 하이라이트 일괄 분석 (아침에 올라온 리포트 미리 계산 등)
+
+    파일 하나를 작업 하나로 삼아 작업 프로세스에 나눠 주므로 (프로세스마다 PDF를 직접 열고
+    분석기도 한 번만 생성) 파일 수가 충분하면 코어 수에 거의 비례해 빨라진다.
+    결과는 압축 배열이라 주 프로세스로 돌려받는 비용이 작다.
+
+    Args:
+        paths: PDF 파일 경로
+        max_workers: 분석 프로세스 수 (1이면 현재 프로세스에서 순서대로 분석)
+
+    Returns:
+        paths 순서대로 파일별 결과 (실패한 파일은 error가 채워짐)
+    """
+    paths = list(paths)
+    workers = min(max(1, max_workers), len(paths))
+    if workers <= 1:
+        results = [analyze_pdf_file(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(analyze_pdf_file, paths))
+    failed = sum(1 for packed in results if packed.error)
+    logger.info(f"자동 하이라이트 일괄 분석: {len(paths)}개 파일 ({workers}개 프로세스, 실패 {failed}개)")
+    return results
@@ -0,0 +1,316 @@
+"""
+HTTP 캐시 모듈
+- HTTPCache: ETag/Last-Modified 기반 디스크 응답 캐시 (URL 종류별 TTL)
+- CachingSession: 캐시를 거치는 requests.Session
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .config import (
+    HTTP_CACHE_DIR, HTTP_CACHE_TTL_RULES, HTTP_CACHE_DEFAULT_TTL,
+    HTTP_CACHE_MAX_BYTES
+)
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 캐시된 응답에 보존할 헤더
+_KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified', 'Date')
+
+# 정리 시 최대 크기의 이 비율까지 줄임 (한도 근처에서 저장할 때마다 정리하지 않도록)
+_PRUNE_TARGET_RATIO = 0.9
+
+
+@dataclass
+class CacheEntry:
+    """디스크에 저장된 응답 하나"""
+    url: str
+    body_path: str
+    stored_at: float
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get('ETag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get('Last-Modified')
+
+    def is_fresh(self, ttl: Optional[float]) -> bool:
+        """TTL 내인지 확인 (ttl이 None이면 영구)"""
+        if ttl is None:
+            return True
+        return time.time() - self.stored_at < ttl
+
+    def to_response(self) -> requests.Response:
+        """캐시된 본문으로 requests.Response 재구성"""
+        with open(self.body_path, 'rb') as f:
+            body = f.read()
+
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.url
+        response._content = body
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.reason = 'OK (cached)'
+        return response
+
+
+class HTTPCache:
+    """
+    ETag/Last-Modified 기반 디스크 HTTP 응답 캐시
+
+    URL마다 <sha256>.json(메타)과 <sha256>.body(본문) 파일로 저장.
+    TTL 안이면 네트워크 없이 응답하고, 지나면 조건부 GET으로 재검증.
+    """
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR,
+                 ttl_rules: Optional[List[Tuple[str, Optional[float]]]] = None,
+                 default_ttl: Optional[float] = HTTP_CACHE_DEFAULT_TTL,
+                 max_bytes: int = HTTP_CACHE_MAX_BYTES) -> None:
+        """
+        Args:
+            cache_dir: 캐시 디렉터리
+            ttl_rules: (URL 정규식, TTL초) 목록. 처음 매칭되는 규칙 사용, TTL None은 영구
+            default_ttl: 매칭 규칙이 없을 때 TTL (0이면 항상 재검증)
+            max_bytes: 캐시 최대 크기 (저장 중 초과하면 오래된 항목부터 삭제)
+        """
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+        rules = HTTP_CACHE_TTL_RULES if ttl_rules is None else ttl_rules
+        self._ttl_rules = [(re.compile(pattern), ttl) for pattern, ttl in rules]
+        self._default_ttl = default_ttl
+        self._max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self.hits = 0          # TTL 내 캐시 응답 (요청 없음)
+        self.revalidated = 0   # 304 Not Modified (본문 전송 없음)
+        self.misses = 0        # 전체 응답 수신
+        self.errors = 0        # 200/304가 아닌 응답 (저장 안 함)
+        self._total_bytes = 0  # 본문 크기 합 추정치 (prune에서 실제 값으로 갱신)
+
+        self.prune()
+        logger.debug(f"HTTPCache 초기화됨: {cache_dir}")
+
+    def ttl_for(self, url: str) -> Optional[float]:
+        """URL 종류별 TTL (None이면 영구)"""
+        for pattern, ttl in self._ttl_rules:
+            if pattern.search(url):
+                return ttl
+        return self._default_ttl
+
+    def _paths(self, url: str) -> Tuple[str, str]:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + '.json', base + '.body'
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """캐시 항목 조회 (없거나 손상되면 None)"""
+        meta_path, body_path = self._paths(url)
+        try:
+            with open(meta_path, encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if meta.get('url') != url or not os.path.exists(body_path):
+            return None
+        return CacheEntry(url=url, body_path=body_path,
+                          stored_at=meta.get('stored_at', 0.0),
+                          headers=meta.get('headers', {}))
+
+    def store(self, url: str, response: requests.Response) -> None:
+        """200 응답 저장 (저장 후 최대 크기를 넘으면 정리)"""
+        meta_path, body_path = self._paths(url)
+        headers = {name: response.headers[name]
+                   for name in _KEPT_HEADERS if name in response.headers}
+        try:
+            self._write_atomic(body_path, response.content)
+            self._write_meta(meta_path, url, headers)
+        except OSError as e:
+            logger.warning(f"HTTP 캐시 저장 실패: {url}, 오류: {e}")
+            return
+
+        # 같은 URL을 덮어쓴 경우도 더하므로 추정치는 실제보다 크거나 같음 — 넘었을 때만 디렉터리 확인
+        with self._lock:
+            self._total_bytes += len(response.content)
+            over = self._total_bytes > self._max_bytes
+        if over:
+            self.prune()
+
+    def discard(self, url: str) -> None:
+        """
+        캐시 항목 삭제
+
+        200이지만 내용이 올바르지 않은 응답(오류/점검 안내 페이지 등)을 호출자가 확인한 뒤
+        지울 때 사용 — 영구 보관 URL이라도 다음 요청은 네트워크로 다시 받는다.
+        """
+        for path in self._paths(url):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"HTTP 캐시 항목 삭제 실패: {path}, 오류: {e}")
+
+    def refresh(self, entry: CacheEntry, response: requests.Response) -> None:
+        """304 응답 후 저장 시각과 검증자 갱신"""
+        headers = dict(entry.headers)
+        for name in ('ETag', 'Last-Modified', 'Date'):
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        entry.headers = headers
+        entry.stored_at = time.time()
+        meta_path, _ = self._paths(entry.url)
+        try:
+            self._write_meta(meta_path, entry.url, headers)
+        except OSError as e:
+            logger.warning(f"HTTP 캐시 갱신 실패: {entry.url}, 오류: {e}")
+
+    def _write_meta(self, meta_path: str, url: str, headers: Dict[str, str]) -> None:
+        meta = {'url': url, 'stored_at': time.time(), 'headers': headers}
+        self._write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        """임시 파일에 쓴 뒤 교체 (동시 요청 스레드가 반쯤 쓴 파일을 읽지 않도록)"""
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def record(self, kind: str) -> None:
+        """카운터 증가 ('hits' | 'revalidated' | 'misses' | 'errors')"""
+        with self._lock:
+            setattr(self, kind, getattr(self, kind) + 1)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """적중/재검증/미스/오류 응답 카운터"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'revalidated': self.revalidated,
+                'misses': self.misses,
+                'errors': self.errors,
+            }
+
+    def prune(self) -> None:
+        """최대 크기를 넘으면 오래된 항목부터 삭제 (최대 크기의 _PRUNE_TARGET_RATIO까지)"""
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+
+        bodies = []
+        total = 0
+        for name in names:
+            if not name.endswith('.body'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            bodies.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        if total <= self._max_bytes:
+            with self._lock:
+                self._total_bytes = total
+            return
+
+        target = self._max_bytes * _PRUNE_TARGET_RATIO
+        removed = 0
+        for _, size, path in sorted(bodies):
+            if total <= target:
+                break
+            for p in (path, path[:-len('.body')] + '.json'):
+                try:
+                    os.remove(p)
+                except OSError:
+                    pass
+            total -= size
+            removed += 1
+        with self._lock:
+            self._total_bytes = total
+        logger.info(f"HTTP 캐시 정리: {removed}개 항목 삭제")
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        for name in os.listdir(self.cache_dir):
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except OSError:
+                pass
+
+
+class CachingSession(requests.Session):
+    """
+    HTTPCache를 거치는 requests.Session.
+    cache가 None이거나 stream/params 요청이면 일반 Session과 동일하게 동작.
+    """
+
+    def __init__(self, cache: Optional[HTTPCache] = None) -> None:
+        super().__init__()
+        self.cache = cache
+
+    def get(self, url, **kwargs):
+        cache = self.cache
+        if cache is None or kwargs.get('stream') or kwargs.get('params'):
+            return super().get(url, **kwargs)
+
+        ttl = cache.ttl_for(url)
+        entry = cache.lookup(url)
+
+        if entry is not None and entry.is_fresh(ttl):
+            try:
+                response = entry.to_response()
+                cache.record('hits')
+                logger.debug(f"HTTP 캐시 적중: {url}")
+                return response
+            except OSError:
+                entry = None
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if entry is not None:
+            if entry.etag:
+                headers['If-None-Match'] = entry.etag
+            if entry.last_modified:
+                headers['If-Modified-Since'] = entry.last_modified
+
+        response = super().get(url, headers=headers, **kwargs)
+
+        if entry is not None and response.status_code == 304:
+            cache.refresh(entry, response)
+            try:
+                cached = entry.to_response()
+                cache.record('revalidated')
+                logger.debug(f"HTTP 캐시 재검증 (304): {url}")
+                return cached
+            except OSError:
+                # 본문이 사라진 경우 조건 없이 다시 요청
+                headers.pop('If-None-Match', None)
+                headers.pop('If-Modified-Since', None)
+                response = super().get(url, headers=headers, **kwargs)
+
+        if response.status_code == 200:
+            cache.record('misses')
+            cache.store(url, response)
+        else:
+            cache.record('errors')
+        return response
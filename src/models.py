@@ -58,20 +58,29 @@ class ReportData:
         )
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Annotation:
-    """어노테이션 정보 데이터 클래스"""
+    """
+    어노테이션 정보 데이터 클래스
+
+    __slots__ 레코드로 메모리를 줄이고, 비교는 객체 동일성 기준 (같은 좌표의 어노테이션도 서로 다름).
+    id는 PDFHandler가 추가할 때 부여하는 문서 내 고유 번호 (0이면 미부여).
+    """
     type: str  # 'highlight', 'line', 'erased'
     coords: Tuple[float, float, float, float]  # (x1, y1, x2, y2)
     color: str = '#FFFF00'
     alpha: int = 77  # 투명도 (0-255)
     width: int = 3  # 라인 굵기
     zoom: float = 1.0  # 생성 시 줌 레벨
+    id: int = 0
+    kind: str = 'user'  # 'user' (직접 그림), 'search' (검색 결과), 'auto' (자동 하이라이트)
 
     def to_dict(self) -> dict:
         """딕셔너리로 변환"""
         return {
+            'id': self.id,
             'type': self.type,
+            'kind': self.kind,
             'coords': self.coords,
             'color': self.color,
             'alpha': self.alpha,
@@ -89,6 +98,8 @@ class Annotation:
             alpha=data.get('alpha', 77),
             width=data.get('width', 3),
             zoom=data.get('zoom', 1.0),
+            id=data.get('id', 0),
+            kind=data.get('kind', 'user'),
         )
 
 
@@ -0,0 +1,217 @@
+"""
+페이지 이미지 캐시 모듈
+- PageImageCache: 바이트 예산 기반 LRU 렌더링 이미지 캐시 (압축 보관 계층 포함)
+"""
+
+import io
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from .config import (
+    PAGE_CACHE_MAX_BYTES, PAGE_CACHE_COMPRESSED_MAX_BYTES,
+    PAGE_CACHE_COMPRESS_FORMAT, PRERENDER_RADIUS
+)
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+def image_nbytes(img: Any) -> int:
+    """PIL 이미지의 메모리 크기 (픽셀 버퍼 기준)"""
+    return img.width * img.height * len(img.getbands())
+
+
+class PageImageCache:
+    """
+    페이지 렌더링 이미지 캐시
+
+    키는 (페이지, 줌 버킷, ...) 튜플. 원본(hot) 계층은 max_bytes까지 PIL 이미지를 보관하고,
+    밀려난 이미지는 compressed_max_bytes까지 PNG/JPEG 바이트로 압축해 보관(cold)한다.
+    교체 대상은 LRU 순서로 고르되, 읽는 방향 앞쪽(현재 페이지부터 radius 이내)의
+    현재 줌 이미지는 가능한 한 남긴다.
+    """
+
+    def __init__(self, max_bytes: int = PAGE_CACHE_MAX_BYTES,
+                 compressed_max_bytes: int = PAGE_CACHE_COMPRESSED_MAX_BYTES,
+                 compress_format: Optional[str] = PAGE_CACHE_COMPRESS_FORMAT,
+                 radius: int = PRERENDER_RADIUS) -> None:
+        """
+        Args:
+            max_bytes: 원본 이미지 계층 최대 바이트
+            compressed_max_bytes: 압축 계층 최대 바이트 (0이면 압축 보관 안 함)
+            compress_format: 'PNG' | 'JPEG' | None (None이면 압축 보관 안 함)
+            radius: 방향 보호 범위 (현재 페이지 앞쪽 페이지 수)
+        """
+        self._max_bytes = max_bytes
+        self._compressed_max_bytes = compressed_max_bytes if compress_format else 0
+        self._compress_format = compress_format
+        self._radius = radius
+
+        self._lock = threading.Lock()
+        self._hot: 'OrderedDict[Hashable, Tuple[Any, int]]' = OrderedDict()
+        self._cold: 'OrderedDict[Hashable, bytes]' = OrderedDict()
+        self._hot_bytes = 0
+        self._cold_bytes = 0
+
+        # 읽는 위치와 방향 (+1: 다음 페이지 쪽, -1: 이전 페이지 쪽)
+        self._position: Optional[Tuple[int, int]] = None
+        self._direction = 1
+
+        self.hits = 0
+        self.compressed_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def set_position(self, page_num: int, zoom_bucket: int) -> None:
+        """현재 보고 있는 페이지/줌 기록 (이동 방향 추정)"""
+        with self._lock:
+            if self._position is not None and page_num != self._position[0]:
+                self._direction = 1 if page_num > self._position[0] else -1
+            self._position = (page_num, zoom_bucket)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        이미지 조회 (압축 계층에 있으면 복원해 원본 계층으로 승격)
+
+        Returns:
+            PIL Image 또는 None
+        """
+        with self._lock:
+            entry = self._hot.get(key)
+            if entry is not None:
+                self._hot.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            data = self._cold.pop(key, None)
+            if data is None:
+                self.misses += 1
+                return None
+            self._cold_bytes -= len(data)
+            self.compressed_hits += 1
+
+        img = Image.open(io.BytesIO(data))
+        img.load()
+        if img.mode != 'RGB':
+            img = img.convert('RGB')
+        self.put(key, img)
+        return img
+
+    def put(self, key: Hashable, img: Any) -> None:
+        """이미지 저장 (예산 초과 시 교체)"""
+        nbytes = image_nbytes(img)
+        with self._lock:
+            old = self._hot.pop(key, None)
+            if old is not None:
+                self._hot_bytes -= old[1]
+            data = self._cold.pop(key, None)
+            if data is not None:
+                self._cold_bytes -= len(data)
+
+            self._hot[key] = (img, nbytes)
+            self._hot_bytes += nbytes
+
+            evicted = []
+            while self._hot_bytes > self._max_bytes and len(self._hot) > 1:
+                victim = self._pick_victim(exclude=key)
+                victim_img, victim_bytes = self._hot.pop(victim)
+                self._hot_bytes -= victim_bytes
+                self.evictions += 1
+                evicted.append((victim, victim_img))
+
+        # 압축은 락 밖에서 (UI 스레드의 조회를 막지 않도록)
+        for victim, victim_img in evicted:
+            self._store_compressed(victim, victim_img)
+
+    def _pick_victim(self, exclude: Hashable) -> Hashable:
+        """교체 대상 선택: LRU 순서 중 방향 보호 대상이 아닌 첫 항목"""
+        fallback = None
+        for key in self._hot:
+            if key == exclude:
+                continue
+            if fallback is None:
+                fallback = key
+            if not self._is_protected(key):
+                return key
+        return fallback
+
+    def _is_protected(self, key: Hashable) -> bool:
+        """현재 줌에서 현재 페이지 또는 읽는 방향 앞쪽 radius 이내인지"""
+        if self._position is None or not isinstance(key, tuple) or len(key) < 2:
+            return False
+        page_num, zoom_bucket = key[0], key[1]
+        current_page, current_zoom = self._position
+        if zoom_bucket != current_zoom:
+            return False
+        ahead = (page_num - current_page) * self._direction
+        return 0 <= ahead <= self._radius
+
+    def _store_compressed(self, key: Hashable, img: Any) -> None:
+        """밀려난 이미지를 압축 계층에 보관"""
+        if self._compressed_max_bytes <= 0:
+            return
+
+        buf = io.BytesIO()
+        try:
+            if self._compress_format == 'JPEG':
+                img.save(buf, format='JPEG', quality=85)
+            else:
+                img.save(buf, format='PNG', compress_level=1)
+        except (OSError, ValueError) as e:
+            logger.debug(f"페이지 이미지 압축 실패: {e}")
+            return
+        data = buf.getvalue()
+
+        with self._lock:
+            if key in self._hot or len(data) > self._compressed_max_bytes:
+                return
+            self._cold[key] = data
+            self._cold_bytes += len(data)
+            while self._cold_bytes > self._compressed_max_bytes:
+                _, dropped = self._cold.popitem(last=False)
+                self._cold_bytes -= len(dropped)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._hot or key in self._cold
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._hot)
+
+    def keys(self):
+        """원본 계층 키 목록 (LRU 순서)"""
+        with self._lock:
+            return list(self._hot.keys())
+
+    def clear(self) -> None:
+        """전체 비우기 (통계는 유지)"""
+        with self._lock:
+            self._hot.clear()
+            self._cold.clear()
+            self._hot_bytes = 0
+            self._cold_bytes = 0
+            self._position = None
+            self._direction = 1
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """적중/미스/교체 카운터와 계층별 사용량"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'compressed_hits': self.compressed_hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hot_bytes': self._hot_bytes,
+                'hot_entries': len(self._hot),
+                'compressed_bytes': self._cold_bytes,
+                'compressed_entries': len(self._cold),
+            }
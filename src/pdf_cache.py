@@ -0,0 +1,270 @@
+"""
+PDF 캐시 모듈
+- PDFCache: 내용 해시(sha256) 기반 디스크 PDF 캐시 (URL 인덱스, LRU 용량 제한)
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Optional
+
+from .config import PDF_CACHE_DIR, PDF_CACHE_MAX_BYTES, PDF_CACHE_STALE_PART_AGE
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS pdf_entries (
+    url TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_pdf_entries_sha256 ON pdf_entries (sha256);
+"""
+
+
+class PDFCache:
+    """
+    내용 주소 기반 디스크 PDF 캐시
+
+    파일은 objects/<sha256>.pdf로 한 번만 저장하고, URL → 해시 매핑은
+    SQLite 인덱스(index.db)에 보관. 같은 PDF가 다른 URL로 올라와도 파일은 공유.
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 파일부터 삭제.
+    """
+
+    def __init__(self, cache_dir: str = PDF_CACHE_DIR,
+                 max_bytes: int = PDF_CACHE_MAX_BYTES,
+                 stale_part_age: float = PDF_CACHE_STALE_PART_AGE) -> None:
+        """
+        Args:
+            cache_dir: 캐시 디렉터리
+            max_bytes: 캐시 최대 크기
+            stale_part_age: 이보다 오래된 임시 다운로드 파일은 시작 시 삭제 (초)
+        """
+        self.cache_dir = cache_dir
+        self._objects_dir = os.path.join(cache_dir, 'objects')
+        os.makedirs(self._objects_dir, exist_ok=True)
+        self._max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # PDF 로드 백그라운드 스레드와 UI 스레드에서 함께 사용 (접근은 _lock으로 직렬화)
+        self._conn = sqlite3.connect(os.path.join(cache_dir, 'index.db'),
+                                     check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+        self._remove_stale_parts(stale_part_age)
+        logger.debug(f"PDFCache 초기화됨: {cache_dir}")
+
+    def _remove_stale_parts(self, max_age: float) -> None:
+        """
+        비정상 종료로 남은 임시 다운로드 파일(*.part) 삭제
+
+        다운로드 중에는 계속 쓰이므로 수정 시각이 max_age보다 오래된 파일만 지운다
+        (다른 인스턴스가 받고 있는 파일은 남김).
+        """
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+
+        cutoff = time.time() - max_age
+        removed = 0
+        for name in names:
+            if not name.endswith('.part'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                pass
+        if removed:
+            logger.info(f"PDF 캐시: 남은 임시 다운로드 파일 {removed}개 삭제")
+
+    def path_for_hash(self, sha256: str) -> str:
+        """내용 해시에 해당하는 파일 경로"""
+        return os.path.join(self._objects_dir, f"{sha256}.pdf")
+
+    def temp_path(self) -> str:
+        """다운로드용 임시 파일 생성 (put_file로 옮길 수 있도록 캐시 디렉터리에 생성)"""
+        fd, path = tempfile.mkstemp(suffix='.part', dir=self.cache_dir)
+        os.close(fd)
+        return path
+
+    def get(self, url: str) -> Optional[str]:
+        """
+        캐시된 PDF 경로 조회 (사용 시각 갱신)
+
+        Args:
+            url: PDF URL
+
+        Returns:
+            파일 경로 (없으면 None)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256 FROM pdf_entries WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            path = self.path_for_hash(row[0])
+            if not os.path.exists(path):
+                # 파일이 외부에서 지워진 경우 인덱스 정리
+                with self._conn:
+                    self._conn.execute("DELETE FROM pdf_entries WHERE sha256 = ?", (row[0],))
+                return None
+
+            with self._conn:
+                self._conn.execute(
+                    "UPDATE pdf_entries SET last_access = ? WHERE url = ?",
+                    (time.time(), url),
+                )
+        return path
+
+    def content_hash(self, url: str) -> Optional[str]:
+        """URL의 캐시된 내용 해시 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256 FROM pdf_entries WHERE url = ?", (url,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, url: str, data: bytes) -> str:
+        """
+        PDF 저장 후 캐시 파일 경로 반환
+
+        Args:
+            url: PDF URL
+            data: PDF 바이트
+
+        Returns:
+            저장된 파일 경로
+        """
+        fd, tmp_path = tempfile.mkstemp(suffix='.part', dir=self.cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        return self.put_file(url, tmp_path, hashlib.sha256(data).hexdigest())
+
+    def put_file(self, url: str, src_path: str, sha256: Optional[str] = None) -> str:
+        """
+        다운로드가 끝난 파일을 캐시로 이동 (src_path는 캐시와 같은 파일시스템이어야 함)
+
+        Args:
+            url: PDF URL
+            src_path: 다운로드된 임시 파일 경로 (이동 또는 삭제됨)
+            sha256: 내용 해시 (None이면 파일에서 계산)
+
+        Returns:
+            캐시 파일 경로
+        """
+        if sha256 is None:
+            hasher = hashlib.sha256()
+            with open(src_path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    hasher.update(chunk)
+            sha256 = hasher.hexdigest()
+
+        path = self.path_for_hash(sha256)
+        if os.path.exists(path):
+            # 같은 내용이 이미 있으면 기존 파일 공유
+            self._remove_file(src_path)
+        else:
+            os.replace(src_path, path)
+        size = os.path.getsize(path)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO pdf_entries (url, sha256, size, last_access)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    sha256 = excluded.sha256,
+                    size = excluded.size,
+                    last_access = excluded.last_access
+                """,
+                (url, sha256, size, time.time()),
+            )
+
+        self._evict(keep=sha256)
+        logger.debug(f"PDF 캐시 저장: {url} → {sha256[:12]} ({size} bytes)")
+        return path
+
+    def discard(self, url: str) -> None:
+        """URL 항목 제거 (손상된 파일 등). 다른 URL이 참조하지 않으면 파일도 삭제"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256 FROM pdf_entries WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return
+            with self._conn:
+                self._conn.execute("DELETE FROM pdf_entries WHERE url = ?", (url,))
+            shared = self._conn.execute(
+                "SELECT 1 FROM pdf_entries WHERE sha256 = ? LIMIT 1", (row[0],)
+            ).fetchone()
+        if not shared:
+            self._remove_file(self.path_for_hash(row[0]))
+
+    def total_bytes(self) -> int:
+        """캐시된 파일 전체 크기 (내용 해시 기준 중복 제외)"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM "
+                "(SELECT MAX(size) AS size FROM pdf_entries GROUP BY sha256)"
+            ).fetchone()
+        return row[0]
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """최대 크기를 넘으면 가장 오래 사용하지 않은 파일부터 삭제"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT sha256, MAX(size), MAX(last_access) FROM pdf_entries "
+                "GROUP BY sha256 ORDER BY MAX(last_access)"
+            ).fetchall()
+
+            total = sum(size for _, size, _ in rows)
+            evicted = []
+            for sha256, size, _ in rows:
+                if total <= self._max_bytes:
+                    break
+                if sha256 == keep:
+                    continue
+                evicted.append(sha256)
+                total -= size
+
+            if evicted:
+                with self._conn:
+                    self._conn.executemany(
+                        "DELETE FROM pdf_entries WHERE sha256 = ?",
+                        [(sha256,) for sha256 in evicted],
+                    )
+
+        for sha256 in evicted:
+            self._remove_file(self.path_for_hash(sha256))
+        if evicted:
+            logger.info(f"PDF 캐시 정리: {len(evicted)}개 파일 삭제")
+
+    @staticmethod
+    def _remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError as e:
+            # 뷰어가 열어둔 파일(Windows) 등 삭제 실패는 무시 (고아 파일로 남음)
+            logger.debug(f"PDF 캐시 파일 삭제 실패: {path}, 오류: {e}")
+
+    def close(self) -> None:
+        """인덱스 연결 종료"""
+        try:
+            with self._lock:
+                self._conn.close()
+            logger.debug("PDFCache 연결 종료됨")
+        except sqlite3.Error as e:
+            logger.warning(f"PDFCache 종료 중 오류: {e}")
@@ -0,0 +1,186 @@
+"""
+PDF 내보내기 모듈
+- add_pdf_annotations: 어노테이션을 PDF 형광펜/잉크 주석으로 변환
+- export_annotated_pdf: 주석을 넣은 PDF를 증분 저장으로 내보내기
+- batch_export: 여러 리포트를 프로세스 풀에서 일괄 내보내기
+"""
+
+import logging
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+from .config import PDF_RENDER_SCALE, EXPORT_MAX_WORKERS
+from .models import Annotation
+from .pdf_handler import parse_hex_color
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+# 검색 하이라이트는 보기용이므로 내보내지 않음
+_EXPORT_SKIP_KINDS = ('search',)
+
+# 일괄 내보내기 작업: (원본 PDF 경로, 저장 경로, 페이지 -> 어노테이션)
+ExportJob = Tuple[str, str, Dict[int, List[Annotation]]]
+# 일괄 내보내기 결과: (저장 경로, 추가한 주석 수 또는 None, 오류 메시지 또는 None)
+ExportResult = Tuple[str, Optional[int], Optional[str]]
+
+
+def _rgb(color: str) -> Tuple[float, float, float]:
+    r, g, b = parse_hex_color(color)
+    return r / 255, g / 255, b / 255
+
+
+def add_pdf_annotations(doc, annotations: Dict[int, Iterable[Annotation]]) -> int:
+    """
+    어노테이션을 문서에 PDF 주석으로 추가
+
+    뷰어 좌표(PDF_RENDER_SCALE * 줌 픽셀)를 PDF 포인트로 되돌린다.
+    형광펜은 Highlight 주석(본문 텍스트는 그대로라 검색 가능), 라인은 Ink 주석.
+
+    Args:
+        doc: fitz.Document
+        annotations: 페이지 -> 어노테이션
+
+    Returns:
+        추가한 주석 수
+    """
+    count = 0
+    for page_num, page_annotations in annotations.items():
+        if not 0 <= page_num < len(doc):
+            continue
+        page = doc[page_num]
+        # 회전된 페이지는 화면 좌표를 원래 페이지 좌표로 변환
+        derotate = page.derotation_matrix
+
+        for ann in page_annotations:
+            if ann.kind in _EXPORT_SKIP_KINDS:
+                continue
+            scale = PDF_RENDER_SCALE * ann.zoom
+            x1, y1, x2, y2 = (v / scale for v in ann.coords)
+            try:
+                if ann.type == 'highlight':
+                    rect = fitz.Rect(x1, y1, x2, y2).normalize() * derotate
+                    annot = page.add_highlight_annot(rect)
+                    annot.set_colors(stroke=_rgb(ann.color))
+                    annot.set_opacity(ann.alpha / 255)
+                elif ann.type == 'line':
+                    p1 = fitz.Point(x1, y1) * derotate
+                    p2 = fitz.Point(x2, y2) * derotate
+                    annot = page.add_ink_annot([[tuple(p1), tuple(p2)]])
+                    annot.set_colors(stroke=_rgb(ann.color))
+                    annot.set_border(width=max(ann.width / scale, 0.5))
+                else:
+                    continue
+                annot.update()
+                count += 1
+            except Exception as e:
+                logger.warning(f"페이지 {page_num} 주석 추가 실패: {e}")
+    return count
+
+
+def export_annotated_pdf(src: Union[str, bytes], dest_path: str,
+                         annotations: Dict[int, Iterable[Annotation]]) -> int:
+    """
+    어노테이션을 넣은 PDF 저장
+
+    원본을 복사한 뒤 주석만 증분 저장(saveIncr)으로 덧붙이므로 원본 내용은 다시 쓰지 않는다.
+    증분 저장이 불가능한 문서(복구된 문서 등)는 전체 저장. 완성 후 os.replace로 교체.
+
+    Args:
+        src: 원본 PDF 경로 또는 PDF 바이트
+        dest_path: 저장 경로
+        annotations: 페이지 -> 어노테이션
+
+    Returns:
+        추가한 주석 수
+    """
+    if fitz is None:
+        raise RuntimeError("PDF 지원 라이브러리가 설치되지 않음")
+
+    dest_dir = os.path.dirname(os.path.abspath(dest_path))
+    os.makedirs(dest_dir, exist_ok=True)
+    part_path = dest_path + '.part'
+
+    try:
+        if isinstance(src, bytes):
+            with open(part_path, 'wb') as f:
+                f.write(src)
+        else:
+            shutil.copyfile(src, part_path)
+
+        doc = fitz.open(part_path)
+        try:
+            count = add_pdf_annotations(doc, annotations)
+            if doc.can_save_incrementally():
+                doc.saveIncr()
+            else:
+                full_path = dest_path + '.full'
+                doc.save(full_path, garbage=3, deflate=True)
+                doc.close()
+                os.replace(full_path, part_path)
+        finally:
+            if not doc.is_closed:
+                doc.close()
+
+        os.replace(part_path, dest_path)
+    except Exception:
+        for path in (part_path, dest_path + '.full'):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        raise
+
+    logger.info(f"주석 PDF 저장: {dest_path} ({count}개)")
+    return count
+
+
+def _run_export_job(job: ExportJob) -> ExportResult:
+    """작업 프로세스에서 실행 (예외는 결과로 변환)"""
+    src_path, dest_path, annotations = job
+    try:
+        return dest_path, export_annotated_pdf(src_path, dest_path, annotations), None
+    except Exception as e:
+        return dest_path, None, str(e)
+
+
+def batch_export(jobs: List[ExportJob], max_workers: int = EXPORT_MAX_WORKERS) -> List[ExportResult]:
+    """
+    여러 리포트를 일괄 내보내기
+
+    PyMuPDF는 스레드 간 동시 사용을 지원하지 않으므로 작업마다 별도 프로세스에서 실행.
+    max_workers가 1 이하이거나 작업이 하나면 현재 프로세스에서 순서대로 실행.
+
+    Args:
+        jobs: (원본 PDF 경로, 저장 경로, 페이지 -> 어노테이션) 리스트
+        max_workers: 최대 프로세스 수
+
+    Returns:
+        작업 순서대로 (저장 경로, 주석 수 또는 None, 오류 또는 None)
+    """
+    if not jobs:
+        return []
+    if max_workers <= 1 or len(jobs) == 1:
+        return [_run_export_job(job) for job in jobs]
+
+    results: List[Optional[ExportResult]] = [None] * len(jobs)
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = {executor.submit(_run_export_job, job): i for i, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                # 작업 프로세스가 비정상 종료된 경우
+                results[i] = (jobs[i][1], None, str(e))
+
+    failed = sum(1 for r in results if r[2])
+    logger.info(f"일괄 내보내기 완료: {len(jobs)}개 중 {len(jobs) - failed}개 성공")
+    return results
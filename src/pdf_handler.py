@@ -3,16 +3,25 @@ PDF 처리 모듈
 - PDFHandler: PDF 다운로드, 렌더링, 어노테이션 합성
 """
 
+import hashlib
 import logging
+import os
+import tempfile
+import threading
 import requests
-from io import BytesIO
 from urllib.parse import urlparse
-from typing import List, Optional, Dict, Tuple, Any
+from typing import List, Optional, Dict, Tuple, Any, Callable
 
 from .config import (
     HTTP_HEADERS, PDF_RENDER_SCALE, PDF_DOWNLOAD_TIMEOUT,
-    ALLOWED_PDF_DOMAINS
+    PDF_DOWNLOAD_CHUNK_SIZE, ALLOWED_PDF_DOMAINS,
+    TILE_SIZE, TILED_RENDER_MIN_ZOOM
 )
+from .page_cache import PageImageCache
+from .models import Annotation
+from .pdf_cache import PDFCache
+from .spatial_index import GridIndex
+from .text_cache import PageText, TextCache
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -58,19 +67,124 @@ def parse_hex_color(color: str) -> Tuple[int, int, int]:
         return (255, 255, 0)  # 기본 노란색
 
 
+class PDFDownloadCancelled(Exception):
+    """PDF 다운로드가 취소됨 (다른 리포트 선택 등)"""
+
+
+def validate_pdf_url(pdf_url: str) -> None:
+    """
+    PDF URL 검증 (프로토콜, 허용 도메인)
+
+    Args:
+        pdf_url: PDF URL
+
+    Raises:
+        ValueError: 허용되지 않은 URL
+    """
+    parsed = urlparse(pdf_url)
+    if parsed.scheme not in ('https', 'http'):
+        raise ValueError(f"허용되지 않은 프로토콜: {parsed.scheme}")
+    domain = parsed.hostname or ''
+    if not any(domain == allowed or domain.endswith('.' + allowed)
+               for allowed in ALLOWED_PDF_DOMAINS):
+        raise ValueError(f"허용되지 않은 PDF 도메인: {domain}")
+
+
+def download_pdf(pdf_url: str, dest_path: str,
+                 progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+                 cancel_event: Optional[threading.Event] = None) -> str:
+    """
+    PDF를 청크 단위로 스트리밍 다운로드해 파일에 저장
+
+    Args:
+        pdf_url: PDF URL (검증은 호출자 책임)
+        dest_path: 저장할 파일 경로
+        progress_callback: 청크마다 호출되는 콜백 (받은 바이트, 전체 바이트 또는 None)
+        cancel_event: 설정되면 다음 청크에서 다운로드 중단
+
+    Returns:
+        내용 sha256
+
+    Raises:
+        PDFDownloadCancelled: cancel_event로 취소됨
+        requests.RequestException: 네트워크 오류
+        Exception: HTTP 오류 응답
+    """
+    response = requests.get(
+        pdf_url,
+        headers=HTTP_HEADERS,
+        timeout=PDF_DOWNLOAD_TIMEOUT,
+        stream=True
+    )
+    try:
+        if response.status_code != 200:
+            logger.error(f"PDF 다운로드 실패: HTTP {response.status_code}")
+            raise Exception(f"PDF 다운로드 실패: {response.status_code}")
+
+        try:
+            total = int(response.headers.get('Content-Length', ''))
+        except ValueError:
+            total = None
+
+        hasher = hashlib.sha256()
+        downloaded = 0
+        with open(dest_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=PDF_DOWNLOAD_CHUNK_SIZE):
+                if cancel_event is not None and cancel_event.is_set():
+                    raise PDFDownloadCancelled(pdf_url)
+                if not chunk:
+                    continue
+                f.write(chunk)
+                hasher.update(chunk)
+                downloaded += len(chunk)
+                if progress_callback:
+                    progress_callback(downloaded, total)
+
+        return hasher.hexdigest()
+    finally:
+        response.close()
+
+
+def _remove_file(path: Optional[str]) -> None:
+    """임시 파일 삭제 (없으면 무시)"""
+    if not path:
+        return
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
 class PDFHandler:
     """PDF 처리 클래스 (지연 로딩 지원)"""
 
-    def __init__(self) -> None:
+    def __init__(self, pdf_cache: Optional[PDFCache] = None) -> None:
+        """
+        Args:
+            pdf_cache: 디스크 PDF 캐시 (None이면 매번 다운로드해 메모리에서 열기)
+        """
         self._pdf_doc: Optional[Any] = None  # fitz.Document
-        self._pdf_data: Optional[BytesIO] = None
-        self._page_cache: Dict[int, Any] = {}  # 페이지 이미지 캐시
-        self._max_cache_size: int = 5  # 최대 캐시 페이지 수
+        self._temp_path: Optional[str] = None  # 캐시 없이 받은 PDF 임시 파일
+        self._pdf_cache = pdf_cache
+        self.content_hash: Optional[str] = None  # 로드된 PDF 내용의 sha256
+        # (페이지, 줌 버킷) → 렌더링 이미지 (바이트 예산 LRU, 읽는 방향 앞쪽 우선 보관)
+        self._page_cache = PageImageCache()
+        # 페이지 → 텍스트/단어/글자 좌표 (페이지마다 한 번 추출, 검색/자동 하이라이트용)
+        self._text_cache = TextCache(self._extract_page_text)
+
+        # fitz 문서는 스레드 안전하지 않음 — 문서/페이지 캐시 접근은 모두 이 락으로 직렬화
+        self._doc_lock = threading.RLock()
+        self._doc_generation: int = 0  # 문서 교체/정리 시 증가 (렌더 작업자 무효화)
 
         self.total_pages: int = 0
         self.current_page: int = 0
         self.zoom_level: float = 1.0
-        self.annotations: Dict[int, List[dict]] = {}
+        self.annotations: Dict[int, Dict[int, Annotation]] = {}  # 페이지 -> {id: 어노테이션} (추가 순서 유지)
+        self._annotation_index: Dict[int, GridIndex] = {}  # 페이지별 적중 검사용 (줌 1.0 좌표)
+        self._search_highlight_ids: Dict[int, List[int]] = {}  # 페이지별 검색 하이라이트 id
+        self._next_annotation_id = 0
+        # 저장 대상 어노테이션(검색 하이라이트 제외)이 바뀌면 호출 (저장 예약용)
+        self.on_annotations_changed: Optional[Callable[[], None]] = None
 
         logger.debug("PDFHandler 초기화됨")
 
@@ -79,12 +193,18 @@ class PDFHandler:
         """PDF 지원 여부 확인"""
         return PDF_SUPPORT
 
-    def load_pdf(self, pdf_url: str) -> bool:
+    def load_pdf(self, pdf_url: str,
+                 progress_callback: Optional[Callable[[int, Optional[int]], None]] = None,
+                 cancel_event: Optional[threading.Event] = None) -> bool:
         """
-        PDF 다운로드 및 로드 (지연 로딩)
+        PDF 다운로드 및 로드 (지연 로딩, 디스크 캐시 우선)
+
+        다운로드는 임시 파일로 스트리밍하고, 완료되면 캐시로 옮겨 파일에서 바로 연다.
 
         Args:
             pdf_url: PDF URL
+            progress_callback: 다운로드 진행 콜백 (받은 바이트, 전체 바이트 또는 None)
+            cancel_event: 설정되면 다운로드를 중단하고 PDFDownloadCancelled 발생
 
         Returns:
             성공 여부
@@ -95,98 +215,282 @@ class PDFHandler:
 
         # URL 유효성 검사
         try:
-            parsed = urlparse(pdf_url)
-            if parsed.scheme not in ('https', 'http'):
-                raise ValueError(f"허용되지 않은 프로토콜: {parsed.scheme}")
-            domain = parsed.hostname or ''
-            if not any(domain == allowed or domain.endswith('.' + allowed)
-                       for allowed in ALLOWED_PDF_DOMAINS):
-                raise ValueError(f"허용되지 않은 PDF 도메인: {domain}")
+            validate_pdf_url(pdf_url)
         except ValueError as e:
             logger.error(f"PDF URL 검증 실패: {e}")
             raise Exception(f"PDF URL 검증 실패: {e}")
 
+        # 디스크 캐시에 있으면 네트워크 없이 파일에서 바로 열기
+        if self._pdf_cache is not None:
+            cached_path = self._pdf_cache.get(pdf_url)
+            if cached_path:
+                try:
+                    self._open_document(fitz.open(cached_path),
+                                        self._pdf_cache.content_hash(pdf_url))
+                    logger.info(f"PDF 캐시에서 로드: {self.total_pages}페이지")
+                    return True
+                except Exception as e:
+                    # 손상된 캐시 파일은 버리고 다시 다운로드
+                    logger.warning(f"캐시된 PDF 열기 실패, 다시 다운로드: {e}")
+                    self._pdf_cache.discard(pdf_url)
+
+        # 캐시로 옮길 수 있도록 임시 파일은 캐시 디렉터리(같은 파일시스템)에 생성
+        if self._pdf_cache is not None:
+            temp_path = self._pdf_cache.temp_path()
+        else:
+            fd, temp_path = tempfile.mkstemp(suffix='.part')
+            os.close(fd)
+        opened = False
+
         try:
             logger.info(f"PDF 다운로드 시작: {pdf_url}")
-            response = requests.get(
-                pdf_url,
-                headers=HTTP_HEADERS,
-                timeout=PDF_DOWNLOAD_TIMEOUT
-            )
+            content_hash = download_pdf(pdf_url, temp_path, progress_callback, cancel_event)
 
-            if response.status_code != 200:
-                logger.error(f"PDF 다운로드 실패: HTTP {response.status_code}")
-                raise Exception(f"PDF 다운로드 실패: {response.status_code}")
+            path = temp_path
+            if self._pdf_cache is not None:
+                try:
+                    path = self._pdf_cache.put_file(pdf_url, temp_path, content_hash)
+                except OSError as e:
+                    logger.warning(f"PDF 캐시 저장 실패, 임시 파일에서 열기: {e}")
 
-            # 기존 문서 정리
-            self._cleanup()
+            # 다운로드 직후 다른 리포트가 선택됐으면 문서를 교체하지 않음
+            if cancel_event is not None and cancel_event.is_set():
+                raise PDFDownloadCancelled(pdf_url)
 
-            # PDF 데이터 저장 (지연 로딩을 위해)
-            self._pdf_data = BytesIO(response.content)
-            self._pdf_doc = fitz.open(stream=self._pdf_data, filetype="pdf")
-
-            self.total_pages = len(self._pdf_doc)
-            self.current_page = 0
-            self.zoom_level = 1.0
-            self.annotations = {}
-            self._page_cache = {}
+            doc = fitz.open(path)
+            self._open_document(doc, content_hash,
+                                temp_path=temp_path if path == temp_path else None)
+            opened = True
 
             logger.info(f"PDF 로드 완료: {self.total_pages}페이지")
             return True
 
+        except PDFDownloadCancelled:
+            logger.info(f"PDF 다운로드 취소됨: {pdf_url}")
+            raise
         except requests.RequestException as e:
             logger.error(f"PDF 다운로드 네트워크 오류: {e}")
             raise Exception(f"PDF 다운로드 실패: {e}")
         except Exception as e:
             logger.error(f"PDF 로드 오류: {e}")
             raise
+        finally:
+            if not opened:
+                _remove_file(temp_path)
+
+    def _open_document(self, doc: Any, content_hash: Optional[str],
+                       temp_path: Optional[str] = None) -> None:
+        """
+        열린 fitz 문서로 상태 교체
+
+        Args:
+            doc: fitz.Document
+            content_hash: PDF 내용 sha256
+            temp_path: 캐시 없이 연 임시 파일 경로 (문서를 닫을 때 삭제)
+        """
+        with self._doc_lock:
+            # 기존 문서 정리
+            self._cleanup()
+
+            self._temp_path = temp_path
+            self._pdf_doc = doc
+            self.content_hash = content_hash
+
+            self.total_pages = len(self._pdf_doc)
+            self.current_page = 0
+            self.zoom_level = 1.0
+            self._clear_all_annotations()
+            self._page_cache.clear()
+            self._text_cache.clear()
 
-    def _get_page_image(self, page_num: int) -> Optional[Any]:
+    @property
+    def document_generation(self) -> int:
+        """현재 문서 세대 (문서가 바뀌거나 정리되면 증가)"""
+        return self._doc_generation
+
+    @staticmethod
+    def _zoom_bucket(zoom: float) -> int:
+        """캐시 키용 줌 버킷 (1% 단위 — ZOOM_STEP 배수는 항상 서로 다른 버킷)"""
+        return int(round(zoom * 100))
+
+    def _get_page_image(self, page_num: int, zoom: float = 1.0) -> Optional[Any]:
         """
         페이지 이미지 가져오기 (캐시 사용)
 
+        PDF_RENDER_SCALE * zoom 배율로 바로 래스터화하므로 리사이즈가 필요 없음.
+        반환된 이미지는 캐시와 공유되므로 호출자는 수정하지 않아야 함.
+
         Args:
             page_num: 페이지 번호
+            zoom: 줌 레벨
 
         Returns:
             PIL Image 또는 None
         """
-        if not self._pdf_doc or page_num < 0 or page_num >= self.total_pages:
+        with self._doc_lock:
+            if not self._pdf_doc or page_num < 0 or page_num >= self.total_pages:
+                return None
+
+            key = (page_num, self._zoom_bucket(zoom))
+
+            # 캐시 확인
+            cached = self._page_cache.get(key)
+            if cached is not None:
+                logger.debug(f"페이지 {page_num} (줌 {zoom}) 캐시에서 로드")
+                return cached
+
+            # 페이지 렌더링
+            try:
+                page = self._pdf_doc[page_num]
+                scale = PDF_RENDER_SCALE * key[1] / 100
+                mat = fitz.Matrix(scale, scale)
+                pix = page.get_pixmap(matrix=mat, alpha=False)
+                img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+                self._page_cache.put(key, img)
+                logger.debug(f"페이지 {page_num} 렌더링 및 캐시 (배율 {scale:.2f})")
+                return img
+
+            except Exception as e:
+                logger.error(f"페이지 {page_num} 렌더링 실패: {e}")
+                return None
+
+    def prerender_page(self, page_num: int, zoom: float, doc_generation: int) -> bool:
+        """
+        렌더 작업자용: 페이지를 렌더링해 캐시에 채움
+
+        Args:
+            page_num: 페이지 번호
+            zoom: 줌 레벨
+            doc_generation: 작업 예약 시점의 문서 세대 (다르면 건너뜀)
+
+        Returns:
+            렌더링(또는 캐시 적중) 여부
+        """
+        with self._doc_lock:
+            if doc_generation != self._doc_generation:
+                return False
+            if self.use_tiles(zoom):
+                # 타일 모드에서는 전체 페이지 대신 페이지 상단 타일 한 줄만 준비
+                size = self.tile_grid(page_num, zoom)
+                if size is None:
+                    return False
+                return all(self._get_tile_image(page_num, zoom, tx, 0) is not None
+                           for tx in range(size[0]))
+            return self._get_page_image(page_num, zoom) is not None
+
+    def is_page_cached(self, page_num: int, zoom: float) -> bool:
+        """해당 줌의 페이지 이미지(타일 모드면 첫 타일)가 캐시에 있는지 확인"""
+        bucket = self._zoom_bucket(zoom)
+        key = (page_num, bucket, 'tile', 0, 0) if self.use_tiles(zoom) else (page_num, bucket)
+        with self._doc_lock:
+            return key in self._page_cache
+
+    @staticmethod
+    def use_tiles(zoom: float) -> bool:
+        """해당 줌에서 타일 렌더링을 사용하는지 여부"""
+        return zoom >= TILED_RENDER_MIN_ZOOM
+
+    def page_pixel_size(self, page_num: int, zoom: float) -> Optional[Tuple[int, int]]:
+        """
+        줌 배율로 렌더링했을 때의 페이지 픽셀 크기 (렌더링하지 않고 계산)
+
+        Returns:
+            (너비, 높이) 또는 None
+        """
+        with self._doc_lock:
+            if not self._pdf_doc or page_num < 0 or page_num >= self.total_pages:
+                return None
+            scale = PDF_RENDER_SCALE * self._zoom_bucket(zoom) / 100
+            irect = (self._pdf_doc[page_num].rect * fitz.Matrix(scale, scale)).irect
+            return irect.width, irect.height
+
+    def tile_grid(self, page_num: int, zoom: float) -> Optional[Tuple[int, int]]:
+        """페이지의 타일 개수 (열, 행)"""
+        size = self.page_pixel_size(page_num, zoom)
+        if size is None:
             return None
+        width, height = size
+        return -(-width // TILE_SIZE), -(-height // TILE_SIZE)
 
-        # 캐시 확인
-        if page_num in self._page_cache:
-            logger.debug(f"페이지 {page_num} 캐시에서 로드")
-            return self._page_cache[page_num]
+    def _get_tile_image(self, page_num: int, zoom: float, tx: int, ty: int) -> Optional[Any]:
+        """
+        타일 이미지 가져오기 (캐시 사용)
 
-        # 페이지 렌더링
-        try:
-            page = self._pdf_doc[page_num]
-            mat = fitz.Matrix(PDF_RENDER_SCALE, PDF_RENDER_SCALE)
-            pix = page.get_pixmap(matrix=mat)
-            img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-
-            # 캐시에 추가 (최대 크기 관리)
-            if len(self._page_cache) >= self._max_cache_size:
-                # 현재 페이지와 가장 먼 페이지 제거
-                pages_to_remove = sorted(
-                    self._page_cache.keys(),
-                    key=lambda p: abs(p - page_num),
-                    reverse=True
-                )
-                if pages_to_remove:
-                    removed = pages_to_remove[0]
-                    del self._page_cache[removed]
-                    logger.debug(f"캐시에서 페이지 {removed} 제거")
+        clip 사각형으로 페이지의 TILE_SIZE 크기 영역만 래스터화한다.
+        페이지 이미지와 같은 캐시에 (페이지, 줌 버킷, 'tile', 열, 행) 키로 따로 저장.
 
-            self._page_cache[page_num] = img
-            logger.debug(f"페이지 {page_num} 렌더링 및 캐시")
-            return img
+        Args:
+            page_num: 페이지 번호
+            zoom: 줌 레벨
+            tx: 타일 열
+            ty: 타일 행
 
-        except Exception as e:
-            logger.error(f"페이지 {page_num} 렌더링 실패: {e}")
+        Returns:
+            PIL Image 또는 None (범위 밖)
+        """
+        with self._doc_lock:
+            size = self.page_pixel_size(page_num, zoom)
+            if size is None:
+                return None
+            width, height = size
+            x0, y0 = tx * TILE_SIZE, ty * TILE_SIZE
+            if tx < 0 or ty < 0 or x0 >= width or y0 >= height:
+                return None
+
+            key = (page_num, self._zoom_bucket(zoom), 'tile', tx, ty)
+            cached = self._page_cache.get(key)
+            if cached is not None:
+                return cached
+
+            try:
+                page = self._pdf_doc[page_num]
+                scale = PDF_RENDER_SCALE * key[1] / 100
+                mat = fitz.Matrix(scale, scale)
+                # 픽셀 좌표의 타일 영역을 페이지 좌표로 되돌려 clip으로 사용
+                clip = fitz.Rect(x0, y0, min(x0 + TILE_SIZE, width),
+                                 min(y0 + TILE_SIZE, height)) * ~mat
+                pix = page.get_pixmap(matrix=mat, clip=clip, alpha=False)
+                img = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+
+                self._page_cache.put(key, img)
+                logger.debug(f"페이지 {page_num} 타일 ({tx}, {ty}) 렌더링 및 캐시")
+                return img
+
+            except Exception as e:
+                logger.error(f"페이지 {page_num} 타일 ({tx}, {ty}) 렌더링 실패: {e}")
+                return None
+
+    def render_tile(self, page_num: int, tx: int, ty: int,
+                    zoom: Optional[float] = None,
+                    apply_annotations: bool = True) -> Optional[Any]:
+        """
+        타일 렌더링 (높은 줌에서 화면에 보이는 부분만 그릴 때 사용)
+
+        Args:
+            page_num: 페이지 번호
+            tx: 타일 열
+            ty: 타일 행
+            zoom: 줌 레벨 (None이면 현재 줌)
+            apply_annotations: 어노테이션 적용 여부
+
+        Returns:
+            렌더링된 PIL Image (어노테이션이 없으면 캐시 이미지 자체이므로 수정하지 않아야 함)
+        """
+        if zoom is None:
+            zoom = self.zoom_level
+
+        self._page_cache.set_position(page_num, self._zoom_bucket(zoom))
+
+        img = self._get_tile_image(page_num, zoom, tx, ty)
+        if img is None:
             return None
 
+        if apply_annotations:
+            img = self.apply_annotations(img, page_num, zoom,
+                                         origin=(tx * TILE_SIZE, ty * TILE_SIZE))
+        return img
+
     @property
     def images(self) -> List:
         """하위 호환성을 위한 images 속성 (권장하지 않음)"""
@@ -205,7 +509,7 @@ class PDFHandler:
             apply_annotations: 어노테이션 적용 여부
 
         Returns:
-            렌더링된 PIL Image
+            렌더링된 PIL Image (어노테이션이 없으면 캐시 이미지 자체이므로 수정하지 않아야 함)
         """
         if not self._pdf_doc:
             logger.warning("PDF가 로드되지 않음")
@@ -221,24 +525,22 @@ class PDFHandler:
             logger.warning(f"잘못된 페이지 번호: {page_num}")
             return None
 
-        img = self._get_page_image(page_num)
+        # 읽는 위치/방향을 캐시 교체 정책에 알림
+        self._page_cache.set_position(page_num, self._zoom_bucket(zoom))
+
+        # 목표 줌 배율로 바로 렌더링된 캐시 이미지 (복사/리사이즈 없음)
+        img = self._get_page_image(page_num, zoom)
         if img is None:
             return None
 
-        img = img.copy()
-
-        # 줌 적용
-        new_width = int(img.width * zoom)
-        new_height = int(img.height * zoom)
-        resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-
-        # 어노테이션 합성
+        # 어노테이션 합성 (있을 때만 새 이미지 생성, 캐시 이미지는 변경하지 않음)
         if apply_annotations:
-            resized = self.apply_annotations(resized, page_num, zoom)
+            img = self.apply_annotations(img, page_num, zoom)
 
-        return resized
+        return img
 
-    def apply_annotations(self, img: Any, page_num: int, zoom: float) -> Any:
+    def apply_annotations(self, img: Any, page_num: int, zoom: float,
+                          origin: Tuple[int, int] = (0, 0)) -> Any:
         """
         어노테이션을 이미지에 합성
 
@@ -246,6 +548,7 @@ class PDFHandler:
             img: PIL Image
             page_num: 페이지 번호
             zoom: 현재 줌 레벨
+            origin: 페이지 이미지 안에서 img의 왼쪽 위 좌표 (타일 합성용)
 
         Returns:
             어노테이션이 합성된 이미지
@@ -261,41 +564,110 @@ class PDFHandler:
         overlay = Image.new('RGBA', img.size, (0, 0, 0, 0))
         draw = ImageDraw.Draw(overlay)
 
-        for ann in self.annotations[page_num]:
-            try:
-                # 줌 레벨 보정
-                scale = zoom / ann.get('zoom', 1.0)
+        for ann in self.annotations[page_num].values():
+            self._draw_annotation(draw, ann, zoom, origin)
 
-                if ann['type'] == 'highlight':
-                    x1, y1, x2, y2 = ann['coords']
-                    x1, y1, x2, y2 = int(x1 * scale), int(y1 * scale), int(x2 * scale), int(y2 * scale)
+        # 합성
+        result = Image.alpha_composite(img, overlay)
+        return result.convert('RGB')
 
-                    # 색상을 RGBA로 변환 (안전한 파싱)
-                    r, g, b = parse_hex_color(ann.get('color', '#FFFF00'))
-                    alpha = ann.get('alpha', 77)
+    @staticmethod
+    def _draw_annotation(draw: Any, ann: Annotation, zoom: float,
+                         origin: Tuple[int, int] = (0, 0)) -> None:
+        """어노테이션 하나를 RGBA 레이어에 그리기 (origin은 레이어 왼쪽 위의 페이지 픽셀 좌표)"""
+        ox, oy = origin
+        try:
+            # 줌 레벨 보정
+            scale = zoom / ann.zoom
 
-                    draw.rectangle([x1, y1, x2, y2], fill=(r, g, b, alpha))
+            if ann.type == 'highlight':
+                x1, y1, x2, y2 = ann.coords
+                x1, y1 = int(x1 * scale) - ox, int(y1 * scale) - oy
+                x2, y2 = int(x2 * scale) - ox, int(y2 * scale) - oy
 
-                elif ann['type'] == 'line':
-                    x1, y1, x2, y2 = ann['coords']
-                    x1, y1, x2, y2 = int(x1 * scale), int(y1 * scale), int(x2 * scale), int(y2 * scale)
+                # 색상을 RGBA로 변환 (안전한 파싱)
+                r, g, b = parse_hex_color(ann.color)
 
-                    r, g, b = parse_hex_color(ann.get('color', '#FF0000'))
-                    width = int(ann.get('width', 3) * scale)
+                draw.rectangle([x1, y1, x2, y2], fill=(r, g, b, ann.alpha))
 
-                    draw.line([x1, y1, x2, y2], fill=(r, g, b, 255), width=max(1, width))
+            elif ann.type == 'line':
+                x1, y1, x2, y2 = ann.coords
+                x1, y1 = int(x1 * scale) - ox, int(y1 * scale) - oy
+                x2, y2 = int(x2 * scale) - ox, int(y2 * scale) - oy
 
-            except Exception as e:
-                logger.error(f"어노테이션 렌더링 실패: {e}")
-                continue
+                r, g, b = parse_hex_color(ann.color)
+                width = int(ann.width * scale)
 
-        # 합성
-        result = Image.alpha_composite(img, overlay)
-        return result.convert('RGB')
+                draw.line([x1, y1, x2, y2], fill=(r, g, b, 255), width=max(1, width))
+
+        except Exception as e:
+            logger.error(f"어노테이션 렌더링 실패: {e}")
+
+    @staticmethod
+    def annotation_bbox(ann: Annotation, zoom: float) -> Tuple[int, int, int, int]:
+        """어노테이션이 차지하는 페이지 픽셀 영역 (x0, y0, x1, y1, 끝 미포함)"""
+        scale = zoom / ann.zoom
+        x1, y1, x2, y2 = (int(v * scale) for v in ann.coords)
+        # 선 두께만큼 여유 (형광펜은 끝점 포함 1픽셀)
+        pad = max(1, int(ann.width * scale)) if ann.type == 'line' else 0
+        return (min(x1, x2) - pad, min(y1, y2) - pad,
+                max(x1, x2) + pad + 1, max(y1, y2) + pad + 1)
+
+    def render_annotation(self, ann: Annotation, zoom: float) -> Optional[Tuple[int, int, Any]]:
+        """
+        어노테이션 하나만 영역 크기의 투명 이미지로 렌더링 (뷰어 오버레이용)
+
+        페이지 이미지를 다시 합성하지 않으므로 비용이 어노테이션 크기에 비례한다.
+
+        Args:
+            ann: 어노테이션
+            zoom: 현재 줌 레벨
+
+        Returns:
+            (x, y, RGBA Image) — x, y는 페이지 픽셀 좌표, 실패 시 None
+        """
+        if not PDF_SUPPORT:
+            return None
+        try:
+            x0, y0, x1, y1 = self.annotation_bbox(ann, zoom)
+        except (TypeError, ValueError) as e:
+            logger.error(f"어노테이션 렌더링 실패: {e}")
+            return None
+
+        sprite = Image.new('RGBA', (max(1, x1 - x0), max(1, y1 - y0)), (0, 0, 0, 0))
+        self._draw_annotation(ImageDraw.Draw(sprite), ann, zoom, origin=(x0, y0))
+        return x0, y0, sprite
+
+    def _extract_page_text(self, page_num: int) -> Optional[PageText]:
+        """페이지 텍스트 추출 (rawdict 한 번으로 텍스트/블록/단어/글자 좌표, TextCache 로더)"""
+        try:
+            with self._doc_lock:
+                if not self._pdf_doc or page_num < 0 or page_num >= self.total_pages:
+                    return None
+                # get_text()와 같은 플래그 (이미지 블록 데이터는 추출하지 않음)
+                raw = self._pdf_doc[page_num].get_text("rawdict", flags=fitz.TEXTFLAGS_TEXT)
+        except Exception as e:
+            logger.error(f"페이지 {page_num} 텍스트 추출 실패: {e}")
+            return None
+        return PageText.from_rawdict(raw)
+
+    def get_page_text_data(self, page_num: int) -> Optional[PageText]:
+        """
+        페이지 텍스트 캐시 항목 (처음 요청 시 추출)
+
+        Args:
+            page_num: 페이지 번호
+
+        Returns:
+            PageText 또는 None (문서 없음/범위 밖/추출 실패)
+        """
+        if not self._pdf_doc or page_num < 0 or page_num >= self.total_pages:
+            return None
+        return self._text_cache.get(page_num)
 
     def search_text(self, query: str, page_num: Optional[int] = None) -> List[Dict]:
         """
-        PDF에서 텍스트 검색
+        PDF에서 텍스트 검색 (텍스트 캐시 사용)
 
         Args:
             query: 검색할 텍스트
@@ -311,35 +683,29 @@ class PDFHandler:
         pages_to_search = [page_num] if page_num is not None else range(self.total_pages)
 
         for pn in pages_to_search:
-            if pn < 0 or pn >= self.total_pages:
+            page_text = self.get_page_text_data(pn)
+            if page_text is None:
                 continue
 
-            try:
-                page = self._pdf_doc[pn]
-                text_instances = page.search_for(query)
-
-                if text_instances:
-                    # fitz.Rect를 튜플로 변환하고 PDF_RENDER_SCALE 적용
-                    rects = [
-                        (
-                            int(rect.x0 * PDF_RENDER_SCALE),
-                            int(rect.y0 * PDF_RENDER_SCALE),
-                            int(rect.x1 * PDF_RENDER_SCALE),
-                            int(rect.y1 * PDF_RENDER_SCALE)
-                        )
-                        for rect in text_instances
-                    ]
-                    results.append({
-                        'page': pn,
-                        'rects': rects,
-                        'text': query,
-                        'count': len(rects)
-                    })
-                    logger.debug(f"페이지 {pn}에서 '{query}' {len(rects)}개 발견")
-
-            except Exception as e:
-                logger.error(f"페이지 {pn} 텍스트 검색 실패: {e}")
-                continue
+            text_instances = page_text.search(query)
+            if text_instances:
+                # PDF 좌표에 PDF_RENDER_SCALE 적용
+                rects = [
+                    (
+                        int(x0 * PDF_RENDER_SCALE),
+                        int(y0 * PDF_RENDER_SCALE),
+                        int(x1 * PDF_RENDER_SCALE),
+                        int(y1 * PDF_RENDER_SCALE)
+                    )
+                    for x0, y0, x1, y1 in text_instances
+                ]
+                results.append({
+                    'page': pn,
+                    'rects': rects,
+                    'text': query,
+                    'count': len(rects)
+                })
+                logger.debug(f"페이지 {pn}에서 '{query}' {len(rects)}개 발견")
 
         logger.info(f"'{query}' 검색 완료: {sum(r['count'] for r in results)}개 발견")
         return results
@@ -354,15 +720,8 @@ class PDFHandler:
         Returns:
             페이지 텍스트
         """
-        if not self._pdf_doc or page_num < 0 or page_num >= self.total_pages:
-            return ""
-
-        try:
-            page = self._pdf_doc[page_num]
-            return page.get_text()
-        except Exception as e:
-            logger.error(f"페이지 {page_num} 텍스트 추출 실패: {e}")
-            return ""
+        page_text = self.get_page_text_data(page_num)
+        return page_text.text if page_text is not None else ""
 
     def get_page_blocks(self, page_num: int) -> List[str]:
         """
@@ -375,24 +734,27 @@ class PDFHandler:
         Returns:
             블록(단락) 텍스트 리스트. 각 블록 내부에는 줄바꿈(\n)이 보존됨.
         """
-        if not self._pdf_doc or page_num < 0 or page_num >= self.total_pages:
-            return []
+        page_text = self.get_page_text_data(page_num)
+        return list(page_text.blocks) if page_text is not None else []
 
-        try:
-            page = self._pdf_doc[page_num]
-            # blocks: [(x0, y0, x1, y1, text, block_no, block_type), ...]
-            # block_type == 0 은 텍스트 블록, 1은 이미지
-            blocks_raw = page.get_text("blocks")
-            return [b[4] for b in blocks_raw if len(b) >= 7 and b[6] == 0 and b[4].strip()]
-        except Exception as e:
-            logger.error(f"페이지 {page_num} 블록 추출 실패: {e}")
-            return []
+    def get_page_words(self, page_num: int) -> List[Tuple]:
+        """
+        페이지의 단어와 좌표 (get_text('words') 형식)
+
+        Args:
+            page_num: 페이지 번호
+
+        Returns:
+            [(x0, y0, x1, y1, 단어, 블록 번호, 라인 번호, 단어 번호), ...] (PDF 좌표)
+        """
+        page_text = self.get_page_text_data(page_num)
+        return list(page_text.words) if page_text is not None else []
 
     def add_auto_highlights(self, page_num: int, spans: List[Any],
-                              zoom: float) -> List[dict]:
+                              zoom: float) -> List[Annotation]:
         """
-        자동 하이라이트: HighlightSpan 리스트를 받아 search_for로 좌표 변환 후
-        add_highlight 반복 호출.
+        자동 하이라이트: HighlightSpan 리스트를 받아 좌표를 정한 뒤 add_highlight 반복 호출.
+        라인 사각형(bbox)이 있는 스팬은 그대로 쓰고, 없는 스팬(LLM 결과 등)만 텍스트 캐시에서 검색.
 
         Args:
             page_num: 페이지 번호
@@ -400,126 +762,216 @@ class PDFHandler:
             zoom: 현재 줌 레벨
 
         Returns:
-            추가된 어노테이션 dict 리스트 (undo 등록용)
+            추가된 어노테이션 리스트 (undo 등록용)
         """
-        if not self._pdf_doc or page_num < 0 or page_num >= self.total_pages:
+        page_text = self.get_page_text_data(page_num)
+        if page_text is None:
             return []
 
-        added: List[dict] = []
-        try:
-            page = self._pdf_doc[page_num]
-        except Exception as e:
-            logger.error(f"페이지 {page_num} 접근 실패: {e}")
-            return []
+        resolved = [(span, [span.bbox] if span.bbox is not None
+                     else page_text.search(span.snippet))
+                    for span in spans]
+        added = self.add_resolved_highlights(page_num, resolved, zoom)
+        logger.info(f"자동 하이라이트 페이지 {page_num}: {len(spans)}개 스팬 → {len(added)}개 어노테이션 추가")
+        return added
 
-        for span in spans:
-            try:
-                rects = page.search_for(span.snippet)
-            except Exception as e:
-                logger.debug(f"search_for 실패 ('{span.snippet[:30]}...'): {e}")
-                continue
+    def add_resolved_highlights(self, page_num: int, resolved: List[Tuple[Any, List[Tuple]]],
+                                zoom: float) -> List[Annotation]:
+        """
+        좌표를 이미 찾은 자동 하이라이트 추가 (문서 전체 분석 결과, 캐시된 결과 등)
+
+        같은 자리에 같은 색의 자동 하이라이트가 이미 있으면 건너뛰므로
+        같은 페이지에 여러 번 적용해도 어노테이션이 중복되지 않는다.
+
+        Args:
+            page_num: 페이지 번호
+            resolved: (HighlightSpan, [(x0, y0, x1, y1), ...]) 리스트 (PDF 좌표)
+            zoom: 현재 줌 레벨
 
-            for rect in rects:
+        Returns:
+            새로 추가된 어노테이션 리스트 (undo 등록용)
+        """
+        if not self._pdf_doc or not 0 <= page_num < self.total_pages:
+            return []
+
+        existing = {(ann.coords, ann.color) for ann in self.annotations.get(page_num, {}).values()
+                    if ann.kind == 'auto'}
+        added: List[Annotation] = []
+        for span, rects in resolved:
+            for x0, y0, x1, y1 in rects:
                 coords = (
-                    rect.x0 * PDF_RENDER_SCALE,
-                    rect.y0 * PDF_RENDER_SCALE,
-                    rect.x1 * PDF_RENDER_SCALE,
-                    rect.y1 * PDF_RENDER_SCALE,
+                    x0 * PDF_RENDER_SCALE,
+                    y0 * PDF_RENDER_SCALE,
+                    x1 * PDF_RENDER_SCALE,
+                    y1 * PDF_RENDER_SCALE,
                 )
-                annotation = self.add_highlight(page_num, coords, span.color, span.alpha, zoom)
+                if (coords, span.color) in existing:
+                    continue
+                existing.add((coords, span.color))
+                annotation = self.add_highlight(page_num, coords, span.color, span.alpha, zoom,
+                                                kind='auto')
                 added.append(annotation)
-
-        logger.info(f"자동 하이라이트 페이지 {page_num}: {len(spans)}개 스팬 → {len(added)}개 어노테이션 추가")
         return added
 
+    @staticmethod
+    def _annotation_page_bbox(ann: Annotation) -> Tuple[float, float, float, float]:
+        """어노테이션 경계 사각형 (줌 1.0 좌표, 라인은 두께 포함)"""
+        x1, y1, x2, y2 = (v / ann.zoom for v in ann.coords)
+        pad = ann.width / ann.zoom / 2 if ann.type == 'line' else 0
+        return min(x1, x2) - pad, min(y1, y2) - pad, max(x1, x2) + pad, max(y1, y2) + pad
+
+    def _notify_annotations_changed(self, annotations: List[Annotation]) -> None:
+        if self.on_annotations_changed and any(a.kind != 'search' for a in annotations):
+            self.on_annotations_changed()
+
+    def _append_annotation(self, page_num: int, annotation: Annotation,
+                           notify: bool = True) -> None:
+        """어노테이션 저장소, 공간 인덱스, 종류별 목록에 함께 추가 (id가 없으면 부여)"""
+        if not annotation.id:
+            self._next_annotation_id += 1
+            annotation.id = self._next_annotation_id
+        else:
+            self._next_annotation_id = max(self._next_annotation_id, annotation.id)
+
+        self.annotations.setdefault(page_num, {})[annotation.id] = annotation
+        index = self._annotation_index.get(page_num)
+        if index is None:
+            index = self._annotation_index[page_num] = GridIndex()
+        index.insert(annotation.id, self._annotation_page_bbox(annotation), annotation)
+
+        if annotation.kind == 'search':
+            self._search_highlight_ids.setdefault(page_num, []).append(annotation.id)
+        if notify:
+            self._notify_annotations_changed([annotation])
+
+    def load_annotations(self, annotations: Dict[int, List[Annotation]]) -> int:
+        """
+        저장소에서 읽은 어노테이션 복원 (변경 알림 없음, id 유지)
+
+        Args:
+            annotations: 페이지 -> 어노테이션 리스트
+
+        Returns:
+            복원한 어노테이션 수
+        """
+        count = 0
+        for page_num, page_annotations in annotations.items():
+            if not 0 <= page_num < self.total_pages:
+                continue
+            for ann in page_annotations:
+                self._append_annotation(page_num, ann, notify=False)
+                count += 1
+        logger.debug(f"어노테이션 {count}개 복원")
+        return count
+
+    def get_annotations(self, page_num: int) -> List[Annotation]:
+        """페이지의 어노테이션 목록 (추가된 순서)"""
+        return list(self.annotations.get(page_num, {}).values())
+
+    def _clear_all_annotations(self) -> None:
+        """문서 교체/초기화 시 모든 어노테이션 상태 비우기 (id는 계속 증가)"""
+        self.annotations = {}
+        self._annotation_index = {}
+        self._search_highlight_ids = {}
+
+    def restore_annotation(self, page_num: int, annotation: Annotation) -> None:
+        """삭제했던 어노테이션 복원 (되돌리기용, 같은 id 유지)"""
+        self._append_annotation(page_num, annotation)
+        logger.debug(f"어노테이션 복원: 페이지 {page_num}")
+
     def add_highlight(self, page_num: int, coords: Tuple[float, float, float, float],
-                      color: str, alpha: int, zoom: float) -> dict:
+                      color: str, alpha: int, zoom: float, kind: str = 'user') -> Annotation:
         """형광펜 어노테이션 추가"""
-        if page_num not in self.annotations:
-            self.annotations[page_num] = []
-
-        annotation = {
-            'type': 'highlight',
-            'coords': coords,
-            'color': color,
-            'alpha': alpha,
-            'zoom': zoom
-        }
-
-        self.annotations[page_num].append(annotation)
+        annotation = Annotation(type='highlight', coords=tuple(coords), color=color,
+                                alpha=alpha, zoom=zoom, kind=kind)
+
+        self._append_annotation(page_num, annotation)
         logger.debug(f"형광펜 추가: 페이지 {page_num}, 좌표 {coords}")
         return annotation
 
     def add_line(self, page_num: int, coords: Tuple[float, float, float, float],
-                 color: str, width: int, zoom: float) -> dict:
+                 color: str, width: int, zoom: float) -> Annotation:
         """라인 어노테이션 추가"""
-        if page_num not in self.annotations:
-            self.annotations[page_num] = []
-
-        annotation = {
-            'type': 'line',
-            'coords': coords,
-            'color': color,
-            'width': width,
-            'zoom': zoom
-        }
-
-        self.annotations[page_num].append(annotation)
+        annotation = Annotation(type='line', coords=tuple(coords), color=color,
+                                width=width, zoom=zoom)
+
+        self._append_annotation(page_num, annotation)
         logger.debug(f"라인 추가: 페이지 {page_num}, 좌표 {coords}")
         return annotation
 
     def add_search_highlight(self, page_num: int, rect: Tuple[int, int, int, int],
-                             color: str = '#FFFF00', alpha: int = 100) -> dict:
+                             color: str = '#FFFF00', alpha: int = 100) -> Annotation:
         """검색 결과 하이라이트 추가"""
-        return self.add_highlight(page_num, rect, color, alpha, 1.0)
+        return self.add_highlight(page_num, rect, color, alpha, 1.0, kind='search')
 
     def clear_search_highlights(self, page_num: Optional[int] = None) -> None:
-        """검색 하이라이트 제거"""
-        pages = [page_num] if page_num is not None else list(self.annotations.keys())
+        """검색 하이라이트 제거 (kind='search'로 추가된 것만, 다른 어노테이션은 훑지 않음)"""
+        pages = [page_num] if page_num is not None else list(self._search_highlight_ids.keys())
 
         for pn in pages:
-            if pn in self.annotations:
-                # alpha가 100인 것은 검색 하이라이트로 간주
-                self.annotations[pn] = [
-                    ann for ann in self.annotations[pn]
-                    if not (ann.get('type') == 'highlight' and ann.get('alpha') == 100)
-                ]
+            for ann_id in self._search_highlight_ids.pop(pn, []):
+                self._discard_annotation(pn, ann_id)
+
+    def _discard_annotation(self, page_num: int, ann_id: int) -> Optional[Annotation]:
+        """id로 어노테이션 제거 (저장소와 공간 인덱스)"""
+        annotation = self.annotations.get(page_num, {}).pop(ann_id, None)
+        if annotation is not None:
+            self._annotation_index[page_num].remove(ann_id)
+            self._notify_annotations_changed([annotation])
+        return annotation
 
-    def remove_annotation(self, page_num: int, annotation: dict) -> bool:
-        """어노테이션 제거"""
-        if page_num in self.annotations and annotation in self.annotations[page_num]:
-            self.annotations[page_num].remove(annotation)
-            logger.debug(f"어노테이션 제거: 페이지 {page_num}")
-            return True
-        return False
+    def remove_annotation(self, page_num: int, annotation: Annotation) -> bool:
+        """어노테이션 제거 (같은 객체만 제거)"""
+        if self.annotations.get(page_num, {}).get(annotation.id) is not annotation:
+            return False
+        self._discard_annotation(page_num, annotation.id)
+        logger.debug(f"어노테이션 제거: 페이지 {page_num}")
+        return True
 
-    def clear_annotations(self, page_num: int) -> List[dict]:
+    def clear_annotations(self, page_num: int) -> List[Annotation]:
         """페이지의 모든 어노테이션 삭제 (삭제된 어노테이션 반환)"""
         if page_num in self.annotations:
-            cleared = self.annotations[page_num].copy()
-            self.annotations[page_num] = []
+            cleared = list(self.annotations[page_num].values())
+            self.annotations[page_num] = {}
+            self._annotation_index.pop(page_num, None)
+            self._search_highlight_ids.pop(page_num, None)
+            self._notify_annotations_changed(cleared)
             logger.debug(f"페이지 {page_num} 어노테이션 전체 삭제: {len(cleared)}개")
             return cleared
         return []
 
     def find_annotation_at_point(self, page_num: int, x: float, y: float,
-                                 zoom: float, threshold: int = 10) -> Optional[dict]:
-        """지정된 좌표의 어노테이션 찾기"""
-        if page_num not in self.annotations:
+                                 zoom: float, threshold: int = 10) -> Optional[Annotation]:
+        """
+        지정된 좌표의 어노테이션 찾기
+
+        공간 인덱스로 후보를 좁힌 뒤 후보만 정확히 판정 (형광펜: 포함, 라인: 거리 <= threshold).
+
+        Args:
+            page_num: 페이지 번호
+            x, y: 현재 줌 기준 페이지 픽셀 좌표
+            zoom: 현재 줌 레벨
+            threshold: 라인 판정 거리 (현재 줌 픽셀)
+
+        Returns:
+            가장 먼저 추가된 적중 어노테이션 또는 None
+        """
+        index = self._annotation_index.get(page_num)
+        if index is None:
             return None
 
-        for ann in self.annotations[page_num]:
-            scale = zoom / ann.get('zoom', 1.0)
+        for ann in index.query_point(x / zoom, y / zoom, margin=threshold / zoom):
+            scale = zoom / ann.zoom
 
-            if ann['type'] == 'highlight':
-                ax1, ay1, ax2, ay2 = ann['coords']
+            if ann.type == 'highlight':
+                ax1, ay1, ax2, ay2 = ann.coords
                 ax1, ay1, ax2, ay2 = ax1 * scale, ay1 * scale, ax2 * scale, ay2 * scale
 
                 if ax1 <= x <= ax2 and ay1 <= y <= ay2:
                     return ann
 
-            elif ann['type'] == 'line':
-                x1, y1, x2, y2 = ann['coords']
+            elif ann.type == 'line':
+                x1, y1, x2, y2 = ann.coords
                 x1, y1, x2, y2 = x1 * scale, y1 * scale, x2 * scale, y2 * scale
 
                 # 점과 선 사이 거리 계산
@@ -537,6 +989,42 @@ class PDFHandler:
 
         return None
 
+    def find_annotations_in_rect(self, page_num: int, rect: Tuple[float, float, float, float],
+                                 zoom: float) -> List[Annotation]:
+        """
+        사각형 영역과 겹치는 어노테이션 (경계 사각형 기준)
+
+        Args:
+            page_num: 페이지 번호
+            rect: 현재 줌 기준 페이지 픽셀 좌표 (x0, y0, x1, y1)
+            zoom: 현재 줌 레벨
+
+        Returns:
+            어노테이션 리스트 (추가된 순서)
+        """
+        index = self._annotation_index.get(page_num)
+        if index is None:
+            return []
+        return index.query_rect(tuple(v / zoom for v in rect))
+
+    def document_source(self) -> Optional[Any]:
+        """
+        열린 문서의 원본 (내보내기, 검색 색인/자동 하이라이트 작업용)
+
+        캐시 없이 받은 임시 파일은 리포트를 바꾸면 삭제되므로, 나중에 파일을 여는
+        백그라운드 작업이 실패하지 않도록 경로 대신 바이트를 돌려준다.
+
+        Returns:
+            파일에서 연 문서면 경로, 메모리/임시 파일 문서면 PDF 바이트, 문서가 없으면 None
+        """
+        with self._doc_lock:
+            if not self._pdf_doc:
+                return None
+            if self._pdf_doc.name and self._pdf_doc.name != self._temp_path and \
+                    os.path.exists(self._pdf_doc.name):
+                return self._pdf_doc.name
+            return self._pdf_doc.tobytes()
+
     def save_page_image(self, filepath: str, page_num: Optional[int] = None,
                         zoom: Optional[float] = None) -> bool:
         """현재 페이지를 이미지로 저장"""
@@ -553,21 +1041,26 @@ class PDFHandler:
 
     def _cleanup(self) -> None:
         """리소스 정리"""
-        if self._pdf_doc:
-            try:
-                self._pdf_doc.close()
-            except Exception:
-                pass
-            self._pdf_doc = None
-
-        if self._pdf_data:
-            try:
-                self._pdf_data.close()
-            except Exception:
-                pass
-            self._pdf_data = None
-
-        self._page_cache = {}
+        with self._doc_lock:
+            self._doc_generation += 1
+
+            if self._pdf_doc:
+                try:
+                    self._pdf_doc.close()
+                except Exception:
+                    pass
+                self._pdf_doc = None
+
+            if self._temp_path:
+                _remove_file(self._temp_path)
+                self._temp_path = None
+
+            stats = self._page_cache.stats
+            if stats['hits'] or stats['misses']:
+                logger.debug(f"페이지 캐시 통계: {stats}")
+            self._page_cache.clear()
+            self._text_cache.clear()
+            self.content_hash = None
         logger.debug("PDF 리소스 정리됨")
 
     def reset(self) -> None:
@@ -576,7 +1069,7 @@ class PDFHandler:
         self.total_pages = 0
         self.current_page = 0
         self.zoom_level = 1.0
-        self.annotations = {}
+        self._clear_all_annotations()
         logger.debug("PDFHandler 상태 초기화됨")
 
     def __del__(self):
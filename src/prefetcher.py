@@ -0,0 +1,179 @@
+"""
+PDF 미리 받기 모듈
+- PDFPrefetcher: 목록에서 다음에 읽을 리포트의 PDF를 백그라운드로 캐시에 저장
+"""
+
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, List, Optional
+
+from .config import PREFETCH_MAX_WORKERS, PREFETCH_BYTE_BUDGET
+from .pdf_cache import PDFCache
+from .pdf_handler import PDFDownloadCancelled, download_pdf, validate_pdf_url
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class _BudgetExceeded(Exception):
+    """이번 라운드의 바이트 예산 초과"""
+
+
+class PDFPrefetcher:
+    """
+    리포트 PDF 미리 받기 (저우선순위 작업 풀)
+
+    prefetch()를 호출할 때마다 새 라운드가 시작되어 이전 라운드의 남은 작업은 버려진다.
+    라운드마다 byte_budget까지만 받으며, 사용자가 직접 여는 PDF를 받는 동안에는
+    pause()로 진행 중인 다운로드를 중단했다가 resume() 후 다시 받는다.
+    """
+
+    def __init__(self, pdf_cache: PDFCache,
+                 max_workers: int = PREFETCH_MAX_WORKERS,
+                 byte_budget: int = PREFETCH_BYTE_BUDGET) -> None:
+        """
+        Args:
+            pdf_cache: 받은 PDF를 저장할 캐시 (PDFHandler와 공유)
+            max_workers: 동시 다운로드 수
+            byte_budget: 라운드당 최대 다운로드 바이트
+        """
+        self._cache = pdf_cache
+        self._byte_budget = byte_budget
+        self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                            thread_name_prefix='pdf-prefetch')
+
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._bytes_used = 0
+        self._futures: List[Future] = []
+        self._closed = False
+
+        # 사용자 다운로드 중에는 대기 (중첩 가능하므로 카운터로 관리)
+        self._user_downloads = 0
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+        # 진행 중인 미리 받기를 끊을 때 설정 (일시정지/새 라운드마다 교체)
+        self._interrupt = threading.Event()
+        # 미리 받기를 마치면 (URL, 내용 해시)로 호출 (미리 받기 스레드에서 실행, 검색 색인용)
+        self.on_downloaded: Optional[Callable[[str, str], None]] = None
+
+        logger.debug(f"PDFPrefetcher 초기화됨: workers={max_workers}, budget={byte_budget}")
+
+    def prefetch(self, urls: List[str]) -> None:
+        """
+        새 라운드로 PDF 미리 받기 예약 (앞쪽 URL부터)
+
+        Args:
+            urls: PDF URL 목록 (읽을 순서)
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._generation += 1
+            gen = self._generation
+            self._bytes_used = 0
+            self._interrupt.set()
+            self._interrupt = threading.Event()
+            self._futures = [f for f in self._futures if not f.done()]
+
+            for url in urls:
+                if url:
+                    self._futures.append(self._executor.submit(self._run, url, gen))
+
+        logger.debug(f"PDF 미리 받기 예약: {len(urls)}개 (라운드 {gen})")
+
+    def pause(self) -> None:
+        """사용자 다운로드 시작 — 미리 받기 일시정지"""
+        with self._lock:
+            self._user_downloads += 1
+            self._resume_event.clear()
+            self._interrupt.set()
+            self._interrupt = threading.Event()
+
+    def resume(self) -> None:
+        """사용자 다운로드 종료 — 다른 다운로드가 없으면 미리 받기 재개"""
+        with self._lock:
+            self._user_downloads = max(0, self._user_downloads - 1)
+            if self._user_downloads == 0:
+                self._resume_event.set()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """예약된 작업이 끝날 때까지 대기"""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures, timeout=timeout)
+
+    def _run(self, url: str, gen: int) -> None:
+        """URL 하나 미리 받기 (일시정지로 중단되면 재개 후 다시 시도)"""
+        while True:
+            self._resume_event.wait()
+            with self._lock:
+                if self._closed or gen != self._generation:
+                    return
+                if self._bytes_used >= self._byte_budget:
+                    return
+                interrupt = self._interrupt
+
+            if self._cache.content_hash(url):
+                return
+            try:
+                validate_pdf_url(url)
+            except ValueError as e:
+                logger.debug(f"미리 받기 건너뜀: {e}")
+                return
+
+            try:
+                self._download(url, gen, interrupt)
+                return
+            except PDFDownloadCancelled:
+                continue
+            except _BudgetExceeded:
+                logger.debug(f"미리 받기 예산 초과로 중단: {url}")
+                return
+            except Exception as e:
+                logger.debug(f"미리 받기 실패: {url}, 오류: {e}")
+                return
+
+    def _download(self, url: str, gen: int, interrupt: threading.Event) -> None:
+        """예산을 지키며 받아서 캐시에 저장"""
+        with self._lock:
+            remaining = self._byte_budget - self._bytes_used
+
+        def check_budget(downloaded: int, total: Optional[int]) -> None:
+            # 전체 크기를 알면 첫 청크에서 바로 판단
+            if (total or downloaded) > remaining:
+                raise _BudgetExceeded(url)
+
+        temp_path = self._cache.temp_path()
+        try:
+            sha256 = download_pdf(url, temp_path, progress_callback=check_budget,
+                                  cancel_event=interrupt)
+            size = os.path.getsize(temp_path)
+            # 라운드가 바뀌었어도 다 받은 파일은 캐시에 남기되 새 라운드 예산에는 넣지 않음
+            with self._lock:
+                if gen == self._generation:
+                    self._bytes_used += size
+            self._cache.put_file(url, temp_path, sha256)
+            logger.debug(f"PDF 미리 받기 완료: {url} ({size} bytes)")
+        finally:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+        if self.on_downloaded is not None:
+            try:
+                self.on_downloaded(url, sha256)
+            except Exception as e:
+                logger.warning(f"미리 받기 완료 콜백 오류: {e}")
+
+    def close(self) -> None:
+        """미리 받기 중단 및 작업 풀 종료"""
+        with self._lock:
+            self._closed = True
+            self._interrupt.set()
+        self._resume_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.debug("PDFPrefetcher 종료됨")
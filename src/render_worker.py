@@ -0,0 +1,111 @@
+"""
+페이지 미리 렌더링 모듈
+- PageRenderWorker: 현재 페이지 주변을 백그라운드 스레드에서 렌더링해 페이지 캐시에 채움
+"""
+
+import logging
+import threading
+from typing import List, Optional, Tuple
+
+from .config import PRERENDER_RADIUS
+from .pdf_handler import PDFHandler
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class PageRenderWorker:
+    """
+    페이지 미리 렌더링 작업자
+
+    schedule()을 호출할 때마다 작업 세대가 바뀌어 이전 예약은 버려진다.
+    문서가 바뀌면 PDFHandler.document_generation으로, 줌이 바뀌면 새 schedule()로 무효화.
+    렌더링 자체는 PDFHandler의 문서 락 안에서 실행되므로 UI 스레드 렌더링과 겹치지 않음.
+    """
+
+    def __init__(self, handler: PDFHandler, radius: int = PRERENDER_RADIUS) -> None:
+        """
+        Args:
+            handler: 캐시를 채울 PDFHandler
+            radius: 현재 페이지 앞뒤로 미리 렌더링할 페이지 수
+        """
+        self._handler = handler
+        self._radius = radius
+
+        self._cond = threading.Condition()
+        self._pending: List[Tuple[int, float, int]] = []  # (페이지, 줌, 문서 세대)
+        self._generation = 0
+        self._busy = False
+        self._stopped = False
+
+        self._thread = threading.Thread(target=self._loop, name='page-prerender', daemon=True)
+        self._thread.start()
+        logger.debug(f"PageRenderWorker 시작: radius={radius}")
+
+    def schedule(self, page_num: int, zoom: float) -> None:
+        """
+        현재 페이지 기준 미리 렌더링 예약 (이전 예약 대체)
+
+        다음 페이지 쪽을 먼저: page+1, page-1, page+2, page-2, ...
+
+        Args:
+            page_num: 현재 페이지
+            zoom: 현재 줌 레벨
+        """
+        total = self._handler.total_pages
+        doc_generation = self._handler.document_generation
+
+        pages = []
+        for offset in range(1, self._radius + 1):
+            for candidate in (page_num + offset, page_num - offset):
+                if 0 <= candidate < total:
+                    pages.append(candidate)
+
+        with self._cond:
+            self._generation += 1
+            self._pending = [(p, zoom, doc_generation) for p in pages]
+            self._cond.notify_all()
+
+    def cancel(self) -> None:
+        """남은 예약 취소 (문서 교체 등)"""
+        with self._cond:
+            self._generation += 1
+            self._pending = []
+            self._cond.notify_all()
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """예약된 렌더링이 모두 끝날 때까지 대기 (테스트/종료용)"""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy,
+                                       timeout=timeout)
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                page_num, zoom, doc_generation = self._pending.pop(0)
+                generation = self._generation
+                self._busy = True
+
+            try:
+                # 예약 후 문서가 바뀌었으면 prerender_page가 건너뜀
+                if self._handler.prerender_page(page_num, zoom, doc_generation):
+                    logger.debug(f"페이지 {page_num} 미리 렌더링 (세대 {generation})")
+            except Exception as e:
+                logger.debug(f"페이지 {page_num} 미리 렌더링 실패: {e}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def stop(self) -> None:
+        """작업자 종료"""
+        with self._cond:
+            self._stopped = True
+            self._pending = []
+            self._cond.notify_all()
+        self._thread.join(timeout=2)
+        logger.debug("PageRenderWorker 종료됨")
@@ -0,0 +1,194 @@
+"""
+리포트 저장소 모듈
+- ReportStore: SQLite 기반 로컬 리포트 저장소 (link 기준)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Set
+
+from .config import REPORT_DB_PATH
+from .models import ReportData
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+_REPORT_COLUMNS = ('link', 'stock', 'title', 'firm', 'date',
+                   'pdf_link', 'views', 'opinion', 'target')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    link TEXT PRIMARY KEY,
+    stock TEXT NOT NULL,
+    title TEXT NOT NULL,
+    firm TEXT NOT NULL,
+    date TEXT NOT NULL,
+    pdf_link TEXT NOT NULL DEFAULT '',
+    views TEXT NOT NULL DEFAULT '0',
+    opinion TEXT NOT NULL DEFAULT '-',
+    target TEXT NOT NULL DEFAULT '-',
+    meta_fetched INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reports_date ON reports (date);
+CREATE INDEX IF NOT EXISTS idx_reports_stock ON reports (stock);
+CREATE INDEX IF NOT EXISTS idx_reports_firm ON reports (firm);
+"""
+
+
+class ReportStore:
+    """
+    SQLite 기반 리포트 저장소
+
+    목록 순서는 rowid로 유지: 목록(최신순)을 역순으로 삽입하므로
+    rowid가 클수록 최신 리포트. 기존 행은 upsert 시 rowid가 유지됨.
+    """
+
+    def __init__(self, db_path: str = REPORT_DB_PATH) -> None:
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # 스크래퍼 백그라운드 스레드와 UI 스레드에서 함께 사용 (접근은 _lock으로 직렬화)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+
+        logger.debug(f"ReportStore 초기화됨: {db_path}")
+
+    def save_reports(self, reports: List[ReportData]) -> None:
+        """
+        목록에서 수집한 리포트 저장 (upsert)
+
+        이미 가져온 투자의견/목표가는 목록 행의 기본값('-')으로 덮어쓰지 않음.
+
+        Args:
+            reports: 목록 순서(최신순)의 ReportData 리스트
+        """
+        if not reports:
+            return
+
+        now = time.time()
+        rows = [
+            tuple(getattr(r, col) for col in _REPORT_COLUMNS) + (now,)
+            for r in reversed(reports)
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO reports (link, stock, title, firm, date,
+                                     pdf_link, views, opinion, target, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(link) DO UPDATE SET
+                    stock = excluded.stock,
+                    title = excluded.title,
+                    firm = excluded.firm,
+                    date = excluded.date,
+                    pdf_link = excluded.pdf_link,
+                    views = excluded.views,
+                    updated_at = excluded.updated_at
+                """,
+                rows,
+            )
+        logger.debug(f"리포트 {len(rows)}개 저장")
+
+    def save_meta(self, report: ReportData) -> None:
+        """
+        상세 페이지에서 가져온 투자의견/목표가 저장
+
+        Args:
+            report: 메타 정보가 채워진 ReportData
+        """
+        row = tuple(getattr(report, col) for col in _REPORT_COLUMNS) + (time.time(),)
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO reports (link, stock, title, firm, date,
+                                     pdf_link, views, opinion, target,
+                                     updated_at, meta_fetched)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)
+                ON CONFLICT(link) DO UPDATE SET
+                    opinion = excluded.opinion,
+                    target = excluded.target,
+                    meta_fetched = 1,
+                    updated_at = excluded.updated_at
+                """,
+                row,
+            )
+
+    def get_reports(self, date: Optional[str] = None,
+                    stock: Optional[str] = None,
+                    firm: Optional[str] = None) -> List[ReportData]:
+        """
+        저장된 리포트 조회 (최신순)
+
+        Args:
+            date: 날짜 필터 (yy.mm.dd)
+            stock: 종목명 필터
+            firm: 증권사 필터
+
+        Returns:
+            ReportData 리스트
+        """
+        conditions = []
+        params = []
+        for column, value in (('date', date), ('stock', stock), ('firm', firm)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        query = (f"SELECT {', '.join(_REPORT_COLUMNS)} FROM reports "
+                 f"{where} ORDER BY date DESC, rowid DESC")
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [ReportData.from_dict(dict(zip(_REPORT_COLUMNS, row))) for row in rows]
+
+    def get_report(self, link: str) -> Optional[ReportData]:
+        """link로 리포트 조회"""
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {', '.join(_REPORT_COLUMNS)} FROM reports WHERE link = ?",
+                (link,),
+            ).fetchone()
+        if row is None:
+            return None
+        return ReportData.from_dict(dict(zip(_REPORT_COLUMNS, row)))
+
+    def get_links(self, date: Optional[str] = None) -> Set[str]:
+        """저장된 리포트 link 집합 (날짜 필터 가능)"""
+        with self._lock:
+            if date is None:
+                rows = self._conn.execute("SELECT link FROM reports").fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT link FROM reports WHERE date = ?", (date,)
+                ).fetchall()
+        return {row[0] for row in rows}
+
+    def has_meta(self, link: str) -> bool:
+        """상세 메타 정보(투자의견/목표가)를 이미 가져왔는지 확인"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT meta_fetched FROM reports WHERE link = ?", (link,)
+            ).fetchone()
+        return bool(row and row[0])
+
+    def count(self) -> int:
+        """저장된 리포트 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM reports").fetchone()[0]
+
+    def close(self) -> None:
+        """연결 종료"""
+        try:
+            with self._lock:
+                self._conn.close()
+            logger.debug("ReportStore 연결 종료됨")
+        except sqlite3.Error as e:
+            logger.warning(f"ReportStore 종료 중 오류: {e}")
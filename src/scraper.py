@@ -4,155 +4,451 @@
 """
 
 import logging
+import sqlite3
+import threading
+import time
 import requests
 from bs4 import BeautifulSoup
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Dict, Set
 
 from .config import (
-    RESEARCH_URL, HTTP_HEADERS, PARSER,
-    MAX_PAGES_TO_FETCH, REQUEST_TIMEOUT,
+    RESEARCH_URL, HTTP_HEADERS, PARSER, LISTING_PARSER,
+    MAX_PAGES_TO_FETCH, REQUEST_TIMEOUT, FETCH_MAX_WORKERS,
+    MAX_CONSECUTIVE_ERRORS, META_FETCH_MAX_WORKERS, META_FETCH_RATE_LIMIT,
     ALLOWED_PDF_DOMAINS
 )
+from .http_cache import CachingSession, HTTPCache
 from .models import ReportData
+from .report_store import ReportStore
+
+# 목록 페이지 빠른 파서 (lxml 없으면 BeautifulSoup 경로 사용)
+if LISTING_PARSER == 'lxml':
+    from lxml import etree
+    from lxml import html as lxml_html
+else:
+    etree = None
+    lxml_html = None
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 목록 테이블(table.type_1)의 행 XPath — bs4의 find('table', class_='type_1')와 동일하게 첫 테이블만
+_LISTING_ROWS_XPATH = (
+    "(//table[contains(concat(' ', normalize-space(@class), ' '), ' type_1 ')])[1]//tr"
+)
+
+
+class _ListingAccumulator:
+    """
+    목록 페이지 결과를 페이지 순서대로 병합하는 누적기.
+    순차/병렬 수집 경로가 같은 중단 규칙(이전 날짜, 연속 오류)을 공유하도록 분리.
+    """
+
+    def __init__(self, date: str,
+                 max_consecutive_errors: int = MAX_CONSECUTIVE_ERRORS,
+                 known_links: Optional[Set[str]] = None) -> None:
+        self.date = date
+        self.reports: List[ReportData] = []
+        self.reached_known = False
+        self._known_links = known_links or set()
+        self._seen_links: Set[str] = set()
+        self._consecutive_errors = 0
+        self._max_consecutive_errors = max_consecutive_errors
+
+    def add_page(self, page: int, page_reports: Optional[List[ReportData]]) -> bool:
+        """
+        페이지 결과 병합
+
+        Args:
+            page: 페이지 번호
+            page_reports: 페이지에서 파싱된 리포트 (테이블이 없으면 None)
+
+        Returns:
+            다음 페이지를 계속 가져올지 여부
+        """
+        if page_reports is None:
+            logger.warning(f"페이지 {page}: 테이블을 찾을 수 없음")
+            return self.add_error()
+
+        # 오류 카운터 리셋
+        self._consecutive_errors = 0
+
+        found_old_date = False
+        added = 0
+        for report in page_reports:
+            # 증분 수집: 이미 알고 있는 리포트부터는 이전 수집 결과와 동일
+            if report.link in self._known_links:
+                self.reached_known = True
+                break
+            if report.date == self.date:
+                # 수집 중 새 리포트가 올라오면 페이지 경계가 밀려 중복 행이 생길 수 있음
+                if report.link in self._seen_links:
+                    continue
+                self._seen_links.add(report.link)
+                self.reports.append(report)
+                added += 1
+            elif self.reports:
+                found_old_date = True
+                break
+
+        logger.debug(f"페이지 {page}: {added}개 리포트 수집")
+
+        if self.reached_known:
+            logger.debug("이미 수집한 리포트 도달, 스크래핑 종료")
+            return False
+        if found_old_date:
+            logger.debug("이전 날짜 리포트 발견, 스크래핑 종료")
+            return False
+        return True
+
+    def add_error(self) -> bool:
+        """
+        페이지 오류 기록
+
+        Returns:
+            다음 페이지를 계속 가져올지 여부
+        """
+        self._consecutive_errors += 1
+        if self._consecutive_errors >= self._max_consecutive_errors:
+            logger.error("연속 오류 한계 도달, 스크래핑 중단")
+            return False
+        return True
+
+
+class _RateLimiter:
+    """여러 워커 스레드가 공유하는 최소 요청 간격 제한기"""
+
+    def __init__(self, rate: float) -> None:
+        """
+        Args:
+            rate: 초당 최대 요청 수 (0 이하이면 제한 없음)
+        """
+        self._interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+
+    def wait(self) -> None:
+        """다음 요청 슬롯까지 대기"""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_time - now
+            self._next_time = max(now, self._next_time) + self._interval
+        if delay > 0:
+            time.sleep(delay)
+
 
 class NaverReportScraper:
     """네이버 금융 종목 리포트 스크래퍼"""
 
-    def __init__(self) -> None:
+    def __init__(self, store: Optional[ReportStore] = None,
+                 http_cache: Optional[HTTPCache] = None) -> None:
+        """
+        Args:
+            store: 수집 결과를 기록할 로컬 저장소 (None이면 저장하지 않음)
+            http_cache: 목록/상세 페이지 HTTP 캐시 (None이면 캐시 없이 요청)
+        """
         self.headers = HTTP_HEADERS
-        self.session = requests.Session()
+        self.session = CachingSession(http_cache)
         self.session.headers.update(self.headers)
+        self.store = store
+        self.listing_parser = LISTING_PARSER
         logger.debug("NaverReportScraper 초기화됨")
 
     def fetch_reports(self, date: Optional[str] = None,
-                      progress_callback: Optional[Callable[[int, int], None]] = None) -> List[ReportData]:
+                      progress_callback: Optional[Callable[[int, int], None]] = None,
+                      max_workers: Optional[int] = None,
+                      known_links: Optional[Set[str]] = None) -> List[ReportData]:
         """
         리포트 목록 가져오기
 
         Args:
             date: 필터링할 날짜 (yy.mm.dd 형식), None이면 오늘
             progress_callback: 진행 상황 콜백 (current_page, total_pages)
+            max_workers: 동시에 요청할 목록 페이지 수 (None이면 FETCH_MAX_WORKERS, 1이면 순차)
+            known_links: 이미 수집한 리포트 link 집합. 지정하면 증분 모드로 동작해
+                처음 만나는 기존 리포트에서 중단하고 새 리포트만 반환.
+                새 리포트는 대부분 첫 페이지에 있으므로 증분 모드는 항상 순차 수집.
 
         Returns:
-            ReportData 리스트
+            ReportData 리스트 (페이지 순서 유지)
 
         Raises:
             requests.RequestException: 네트워크 오류 발생 시
         """
         if date is None:
             date = datetime.now().strftime("%y.%m.%d")
+        if max_workers is None:
+            max_workers = FETCH_MAX_WORKERS
+        if known_links:
+            max_workers = 1
 
-        logger.info(f"리포트 목록 가져오기 시작: 날짜={date}")
-        reports: List[ReportData] = []
-        consecutive_errors = 0
-        max_consecutive_errors = 3
+        logger.info(f"리포트 목록 가져오기 시작: 날짜={date}, 동시 요청={max_workers}, "
+                    f"증분={'예' if known_links else '아니오'}")
+        accumulator = _ListingAccumulator(date, known_links=known_links)
+
+        if max_workers <= 1:
+            self._fetch_pages_sequential(accumulator, progress_callback)
+        else:
+            self._fetch_pages_concurrent(accumulator, max_workers, progress_callback)
+
+        reports = accumulator.reports
+        logger.info(f"리포트 목록 가져오기 완료: 총 {len(reports)}개")
+        self._save_to_store(reports)
+        return reports
+
+    def _save_to_store(self, reports: List[ReportData]) -> None:
+        """수집한 리포트를 로컬 저장소에 기록 (실패해도 수집 결과는 반환)"""
+        if self.store is None or not reports:
+            return
+        try:
+            self.store.save_reports(reports)
+        except sqlite3.Error as e:
+            logger.warning(f"리포트 저장 실패: {e}")
+
+    def fetch_new_reports(self, date: Optional[str] = None,
+                          known_links: Optional[Set[str]] = None,
+                          progress_callback: Optional[Callable[[int, int], None]] = None
+                          ) -> List[ReportData]:
+        """
+        증분 수집: 이미 알고 있는 리포트 이후에 올라온 새 리포트만 가져오기
+
+        Args:
+            date: 필터링할 날짜 (yy.mm.dd 형식), None이면 오늘
+            known_links: 이미 수집한 link 집합 (None이면 저장소에서 해당 날짜 link 조회)
+            progress_callback: 진행 상황 콜백 (current_page, total_pages)
 
+        Returns:
+            새 리포트 리스트 (최신순). 알고 있는 리포트가 없으면 전체 수집과 동일.
+        """
+        if date is None:
+            date = datetime.now().strftime("%y.%m.%d")
+
+        if known_links is None and self.store is not None:
+            try:
+                known_links = self.store.get_links(date=date)
+            except sqlite3.Error as e:
+                logger.warning(f"저장된 리포트 조회 실패, 전체 수집: {e}")
+
+        return self.fetch_reports(date=date, progress_callback=progress_callback,
+                                  known_links=known_links)
+
+    def _fetch_pages_sequential(self, accumulator: _ListingAccumulator,
+                                progress_callback: Optional[Callable[[int, int], None]]) -> None:
+        """목록 페이지를 한 페이지씩 순서대로 가져오기"""
         for page in range(1, MAX_PAGES_TO_FETCH + 1):
             if progress_callback:
                 progress_callback(page, MAX_PAGES_TO_FETCH)
 
-            url = f"{RESEARCH_URL}company_list.naver?&page={page}"
-            logger.debug(f"페이지 {page} 요청: {url}")
-
             try:
-                response = self.session.get(url, timeout=REQUEST_TIMEOUT)
-                response.raise_for_status()  # HTTP 에러 체크
+                page_reports = self._fetch_listing_page(page)
+            except Exception as e:
+                self._log_page_error(page, e)
+                if not accumulator.add_error():
+                    break
+                continue
 
-                # 인코딩 자동 감지 시도
-                if response.encoding is None or response.encoding.lower() == 'iso-8859-1':
-                    response.encoding = 'euc-kr'
+            if not accumulator.add_page(page, page_reports):
+                break
 
-                soup = BeautifulSoup(response.text, PARSER)
-                table = soup.find('table', class_='type_1')
+    def _fetch_pages_concurrent(self, accumulator: _ListingAccumulator, max_workers: int,
+                                progress_callback: Optional[Callable[[int, int], None]]) -> None:
+        """
+        목록 페이지를 제한된 워커 풀에서 병렬로 가져오기.
 
-                if not table:
-                    logger.warning(f"페이지 {page}: 테이블을 찾을 수 없음")
-                    consecutive_errors += 1
-                    if consecutive_errors >= max_consecutive_errors:
-                        logger.error("연속 오류 한계 도달, 스크래핑 중단")
+        최대 max_workers개 페이지만 미리 요청하고, 결과는 항상 페이지 순서대로 병합.
+        이전 날짜를 만나거나 연속 오류 한계에 도달하면 더 이상 페이지를 요청하지 않음.
+        """
+        executor = ThreadPoolExecutor(max_workers=max_workers,
+                                      thread_name_prefix='listing-fetch')
+        pending: Dict[int, Future] = {}
+        next_page = 1
+
+        def dispatch() -> None:
+            nonlocal next_page
+            while len(pending) < max_workers and next_page <= MAX_PAGES_TO_FETCH:
+                pending[next_page] = executor.submit(self._fetch_listing_page, next_page)
+                next_page += 1
+
+        try:
+            dispatch()
+            page = 1
+            while page in pending:
+                future = pending.pop(page)
+                if progress_callback:
+                    progress_callback(page, MAX_PAGES_TO_FETCH)
+
+                try:
+                    page_reports = future.result()
+                except Exception as e:
+                    self._log_page_error(page, e)
+                    if not accumulator.add_error():
+                        break
+                else:
+                    if not accumulator.add_page(page, page_reports):
                         break
-                    continue
 
-                # 오류 카운터 리셋
-                consecutive_errors = 0
+                page += 1
+                dispatch()
+        finally:
+            # 중단 시 아직 시작하지 않은 페이지 요청은 취소
+            for future in pending.values():
+                future.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
 
-                rows = table.find_all('tr')
-                found_old_date = False
-                page_reports = 0
+    def _fetch_listing_page(self, page: int) -> Optional[List[ReportData]]:
+        """
+        목록 페이지 하나를 가져와서 파싱
 
-                for row in rows:
-                    cols = row.find_all('td')
-                    if len(cols) < 6:
-                        continue
+        Args:
+            page: 페이지 번호 (1부터)
 
-                    report = self._parse_report_row(cols)
-                    if report is None:
-                        continue
+        Returns:
+            페이지의 ReportData 리스트, 테이블이 없으면 None
 
-                    if report.date == date:
-                        reports.append(report)
-                        page_reports += 1
-                    elif reports and report.date != date:
-                        found_old_date = True
-                        break
+        Raises:
+            requests.RequestException: 네트워크/HTTP 오류 발생 시
+        """
+        url = f"{RESEARCH_URL}company_list.naver?&page={page}"
+        logger.debug(f"페이지 {page} 요청: {url}")
 
-                logger.debug(f"페이지 {page}: {page_reports}개 리포트 수집")
+        response = self.session.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()  # HTTP 에러 체크
 
-                if found_old_date:
-                    logger.debug(f"이전 날짜 리포트 발견, 스크래핑 종료")
-                    break
+        # 인코딩 자동 감지 시도
+        if response.encoding is None or response.encoding.lower() == 'iso-8859-1':
+            response.encoding = 'euc-kr'
 
-                # 마지막 행의 날짜 확인
-                if reports and rows:
-                    last_row = rows[-1] if rows else None
-                    if last_row:
-                        cols = last_row.find_all('td')
-                        if len(cols) >= 5:
-                            last_date = cols[4].get_text(strip=True)
-                            if last_date != date:
-                                logger.debug(f"마지막 행 날짜가 다름 ({last_date}), 스크래핑 종료")
-                                break
-
-            except requests.Timeout:
-                logger.warning(f"페이지 {page} 요청 타임아웃")
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    logger.error("연속 타임아웃 한계 도달, 스크래핑 중단")
-                    break
-                continue
+        return self._parse_listing_page(response.text)
 
-            except requests.HTTPError as e:
-                logger.warning(f"페이지 {page} HTTP 오류: {e}")
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    logger.error("연속 HTTP 오류 한계 도달, 스크래핑 중단")
-                    break
-                continue
+    def _parse_listing_page(self, html: str) -> Optional[List[ReportData]]:
+        """
+        목록 페이지 HTML에서 리포트 행 파싱 (listing_parser 설정에 따라 분기)
 
-            except requests.RequestException as e:
-                logger.error(f"페이지 {page} 네트워크 오류: {e}")
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    logger.error("연속 네트워크 오류 한계 도달, 스크래핑 중단")
-                    break
+        Args:
+            html: 목록 페이지 HTML
+
+        Returns:
+            ReportData 리스트, 테이블이 없으면 None
+        """
+        if self.listing_parser == 'lxml' and lxml_html is not None:
+            try:
+                return self._parse_listing_page_lxml(html)
+            except (etree.ParserError, ValueError) as e:
+                logger.debug(f"lxml 목록 파싱 실패, BeautifulSoup으로 재시도: {e}")
+        return self._parse_listing_page_bs4(html)
+
+    def _parse_listing_page_bs4(self, html: str) -> Optional[List[ReportData]]:
+        """BeautifulSoup 트리 기반 목록 파싱 (lxml이 없을 때의 fallback)"""
+        soup = BeautifulSoup(html, PARSER)
+        table = soup.find('table', class_='type_1')
+        if not table:
+            return None
+
+        reports: List[ReportData] = []
+        for row in table.find_all('tr'):
+            cols = row.find_all('td')
+            if len(cols) < 6:
                 continue
 
-            except Exception as e:
-                logger.error(f"페이지 {page} 예기치 않은 오류: {e}", exc_info=True)
-                consecutive_errors += 1
-                if consecutive_errors >= max_consecutive_errors:
-                    break
+            report = self._parse_report_row(cols)
+            if report is not None:
+                reports.append(report)
+        return reports
+
+    def _parse_listing_page_lxml(self, html: str) -> Optional[List[ReportData]]:
+        """
+        lxml XPath 기반 목록 파싱.
+        bs4 트리를 만들지 않고 table.type_1의 행만 직접 순회.
+        """
+        root = lxml_html.fromstring(html)
+        rows = root.xpath(_LISTING_ROWS_XPATH)
+        if not rows:
+            # 행이 없는 빈 테이블과 테이블 자체가 없는 경우 구분
+            has_table = root.xpath(
+                "//table[contains(concat(' ', normalize-space(@class), ' '), ' type_1 ')]"
+            )
+            return [] if has_table else None
+
+        reports: List[ReportData] = []
+        for row in rows:
+            cols = row.xpath('.//td')
+            if len(cols) < 6:
                 continue
 
-        logger.info(f"리포트 목록 가져오기 완료: 총 {len(reports)}개")
+            report = self._parse_report_row_lxml(cols)
+            if report is not None:
+                reports.append(report)
         return reports
 
+    @staticmethod
+    def _lxml_text(element) -> str:
+        """BeautifulSoup get_text(strip=True)와 같은 규칙으로 텍스트 추출"""
+        return ''.join(s.strip() for s in element.xpath('.//text()'))
+
+    def _parse_report_row_lxml(self, cols) -> Optional[ReportData]:
+        """
+        lxml td 요소 리스트에서 리포트 정보 파싱
+
+        Args:
+            cols: lxml td 요소 리스트
+
+        Returns:
+            ReportData 또는 None
+        """
+        try:
+            stock_links = cols[0].xpath('.//a')
+            if not stock_links:
+                return None
+            stock_name = self._lxml_text(stock_links[0])
+
+            title_links = cols[1].xpath('.//a')
+            if not title_links:
+                return None
+            title = self._lxml_text(title_links[0])
+            report_link = urljoin(RESEARCH_URL, title_links[0].get('href', ''))
+
+            firm = self._lxml_text(cols[2])
+
+            pdf_links = cols[3].xpath('.//a')
+            pdf_link = ""
+            if pdf_links:
+                pdf_link = self._validate_pdf_url(pdf_links[0].get('href', ''))
+
+            return ReportData(
+                stock=stock_name,
+                title=title,
+                firm=firm,
+                date=self._lxml_text(cols[4]),
+                link=report_link,
+                pdf_link=pdf_link,
+                views=self._lxml_text(cols[5]),
+            )
+
+        except (IndexError, AttributeError) as e:
+            logger.debug(f"행 파싱 실패: {e}")
+            return None
+        except Exception as e:
+            logger.warning(f"행 파싱 중 예기치 않은 오류: {e}")
+            return None
+
+    @staticmethod
+    def _log_page_error(page: int, error: Exception) -> None:
+        """목록 페이지 요청 오류 로깅"""
+        if isinstance(error, requests.Timeout):
+            logger.warning(f"페이지 {page} 요청 타임아웃")
+        elif isinstance(error, requests.HTTPError):
+            logger.warning(f"페이지 {page} HTTP 오류: {error}")
+        elif isinstance(error, requests.RequestException):
+            logger.error(f"페이지 {page} 네트워크 오류: {error}")
+        else:
+            logger.error(f"페이지 {page} 예기치 않은 오류: {error}",
+                         exc_info=(type(error), error, error.__traceback__))
+
     def _parse_report_row(self, cols) -> Optional[ReportData]:
         """
         테이블 행에서 리포트 정보 파싱
@@ -252,7 +548,17 @@ class NaverReportScraper:
             report: ReportData 객체
 
         Returns:
-            업데이트된 ReportData 객체
+            업데이트된 ReportData 객체 (실패하면 변경 없이 그대로)
+        """
+        self._fetch_meta(report)
+        return report
+
+    def _fetch_meta(self, report: ReportData) -> bool:
+        """
+        상세 페이지에서 투자의견/목표가를 읽어 report에 채우고 저장소에 기록
+
+        Returns:
+            상세 정보 표를 읽었으면 True (네트워크 오류, 표가 없는 페이지는 False — 저장하지 않음)
         """
         logger.debug(f"메타 정보 가져오기: {report.stock} - {report.title}")
 
@@ -267,20 +573,34 @@ class NaverReportScraper:
             soup = BeautifulSoup(response.text, PARSER)
 
             table = soup.find('table', class_='view_type_1')
-            if table:
-                rows = table.find_all('tr')
-                for row in rows:
-                    th = row.find('th')
-                    td = row.find('td')
-                    if th and td:
-                        label = th.get_text(strip=True)
-                        value = td.get_text(strip=True)
-                        if '투자의견' in label:
-                            report.opinion = value
-                            logger.debug(f"투자의견: {value}")
-                        elif '목표주가' in label or '목표가' in label:
-                            report.target = value
-                            logger.debug(f"목표가: {value}")
+            if not table:
+                # 오류/안내 페이지 — 저장하면 다시 요청하지 않으므로 기록하지 않고,
+                # 상세 페이지는 HTTP 캐시에 영구 보관되므로 캐시에서도 지워 다음에 다시 받게 함
+                logger.warning(f"메타 정보 표를 찾을 수 없음: {report.link}")
+                if self.session.cache is not None:
+                    self.session.cache.discard(report.link)
+                return False
+
+            rows = table.find_all('tr')
+            for row in rows:
+                th = row.find('th')
+                td = row.find('td')
+                if th and td:
+                    label = th.get_text(strip=True)
+                    value = td.get_text(strip=True)
+                    if '투자의견' in label:
+                        report.opinion = value
+                        logger.debug(f"투자의견: {value}")
+                    elif '목표주가' in label or '목표가' in label:
+                        report.target = value
+                        logger.debug(f"목표가: {value}")
+
+            if self.store is not None:
+                try:
+                    self.store.save_meta(report)
+                except sqlite3.Error as e:
+                    logger.warning(f"메타 정보 저장 실패: {e}")
+            return True
 
         except requests.Timeout:
             logger.warning(f"메타 정보 요청 타임아웃: {report.link}")
@@ -291,10 +611,102 @@ class NaverReportScraper:
         except Exception as e:
             logger.error(f"메타 정보 파싱 오류: {e}", exc_info=True)
 
-        return report
+        return False
+
+    def has_cached_meta(self, report: ReportData) -> bool:
+        """
+        메타 정보가 이미 있는지 확인.
+        객체에 없더라도 저장소에 있으면 저장된 값을 채워 넣고 True 반환.
+        """
+        if report.opinion != '-' or report.target != '-':
+            return True
+        if self.store is None:
+            return False
+
+        try:
+            if not self.store.has_meta(report.link):
+                return False
+            stored = self.store.get_report(report.link)
+        except sqlite3.Error as e:
+            logger.warning(f"저장된 메타 정보 조회 실패: {e}")
+            return False
+
+        if stored is not None:
+            report.opinion = stored.opinion
+            report.target = stored.target
+        return True
+
+    def fetch_report_meta_many(self, reports: List[ReportData],
+                               callback: Optional[Callable[[ReportData], None]] = None,
+                               max_workers: Optional[int] = None,
+                               rate_limit: Optional[float] = None,
+                               cancel_event: Optional[threading.Event] = None) -> List[ReportData]:
+        """
+        여러 리포트의 상세 정보(투자의견, 목표가)를 병렬로 가져오기
+
+        이미 메타 정보가 있는 리포트(객체 또는 저장소)는 요청하지 않음.
+
+        Args:
+            reports: ReportData 리스트
+            callback: 리포트 하나가 갱신될 때마다 호출 (워커 스레드에서 호출됨, 실패한 리포트는 호출 안 함)
+            max_workers: 동시 요청 수 (None이면 META_FETCH_MAX_WORKERS)
+            rate_limit: 초당 최대 요청 수 (None이면 META_FETCH_RATE_LIMIT)
+            cancel_event: 설정되면 남은 요청을 시작하지 않음
+
+        Returns:
+            네트워크로 새로 가져온 ReportData 리스트 (완료 순서, 실패한 리포트 제외)
+        """
+        if max_workers is None:
+            max_workers = META_FETCH_MAX_WORKERS
+        if rate_limit is None:
+            rate_limit = META_FETCH_RATE_LIMIT
+
+        to_fetch: List[ReportData] = []
+        for report in reports:
+            if self.has_cached_meta(report):
+                if callback and (report.opinion != '-' or report.target != '-'):
+                    callback(report)
+            else:
+                to_fetch.append(report)
+
+        logger.info(f"메타 정보 일괄 요청: {len(to_fetch)}개 "
+                    f"(캐시 {len(reports) - len(to_fetch)}개 건너뜀)")
+        if not to_fetch:
+            return []
+
+        limiter = _RateLimiter(rate_limit)
+
+        def worker(report: ReportData) -> Optional[ReportData]:
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            limiter.wait()
+            if cancel_event is not None and cancel_event.is_set():
+                return None
+            return report if self._fetch_meta(report) else None
+
+        fetched: List[ReportData] = []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers),
+                                thread_name_prefix='meta-fetch') as executor:
+            futures = [executor.submit(worker, report) for report in to_fetch]
+            for future in as_completed(futures):
+                try:
+                    report = future.result()
+                except Exception as e:
+                    logger.error(f"메타 정보 일괄 요청 오류: {e}", exc_info=True)
+                    continue
+                if report is None:
+                    continue
+                fetched.append(report)
+                if callback:
+                    callback(report)
+
+        logger.info(f"메타 정보 일괄 요청 완료: {len(fetched)}개")
+        return fetched
 
     def close(self) -> None:
         """세션 종료"""
+        if self.session.cache is not None:
+            logger.info(f"HTTP 캐시 통계: {self.session.cache.stats}")
         try:
             self.session.close()
             logger.debug("스크래퍼 세션 종료됨")
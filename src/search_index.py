@@ -0,0 +1,365 @@
+"""
+리포트 전문 검색 색인 모듈
+- ReportSearchIndex: 받은 리포트 PDF 전체의 페이지 텍스트 색인 (SQLite FTS5 trigram)
+- SearchIndexer: PDF를 백그라운드에서 색인 (텍스트 추출은 별도 프로세스)
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from .config import (
+    PDF_RENDER_SCALE, SEARCH_INDEX_DB_PATH,
+    SEARCH_INDEX_MAX_RESULTS, SEARCH_INDEX_MAX_WORKERS
+)
+from .models import ReportData
+from .text_cache import PageText, normalize_query
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    content_hash TEXT PRIMARY KEY,
+    link TEXT NOT NULL,
+    pdf_link TEXT NOT NULL,
+    stock TEXT NOT NULL,
+    title TEXT NOT NULL,
+    firm TEXT NOT NULL,
+    date TEXT NOT NULL,
+    pages INTEGER NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_documents_date ON documents (date);
+CREATE TABLE IF NOT EXISTS page_geometry (
+    content_hash TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    geometry BLOB NOT NULL,
+    PRIMARY KEY (content_hash, page)
+) WITHOUT ROWID;
+"""
+
+# trigram 토크나이저: 띄어쓰기 없는 한국어도 부분 문자열로 찾음 (SQLite 3.34+)
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS page_text USING fts5(
+    text, content_hash UNINDEXED, page UNINDEXED, tokenize='trigram'
+);
+"""
+
+# FTS5/trigram을 쓸 수 없는 SQLite에서는 일반 테이블 + instr 검색
+_PLAIN_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_text (
+    text TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    PRIMARY KEY (content_hash, page)
+);
+"""
+
+# trigram 색인은 3글자 이상 검색어만 사용 가능 (짧은 검색어는 전체 스캔)
+_TRIGRAM_MIN_CHARS = 3
+
+# 색인할 페이지: (정규화된 검색용 문자열, 글자 좌표) — PageText.pack() 결과
+PackedPage = Tuple[str, bytes]
+
+
+@dataclass
+class SearchHit:
+    """전체 리포트 검색 결과 (리포트의 한 페이지)"""
+    report: ReportData
+    content_hash: str
+    page: int
+    rects: List[Tuple[int, int, int, int]] = field(default_factory=list)  # 렌더링 좌표 (줌 1.0)
+
+    @property
+    def count(self) -> int:
+        return len(self.rects)
+
+
+def extract_search_pages(source: Union[str, bytes]) -> List[PackedPage]:
+    """
+    PDF 전체 페이지의 검색용 텍스트/글자 좌표 추출 (작업 프로세스에서 실행)
+
+    Args:
+        source: PDF 경로 또는 PDF 바이트
+
+    Returns:
+        페이지 순서대로 PackedPage 리스트
+    """
+    if fitz is None:
+        raise RuntimeError("PDF 지원 라이브러리가 설치되지 않음")
+
+    if isinstance(source, bytes):
+        doc = fitz.open(stream=source, filetype="pdf")
+    else:
+        doc = fitz.open(source)
+    try:
+        return [PageText.from_rawdict(page.get_text("rawdict", flags=fitz.TEXTFLAGS_TEXT)).pack()
+                for page in doc]
+    finally:
+        doc.close()
+
+
+class ReportSearchIndex:
+    """
+    리포트 전문 검색 색인
+
+    PDF 내용 해시마다 페이지별 검색용 문자열(대소문자/공백 정규화)을 FTS5 trigram 테이블에,
+    글자 좌표는 압축해 별도 테이블에 저장한다. 검색은 색인으로 후보 페이지를 찾고
+    저장된 글자 좌표로 적중 사각형을 계산하므로 PDF를 다시 열지 않는다.
+    """
+
+    def __init__(self, db_path: str = SEARCH_INDEX_DB_PATH) -> None:
+        if db_path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        # 색인 스레드(쓰기)와 UI 스레드(검색)에서 함께 사용 (접근은 _lock으로 직렬화)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            try:
+                self._conn.executescript(_FTS_SCHEMA)
+                self.fts_enabled = True
+            except sqlite3.OperationalError as e:
+                logger.warning(f"FTS5 trigram 사용 불가, 일반 검색으로 대체: {e}")
+                self._conn.executescript(_PLAIN_SCHEMA)
+                self.fts_enabled = False
+
+        logger.debug(f"ReportSearchIndex 초기화됨: {db_path} (fts={self.fts_enabled})")
+
+    def is_indexed(self, content_hash: str) -> bool:
+        """색인된 문서인지"""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT 1 FROM documents WHERE content_hash = ?", (content_hash,)
+            ).fetchone() is not None
+
+    def add_document(self, content_hash: str, report: Optional[ReportData],
+                     pages: List[PackedPage]) -> None:
+        """
+        문서 색인 (이미 있으면 교체)
+
+        Args:
+            content_hash: PDF 내용 해시
+            report: 리포트 정보 (모르면 None)
+            pages: 페이지 순서대로 PackedPage 리스트
+        """
+        report = report or ReportData(stock='', title='', firm='', date='', link='')
+        with self._lock, self._conn:
+            self._delete(content_hash)
+            self._conn.execute(
+                """
+                INSERT INTO documents (content_hash, link, pdf_link, stock, title, firm,
+                                       date, pages, indexed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (content_hash, report.link, report.pdf_link, report.stock, report.title,
+                 report.firm, report.date, len(pages), time.time()),
+            )
+            self._conn.executemany(
+                "INSERT INTO page_text (text, content_hash, page) VALUES (?, ?, ?)",
+                [(text, content_hash, page) for page, (text, _) in enumerate(pages) if text],
+            )
+            self._conn.executemany(
+                "INSERT INTO page_geometry (content_hash, page, geometry) VALUES (?, ?, ?)",
+                [(content_hash, page, geometry) for page, (text, geometry) in enumerate(pages) if text],
+            )
+        logger.debug(f"검색 색인 추가: {content_hash[:12]} ({len(pages)}페이지)")
+
+    def remove_document(self, content_hash: str) -> None:
+        """문서 색인 삭제"""
+        with self._lock, self._conn:
+            self._delete(content_hash)
+
+    def _delete(self, content_hash: str) -> None:
+        self._conn.execute("DELETE FROM documents WHERE content_hash = ?", (content_hash,))
+        self._conn.execute("DELETE FROM page_text WHERE content_hash = ?", (content_hash,))
+        self._conn.execute("DELETE FROM page_geometry WHERE content_hash = ?", (content_hash,))
+
+    def search(self, query: str, date_prefix: Optional[str] = None,
+               limit: int = SEARCH_INDEX_MAX_RESULTS) -> List[SearchHit]:
+        """
+        전체 리포트 검색 (대소문자/공백 무시)
+
+        Args:
+            query: 검색어
+            date_prefix: 리포트 날짜 앞부분 (예: '24.05.13' 하루, '24.05.' 한 달, None이면 전체)
+            limit: 최대 결과 페이지 수
+
+        Returns:
+            SearchHit 리스트 (최신 리포트부터, 리포트 안에서는 페이지 순서)
+        """
+        needle = normalize_query(query)
+        if not needle:
+            return []
+
+        if self.fts_enabled and len(needle) >= _TRIGRAM_MIN_CHARS:
+            condition = "page_text MATCH ?"
+            param = '"' + needle.replace('"', '""') + '"'
+        else:
+            condition = "instr(page_text.text, ?) > 0"
+            param = needle
+
+        sql = f"""
+            SELECT page_text.text, page_text.content_hash, page_text.page, g.geometry,
+                   d.link, d.pdf_link, d.stock, d.title, d.firm, d.date
+            FROM page_text
+            JOIN documents d ON d.content_hash = page_text.content_hash
+            JOIN page_geometry g ON g.content_hash = page_text.content_hash
+                                AND g.page = page_text.page
+            WHERE {condition}
+        """
+        params: list = [param]
+        if date_prefix:
+            sql += " AND substr(d.date, 1, ?) = ?"
+            params += [len(date_prefix), date_prefix]
+        sql += " ORDER BY d.date DESC, d.stock, page_text.content_hash, page_text.page LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        hits: List[SearchHit] = []
+        reports: Dict[str, ReportData] = {}
+        for text, content_hash, page, geometry, link, pdf_link, stock, title, firm, date in rows:
+            rects = PageText.from_packed(text, geometry).search(needle)
+            if not rects:
+                continue
+            report = reports.get(content_hash)
+            if report is None:
+                report = ReportData(stock=stock, title=title, firm=firm, date=date,
+                                    link=link, pdf_link=pdf_link)
+                reports[content_hash] = report
+            hits.append(SearchHit(
+                report=report,
+                content_hash=content_hash,
+                page=page,
+                rects=[(int(x0 * PDF_RENDER_SCALE), int(y0 * PDF_RENDER_SCALE),
+                        int(x1 * PDF_RENDER_SCALE), int(y1 * PDF_RENDER_SCALE))
+                       for x0, y0, x1, y1 in rects],
+            ))
+
+        logger.debug(f"전체 검색 '{query}': {len(hits)}페이지")
+        return hits
+
+    def count(self) -> int:
+        """색인된 문서 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def close(self) -> None:
+        """연결 종료"""
+        try:
+            with self._lock:
+                self._conn.close()
+            logger.debug("ReportSearchIndex 연결 종료됨")
+        except sqlite3.Error as e:
+            logger.warning(f"ReportSearchIndex 종료 중 오류: {e}")
+
+
+class SearchIndexer:
+    """
+    백그라운드 PDF 색인
+
+    색인 스레드 하나가 요청을 순서대로 처리한다. PyMuPDF는 스레드 간 동시 사용을 지원하지 않으므로
+    (UI/렌더 작업자가 PDFHandler 문서를 쓰는 중) 텍스트 추출은 작업 프로세스에서 실행하고,
+    결과만 받아 색인에 저장한다. 이미 색인된 문서는 건너뛴다.
+    """
+
+    def __init__(self, index: ReportSearchIndex,
+                 max_workers: int = SEARCH_INDEX_MAX_WORKERS) -> None:
+        """
+        Args:
+            index: 저장할 검색 색인
+            max_workers: 텍스트 추출 프로세스 수
+        """
+        self._index = index
+        self._max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='search-index')
+        self._pool: Optional[ProcessPoolExecutor] = None  # 첫 색인 요청 때 생성
+
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._futures: List[Future] = []
+        self._closed = False
+
+        logger.debug("SearchIndexer 초기화됨")
+
+    def submit(self, content_hash: str, source: Union[str, bytes],
+               report: Optional[ReportData] = None) -> bool:
+        """
+        색인 예약 (이미 예약된 문서는 무시)
+
+        Args:
+            content_hash: PDF 내용 해시
+            source: PDF 경로 또는 PDF 바이트
+            report: 리포트 정보
+
+        Returns:
+            예약했으면 True
+        """
+        with self._lock:
+            if self._closed or not content_hash or content_hash in self._pending:
+                return False
+            self._pending.add(content_hash)
+            self._futures = [f for f in self._futures if not f.done()]
+            self._futures.append(self._executor.submit(self._run, content_hash, source, report))
+        return True
+
+    def _run(self, content_hash: str, source: Union[str, bytes],
+             report: Optional[ReportData]) -> bool:
+        """문서 하나 색인 (색인 스레드)"""
+        try:
+            if self._index.is_indexed(content_hash):
+                return False
+            pages = self._extract(source)
+            if pages is None:
+                return False
+            self._index.add_document(content_hash, report, pages)
+            logger.info(f"검색 색인 완료: {report.stock if report else content_hash[:12]} "
+                        f"({len(pages)}페이지)")
+            return True
+        except Exception as e:
+            logger.warning(f"검색 색인 실패 ({content_hash[:12]}): {e}")
+            return False
+        finally:
+            with self._lock:
+                self._pending.discard(content_hash)
+
+    def _extract(self, source: Union[str, bytes]) -> Optional[List[PackedPage]]:
+        """작업 프로세스에서 텍스트 추출 (종료 중이면 None)"""
+        with self._lock:
+            if self._closed:
+                return None
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self._max_workers)
+            future = self._pool.submit(extract_search_pages, source)
+        return future.result()
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """예약된 색인이 끝날 때까지 대기"""
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures, timeout=timeout)
+
+    def close(self) -> None:
+        """색인 중단 및 작업 풀 종료"""
+        with self._lock:
+            self._closed = True
+            pool = self._pool
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        logger.debug("SearchIndexer 종료됨")
@@ -0,0 +1,129 @@
+"""
+공간 인덱스 모듈
+- GridIndex: 균일 격자 기반 사각형 인덱스 (어노테이션 적중 검사용)
+"""
+
+import logging
+from typing import Any, Dict, Hashable, List, Set, Tuple
+
+from .config import ANNOTATION_GRID_CELL_SIZE
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+BBox = Tuple[float, float, float, float]
+
+
+class GridIndex:
+    """
+    균일 격자 공간 인덱스
+
+    항목마다 경계 사각형(bbox)을 받아 겹치는 격자 칸에 등록한다.
+    점/사각형 조회는 해당 칸의 항목만 확인하므로 항목 수와 무관하게 칸 크기에 비례.
+    조회 결과는 삽입 순서대로 반환 (겹친 항목 중 먼저 추가된 것이 앞).
+    """
+
+    def __init__(self, cell_size: float = ANNOTATION_GRID_CELL_SIZE) -> None:
+        """
+        Args:
+            cell_size: 격자 칸 한 변 크기 (인덱스 좌표 단위)
+        """
+        if cell_size <= 0:
+            raise ValueError(f"cell_size는 양수여야 함: {cell_size}")
+        self._cell_size = cell_size
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._entries: Dict[Hashable, Tuple[BBox, int, Any]] = {}  # 키 -> (bbox, 삽입 순번, 값)
+        self._seq = 0
+
+    def _cell_range(self, bbox: BBox) -> Tuple[int, int, int, int]:
+        x0, y0, x1, y1 = bbox
+        size = self._cell_size
+        return int(x0 // size), int(y0 // size), int(x1 // size), int(y1 // size)
+
+    @staticmethod
+    def _normalize(bbox: BBox) -> BBox:
+        x0, y0, x1, y1 = bbox
+        return min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)
+
+    def insert(self, key: Hashable, bbox: BBox, value: Any = None) -> None:
+        """
+        항목 등록 (같은 키가 있으면 교체)
+
+        Args:
+            key: 항목 키
+            bbox: 경계 사각형 (x0, y0, x1, y1)
+            value: 조회 시 돌려줄 값 (None이면 키)
+        """
+        if key in self._entries:
+            self.remove(key)
+
+        bbox = self._normalize(bbox)
+        cx0, cy0, cx1, cy1 = self._cell_range(bbox)
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                self._cells.setdefault((cx, cy), set()).add(key)
+
+        self._seq += 1
+        self._entries[key] = (bbox, self._seq, key if value is None else value)
+
+    def remove(self, key: Hashable) -> bool:
+        """항목 제거 (없으면 False)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+
+        cx0, cy0, cx1, cy1 = self._cell_range(entry[0])
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell is not None:
+                    cell.discard(key)
+                    if not cell:
+                        del self._cells[(cx, cy)]
+        return True
+
+    def clear(self) -> None:
+        """전체 비우기"""
+        self._cells.clear()
+        self._entries.clear()
+
+    def query_point(self, x: float, y: float, margin: float = 0.0) -> List[Any]:
+        """
+        점을 포함하는 항목 (bbox를 margin만큼 넓혀서 판정)
+
+        Returns:
+            값 리스트 (삽입 순서)
+        """
+        return self.query_rect((x, y, x, y), margin)
+
+    def query_rect(self, rect: BBox, margin: float = 0.0) -> List[Any]:
+        """
+        사각형과 겹치는 항목 (bbox를 margin만큼 넓혀서 판정)
+
+        Returns:
+            값 리스트 (삽입 순서)
+        """
+        qx0, qy0, qx1, qy1 = self._normalize(rect)
+        qx0, qy0, qx1, qy1 = qx0 - margin, qy0 - margin, qx1 + margin, qy1 + margin
+
+        cx0, cy0, cx1, cy1 = self._cell_range((qx0, qy0, qx1, qy1))
+        candidates: Set[Hashable] = set()
+        for cy in range(cy0, cy1 + 1):
+            for cx in range(cx0, cx1 + 1):
+                cell = self._cells.get((cx, cy))
+                if cell:
+                    candidates.update(cell)
+
+        hits = []
+        for key in candidates:
+            (x0, y0, x1, y1), seq, value = self._entries[key]
+            if x0 <= qx1 and qx0 <= x1 and y0 <= qy1 and qy0 <= y1:
+                hits.append((seq, value))
+        hits.sort(key=lambda hit: hit[0])
+        return [value for _, value in hits]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,275 @@
+"""
+텍스트 캐시 모듈
+- PageText: 한 페이지의 텍스트/블록/단어와 글자별 좌표 (rawdict 한 번 추출)
+- TextCache: 문서 단위 페이지 텍스트 캐시 (검색/자동 하이라이트용)
+"""
+
+import logging
+import math
+import threading
+import zlib
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+Rect = Tuple[float, float, float, float]
+# get_text('words')와 같은 형식: (x0, y0, x1, y1, 단어, 블록 번호, 라인 번호, 단어 번호)
+Word = Tuple[float, float, float, float, str, int, int, int]
+
+
+def _fold(c: str) -> str:
+    """검색용 글자 정규화 (대소문자 무시, 길이가 바뀌는 글자는 그대로)"""
+    lowered = c.lower()
+    return lowered if len(lowered) == 1 else c
+
+
+def normalize_query(query: str) -> str:
+    """검색어 정규화: 공백 연속은 한 칸, 대소문자 무시"""
+    return ' '.join(''.join(_fold(c) for c in query).split())
+
+
+class PageText:
+    """
+    페이지 텍스트 추출 결과
+
+    rawdict의 글자 좌표를 보관해 두고 검색은 정규화된 문자열에서 찾은 뒤
+    글자 좌표를 라인별로 합쳐 사각형을 만든다 (page.search_for와 같은 결과 형식).
+    공백 연속과 줄바꿈은 한 칸으로 취급하므로 여러 줄에 걸친 구절도 찾는다.
+    좌표는 모두 PDF 포인트 (줌 1.0, PDF_RENDER_SCALE 적용 전).
+    """
+
+    __slots__ = ('text', 'blocks', 'line_boxes', 'words',
+                 '_search_text', '_char_boxes', '_char_lines')
+
+    def __init__(self, text: str, blocks: List[str], words: List[Word],
+                 search_text: str, char_boxes: List[Optional[Rect]],
+                 char_lines: List[int], line_boxes: Optional[List[List[Rect]]] = None) -> None:
+        self.text = text  # get_text()와 같은 전체 텍스트
+        self.blocks = blocks  # 텍스트 블록(단락) 리스트, 블록 내부 줄바꿈 보존
+        # blocks와 같은 순서로 블록 내 라인별 사각형 (공백을 뺀 글자 좌표 합, 빈 라인은 라인 bbox)
+        self.line_boxes = line_boxes if line_boxes is not None else []
+        self.words = words
+        self._search_text = search_text  # 정규화된 검색용 문자열
+        self._char_boxes = char_boxes  # 검색용 문자열 글자별 좌표 (공백 구분자는 None)
+        self._char_lines = char_lines  # 검색용 문자열 글자별 라인 번호 (페이지 전체 기준)
+
+    @classmethod
+    def from_rawdict(cls, raw: Dict[str, Any]) -> 'PageText':
+        """page.get_text('rawdict') 결과로 생성"""
+        text_parts: List[str] = []
+        blocks: List[str] = []
+        line_boxes: List[List[Rect]] = []
+        words: List[Word] = []
+        search_chars: List[str] = []
+        char_boxes: List[Optional[Rect]] = []
+        char_lines: List[int] = []
+
+        line_id = 0
+        block_no = 0
+        for block in raw.get('blocks', ()):
+            if block.get('type', 0) != 0:
+                continue  # 이미지 블록
+
+            block_lines: List[str] = []
+            block_boxes: List[Rect] = []
+            for line_no, line in enumerate(block.get('lines', ())):
+                chars = [ch for span in line.get('spans', ()) for ch in span.get('chars', ())]
+                line_text = ''.join(ch['c'] for ch in chars)
+                block_lines.append(line_text)
+
+                # 라인 사각형: 검색 결과와 같도록 공백을 뺀 글자 좌표의 합
+                visible = [ch['bbox'] for ch in chars if not ch['c'].isspace()]
+                if visible:
+                    block_boxes.append((min(b[0] for b in visible), min(b[1] for b in visible),
+                                        max(b[2] for b in visible), max(b[3] for b in visible)))
+                else:
+                    block_boxes.append(tuple(line.get('bbox', (0.0, 0.0, 0.0, 0.0))))
+
+                # 단어: 공백으로 나뉜 글자 묶음의 좌표 합
+                word: List[Dict[str, Any]] = []
+                word_no = 0
+                for ch in chars + [None]:
+                    if ch is not None and not ch['c'].isspace():
+                        word.append(ch)
+                        continue
+                    if word:
+                        words.append((
+                            min(w['bbox'][0] for w in word), min(w['bbox'][1] for w in word),
+                            max(w['bbox'][2] for w in word), max(w['bbox'][3] for w in word),
+                            ''.join(w['c'] for w in word), block_no, line_no, word_no,
+                        ))
+                        word_no += 1
+                        word = []
+
+                # 검색용 문자열: 라인/블록 경계와 공백 연속은 한 칸
+                for ch in chars:
+                    if ch['c'].isspace():
+                        if search_chars and search_chars[-1] != ' ':
+                            search_chars.append(' ')
+                            char_boxes.append(None)
+                            char_lines.append(line_id)
+                        continue
+                    search_chars.append(_fold(ch['c']))
+                    char_boxes.append(tuple(ch['bbox']))
+                    char_lines.append(line_id)
+                if search_chars and search_chars[-1] != ' ':
+                    search_chars.append(' ')
+                    char_boxes.append(None)
+                    char_lines.append(line_id)
+                line_id += 1
+
+            if block_lines:
+                block_text = ''.join(line + '\n' for line in block_lines)
+                text_parts.append(block_text)
+                if block_text.strip():
+                    blocks.append(block_text)
+                    line_boxes.append(block_boxes)
+            block_no += 1
+
+        return cls(''.join(text_parts), blocks, words, ''.join(search_chars),
+                   char_boxes, char_lines, line_boxes)
+
+    @classmethod
+    def from_packed(cls, search_text: str, geometry: bytes) -> 'PageText':
+        """
+        pack() 결과로 검색 전용 PageText 복원 (text/blocks/line_boxes/words는 비어 있음)
+
+        Args:
+            search_text: 정규화된 검색용 문자열
+            geometry: 글자 좌표/라인 번호 (zlib 압축)
+        """
+        n = len(search_text)
+        data = zlib.decompress(geometry)
+        boxes = array('f')
+        boxes.frombytes(data[:n * 16])
+        lines = array('i')
+        lines.frombytes(data[n * 16:])
+
+        char_boxes: List[Optional[Rect]] = []
+        for i in range(n):
+            x0 = boxes[i * 4]
+            char_boxes.append(None if math.isnan(x0) else
+                              (x0, boxes[i * 4 + 1], boxes[i * 4 + 2], boxes[i * 4 + 3]))
+        return cls('', [], [], search_text, char_boxes, lines.tolist())
+
+    def pack(self) -> Tuple[str, bytes]:
+        """
+        검색에 필요한 부분만 직렬화 (검색 색인 저장용)
+
+        Returns:
+            (정규화된 검색용 문자열, 글자 좌표(float32)/라인 번호(int32)를 zlib 압축한 바이트)
+        """
+        nan = float('nan')
+        boxes = array('f')
+        for box in self._char_boxes:
+            boxes.extend(box if box is not None else (nan, nan, nan, nan))
+        lines = array('i', self._char_lines)
+        return self._search_text, zlib.compress(boxes.tobytes() + lines.tobytes())
+
+    def search(self, query: str) -> List[Rect]:
+        """
+        텍스트 검색 (대소문자 무시, 공백/줄바꿈 무시)
+
+        Args:
+            query: 검색어
+
+        Returns:
+            적중마다 라인별 사각형 리스트 (적중 순서, 여러 줄에 걸치면 줄마다 하나)
+        """
+        needle = normalize_query(query)
+        if not needle:
+            return []
+
+        rects: List[Rect] = []
+        last_line = -1
+        haystack = self._search_text
+        start = haystack.find(needle)
+        while start >= 0:
+            end = start + len(needle)
+            for line, rect in self._span_rects(start, end):
+                # 같은 줄에서 바로 이어지는 적중은 한 사각형으로 (search_for와 동일)
+                if line == last_line and abs(rect[0] - rects[-1][2]) < 0.01:
+                    prev = rects[-1]
+                    rects[-1] = (prev[0], min(prev[1], rect[1]), rect[2], max(prev[3], rect[3]))
+                else:
+                    rects.append(rect)
+                last_line = line
+            start = haystack.find(needle, end)
+        return rects
+
+    def count(self, query: str) -> int:
+        """검색어 적중 수 (좌표 계산 없이)"""
+        needle = normalize_query(query)
+        return self._search_text.count(needle) if needle else 0
+
+    def _span_rects(self, start: int, end: int) -> List[Tuple[int, Rect]]:
+        """검색용 문자열 구간의 글자 좌표를 라인별로 합친 (라인 번호, 사각형) 리스트"""
+        rects: List[Tuple[int, Rect]] = []
+        current_line = -1
+        x0 = y0 = x1 = y1 = 0.0
+        for i in range(start, end):
+            box = self._char_boxes[i]
+            if box is None:
+                continue
+            line = self._char_lines[i]
+            if line != current_line:
+                if current_line >= 0:
+                    rects.append((current_line, (x0, y0, x1, y1)))
+                current_line = line
+                x0, y0, x1, y1 = box
+            else:
+                x0, y0 = min(x0, box[0]), min(y0, box[1])
+                x1, y1 = max(x1, box[2]), max(y1, box[3])
+        if current_line >= 0:
+            rects.append((current_line, (x0, y0, x1, y1)))
+        return rects
+
+
+class TextCache:
+    """
+    문서 단위 페이지 텍스트 캐시
+
+    페이지마다 처음 요청될 때 한 번만 추출하고(loader 호출), 이후 검색/블록/텍스트 조회는
+    캐시에서 처리한다. 문서가 바뀌면 clear()로 비운다.
+    """
+
+    def __init__(self, loader: Callable[[int], Optional[PageText]]) -> None:
+        """
+        Args:
+            loader: 페이지 번호 -> PageText (추출 실패 시 None, 캐시하지 않음)
+        """
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._pages: Dict[int, PageText] = {}
+        self._generation = 0  # clear() 시 증가 (비우기 전에 시작한 추출 결과는 버림)
+
+    def get(self, page_num: int) -> Optional[PageText]:
+        """페이지 텍스트 (없으면 추출해 캐시)"""
+        with self._lock:
+            page_text = self._pages.get(page_num)
+            generation = self._generation
+        if page_text is not None:
+            return page_text
+
+        page_text = self._loader(page_num)
+        if page_text is not None:
+            with self._lock:
+                if generation == self._generation:
+                    page_text = self._pages.setdefault(page_num, page_text)
+        return page_text
+
+    def __contains__(self, page_num: int) -> bool:
+        with self._lock:
+            return page_num in self._pages
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pages)
+
+    def clear(self) -> None:
+        """전체 비우기"""
+        with self._lock:
+            self._pages.clear()
+            self._generation += 1
@@ -8,20 +8,34 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from datetime import datetime
 import threading
+import time
 import webbrowser
 import os
-from typing import Optional, List
+import sqlite3
+from typing import Optional, List, Tuple
 
 from ..config import (
     COLORS, WINDOW_TITLE, WINDOW_GEOMETRY, WINDOW_MIN_SIZE,
-    ZOOM_STEP, ZOOM_MIN, ZOOM_MAX
+    ZOOM_STEP, ZOOM_MIN, ZOOM_MAX, REPORT_DB_PATH, HTTP_CACHE_DIR, PDF_CACHE_DIR,
+    PREFETCH_AHEAD, ANNOTATION_DB_PATH, ANNOTATION_SAVE_DELAY_MS, EXPORT_DIR,
+    SEARCH_INDEX_DB_PATH, HIGHLIGHT_CACHE_DB_PATH
 )
-from ..models import ReportData
+from ..annotation_store import AnnotationStore
+from ..http_cache import HTTPCache
+from ..models import ReportData, Annotation
+from ..report_store import ReportStore
 from ..scraper import NaverReportScraper
-from ..pdf_handler import PDFHandler
+from ..pdf_cache import PDFCache
+from ..pdf_handler import PDFHandler, PDFDownloadCancelled
+from ..pdf_export import export_annotated_pdf, batch_export
+from ..prefetcher import PDFPrefetcher
+from ..render_worker import PageRenderWorker
+from ..search_index import ReportSearchIndex, SearchIndexer, SearchHit
 from ..auto_highlighter import AutoHighlighter
+from ..highlight_cache import HighlightCache, HighlightCacheWarmer
+from ..highlight_jobs import DocumentHighlighter, ResolvedSpan, analyze_page_text
 from .styles import setup_styles
-from .widgets import ReportListWidget, PDFViewerWidget, AnnotationToolbar
+from .widgets import ReportListWidget, PDFViewerWidget, AnnotationToolbar, ReportSearchDialog
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -45,11 +59,35 @@ class NaverReportViewerApp:
         self._data_lock = threading.Lock()
         self._load_generation: int = 0  # 리포트/PDF 로드 세대 카운터
         self._is_loading_reports: bool = False  # 리포트 로딩 중복 방지
+        self._meta_cancel_event: Optional[threading.Event] = None  # 메타 일괄 요청 취소
+        self._pdf_cancel_event: Optional[threading.Event] = None  # 진행 중인 PDF 다운로드 취소
+        self._reselect_link: Optional[str] = None  # 목록 새로고침 후 선택 복원 중인 리포트 링크
 
         # 데이터
-        self.scraper = NaverReportScraper()
-        self.pdf_handler = PDFHandler()
+        self.report_store = self._open_report_store()
+        self.scraper = NaverReportScraper(store=self.report_store,
+                                          http_cache=self._open_http_cache())
+        self.pdf_cache = self._open_pdf_cache()
+        self.pdf_handler = PDFHandler(pdf_cache=self.pdf_cache)
+        self.annotation_store = self._open_annotation_store()
+        self.pdf_handler.on_annotations_changed = self._schedule_annotation_save
+        self.render_worker = PageRenderWorker(self.pdf_handler)
+        self.prefetcher = PDFPrefetcher(self.pdf_cache) if self.pdf_cache is not None else None
+        # 전체 리포트 검색 색인 (연 PDF와 미리 받은 PDF를 백그라운드에서 색인)
+        self.search_index = self._open_search_index()
+        self.search_indexer = SearchIndexer(self.search_index) if self.search_index is not None else None
+        # 자동 하이라이트 결과 캐시 (받은 PDF는 백그라운드에서 미리 분석)
+        self.highlight_cache = self._open_highlight_cache()
+        self.highlight_warmer = HighlightCacheWarmer(self.highlight_cache) \
+            if self.highlight_cache is not None else None
+        if self.prefetcher is not None and \
+                (self.search_indexer is not None or self.highlight_warmer is not None):
+            self.prefetcher.on_downloaded = self._on_pdf_prefetched
         self._auto_highlighter = AutoHighlighter()
+        # 문서 전체 자동 하이라이트 (작업 프로세스에서 페이지 묶음 분석)
+        self.document_highlighter = DocumentHighlighter()
+        self._document_highlight_job: Optional[object] = None  # 진행 중인 작업 토큰
+        self._document_highlight_progress: Tuple[int, int] = (0, 0)  # (분석한 페이지, 추가한 어노테이션)
         self._llm_client = None  # LLM 통합 단계에서 초기화
         self._reports: List[ReportData] = []
         self._current_report: Optional[ReportData] = None
@@ -60,10 +98,14 @@ class NaverReportViewerApp:
         self.draw_start: Optional[tuple] = None
         self.temp_rect: Optional[int] = None
         self.temp_line: Optional[int] = None
+        self._annotation_save_pending: Optional[str] = None  # 예약된 어노테이션 저장 (after id)
 
         # 검색 관련
         self._search_results: List[dict] = []
         self._current_search_index: int = 0
+        self._report_search_dialog: Optional[ReportSearchDialog] = None
+        self._report_search_hits: List[SearchHit] = []  # 마지막 전체 리포트 검색 결과
+        self._pending_search_hit: Optional[tuple] = None  # PDF 로드 후 이동할 (검색 결과, 검색어)
 
         # UI 생성
         self._create_ui()
@@ -71,11 +113,66 @@ class NaverReportViewerApp:
         # 키보드 단축키 바인딩
         self._bind_keyboard_shortcuts()
 
-        # 시작 시 자동으로 리포트 로드
+        # 시작 시 저장된 리포트를 먼저 표시하고, 백그라운드에서 새로고침
+        self._load_stored_reports()
         self.root.after(500, self.load_reports)
 
         logger.info("NaverReportViewerApp 초기화 완료")
 
+    @staticmethod
+    def _open_report_store() -> Optional[ReportStore]:
+        """로컬 리포트 저장소 열기 (실패 시 저장 없이 동작)"""
+        try:
+            return ReportStore(REPORT_DB_PATH)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"리포트 저장소를 열 수 없음, 저장 없이 진행: {e}")
+            return None
+
+    @staticmethod
+    def _open_http_cache() -> Optional[HTTPCache]:
+        """HTTP 응답 캐시 열기 (실패 시 캐시 없이 동작)"""
+        try:
+            return HTTPCache(HTTP_CACHE_DIR)
+        except OSError as e:
+            logger.warning(f"HTTP 캐시를 열 수 없음, 캐시 없이 진행: {e}")
+            return None
+
+    @staticmethod
+    def _open_pdf_cache() -> Optional[PDFCache]:
+        """PDF 디스크 캐시 열기 (실패 시 매번 다운로드)"""
+        try:
+            return PDFCache(PDF_CACHE_DIR)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"PDF 캐시를 열 수 없음, 캐시 없이 진행: {e}")
+            return None
+
+    @staticmethod
+    def _open_annotation_store() -> Optional[AnnotationStore]:
+        """어노테이션 저장소 열기 (실패 시 메모리에만 보관)"""
+        try:
+            return AnnotationStore(ANNOTATION_DB_PATH)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"어노테이션 저장소를 열 수 없음, 저장 없이 진행: {e}")
+            return None
+
+    @staticmethod
+    def _open_search_index() -> Optional[ReportSearchIndex]:
+        """전체 리포트 검색 색인 열기 (실패 시 현재 PDF 검색만 사용)"""
+        try:
+            return ReportSearchIndex(SEARCH_INDEX_DB_PATH)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"검색 색인을 열 수 없음, 전체 검색 없이 진행: {e}")
+            return None
+
+    @staticmethod
+    def _open_highlight_cache() -> Optional[HighlightCache]:
+        """자동 하이라이트 캐시 열기 (실패 시 매번 분석)"""
+        try:
+            return HighlightCache(HIGHLIGHT_CACHE_DB_PATH)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"자동 하이라이트 캐시를 열 수 없음, 캐시 없이 진행: {e}")
+            return None
+
     @property
     def reports(self) -> List[ReportData]:
         """스레드 안전한 reports 접근"""
@@ -123,6 +220,7 @@ class NaverReportViewerApp:
 
         # 검색
         self.root.bind('<Control-f>', lambda e: self._show_search_dialog())
+        self.root.bind('<Control-F>', lambda e: self._show_report_search_dialog())  # Ctrl+Shift+F
         self.root.bind('<F3>', lambda e: self._find_next())
         self.root.bind('<Shift-F3>', lambda e: self._find_prev())
         self.root.bind('<Escape>', lambda e: self._clear_search())
@@ -134,6 +232,9 @@ class NaverReportViewerApp:
         # 캡쳐
         self.root.bind('<Control-s>', lambda e: self._capture_pdf_view())
 
+        # 주석 PDF 내보내기
+        self.root.bind('<Control-e>', lambda e: self._export_annotated_pdf())
+
         logger.debug("키보드 단축키 바인딩 완료")
 
     def _create_ui(self) -> None:
@@ -245,9 +346,33 @@ class NaverReportViewerApp:
         self.annotation_toolbar.on_undo = self._undo_annotation
         self.annotation_toolbar.on_clear = self._clear_annotations
         self.annotation_toolbar.on_capture = self._capture_pdf_view
+        self.annotation_toolbar.on_export_pdf = self._export_annotated_pdf
+        self.annotation_toolbar.on_batch_export = self._batch_export_pdfs
         self.annotation_toolbar.on_auto_highlight_rules = self._on_auto_highlight_rules
+        self.annotation_toolbar.on_auto_highlight_document = self._on_auto_highlight_document
         self.annotation_toolbar.on_auto_highlight_llm = self._on_auto_highlight_llm
 
+    def _load_stored_reports(self) -> None:
+        """저장소에 있는 오늘 리포트로 목록을 즉시 채우기"""
+        if self.report_store is None:
+            return
+
+        today = datetime.now().strftime("%y.%m.%d")
+        try:
+            stored = self.report_store.get_reports(date=today)
+        except sqlite3.Error as e:
+            logger.warning(f"저장된 리포트 조회 실패: {e}")
+            return
+
+        if not stored:
+            return
+
+        self.reports = stored
+        self.report_list.set_reports(stored)
+        self.status_label.configure(text=f"💾 저장된 {len(stored)}개",
+                                    foreground=self.colors['text_secondary'])
+        logger.info(f"저장된 리포트 표시: {len(stored)}개")
+
     def load_reports(self) -> None:
         """리포트 로드"""
         # 중복 로딩 방지
@@ -265,7 +390,16 @@ class NaverReportViewerApp:
     def _fetch_reports(self) -> None:
         """리포트 가져오기 (스레드)"""
         try:
-            reports = self.scraper.fetch_reports()
+            # 이미 목록에 있는 오늘 리포트가 있으면 증분 수집 (새 리포트만 앞에 추가)
+            today = datetime.now().strftime("%y.%m.%d")
+            existing = [r for r in self.reports if r.date == today]
+            if existing:
+                known_links = {r.link for r in existing}
+                new_reports = self.scraper.fetch_new_reports(date=today, known_links=known_links)
+                logger.info(f"증분 새로고침: 새 리포트 {len(new_reports)}개")
+                reports = new_reports + existing
+            else:
+                reports = self.scraper.fetch_reports(date=today)
             self.reports = reports
             self.root.after(0, self._update_report_list)
         except Exception as e:
@@ -279,6 +413,17 @@ class NaverReportViewerApp:
         report_data_list = self.reports
         self.report_list.set_reports(report_data_list)
 
+        # 새로고침 전에 보던 리포트 선택 상태 유지
+        current = self.current_report
+        if current:
+            for i, report in enumerate(report_data_list):
+                if report.link == current.link:
+                    # 선택 이벤트는 이벤트 큐를 거쳐 오므로 유휴 시점까지만 복원으로 취급
+                    self._reselect_link = current.link
+                    self.report_list.select_report(i)
+                    self.root.after_idle(self._clear_reselect)
+                    break
+
         total = len(report_data_list)
         self.status_label.configure(text=f"✓ {total}개 로드됨",
                                     foreground=self.colors['success'])
@@ -289,6 +434,41 @@ class NaverReportViewerApp:
 
         logger.info(f"리포트 목록 업데이트: {total}개")
 
+        self._load_all_report_meta(report_data_list)
+
+    def _load_all_report_meta(self, reports: List[ReportData]) -> None:
+        """목록 전체의 투자의견/목표가를 백그라운드에서 채우기"""
+        # 이전 일괄 요청은 취소 (목록이 바뀜)
+        if self._meta_cancel_event is not None:
+            self._meta_cancel_event.set()
+        cancel_event = threading.Event()
+        self._meta_cancel_event = cancel_event
+
+        def on_meta(report: ReportData) -> None:
+            if not cancel_event.is_set():
+                self.root.after(0, lambda: self._on_report_meta_loaded(report))
+
+        thread = threading.Thread(
+            target=self.scraper.fetch_report_meta_many,
+            args=(reports,),
+            kwargs={'callback': on_meta, 'cancel_event': cancel_event},
+            daemon=True,
+        )
+        thread.start()
+
+    def _on_report_meta_loaded(self, report: ReportData) -> None:
+        """메타 정보가 채워진 리포트 행 갱신"""
+        for i, r in enumerate(self.reports):
+            if r.link == report.link:
+                self.report_list.update_report(i, report)
+                break
+
+        current = self.current_report
+        if current and current.link == report.link:
+            current.opinion = report.opinion
+            current.target = report.target
+            self._update_meta_labels()
+
     def _show_error(self, error_msg: str) -> None:
         """에러 표시"""
         self.status_label.configure(text="✗ 로딩 실패",
@@ -304,14 +484,37 @@ class NaverReportViewerApp:
             logger.warning(f"잘못된 리포트 인덱스: {idx}, 전체: {len(reports)}")
             return
 
+        # 목록 새로고침 후 선택 복원으로 같은 리포트가 다시 선택된 경우만 재로딩하지 않음
+        # (사용자가 같은 행을 다시 누르면 PDF/상세 정보 로드 실패 후 재시도)
+        reselect, self._reselect_link = self._reselect_link, None
+        if reselect is not None and reselect == reports[idx].link:
+            return
+
+        self._open_report(reports[idx])
+
+        # 목록에서 다음에 읽을 리포트 PDF 미리 받기
+        self._prefetch_next_pdfs(idx)
+
+    def _clear_reselect(self) -> None:
+        """선택 복원 표시 해제 (선택 이벤트가 오지 않은 경우)"""
+        self._reselect_link = None
+
+    def _open_report(self, report: ReportData) -> None:
+        """리포트 열기 (PDF 로드 및 상세 정보 조회)"""
         # 로드 세대 증가 — 이전 백그라운드 스레드의 콜백 무효화
         with self._data_lock:
             self._load_generation += 1
 
-        self.current_report = reports[idx]
+        # 이전 리포트의 PDF 다운로드 중단
+        self._cancel_pdf_download()
+
+        self.current_report = report
         logger.info(f"리포트 선택: {self.current_report.stock} - {self.current_report.title}")
 
-        # PDF 핸들러 초기화
+        # PDF 핸들러 초기화 (이전 리포트의 어노테이션 변경분은 먼저 저장)
+        self._flush_annotation_save()
+        self.render_worker.cancel()
+        self._cancel_document_highlight()
         self.pdf_handler.reset()
         self.undo_stack = []
         self._search_results = []
@@ -330,6 +533,21 @@ class NaverReportViewerApp:
         # 상세 정보 로드
         self._load_report_meta()
 
+    def _prefetch_next_pdfs(self, idx: int) -> None:
+        """현재 표시 순서(검색 필터 적용)에서 선택한 리포트 다음 PDF들을 미리 받기"""
+        if self.prefetcher is None:
+            return
+
+        order = self.report_list.get_visible_indices()
+        if idx not in order:
+            return
+
+        reports = self.reports
+        pos = order.index(idx)
+        urls = [reports[i].pdf_link for i in order[pos + 1:]
+                if i < len(reports) and reports[i].pdf_link][:PREFETCH_AHEAD]
+        self.prefetcher.prefetch(urls)
+
     def _on_report_double_click(self, idx: int) -> None:
         """리포트 더블클릭"""
         self._open_current_link()
@@ -345,6 +563,9 @@ class NaverReportViewerApp:
             gen = self._load_generation
         current = self.current_report
         if current:
+            if self.scraper.has_cached_meta(current):
+                self.root.after(0, self._update_meta_labels)
+                return
             self.scraper.fetch_report_meta(current)
             # 세대가 바뀌었으면 결과를 무시 (다른 리포트가 선택됨)
             with self._data_lock:
@@ -368,10 +589,30 @@ class NaverReportViewerApp:
 
         self.pdf_viewer.show_loading()
 
-        thread = threading.Thread(target=self._fetch_and_render_pdf, daemon=True)
+        # 사용자가 연 PDF를 받는 동안 미리 받기는 대기 (재개는 로드 스레드가 끝날 때)
+        if self.prefetcher is not None:
+            self.prefetcher.pause()
+
+        self._pdf_cancel_event = threading.Event()
+        thread = threading.Thread(target=self._run_pdf_load,
+                                  args=(self._pdf_cancel_event,), daemon=True)
         thread.start()
 
-    def _fetch_and_render_pdf(self) -> None:
+    def _run_pdf_load(self, cancel_event: threading.Event) -> None:
+        """PDF 로드 스레드 (끝나면 미리 받기 재개)"""
+        try:
+            self._fetch_and_render_pdf(cancel_event)
+        finally:
+            if self.prefetcher is not None:
+                self.prefetcher.resume()
+
+    def _cancel_pdf_download(self) -> None:
+        """진행 중인 PDF 다운로드 취소"""
+        if self._pdf_cancel_event is not None:
+            self._pdf_cancel_event.set()
+            self._pdf_cancel_event = None
+
+    def _fetch_and_render_pdf(self, cancel_event: threading.Event) -> None:
         """PDF 다운로드 및 렌더링"""
         with self._data_lock:
             gen = self._load_generation
@@ -379,14 +620,29 @@ class NaverReportViewerApp:
         if not current:
             return
 
+        last_progress = 0.0
+
+        def on_progress(downloaded: int, total: Optional[int]) -> None:
+            # UI 갱신은 0.1초 간격으로 제한
+            nonlocal last_progress
+            now = time.monotonic()
+            if now - last_progress < 0.1 and downloaded != total:
+                return
+            last_progress = now
+            self.root.after(0, lambda: self._on_pdf_progress(gen, downloaded, total))
+
         try:
-            self.pdf_handler.load_pdf(current.pdf_link)
+            self.pdf_handler.load_pdf(current.pdf_link, progress_callback=on_progress,
+                                      cancel_event=cancel_event)
             # 세대가 바뀌었으면 결과를 무시 (다른 리포트가 선택됨)
             with self._data_lock:
                 if gen != self._load_generation:
                     logger.debug("PDF 로드 완료했으나 세대 불일치, 무시")
                     return
-            self.root.after(0, self._display_pdf_page)
+            saved = self._load_saved_annotations(self.pdf_handler.content_hash)
+            self.root.after(0, lambda: self._on_pdf_loaded(gen, saved))
+        except PDFDownloadCancelled:
+            logger.debug("PDF 다운로드 취소됨, 무시")
         except Exception as e:
             logger.error(f"PDF 로드 실패: {e}")
             with self._data_lock:
@@ -394,16 +650,153 @@ class NaverReportViewerApp:
                     return
             self.root.after(0, lambda: self.pdf_viewer.show_error(str(e)))
 
+    def _load_saved_annotations(self, content_hash: Optional[str]) -> dict:
+        """저장된 어노테이션 조회 (PDF 로드 스레드에서 호출)"""
+        if self.annotation_store is None or not content_hash:
+            return {}
+        try:
+            return self.annotation_store.load(content_hash)
+        except sqlite3.Error as e:
+            logger.warning(f"저장된 어노테이션 조회 실패: {e}")
+            return {}
+
+    def _on_pdf_loaded(self, gen: int, saved: dict) -> None:
+        """PDF 로드 완료: 저장된 어노테이션 복원 후 표시 (자동 하이라이트도 다시 계산하지 않음)"""
+        with self._data_lock:
+            if gen != self._load_generation:
+                return
+        if saved:
+            restored = self.pdf_handler.load_annotations(saved)
+            logger.info(f"저장된 어노테이션 {restored}개 복원")
+        self._display_pdf_page()
+        self._index_current_pdf()
+        self._warm_highlight_cache()
+
+        # 전체 리포트 검색 결과에서 연 리포트면 해당 페이지로 이동
+        pending, self._pending_search_hit = self._pending_search_hit, None
+        current = self.current_report
+        if pending and current and pending[0].report.link == current.link:
+            hit, query = pending
+            if hit.content_hash == self.pdf_handler.content_hash:
+                self._show_search_hit(hit, query)
+            elif query:
+                # 색인 이후 PDF가 바뀐 경우 현재 문서에서 다시 검색
+                self._perform_search(query)
+
+    def _index_current_pdf(self) -> None:
+        """연 PDF를 검색 색인에 추가 (이미 색인된 문서는 건너뜀)"""
+        content_hash = self.pdf_handler.content_hash
+        if self.search_indexer is None or not content_hash:
+            return
+        try:
+            if self.search_index.is_indexed(content_hash):
+                return
+        except sqlite3.Error as e:
+            logger.warning(f"검색 색인 조회 실패: {e}")
+            return
+        source = self.pdf_handler.document_source()
+        if source is not None:
+            self.search_indexer.submit(content_hash, source, self.current_report)
+
+    def _warm_highlight_cache(self) -> None:
+        """연 PDF의 자동 하이라이트를 미리 분석 (이미 전체가 캐시된 문서는 건너뜀)"""
+        content_hash = self.pdf_handler.content_hash
+        if self.highlight_warmer is None or not content_hash:
+            return
+        try:
+            if self.highlight_cache.is_complete(content_hash):
+                return
+        except sqlite3.Error as e:
+            logger.warning(f"자동 하이라이트 캐시 조회 실패: {e}")
+            return
+        source = self.pdf_handler.document_source()
+        if source is not None:
+            self.highlight_warmer.submit(content_hash, source)
+
+    def _on_pdf_prefetched(self, url: str, content_hash: str) -> None:
+        """미리 받은 PDF를 검색 색인에 추가하고 자동 하이라이트 미리 분석 (미리 받기 스레드에서 호출)"""
+        path = self.pdf_cache.path_for_hash(content_hash)
+        if self.search_indexer is not None:
+            report = next((r for r in self.reports if r.pdf_link == url), None)
+            self.search_indexer.submit(content_hash, path, report)
+        if self.highlight_warmer is not None:
+            self.highlight_warmer.submit(content_hash, path)
+
+    def _schedule_annotation_save(self) -> None:
+        """어노테이션 변경 시 저장 예약 (연속된 변경은 한 번에 저장)"""
+        if self.annotation_store is None or self._annotation_save_pending is not None:
+            return
+        self._annotation_save_pending = self.root.after(ANNOTATION_SAVE_DELAY_MS,
+                                                        self._save_annotations)
+
+    def _flush_annotation_save(self) -> None:
+        """예약된 저장이 있으면 바로 저장 (리포트 전환/종료 전)"""
+        if self._annotation_save_pending is not None:
+            self.root.after_cancel(self._annotation_save_pending)
+            self._save_annotations()
+
+    def _save_annotations(self) -> None:
+        """현재 문서의 어노테이션 저장"""
+        self._annotation_save_pending = None
+        content_hash = self.pdf_handler.content_hash
+        if self.annotation_store is None or not content_hash:
+            return
+        snapshot = {page: self.pdf_handler.get_annotations(page)
+                    for page in self.pdf_handler.annotations}
+        try:
+            self.annotation_store.save(content_hash, snapshot)
+        except sqlite3.Error as e:
+            logger.warning(f"어노테이션 저장 실패: {e}")
+
+    def _on_pdf_progress(self, gen: int, downloaded: int, total: Optional[int]) -> None:
+        """PDF 다운로드 진행률 표시"""
+        with self._data_lock:
+            if gen != self._load_generation:
+                return
+        self.pdf_viewer.show_loading(downloaded, total)
+
     def _display_pdf_page(self) -> None:
         """현재 페이지 표시"""
-        img = self.pdf_handler.render_page()
-        if img:
-            self.pdf_viewer.display_image(
-                img,
-                self.pdf_handler.current_page,
-                self.pdf_handler.total_pages,
-                self.pdf_handler.zoom_level
+        handler = self.pdf_handler
+        page_num = handler.current_page
+        zoom = handler.zoom_level
+
+        if handler.use_tiles(zoom):
+            # 높은 줌: 페이지 전체 대신 보이는 타일만 렌더링
+            page_size = handler.page_pixel_size(page_num, zoom)
+            if not page_size:
+                return
+            self.pdf_viewer.display_tiled(
+                page_size,
+                lambda tx, ty: handler.render_tile(page_num, tx, ty, zoom, apply_annotations=False),
+                page_num,
+                handler.total_pages,
+                zoom
             )
+        else:
+            # 캐시된 페이지 이미지를 그대로 표시 (어노테이션은 오버레이로)
+            img = handler.render_page(apply_annotations=False)
+            if not img:
+                return
+            self.pdf_viewer.display_image(img, page_num, handler.total_pages, zoom)
+
+        self._draw_page_annotations()
+
+        # 다음 페이지 이동이 캐시 적중이 되도록 주변 페이지를 백그라운드에서 렌더링
+        self.render_worker.schedule(page_num, zoom)
+
+    def _draw_page_annotations(self) -> None:
+        """현재 페이지의 어노테이션 오버레이를 모두 다시 그리기 (페이지 이미지는 그대로)"""
+        self.pdf_viewer.clear_annotation_items()
+        for ann in self.pdf_handler.get_annotations(self.pdf_handler.current_page):
+            self._draw_annotation_item(ann)
+
+    def _draw_annotation_item(self, annotation: Annotation) -> None:
+        """어노테이션 하나를 오버레이로 그리기 (비용은 어노테이션 크기에 비례)"""
+        sprite = self.pdf_handler.render_annotation(annotation, self.pdf_handler.zoom_level)
+        if sprite:
+            x, y, img = sprite
+            self.pdf_viewer.draw_annotation(annotation.id, x, y, img)
 
     def _prev_page(self) -> None:
         """이전 페이지"""
@@ -491,7 +884,7 @@ class NaverReportViewerApp:
 
         if not results:
             messagebox.showinfo("검색 결과", f"'{query}'를 찾을 수 없습니다.")
-            self._display_pdf_page()
+            self._draw_page_annotations()
             return
 
         # 총 검색 결과 수
@@ -547,9 +940,92 @@ class NaverReportViewerApp:
             self._search_results = []
             self._current_search_index = 0
             self.pdf_handler.clear_search_highlights()
-            self._display_pdf_page()
+            self._draw_page_annotations()
             self.status_label.configure(text="", foreground=self.colors['success'])
 
+    def _show_report_search_dialog(self) -> None:
+        """전체 리포트 검색 창 표시"""
+        if self.search_index is None:
+            messagebox.showinfo("알림", "검색 색인을 사용할 수 없습니다.")
+            return
+
+        dialog = self._report_search_dialog
+        if dialog is not None and dialog.winfo_exists():
+            dialog.lift()
+            dialog.query_entry.focus_set()
+            return
+
+        self._report_search_dialog = ReportSearchDialog(
+            self.root,
+            colors=self.colors,
+            on_search=self._search_reports,
+            on_open=self._open_search_hit
+        )
+
+    def _search_reports(self, query: str, scope: str) -> List[SearchHit]:
+        """
+        전체 리포트 검색
+
+        Args:
+            query: 검색어
+            scope: 'day' (오늘) | 'month' (이번 달) | 'all'
+        """
+        now = datetime.now()
+        date_prefix = {'day': now.strftime("%y.%m.%d"),
+                       'month': now.strftime("%y.%m.")}.get(scope)
+        try:
+            hits = self.search_index.search(query, date_prefix=date_prefix)
+        except sqlite3.Error as e:
+            logger.error(f"전체 리포트 검색 실패: {e}")
+            hits = []
+        self._report_search_hits = hits
+        return hits
+
+    def _open_search_hit(self, hit: SearchHit) -> None:
+        """전체 검색 결과 열기 (다른 리포트면 PDF 로드 후 해당 페이지로 이동)"""
+        dialog = self._report_search_dialog
+        query = dialog.query_var.get().strip() if dialog is not None else ""
+
+        if hit.content_hash == self.pdf_handler.content_hash:
+            self._show_search_hit(hit, query)
+            return
+
+        if not hit.report.pdf_link:
+            messagebox.showinfo("알림", "리포트 정보가 없어 열 수 없습니다.")
+            return
+
+        current = self.current_report
+        if current and current.link == hit.report.link:
+            # 같은 리포트인데 색인 이후 PDF가 바뀐 경우
+            if query:
+                self._perform_search(query)
+            return
+
+        self._pending_search_hit = (hit, query)
+        for i, report in enumerate(self.reports):
+            if report.link == hit.report.link and i in self.report_list.get_visible_indices():
+                # 목록 선택 이벤트로 _on_report_select 실행
+                self.report_list.select_report(i)
+                return
+        # 목록에 없는 (지난) 리포트는 바로 열기
+        self._open_report(hit.report)
+
+    def _show_search_hit(self, hit: SearchHit, query: str) -> None:
+        """현재 문서의 전체 검색 결과를 F3/Shift+F3 검색 결과로 설정하고 해당 페이지로 이동"""
+        hits = [h for h in self._report_search_hits if h.content_hash == hit.content_hash] or [hit]
+        self._search_results = [
+            {'page': h.page, 'rects': h.rects, 'text': query, 'count': h.count}
+            for h in hits
+        ]
+        index = next((i for i, h in enumerate(hits) if h.page == hit.page), 0)
+        self._go_to_search_result(index)
+
+        total_count = sum(h.count for h in hits)
+        self.status_label.configure(
+            text=f"🔍 '{query}' {total_count}개 발견",
+            foreground=self.colors['accent']
+        )
+
     # === 어노테이션 기능 ===
 
     def _on_tool_change(self, tool: Optional[str]) -> None:
@@ -654,7 +1130,7 @@ class NaverReportViewerApp:
         )
         self.undo_stack.append((page, annotation, False))
         self.annotation_toolbar.set_undo_enabled(True)
-        self._display_pdf_page()
+        self._draw_annotation_item(annotation)
 
     def _add_line_annotation(self, coords: tuple) -> None:
         """라인 어노테이션 추가"""
@@ -667,7 +1143,7 @@ class NaverReportViewerApp:
         )
         self.undo_stack.append((page, annotation, False))
         self.annotation_toolbar.set_undo_enabled(True)
-        self._display_pdf_page()
+        self._draw_annotation_item(annotation)
 
     def _erase_at_point(self, canvas_x: float, canvas_y: float) -> None:
         """지정된 좌표의 어노테이션 삭제"""
@@ -686,7 +1162,7 @@ class NaverReportViewerApp:
             self.pdf_handler.remove_annotation(page, annotation)
             self.undo_stack.append((page, annotation, True))
             self.annotation_toolbar.set_undo_enabled(True)
-            self._display_pdf_page()
+            self.pdf_viewer.remove_annotation_item(annotation.id)
 
     def _undo_annotation(self) -> None:
         """마지막 어노테이션 작업 되돌리기"""
@@ -695,21 +1171,22 @@ class NaverReportViewerApp:
 
         page, annotation, was_erased = self.undo_stack.pop()
 
+        on_screen = page == self.pdf_handler.current_page
+
         if was_erased:
             # 삭제된 어노테이션 복원
-            if page not in self.pdf_handler.annotations:
-                self.pdf_handler.annotations[page] = []
-            self.pdf_handler.annotations[page].append(annotation)
+            self.pdf_handler.restore_annotation(page, annotation)
+            if on_screen:
+                self._draw_annotation_item(annotation)
         else:
             # 추가된 어노테이션 제거
             self.pdf_handler.remove_annotation(page, annotation)
+            if on_screen:
+                self.pdf_viewer.remove_annotation_item(annotation.id)
 
         if not self.undo_stack:
             self.annotation_toolbar.set_undo_enabled(False)
 
-        if page == self.pdf_handler.current_page:
-            self._display_pdf_page()
-
     def _clear_annotations(self) -> None:
         """현재 페이지의 모든 어노테이션 삭제"""
         page = self.pdf_handler.current_page
@@ -720,49 +1197,188 @@ class NaverReportViewerApp:
 
         if cleared:
             self.annotation_toolbar.set_undo_enabled(True)
-            self._display_pdf_page()
+            self.pdf_viewer.clear_annotation_items()
 
     def _on_auto_highlight_rules(self) -> None:
-        """현재 페이지에 룰 기반 자동 하이라이트 적용"""
+        """현재 페이지에 룰 기반 자동 하이라이트 적용 (캐시된 분석 결과가 있으면 바로 적용)"""
         if self.pdf_handler.total_pages == 0:
             messagebox.showinfo("알림", "먼저 PDF 리포트를 선택하세요.")
             return
 
         page = self.pdf_handler.current_page
-        # 블록(단락) 단위 추출 — 단락 내 모든 라인이 함께 하이라이트되도록
-        blocks = self.pdf_handler.get_page_blocks(page)
-
-        if not blocks:
-            # Fallback: 블록 추출 실패 시 전체 텍스트로 (\n\n 단위로 단락 분할됨)
-            page_text = self.pdf_handler.get_page_text(page)
-            if not page_text.strip():
+        content_hash = self.pdf_handler.content_hash
+        resolved = self._cached_page_highlights(content_hash, page)
+        if resolved is None:
+            page_text = self.pdf_handler.get_page_text_data(page)
+            if page_text is None or not page_text.text.strip():
                 messagebox.showinfo("알림", "이 페이지에서 텍스트를 추출할 수 없습니다.")
                 return
-            spans = self._auto_highlighter.analyze_with_rules(page_text)
-        else:
-            spans = self._auto_highlighter.analyze_with_rules(blocks)
-        if not spans:
+
+            # 블록(단락) 단위 분석 — 단락 내 모든 라인이 함께 하이라이트되고,
+            # 블록 추출 때 알아 둔 라인 사각형에 바로 배치 (블록이 없으면 전체 텍스트로 분석 후 검색)
+            resolved = analyze_page_text(self._auto_highlighter, page_text)
+            self._store_page_highlights(content_hash, page, resolved)
+
+        if not resolved:
             self.status_label.configure(
                 text="자동 하이라이트: 매칭 없음",
                 foreground=self.colors['text_secondary']
             )
             return
 
-        added = self.pdf_handler.add_auto_highlights(page, spans, self.pdf_handler.zoom_level)
+        # 이미 적용된 하이라이트는 다시 추가하지 않음 (undo 기록도 중복되지 않음)
+        added = self._apply_page_highlights(page, resolved)
+        if not added:
+            self.status_label.configure(
+                text="자동 하이라이트: 이미 적용됨",
+                foreground=self.colors['text_secondary']
+            )
+            return
+
+        self.status_label.configure(
+            text=f"🤖 자동 하이라이트 {len(added)}개 적용",
+            foreground=self.colors['success']
+        )
+        logger.info(f"룰 기반 자동 하이라이트: {len(resolved)}개 스팬 → {len(added)}개 적용")
 
+    def _apply_page_highlights(self, page_num: int, resolved: List[ResolvedSpan]) -> List[Annotation]:
+        """좌표를 찾은 스팬을 페이지에 추가하고 undo 기록/화면 반영 (UI 스레드)"""
+        added = self.pdf_handler.add_resolved_highlights(page_num, resolved,
+                                                         self.pdf_handler.zoom_level)
         # undo_stack에 개별 추가 — 사용자가 한 번씩 되돌리면서 카테고리별 결과 검토 가능
         for ann in added:
-            self.undo_stack.append((page, ann, False))
-
+            self.undo_stack.append((page_num, ann, False))
         if added:
             self.annotation_toolbar.set_undo_enabled(True)
-            self._display_pdf_page()
+            if page_num == self.pdf_handler.current_page:
+                for ann in added:
+                    self._draw_annotation_item(ann)
+        return added
+
+    def _cached_page_highlights(self, content_hash: Optional[str],
+                                page_num: int) -> Optional[List[ResolvedSpan]]:
+        """캐시된 페이지 분석 결과 (캐시가 없거나 조회 실패 시 None)"""
+        if self.highlight_cache is None or not content_hash:
+            return None
+        try:
+            return self.highlight_cache.get(content_hash, page_num)
+        except sqlite3.Error as e:
+            logger.warning(f"자동 하이라이트 캐시 조회 실패: {e}")
+            return None
+
+    def _store_page_highlights(self, content_hash: Optional[str], page_num: int,
+                               resolved: List[ResolvedSpan]) -> None:
+        """페이지 분석 결과를 캐시에 저장 (작업 풀 스레드에서도 호출)"""
+        if self.highlight_cache is None or not content_hash:
+            return
+        try:
+            self.highlight_cache.put(content_hash, page_num, resolved)
+        except sqlite3.Error as e:
+            logger.warning(f"자동 하이라이트 캐시 저장 실패: {e}")
+
+    def _on_auto_highlight_document(self) -> None:
+        """문서 전체에 룰 기반 자동 하이라이트 적용 (백그라운드, 진행 중이면 중지)"""
+        if self._document_highlight_job is not None:
+            self._cancel_document_highlight()
+            self.status_label.configure(
+                text="자동 하이라이트 중지됨",
+                foreground=self.colors['text_secondary']
+            )
+            return
+
+        if self.pdf_handler.total_pages == 0:
+            messagebox.showinfo("알림", "먼저 PDF 리포트를 선택하세요.")
+            return
+
+        # 콜백은 작업 풀 스레드에서 오므로 UI 스레드로 넘기고, 토큰/문서 세대로 이전 작업 결과를 무시
+        token = object()
+        doc_generation = self.pdf_handler.document_generation
+        total = self.pdf_handler.total_pages
+        content_hash = self.pdf_handler.content_hash
+
+        cached = {}
+        if self.highlight_cache is not None and content_hash:
+            try:
+                cached = self.highlight_cache.get_document(content_hash)
+            except sqlite3.Error as e:
+                logger.warning(f"자동 하이라이트 캐시 조회 실패: {e}")
+
+        def on_page(page_num: int, resolved: List[ResolvedSpan]) -> None:
+            self._store_page_highlights(content_hash, page_num, resolved)
+            self.root.after(0, lambda: self._on_document_highlight_page(
+                token, doc_generation, page_num, resolved))
+
+        def on_done() -> None:
+            self.root.after(0, lambda: self._on_document_highlight_done(token))
+
+        self._document_highlight_job = token
+        self._document_highlight_progress = (0, 0)
+
+        # 캐시된 페이지는 바로 적용하고 나머지 페이지만 작업 프로세스에서 분석
+        for page_num in sorted(cached):
+            if page_num < total:
+                self._on_document_highlight_page(token, doc_generation, page_num, cached[page_num])
+        remaining = [page for page in range(total) if page not in cached]
+        if not remaining:
+            self._on_document_highlight_done(token)
+            return
 
+        source = self.pdf_handler.document_source()
+        job = None
+        if source is not None:
+            job = self.document_highlighter.start(source, total, on_page, on_done,
+                                                  first_page=self.pdf_handler.current_page,
+                                                  pages=remaining)
+        if job is None:
+            self._document_highlight_job = None
+            return
+
+        self.annotation_toolbar.set_document_highlight_running(True)
+        pages, _ = self._document_highlight_progress
         self.status_label.configure(
-            text=f"🤖 자동 하이라이트 {len(added)}개 적용",
+            text=f"🤖 전체 문서 자동 하이라이트 중... ({pages}/{total}페이지)",
+            foreground=self.colors['text_secondary']
+        )
+
+    def _on_document_highlight_page(self, token: object, doc_generation: int, page_num: int,
+                                    resolved: List[ResolvedSpan]) -> None:
+        """문서 전체 자동 하이라이트: 페이지 결과 반영 (UI 스레드)"""
+        if token is not self._document_highlight_job or \
+                doc_generation != self.pdf_handler.document_generation:
+            return
+
+        # 현재 페이지 분석과 같은 방식 (이미 적용된 하이라이트는 건너뜀)
+        added = self._apply_page_highlights(page_num, resolved)
+
+        pages, count = self._document_highlight_progress
+        pages, count = pages + 1, count + len(added)
+        self._document_highlight_progress = (pages, count)
+        self.status_label.configure(
+            text=f"🤖 전체 문서 자동 하이라이트 중... ({pages}/{self.pdf_handler.total_pages}페이지, {count}개)",
+            foreground=self.colors['text_secondary']
+        )
+
+    def _on_document_highlight_done(self, token: object) -> None:
+        """문서 전체 자동 하이라이트 완료 (UI 스레드)"""
+        if token is not self._document_highlight_job:
+            return
+        self._document_highlight_job = None
+        self.annotation_toolbar.set_document_highlight_running(False)
+
+        pages, count = self._document_highlight_progress
+        self.status_label.configure(
+            text=f"🤖 전체 문서 자동 하이라이트 {count}개 적용 ({pages}페이지)",
             foreground=self.colors['success']
         )
-        logger.info(f"룰 기반 자동 하이라이트: {len(spans)}개 스팬 → {len(added)}개 적용")
+        logger.info(f"문서 전체 자동 하이라이트: {pages}페이지 → {count}개 적용")
+
+    def _cancel_document_highlight(self) -> None:
+        """진행 중인 문서 전체 자동 하이라이트 취소 (리포트 전환 등)"""
+        if self._document_highlight_job is None:
+            return
+        self.document_highlighter.cancel()
+        self._document_highlight_job = None
+        self.annotation_toolbar.set_document_highlight_running(False)
 
     def _on_auto_highlight_llm(self) -> None:
         """LLM 기반 자동 하이라이트 (LLM 통합 단계에서 구현)"""
@@ -807,13 +1423,111 @@ class NaverReportViewerApp:
             logger.error(f"캡쳐 실패: {e}")
             messagebox.showerror("오류", f"캡쳐 중 오류가 발생했습니다.\n\n{str(e)}")
 
+    @staticmethod
+    def _export_path(report: Optional[ReportData], content_hash: str) -> str:
+        """내보낼 PDF 경로 (종목명_날짜_내용해시.pdf)"""
+        stock_name = report.stock if report else 'unknown'
+        stock_name = "".join(c for c in stock_name if c.isalnum() or c in ('_', '-'))
+        date = report.date.replace('.', '') if report else ''
+        return os.path.join(EXPORT_DIR, f"{stock_name}_{date}_{content_hash[:8]}.pdf")
+
+    def _export_annotated_pdf(self) -> None:
+        """현재 리포트를 어노테이션이 PDF 주석으로 들어간 PDF로 저장"""
+        source = self.pdf_handler.document_source()
+        if source is None:
+            messagebox.showwarning("알림", "내보낼 PDF가 없습니다.")
+            return
+
+        filepath = self._export_path(self.current_report, self.pdf_handler.content_hash or 'pdf')
+        annotations = {page: self.pdf_handler.get_annotations(page)
+                       for page in self.pdf_handler.annotations}
+        try:
+            count = export_annotated_pdf(source, filepath, annotations)
+            messagebox.showinfo("내보내기 완료", f"주석 {count}개를 넣어 저장했습니다.\n\n{filepath}")
+        except Exception as e:
+            logger.error(f"PDF 내보내기 실패: {e}")
+            messagebox.showerror("오류", f"PDF 내보내기 중 오류가 발생했습니다.\n\n{str(e)}")
+
+    def _batch_export_pdfs(self) -> None:
+        """목록에서 캐시된 PDF와 저장된 어노테이션이 있는 리포트를 모두 내보내기"""
+        if self.pdf_cache is None or self.annotation_store is None:
+            messagebox.showinfo("알림", "PDF 캐시와 어노테이션 저장소가 있어야 일괄 내보내기를 할 수 있습니다.")
+            return
+
+        # 현재 리포트의 변경분도 포함되도록 먼저 저장
+        self._flush_annotation_save()
+        reports = self.reports
+        self.annotation_toolbar.set_batch_export_enabled(False)
+        self.status_label.configure(text="📚 일괄 내보내기 준비 중...",
+                                    foreground=self.colors['text_secondary'])
+
+        def run():
+            jobs = []
+            for report in reports:
+                path = self.pdf_cache.get(report.pdf_link) if report.pdf_link else None
+                content_hash = self.pdf_cache.content_hash(report.pdf_link) if path else None
+                if not content_hash:
+                    continue
+                try:
+                    annotations = self.annotation_store.load(content_hash)
+                except sqlite3.Error as e:
+                    logger.warning(f"저장된 어노테이션 조회 실패: {e}")
+                    continue
+                if annotations:
+                    jobs.append((path, self._export_path(report, content_hash), annotations))
+
+            results = batch_export(jobs)
+            self.root.after(0, lambda: self._on_batch_export_done(results))
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def _on_batch_export_done(self, results: list) -> None:
+        """일괄 내보내기 결과 표시"""
+        self.annotation_toolbar.set_batch_export_enabled(True)
+        if not results:
+            self.status_label.configure(text="")
+            messagebox.showinfo("알림", "어노테이션이 저장된 리포트가 없습니다.")
+            return
+
+        failed = [(path, error) for path, _, error in results if error]
+        self.status_label.configure(
+            text=f"📚 {len(results) - len(failed)}개 리포트 내보내기 완료",
+            foreground=self.colors['success'] if not failed else self.colors['warning']
+        )
+        message = f"{len(results) - len(failed)}개 리포트를 저장했습니다.\n\n{EXPORT_DIR}"
+        if failed:
+            message += f"\n\n실패 {len(failed)}개: " + ", ".join(os.path.basename(p) for p, _ in failed)
+        messagebox.showinfo("일괄 내보내기", message)
+
     def run(self) -> None:
         """앱 실행"""
         self.root.mainloop()
 
     def close(self) -> None:
         """앱 종료"""
+        if self._meta_cancel_event is not None:
+            self._meta_cancel_event.set()
+        self._cancel_pdf_download()
+        if self.prefetcher is not None:
+            self.prefetcher.close()
+        if self.search_indexer is not None:
+            self.search_indexer.close()
+        if self.search_index is not None:
+            self.search_index.close()
+        self.render_worker.stop()
+        self.document_highlighter.close()
+        if self.highlight_warmer is not None:
+            self.highlight_warmer.close()
+        if self.highlight_cache is not None:
+            self.highlight_cache.close()
         self.scraper.close()
+        if self.report_store is not None:
+            self.report_store.close()
+        self._flush_annotation_save()
+        if self.annotation_store is not None:
+            self.annotation_store.close()
         self.pdf_handler.reset()
+        if self.pdf_cache is not None:
+            self.pdf_cache.close()
         self.root.destroy()
         logger.info("앱 종료")
@@ -3,17 +3,18 @@
 - ReportListWidget: 리포트 목록 (Treeview)
 - PDFViewerWidget: PDF 뷰어 (Canvas + 컨트롤)
 - AnnotationToolbar: 어노테이션 도구 모음
+- ReportSearchDialog: 전체 리포트 텍스트 검색 창
 """
 
 import tkinter as tk
 from tkinter import ttk
-from typing import List, Callable, Optional
+from typing import Any, Dict, Hashable, List, Callable, Optional, Tuple
 
 from ..config import (
     COLORS, HIGHLIGHT_COLORS, LINE_COLORS,
     DEFAULT_HIGHLIGHT_COLOR, DEFAULT_LINE_COLOR,
     TRANSPARENCY_OPTIONS, DEFAULT_ALPHA,
-    LINE_WIDTH_OPTIONS, DEFAULT_LINE_WIDTH
+    LINE_WIDTH_OPTIONS, DEFAULT_LINE_WIDTH, TILE_SIZE
 )
 from ..models import ReportData
 
@@ -91,7 +92,7 @@ class ReportListWidget(ttk.Frame):
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=1, pady=1)
 
         # 컬럼
-        columns = ('no', 'stock', 'title', 'firm')
+        columns = ('no', 'stock', 'title', 'firm', 'opinion', 'target')
         self.tree = ttk.Treeview(tree_frame,
                                  columns=columns,
                                  show='headings',
@@ -103,11 +104,15 @@ class ReportListWidget(ttk.Frame):
         self.tree.heading('stock', text='종목명')
         self.tree.heading('title', text='리포트 제목')
         self.tree.heading('firm', text='증권사')
+        self.tree.heading('opinion', text='의견')
+        self.tree.heading('target', text='목표가')
 
         self.tree.column('no', width=45, minwidth=40, anchor='center')
         self.tree.column('stock', width=85, minwidth=70, anchor='w')
-        self.tree.column('title', width=230, minwidth=150, anchor='w')
-        self.tree.column('firm', width=85, minwidth=70, anchor='w')
+        self.tree.column('title', width=170, minwidth=120, anchor='w')
+        self.tree.column('firm', width=75, minwidth=60, anchor='w')
+        self.tree.column('opinion', width=50, minwidth=40, anchor='center')
+        self.tree.column('target', width=70, minwidth=50, anchor='e')
 
         # 스크롤바
         scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
@@ -170,9 +175,29 @@ class ReportListWidget(ttk.Frame):
                 no,
                 report.stock,
                 report.title,
-                report.firm
+                report.firm,
+                report.opinion,
+                report.target
             ))
 
+    def update_report(self, idx: int, report: ReportData):
+        """한 행의 투자의견/목표가 갱신 (목록 전체를 다시 그리지 않음)"""
+        iid = str(idx)
+        if self.tree.exists(iid):
+            self.tree.set(iid, 'opinion', report.opinion)
+            self.tree.set(iid, 'target', report.target)
+
+    def select_report(self, idx: int):
+        """리포트 선택 상태 복원 (목록 갱신 후 사용)"""
+        iid = str(idx)
+        if self.tree.exists(iid):
+            self.tree.selection_set(iid)
+            self.tree.see(iid)
+
+    def get_visible_indices(self) -> List[int]:
+        """검색 필터가 적용된 현재 표시 순서의 리포트 인덱스"""
+        return [int(iid) for iid in self.tree.get_children()]
+
     def get_report_count(self) -> int:
         """리포트 개수 반환"""
         return len(self.reports)
@@ -188,6 +213,16 @@ class PDFViewerWidget(ttk.Frame):
         self._current_photo = None
         self.image_offset_x = 0
         self.image_offset_y = 0
+        self._loading_text_id: Optional[int] = None  # 로딩 안내 텍스트 (진행률 갱신용)
+
+        # 타일 모드 상태 (높은 줌에서 보이는 타일만 렌더링)
+        self._tile_provider: Optional[Callable[[int, int], Any]] = None
+        self._tiled_page_size: Tuple[int, int] = (0, 0)
+        self._tile_items: Dict[Tuple[int, int], Tuple[int, Any]] = {}  # (열, 행) -> (캔버스 항목, PhotoImage)
+        self._tile_update_pending: Optional[str] = None
+
+        # 어노테이션 오버레이 (페이지 이미지와 별도의 캔버스 항목)
+        self._annotation_items: Dict[Hashable, Tuple[int, Any]] = {}  # 키 -> (캔버스 항목, PhotoImage)
 
         # 콜백
         self.on_prev_page: Optional[Callable] = None
@@ -329,9 +364,9 @@ class PDFViewerWidget(ttk.Frame):
                                 highlightthickness=0, cursor='arrow')
 
         self.v_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL,
-                                         command=self.canvas.yview)
+                                         command=self._on_yview)
         self.h_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.HORIZONTAL,
-                                         command=self.canvas.xview)
+                                         command=self._on_xview)
 
         self.canvas.configure(yscrollcommand=self.v_scrollbar.set,
                               xscrollcommand=self.h_scrollbar.set)
@@ -381,6 +416,15 @@ class PDFViewerWidget(ttk.Frame):
             self.canvas.yview_scroll(-1, 'units')
         elif event.num == 5 or event.delta < 0:
             self.canvas.yview_scroll(1, 'units')
+        self._schedule_tile_update()
+
+    def _on_yview(self, *args):
+        self.canvas.yview(*args)
+        self._schedule_tile_update()
+
+    def _on_xview(self, *args):
+        self.canvas.xview(*args)
+        self._schedule_tile_update()
 
     def _handle_mouse_press(self, event):
         if self.on_mouse_press:
@@ -401,12 +445,13 @@ class PDFViewerWidget(ttk.Frame):
             self.on_mouse_release(x, y)
 
     def _on_canvas_resize(self, event):
-        # 콜백은 app에서 처리
-        pass
+        # 콜백은 app에서 처리 (타일 모드면 새로 보이는 영역의 타일만 채움)
+        self._schedule_tile_update()
 
     def show_placeholder(self):
         """플레이스홀더 표시"""
         self.canvas.delete('all')
+        self._reset_page_items()
         self.canvas.update_idletasks()
         cx = self.canvas.winfo_width() // 2 or 400
         cy = self.canvas.winfo_height() // 2 or 300
@@ -419,16 +464,37 @@ class PDFViewerWidget(ttk.Frame):
             justify='center'
         )
 
-    def show_loading(self):
-        """로딩 표시"""
+    def show_loading(self, downloaded: Optional[int] = None, total: Optional[int] = None):
+        """
+        로딩 표시
+
+        Args:
+            downloaded: 받은 바이트 (None이면 진행률 없이 표시)
+            total: 전체 바이트 (Content-Length가 없으면 None)
+        """
+        text = "⏳\n\nPDF를 불러오는 중..."
+        if downloaded is not None:
+            received_mb = downloaded / (1024 * 1024)
+            if total:
+                percent = min(100, downloaded * 100 // total)
+                text += f"\n\n{percent}% ({received_mb:.1f} / {total / (1024 * 1024):.1f} MB)"
+            else:
+                text += f"\n\n{received_mb:.1f} MB"
+
+            # 진행률 갱신은 기존 텍스트만 바꿈
+            if self._loading_text_id is not None and self.canvas.type(self._loading_text_id):
+                self.canvas.itemconfigure(self._loading_text_id, text=text)
+                return
+
         self.canvas.delete('all')
+        self._reset_page_items()
         self.canvas.update_idletasks()
         cx = self.canvas.winfo_width() // 2 or 400
         cy = self.canvas.winfo_height() // 2 or 300
 
-        self.canvas.create_text(
+        self._loading_text_id = self.canvas.create_text(
             cx, cy,
-            text="⏳\n\nPDF를 불러오는 중...",
+            text=text,
             fill=self.colors['text_secondary'],
             font=('Segoe UI', 12),
             justify='center'
@@ -437,6 +503,7 @@ class PDFViewerWidget(ttk.Frame):
     def show_no_pdf(self):
         """PDF 없음 표시"""
         self.canvas.delete('all')
+        self._reset_page_items()
         self.canvas.update_idletasks()
         cx = self.canvas.winfo_width() // 2 or 400
         cy = self.canvas.winfo_height() // 2 or 300
@@ -453,6 +520,7 @@ class PDFViewerWidget(ttk.Frame):
     def show_error(self, error_msg: str):
         """에러 표시"""
         self.canvas.delete('all')
+        self._reset_page_items()
         self.canvas.update_idletasks()
         cx = self.canvas.winfo_width() // 2 or 400
         cy = self.canvas.winfo_height() // 2 or 300
@@ -469,6 +537,7 @@ class PDFViewerWidget(ttk.Frame):
     def show_no_support(self):
         """PDF 미지원 표시"""
         self.canvas.delete('all')
+        self._reset_page_items()
         self.canvas.update_idletasks()
         cx = self.canvas.winfo_width() // 2 or 400
         cy = self.canvas.winfo_height() // 2 or 300
@@ -487,16 +556,83 @@ class PDFViewerWidget(ttk.Frame):
             return
 
         self.canvas.delete('all')
+        self._reset_page_items()
         self.canvas.update_idletasks()
 
         photo = ImageTk.PhotoImage(img)
         self._current_photo = photo
 
+        img_x, img_y = self._layout_page(*img.size)
+        self.canvas.create_image(img_x, img_y, anchor='nw', image=photo, tags='pdf_image')
+
+        self.update_controls(current_page, total_pages, zoom_level)
+
+    def display_tiled(self, page_size: Tuple[int, int],
+                      tile_provider: Callable[[int, int], Any],
+                      current_page: int, total_pages: int, zoom_level: float):
+        """
+        타일 모드로 페이지 표시
+
+        스크롤 영역은 페이지 전체 크기로 잡고, 보이는 영역의 타일만
+        tile_provider(열, 행)로 받아 그린다. 스크롤/크기 변경 시 필요한 타일을 추가로 요청하고
+        화면에서 벗어난 타일은 버린다.
+
+        Args:
+            page_size: 렌더링된 페이지 전체 픽셀 크기 (너비, 높이)
+            tile_provider: (열, 행) -> PIL Image 또는 None
+        """
+        if not PDF_SUPPORT:
+            return
+
+        self.canvas.delete('all')
+        self._reset_page_items()
+        self._current_photo = None
+        self.canvas.update_idletasks()
+
+        self._layout_page(*page_size)
+        self._tile_provider = tile_provider
+        self._tiled_page_size = page_size
+        self._render_visible_tiles()
+
+        self.update_controls(current_page, total_pages, zoom_level)
+
+    def draw_annotation(self, key: Hashable, x: int, y: int, img):
+        """
+        어노테이션 하나를 페이지 위 오버레이 항목으로 그리기
+
+        Args:
+            key: 어노테이션 식별자 (같은 키가 있으면 교체)
+            x, y: 페이지 픽셀 좌표
+            img: RGBA PIL Image
+        """
+        if not PDF_SUPPORT:
+            return
+        self.remove_annotation_item(key)
+        photo = ImageTk.PhotoImage(img)
+        item = self.canvas.create_image(
+            self.image_offset_x + x, self.image_offset_y + y,
+            anchor='nw', image=photo, tags='annotation'
+        )
+        self._annotation_items[key] = (item, photo)
+
+    def remove_annotation_item(self, key: Hashable) -> bool:
+        """어노테이션 오버레이 항목 제거"""
+        entry = self._annotation_items.pop(key, None)
+        if entry is None:
+            return False
+        self.canvas.delete(entry[0])
+        return True
+
+    def clear_annotation_items(self):
+        """모든 어노테이션 오버레이 항목 제거"""
+        self.canvas.delete('annotation')
+        self._annotation_items.clear()
+
+    def _layout_page(self, img_width: int, img_height: int) -> Tuple[int, int]:
+        """페이지 배치 위치(오프셋)와 스크롤 영역 설정"""
         canvas_width = self.canvas.winfo_width()
         canvas_height = self.canvas.winfo_height()
 
-        img_width, img_height = img.size
-
         if img_width < canvas_width:
             img_x = (canvas_width - img_width) // 2
         else:
@@ -510,13 +646,70 @@ class PDFViewerWidget(ttk.Frame):
         self.image_offset_x = img_x
         self.image_offset_y = img_y
 
-        self.canvas.create_image(img_x, img_y, anchor='nw', image=photo, tags='pdf_image')
-
         scroll_width = max(img_width + 20, canvas_width)
         scroll_height = max(img_height + 20, canvas_height)
         self.canvas.configure(scrollregion=(0, 0, scroll_width, scroll_height))
+        return img_x, img_y
+
+    def _reset_page_items(self):
+        """타일 모드 해제 및 어노테이션 항목 정리 (캔버스 항목은 호출자가 지움)"""
+        self._tile_provider = None
+        self._tile_items.clear()
+        self._annotation_items.clear()
+        if self._tile_update_pending is not None:
+            self.after_cancel(self._tile_update_pending)
+            self._tile_update_pending = None
+
+    def _schedule_tile_update(self):
+        """연속 스크롤 이벤트를 모아 한 번만 타일 갱신"""
+        if self._tile_provider is None or self._tile_update_pending is not None:
+            return
+        self._tile_update_pending = self.after_idle(self._render_visible_tiles)
 
-        self.update_controls(current_page, total_pages, zoom_level)
+    def _render_visible_tiles(self):
+        """보이는 영역의 타일을 그리고 주변 한 칸 밖의 타일은 해제"""
+        self._tile_update_pending = None
+        if self._tile_provider is None:
+            return
+
+        width, height = self._tiled_page_size
+        cols = -(-width // TILE_SIZE)
+        rows = -(-height // TILE_SIZE)
+
+        # 보이는 영역 (페이지 픽셀 좌표)
+        view_x0 = self.canvas.canvasx(0) - self.image_offset_x
+        view_y0 = self.canvas.canvasy(0) - self.image_offset_y
+        view_x1 = view_x0 + max(self.canvas.winfo_width(), 1)
+        view_y1 = view_y0 + max(self.canvas.winfo_height(), 1)
+
+        first_tx = max(0, int(view_x0 // TILE_SIZE))
+        last_tx = min(cols - 1, int((view_x1 - 1) // TILE_SIZE))
+        first_ty = max(0, int(view_y0 // TILE_SIZE))
+        last_ty = min(rows - 1, int((view_y1 - 1) // TILE_SIZE))
+
+        # 화면에서 한 칸 넘게 벗어난 타일은 PhotoImage까지 해제해 메모리를 일정하게 유지
+        for key in list(self._tile_items):
+            tx, ty = key
+            if not (first_tx - 1 <= tx <= last_tx + 1 and first_ty - 1 <= ty <= last_ty + 1):
+                item, _ = self._tile_items.pop(key)
+                self.canvas.delete(item)
+
+        for ty in range(first_ty, last_ty + 1):
+            for tx in range(first_tx, last_tx + 1):
+                if (tx, ty) in self._tile_items:
+                    continue
+                img = self._tile_provider(tx, ty)
+                if img is None:
+                    continue
+                photo = ImageTk.PhotoImage(img)
+                item = self.canvas.create_image(
+                    self.image_offset_x + tx * TILE_SIZE,
+                    self.image_offset_y + ty * TILE_SIZE,
+                    anchor='nw', image=photo, tags=('pdf_image', 'pdf_tile')
+                )
+                # 어노테이션과 드래그 중인 임시 도형보다 아래에 배치
+                self.canvas.tag_lower(item)
+                self._tile_items[(tx, ty)] = (item, photo)
 
     def update_controls(self, current_page: int, total_pages: int, zoom_level: float):
         """컨트롤 업데이트"""
@@ -562,6 +755,7 @@ class PDFViewerWidget(ttk.Frame):
     def scroll_to_top(self):
         """스크롤을 맨 위로"""
         self.canvas.yview_moveto(0)
+        self._schedule_tile_update()
 
 
 class AnnotationToolbar(tk.Frame):
@@ -584,7 +778,10 @@ class AnnotationToolbar(tk.Frame):
         self.on_undo: Optional[Callable] = None
         self.on_clear: Optional[Callable] = None
         self.on_capture: Optional[Callable] = None
+        self.on_export_pdf: Optional[Callable] = None
+        self.on_batch_export: Optional[Callable] = None
         self.on_auto_highlight_rules: Optional[Callable] = None
+        self.on_auto_highlight_document: Optional[Callable] = None
         self.on_auto_highlight_llm: Optional[Callable] = None
 
         self._create_ui()
@@ -734,6 +931,17 @@ class AnnotationToolbar(tk.Frame):
                                       command=self._on_capture)
         self.capture_btn.pack(side=tk.LEFT, padx=(0, 4))
 
+        # 주석 PDF 내보내기 버튼 (현재 리포트 / 저장된 어노테이션이 있는 리포트 전체)
+        self.export_btn = ttk.Button(toolbar_inner2, text="📄 PDF 내보내기",
+                                     style='Accent.TButton',
+                                     command=self._on_export_pdf)
+        self.export_btn.pack(side=tk.LEFT, padx=(0, 4))
+
+        self.batch_export_btn = ttk.Button(toolbar_inner2, text="📚 일괄 내보내기",
+                                           style='Accent.TButton',
+                                           command=self._on_batch_export)
+        self.batch_export_btn.pack(side=tk.LEFT, padx=(0, 4))
+
         # 구분선
         tk.Frame(toolbar_inner2, bg=self.colors['border'], width=1, height=24).pack(side=tk.LEFT, padx=12)
 
@@ -743,6 +951,12 @@ class AnnotationToolbar(tk.Frame):
                                               command=self._on_auto_highlight_rules)
         self.auto_highlight_btn.pack(side=tk.LEFT, padx=(0, 4))
 
+        # 문서 전체 자동 하이라이트 버튼 (진행 중에는 중지 버튼)
+        self.document_highlight_btn = ttk.Button(toolbar_inner2, text="📑 전체 문서",
+                                                  style='Accent.TButton',
+                                                  command=self._on_auto_highlight_document)
+        self.document_highlight_btn.pack(side=tk.LEFT, padx=(0, 4))
+
         # AI 정밀 분석 버튼 (LLM, API 키 있을 때만 활성 - app.py에서 제어)
         self.ai_highlight_btn = ttk.Button(toolbar_inner2, text="🧠 AI 정밀 분석",
                                             style='Accent.TButton',
@@ -871,10 +1085,26 @@ class AnnotationToolbar(tk.Frame):
         if self.on_capture:
             self.on_capture()
 
+    def _on_export_pdf(self):
+        if self.on_export_pdf:
+            self.on_export_pdf()
+
+    def _on_batch_export(self):
+        if self.on_batch_export:
+            self.on_batch_export()
+
+    def set_batch_export_enabled(self, enabled: bool):
+        """일괄 내보내기 버튼 상태 (진행 중에는 비활성)"""
+        self.batch_export_btn.configure(state='normal' if enabled else 'disabled')
+
     def _on_auto_highlight_rules(self):
         if self.on_auto_highlight_rules:
             self.on_auto_highlight_rules()
 
+    def _on_auto_highlight_document(self):
+        if self.on_auto_highlight_document:
+            self.on_auto_highlight_document()
+
     def _on_auto_highlight_llm(self):
         if self.on_auto_highlight_llm:
             self.on_auto_highlight_llm()
@@ -891,8 +1121,153 @@ class AnnotationToolbar(tk.Frame):
         """자동 하이라이트 버튼 활성화/비활성화 (분석 중 중복 클릭 방지용)"""
         self.auto_highlight_btn.configure(state='normal' if enabled else 'disabled')
 
+    def set_document_highlight_running(self, running: bool):
+        """문서 전체 자동 하이라이트 버튼 표시 (진행 중이면 중지 버튼)"""
+        self.document_highlight_btn.configure(text="⏹ 분석 중지" if running else "📑 전체 문서")
+
     def reset_tool(self):
         """도구 초기화"""
         self.current_tool = None
         self._deactivate_all_tools()
         self.tool_status.configure(text="")
+
+
+class ReportSearchDialog(tk.Toplevel):
+    """전체 리포트 텍스트 검색 창 (검색 색인 사용)"""
+
+    # (표시 이름, 범위 키)
+    SCOPES = [('오늘', 'day'), ('이번 달', 'month'), ('전체', 'all')]
+
+    def __init__(self, parent, colors: dict = None,
+                 on_search: Callable[[str, str], List[Any]] = None,
+                 on_open: Callable[[Any], None] = None):
+        """
+        Args:
+            on_search: (검색어, 범위 키) -> SearchHit 리스트
+            on_open: 결과를 열 때 SearchHit로 호출
+        """
+        super().__init__(parent)
+        self.colors = colors or COLORS
+        self.on_search = on_search
+        self.on_open = on_open
+        self.hits: List[Any] = []
+
+        self.title("전체 리포트 검색")
+        self.geometry("720x460")
+        self.configure(bg=self.colors['bg_card'])
+        self.transient(parent)
+
+        self._create_ui()
+
+    def _create_ui(self):
+        """UI 생성"""
+        inner_frame = ttk.Frame(self, style='Card.TFrame')
+        inner_frame.pack(fill=tk.BOTH, expand=True, padx=16, pady=16)
+
+        # 검색어 / 범위
+        query_frame = ttk.Frame(inner_frame, style='Card.TFrame')
+        query_frame.pack(fill=tk.X, pady=(0, 12))
+
+        self.query_var = tk.StringVar()
+        self.query_entry = tk.Entry(query_frame,
+                                    textvariable=self.query_var,
+                                    bg=self.colors['bg_elevated'],
+                                    fg=self.colors['text_primary'],
+                                    insertbackground=self.colors['text_primary'],
+                                    font=('Segoe UI', 10),
+                                    bd=0,
+                                    highlightthickness=1,
+                                    highlightbackground=self.colors['border'])
+        self.query_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, ipady=6)
+        self.query_entry.bind('<Return>', lambda e: self._on_search())
+
+        self.scope_var = tk.StringVar(value=self.SCOPES[0][0])
+        scope_box = ttk.Combobox(query_frame, textvariable=self.scope_var, width=8,
+                                 values=[label for label, _ in self.SCOPES], state='readonly')
+        scope_box.pack(side=tk.LEFT, padx=(8, 0))
+        scope_box.bind('<<ComboboxSelected>>', lambda e: self._on_search())
+
+        ttk.Button(query_frame, text="🔍 검색", style='Accent.TButton',
+                   command=self._on_search).pack(side=tk.LEFT, padx=(8, 0))
+
+        # 결과 목록
+        tree_frame = ttk.Frame(inner_frame, style='Card.TFrame')
+        tree_frame.pack(fill=tk.BOTH, expand=True)
+
+        columns = ('date', 'stock', 'firm', 'title', 'page', 'count')
+        self.tree = ttk.Treeview(tree_frame, columns=columns, show='headings',
+                                 style='Report.Treeview', selectmode='browse')
+        self.tree.heading('date', text='날짜')
+        self.tree.heading('stock', text='종목명')
+        self.tree.heading('firm', text='증권사')
+        self.tree.heading('title', text='리포트 제목')
+        self.tree.heading('page', text='페이지')
+        self.tree.heading('count', text='적중')
+
+        self.tree.column('date', width=70, minwidth=60, anchor='center')
+        self.tree.column('stock', width=90, minwidth=70, anchor='w')
+        self.tree.column('firm', width=80, minwidth=60, anchor='w')
+        self.tree.column('title', width=280, minwidth=120, anchor='w')
+        self.tree.column('page', width=50, minwidth=40, anchor='center')
+        self.tree.column('count', width=50, minwidth=40, anchor='center')
+
+        scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind('<Double-1>', lambda e: self._on_open())
+        self.tree.bind('<Return>', lambda e: self._on_open())
+
+        self.status_label = tk.Label(inner_frame, text="",
+                                     bg=self.colors['bg_card'],
+                                     fg=self.colors['text_secondary'],
+                                     font=('Segoe UI', 9), anchor='w')
+        self.status_label.pack(fill=tk.X, pady=(8, 0))
+
+        self.query_entry.focus_set()
+
+    def _scope_key(self) -> str:
+        label = self.scope_var.get()
+        for scope_label, key in self.SCOPES:
+            if scope_label == label:
+                return key
+        return 'all'
+
+    def _on_search(self):
+        """검색 실행"""
+        query = self.query_var.get().strip()
+        if not query or not self.on_search:
+            return
+        self.set_hits(self.on_search(query, self._scope_key()))
+
+    def set_hits(self, hits: List[Any]):
+        """검색 결과 표시"""
+        self.hits = hits
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+
+        for i, hit in enumerate(hits):
+            report = hit.report
+            self.tree.insert('', 'end', iid=str(i), values=(
+                report.date,
+                report.stock,
+                report.firm,
+                report.title,
+                hit.page + 1,
+                hit.count
+            ))
+
+        reports = len({hit.content_hash for hit in hits})
+        self.status_label.configure(text=f"리포트 {reports}개, {len(hits)}페이지에서 발견")
+
+    def _on_open(self):
+        """선택한 결과 열기"""
+        selection = self.tree.selection()
+        if not selection or not self.on_open:
+            return
+        try:
+            hit = self.hits[int(selection[0])]
+        except (ValueError, IndexError):
+            return
+        self.on_open(hit)
@@ -0,0 +1,149 @@
+"""
+annotation_store.py 단위 테스트
+"""
+
+import os
+import tempfile
+import unittest
+
+import fitz
+
+from src.annotation_store import AnnotationStore
+from src.models import Annotation
+from src.pdf_handler import PDFHandler
+
+
+def _open_test_pdf(handler, pages=3, content_hash="hash-a"):
+    doc = fitz.open()
+    for i in range(pages):
+        doc.new_page(width=200, height=100)
+    handler._open_document(fitz.open(stream=doc.tobytes(), filetype="pdf"), content_hash)
+    doc.close()
+
+
+class TestAnnotationStore(unittest.TestCase):
+    """AnnotationStore 테스트"""
+
+    def setUp(self):
+        self.store = AnnotationStore(':memory:')
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_empty(self):
+        self.assertEqual(self.store.load("missing"), {})
+        self.assertEqual(self.store.count("missing"), 0)
+
+    def test_roundtrip(self):
+        annotations = {
+            0: [Annotation(type='highlight', coords=(1, 2, 3, 4), color='#00FF00',
+                           alpha=120, zoom=1.5, id=3, kind='auto')],
+            2: [Annotation(type='line', coords=(5, 6, 7, 8), color='#FF0000', width=4, id=9)],
+        }
+        self.assertEqual(self.store.save("hash-a", annotations), 2)
+
+        loaded = self.store.load("hash-a")
+        self.assertEqual(sorted(loaded), [0, 2])
+        self.assertEqual(loaded[0][0].to_dict(), annotations[0][0].to_dict())
+        self.assertEqual(loaded[2][0].to_dict(), annotations[2][0].to_dict())
+
+    def test_preserves_order_within_page(self):
+        # id 순서가 아니라 추가된(리스트) 순서를 유지
+        annotations = {0: [Annotation(type='highlight', coords=(i, 0, i + 1, 1), id=10 - i)
+                           for i in range(5)]}
+        self.store.save("hash-a", annotations)
+        self.assertEqual([a.id for a in self.store.load("hash-a")[0]], [10, 9, 8, 7, 6])
+
+    def test_search_highlights_not_saved(self):
+        annotations = {0: [Annotation(type='highlight', coords=(0, 0, 1, 1), id=1, kind='search'),
+                           Annotation(type='highlight', coords=(0, 0, 1, 1), id=2)]}
+        self.assertEqual(self.store.save("hash-a", annotations), 1)
+        self.assertEqual([a.id for a in self.store.load("hash-a")[0]], [2])
+
+    def test_save_replaces_document(self):
+        self.store.save("hash-a", {0: [Annotation(type='highlight', coords=(0, 0, 1, 1), id=1)]})
+        self.store.save("hash-a", {1: [Annotation(type='line', coords=(0, 0, 1, 1), id=2)]})
+        self.assertEqual(sorted(self.store.load("hash-a")), [1])
+
+        self.store.save("hash-a", {})
+        self.assertEqual(self.store.count("hash-a"), 0)
+
+    def test_documents_isolated(self):
+        self.store.save("hash-a", {0: [Annotation(type='highlight', coords=(0, 0, 1, 1), id=1)]})
+        self.store.save("hash-b", {0: [Annotation(type='line', coords=(0, 0, 1, 1), id=1)]})
+        self.assertEqual(self.store.load("hash-a")[0][0].type, 'highlight')
+        self.assertEqual(self.store.load("hash-b")[0][0].type, 'line')
+
+    def test_persists_on_disk(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'sub', 'annotations.db')
+            store = AnnotationStore(path)
+            store.save("hash-a", {0: [Annotation(type='highlight', coords=(0, 0, 1, 1), id=1)]})
+            store.close()
+
+            store = AnnotationStore(path)
+            self.assertEqual(store.count("hash-a"), 1)
+            store.close()
+
+
+class TestHandlerPersistence(unittest.TestCase):
+    """PDFHandler 어노테이션 복원/변경 알림 테스트"""
+
+    def setUp(self):
+        self.handler = PDFHandler()
+        _open_test_pdf(self.handler)
+        self.changes = 0
+        self.handler.on_annotations_changed = self._on_change
+
+    def tearDown(self):
+        self.handler.reset()
+
+    def _on_change(self):
+        self.changes += 1
+
+    def test_changes_notified(self):
+        ann = self.handler.add_highlight(0, (0, 0, 10, 10), '#FFFF00', 77, 1.0)
+        self.handler.add_line(0, (0, 0, 10, 10), '#FF0000', 3, 1.0)
+        self.handler.remove_annotation(0, ann)
+        self.handler.restore_annotation(0, ann)
+        self.handler.clear_annotations(0)
+        self.assertEqual(self.changes, 5)
+
+    def test_search_highlights_not_notified(self):
+        self.handler.add_search_highlight(0, (0, 0, 10, 10))
+        self.handler.clear_search_highlights()
+        self.assertEqual(self.changes, 0)
+
+    def test_reload_restores_without_notifying(self):
+        store = AnnotationStore(':memory:')
+        self.addCleanup(store.close)
+
+        first = self.handler.add_highlight(0, (0, 0, 10, 10), '#FFFF00', 77, 1.0, kind='auto')
+        second = self.handler.add_line(2, (0, 0, 10, 10), '#FF0000', 3, 1.0)
+        store.save(self.handler.content_hash,
+                   {p: self.handler.get_annotations(p) for p in self.handler.annotations})
+
+        _open_test_pdf(self.handler)
+        self.assertEqual(self.handler.annotations, {})
+        self.changes = 0
+
+        self.assertEqual(self.handler.load_annotations(store.load("hash-a")), 2)
+        self.assertEqual(self.changes, 0)
+        self.assertEqual([a.id for a in self.handler.get_annotations(0)], [first.id])
+        self.assertEqual(self.handler.get_annotations(0)[0].kind, 'auto')
+        self.assertEqual([a.id for a in self.handler.get_annotations(2)], [second.id])
+        self.assertIsNotNone(self.handler.find_annotation_at_point(0, 5, 5, 1.0))
+
+        # 새로 추가하는 어노테이션 id는 복원된 id와 겹치지 않음
+        new = self.handler.add_highlight(1, (0, 0, 1, 1), '#FFFF00', 77, 1.0)
+        self.assertGreater(new.id, max(first.id, second.id))
+
+    def test_load_skips_out_of_range_pages(self):
+        loaded = self.handler.load_annotations(
+            {7: [Annotation(type='highlight', coords=(0, 0, 1, 1), id=1)]})
+        self.assertEqual(loaded, 0)
+        self.assertEqual(self.handler.annotations, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
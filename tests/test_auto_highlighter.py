@@ -0,0 +1,112 @@
+"""
+auto_highlighter.py 단위 테스트
+"""
+
+import json
+import os
+import random
+import re
+import unittest
+
+from src.auto_highlighter import AutoHighlighter, CATEGORY_PRIORITY
+from src.config import AUTO_HIGHLIGHT_CATEGORIES, AUTO_HIGHLIGHT_CATEGORY_COLORS
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), 'fixtures', 'report_page_blocks.json')
+
+
+def classify_per_line(lines):
+    """이전 구현과 같은 라인별 분류 (비교 기준)"""
+    for category in CATEGORY_PRIORITY:
+        for line in lines:
+            for pattern in AUTO_HIGHLIGHT_CATEGORIES[category]:
+                if re.search(pattern, line, re.IGNORECASE):
+                    return category
+    return None
+
+
+def split_lines(block):
+    return [l.strip() for l in block.split('\n') if l.strip()]
+
+
+class TestClassifyBlock(unittest.TestCase):
+    """단락 분류 테스트"""
+
+    def setUp(self):
+        self.highlighter = AutoHighlighter()
+        with open(FIXTURE_PATH, encoding='utf-8') as f:
+            self.pages = json.load(f)
+
+    def test_priority(self):
+        classify = self.highlighter._classify_block
+        self.assertEqual(classify(['영업이익 1,234억원', '목표주가 95,000원']), 'target')
+        self.assertEqual(classify(['매출액 6.1조원', '수요 둔화 우려']), 'risk')
+        self.assertEqual(classify(['수요 증가', '영업이익 1,573억원']), 'financial')
+        self.assertEqual(classify(['신제품 출시']), 'growth')
+        self.assertIsNone(classify(['자료: 하나증권 리서치센터']))
+
+    def test_match_does_not_cross_lines(self):
+        # 라인별로는 어떤 목표주가 패턴에도 맞지 않음 (단락으로 이어 붙여도 같아야 함)
+        lines = ['목표주가', '95,000원']
+        self.assertIsNone(classify_per_line(lines))
+        self.assertIsNone(self.highlighter._classify_block(lines))
+
+        lines = ['상향', '조정 이후 수요 증가']
+        self.assertEqual(self.highlighter._classify_block(lines), classify_per_line(lines))
+
+    def test_equivalent_to_per_line_on_fixture(self):
+        blocks = [split_lines(block) for page in self.pages for block in page]
+        self.assertTrue(any(classify_per_line(lines) for lines in blocks))
+        for lines in blocks:
+            with self.subTest(lines=lines[:1]):
+                self.assertEqual(self.highlighter._classify_block(lines),
+                                 classify_per_line(lines))
+
+    def test_equivalent_to_per_line_on_shuffled_lines(self):
+        # 서로 다른 블록의 라인을 섞어 카테고리가 섞인 단락 생성
+        lines = [line for page in self.pages for block in page for line in split_lines(block)]
+        rng = random.Random(7)
+        for _ in range(300):
+            sample = rng.sample(lines, rng.randint(1, 6))
+            self.assertEqual(self.highlighter._classify_block(sample),
+                             classify_per_line(sample))
+
+    def test_analyze_with_rules(self):
+        spans = self.highlighter.analyze_with_rules(self.pages[0])
+        categories = {span.category for span in spans}
+        self.assertIn('target', categories)
+        for span in spans:
+            self.assertEqual(span.color, AUTO_HIGHLIGHT_CATEGORY_COLORS[span.category])
+        self.assertEqual(len({span.snippet for span in spans}), len(spans))
+
+
+class TestLineBoxes(unittest.TestCase):
+    """라인 사각형 전달 테스트"""
+
+    def setUp(self):
+        self.highlighter = AutoHighlighter()
+
+    def test_spans_carry_line_boxes(self):
+        blocks = ["목표주가 95,000원\n실적 개선 기대\n", "자료: 리서치센터\n"]
+        boxes = [[(10, 10, 90, 20), (10, 22, 80, 32)], [(10, 50, 60, 60)]]
+        spans = self.highlighter.analyze_with_rules(blocks, boxes)
+        self.assertEqual([(s.snippet, s.bbox) for s in spans],
+                         [("목표주가 95,000원", (10, 10, 90, 20)),
+                          ("실적 개선 기대", (10, 22, 80, 32))])
+
+    def test_same_text_at_different_places(self):
+        # 위치가 다르면 같은 문구도 각자 스팬 (위치가 없으면 한 번만)
+        blocks = ["목표주가 95,000원\n", "목표주가 95,000원\n"]
+        boxes = [[(10, 10, 90, 20)], [(10, 200, 90, 210)]]
+        spans = self.highlighter.analyze_with_rules(blocks, boxes)
+        self.assertEqual([s.bbox for s in spans], [(10, 10, 90, 20), (10, 200, 90, 210)])
+        self.assertEqual(len(self.highlighter.analyze_with_rules(blocks)), 1)
+
+    def test_mismatched_boxes_ignored(self):
+        spans = self.highlighter.analyze_with_rules(["목표주가 95,000원\n"], [])
+        self.assertIsNone(spans[0].bbox)
+        spans = self.highlighter.analyze_with_rules("목표주가 95,000원")
+        self.assertIsNone(spans[0].bbox)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,7 +13,8 @@ from src.config import (
     LINE_WIDTH_OPTIONS, DEFAULT_LINE_WIDTH,
     WINDOW_TITLE, WINDOW_GEOMETRY, WINDOW_MIN_SIZE,
     MAX_PAGES_TO_FETCH, REQUEST_TIMEOUT, PDF_DOWNLOAD_TIMEOUT,
-    ALLOWED_PDF_DOMAINS, PARSER
+    FETCH_MAX_WORKERS, MAX_CONSECUTIVE_ERRORS,
+    ALLOWED_PDF_DOMAINS, PARSER, LISTING_PARSER
 )
 
 
@@ -136,6 +137,13 @@ class TestScrapingConfig(unittest.TestCase):
     def test_pdf_timeout_greater_than_request(self):
         self.assertGreaterEqual(PDF_DOWNLOAD_TIMEOUT, REQUEST_TIMEOUT)
 
+    def test_fetch_workers_within_pages(self):
+        self.assertGreaterEqual(FETCH_MAX_WORKERS, 1)
+        self.assertLessEqual(FETCH_MAX_WORKERS, MAX_PAGES_TO_FETCH)
+
+    def test_max_consecutive_errors_positive(self):
+        self.assertGreater(MAX_CONSECUTIVE_ERRORS, 0)
+
 
 class TestSecurityConfig(unittest.TestCase):
     """보안 설정 테스트"""
@@ -151,6 +159,10 @@ class TestSecurityConfig(unittest.TestCase):
     def test_parser_valid(self):
         self.assertIn(PARSER, ('lxml', 'html.parser'))
 
+    def test_listing_parser_follows_parser(self):
+        self.assertIn(LISTING_PARSER, ('lxml', 'bs4'))
+        self.assertEqual(LISTING_PARSER == 'lxml', PARSER == 'lxml')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,167 @@
+"""
+highlight_cache.py 단위 테스트
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import fitz
+
+from src import highlight_cache
+from src.auto_highlighter import HighlightSpan
+from src.highlight_cache import HighlightCache, HighlightCacheWarmer, ruleset_version
+from src.highlight_jobs import analyze_document_pages
+from src.pdf_handler import PDFHandler
+
+PAGES = [
+    ["목표주가 95,000원으로 상향"],
+    ["자료: A증권 리서치센터"],
+    ["수요 둔화 우려가 남아 있다"],
+]
+
+
+def _pdf_bytes(lines_per_page):
+    doc = fitz.open()
+    for lines in lines_per_page:
+        page = doc.new_page(width=400, height=300)
+        page.insert_text((20, 50), "\n".join(lines), fontname="korea", fontsize=11)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _resolved():
+    return [
+        (HighlightSpan(category='target', snippet='목표주가 95,000원', color='#FF0000', alpha=90,
+                       bbox=(10.0, 10.0, 90.0, 20.0)), [(10.0, 10.0, 90.0, 20.0)]),
+        (HighlightSpan(category='growth', snippet='신제품 출시', color='#0000FF', alpha=90),
+         [(5.0, 30.0, 50.0, 40.0), (5.0, 200.0, 50.0, 210.0)]),
+    ]
+
+
+class TestRulesetVersion(unittest.TestCase):
+    """규칙 버전 테스트"""
+
+    def test_changes_with_rules(self):
+        version = ruleset_version()
+        self.assertEqual(version, ruleset_version())
+        changed = dict(highlight_cache.AUTO_HIGHLIGHT_CATEGORIES, target=[r'목표가'])
+        with patch.object(highlight_cache, 'AUTO_HIGHLIGHT_CATEGORIES', changed):
+            self.assertNotEqual(ruleset_version(), version)
+        with patch.object(highlight_cache, 'AUTO_HIGHLIGHT_ALPHA', 1):
+            self.assertNotEqual(ruleset_version(), version)
+
+
+class TestHighlightCache(unittest.TestCase):
+    """HighlightCache 테스트"""
+
+    def setUp(self):
+        self.cache = HighlightCache(':memory:')
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_roundtrip(self):
+        self.assertIsNone(self.cache.get('abc', 0))
+        self.cache.put('abc', 0, _resolved())
+        self.cache.put('abc', 1, [])
+        self.assertEqual(self.cache.get('abc', 0), _resolved())
+        self.assertEqual(self.cache.get('abc', 1), [])
+        self.assertIsNone(self.cache.get('other', 0))
+        self.assertEqual(self.cache.cached_pages('abc'), {0, 1})
+        self.assertEqual(self.cache.get_document('abc'), {0: _resolved(), 1: []})
+
+    def test_put_replaces(self):
+        self.cache.put('abc', 0, _resolved())
+        self.cache.put('abc', 0, _resolved()[:1])
+        self.assertEqual(self.cache.get('abc', 0), _resolved()[:1])
+
+    def test_is_complete(self):
+        self.cache.put('abc', 0, [])
+        self.assertFalse(self.cache.is_complete('abc'))
+        self.cache.put_pages('abc', [(0, []), (1, _resolved())], page_count=2)
+        self.assertTrue(self.cache.is_complete('abc'))
+
+    def test_other_ruleset_pruned(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'highlight_cache.db')
+            old = HighlightCache(path, ruleset='old')
+            old.put_pages('abc', [(0, _resolved())], page_count=1)
+            old.close()
+
+            reopened = HighlightCache(path, ruleset='old')
+            self.assertEqual(reopened.get('abc', 0), _resolved())
+            reopened.close()
+
+            current = HighlightCache(path, ruleset='new')
+            self.assertIsNone(current.get('abc', 0))
+            self.assertFalse(current.is_complete('abc'))
+            current.close()
+
+            again = HighlightCache(path, ruleset='old')
+            self.assertIsNone(again.get('abc', 0))
+            again.close()
+
+
+class TestHighlightCacheWarmer(unittest.TestCase):
+    """HighlightCacheWarmer 테스트"""
+
+    def setUp(self):
+        self.data = _pdf_bytes(PAGES)
+        self.cache = HighlightCache(':memory:')
+        self.warmer = HighlightCacheWarmer(self.cache, max_workers=1)
+
+    def tearDown(self):
+        self.warmer.close()
+        self.cache.close()
+
+    def test_warms_whole_document(self):
+        self.assertTrue(self.warmer.submit('abc', self.data))
+        self.warmer.wait(timeout=60)
+        self.assertTrue(self.cache.is_complete('abc'))
+        self.assertEqual(self.cache.get_document('abc'), dict(analyze_document_pages(self.data)))
+
+    def test_from_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'report.pdf')
+            with open(path, 'wb') as f:
+                f.write(self.data)
+            self.warmer.submit('abc', path)
+            self.warmer.wait(timeout=60)
+        self.assertEqual(self.cache.get('abc', 2)[0][0].category, 'risk')
+
+    def test_temp_file_document_after_switch(self):
+        # 캐시 없이 받은 임시 파일은 리포트를 바꾸면 삭제됨 — 미리 분석은 그 뒤에 실행돼도 성공해야 함
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'download.part')
+            with open(path, 'wb') as f:
+                f.write(self.data)
+            handler = PDFHandler()
+            handler._open_document(fitz.open(path), 'abc', temp_path=path)
+            source = handler.document_source()
+            handler.reset()
+            self.assertFalse(os.path.exists(path))
+
+        self.assertTrue(self.warmer.submit('abc', source))
+        self.warmer.wait(timeout=60)
+        self.assertTrue(self.cache.is_complete('abc'))
+
+    def test_skips_complete_document(self):
+        self.cache.put_pages('abc', [(0, [])], page_count=1)
+        self.warmer.submit('abc', self.data)
+        self.warmer.wait(timeout=60)
+        self.assertEqual(self.cache.cached_pages('abc'), {0})
+
+    def test_invalid_and_closed(self):
+        self.warmer.submit('bad', b'not a pdf')
+        self.warmer.wait(timeout=60)
+        self.assertFalse(self.cache.is_complete('bad'))
+        self.assertFalse(self.warmer.submit('', self.data))
+        self.warmer.close()
+        self.assertFalse(self.warmer.submit('abc', self.data))
+
+
+if __name__ == '__main__':
+    unittest.main()
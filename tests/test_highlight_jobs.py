@@ -0,0 +1,238 @@
+"""
+highlight_jobs.py 단위 테스트
+"""
+
+import os
+import pickle
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import fitz
+
+from src.auto_highlighter import AutoHighlighter, HighlightSpan
+from src.config import AUTO_HIGHLIGHT_ALPHA, AUTO_HIGHLIGHT_CATEGORY_COLORS
+from src.highlight_cache import HighlightCache
+from src.highlight_jobs import (
+    DocumentHighlighter, PackedHighlights, analyze_document_pages, analyze_page_text, batch_analyze
+)
+from src.pdf_handler import PDFHandler
+from src.text_cache import PageText
+
+PAGES = [
+    ["목표주가 95,000원으로 상향", "실적 개선 기대"],
+    ["자료: A증권 리서치센터"],
+    ["수요 둔화 우려가 남아 있다"],
+    ["영업이익 1,234억원 기록"],
+    ["HBM 신규 고객 확보로 수혜"],
+]
+
+
+def _pdf_bytes(lines_per_page):
+    doc = fitz.open()
+    for lines in lines_per_page:
+        page = doc.new_page(width=400, height=300)
+        page.insert_text((20, 50), "\n".join(lines), fontname="korea", fontsize=11)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class TestAnalyzePages(unittest.TestCase):
+    """페이지 분석 함수 테스트"""
+
+    def setUp(self):
+        self.data = _pdf_bytes(PAGES)
+
+    def test_analyze_page_text(self):
+        with fitz.open(stream=self.data, filetype="pdf") as doc:
+            page = doc[0]
+            page_text = PageText.from_rawdict(page.get_text("rawdict", flags=fitz.TEXTFLAGS_TEXT))
+            expected = page.search_for("목표주가 95,000원으로 상향")[0]
+
+        resolved = analyze_page_text(AutoHighlighter(), page_text)
+        self.assertEqual(resolved[0][0].category, 'target')
+        self.assertEqual(len(resolved[0][1]), 1)
+        for got, want in zip(resolved[0][1][0], expected):
+            self.assertAlmostEqual(got, want, places=3)
+
+    def test_duplicate_line_not_misplaced(self):
+        # 분류된 단락의 라인과 같은 문구가 다른 (분류되지 않은) 단락에도 있는 페이지
+        doc = fitz.open()
+        page = doc.new_page(width=400, height=300)
+        page.insert_text((20, 50), "목표주가 95,000원으로 상향\n실적 개선 기대",
+                         fontname="korea", fontsize=11)
+        page.insert_text((20, 250), "실적 개선 기대", fontname="korea", fontsize=11)
+        self.assertEqual(len(page.search_for("실적 개선 기대")), 2)
+        page_text = PageText.from_rawdict(page.get_text("rawdict", flags=fitz.TEXTFLAGS_TEXT))
+        doc.close()
+
+        with patch.object(PageText, 'search', side_effect=AssertionError("검색 호출됨")):
+            resolved = analyze_page_text(AutoHighlighter(), page_text)
+        rects = {span.snippet: found for span, found in resolved}
+        self.assertEqual(len(rects["실적 개선 기대"]), 1)
+        self.assertLess(rects["실적 개선 기대"][0][3], 100)
+
+    def test_analyze_document_pages(self):
+        results = analyze_document_pages(self.data, [3, 1, 0, 99])
+        self.assertEqual([page for page, _ in results], [3, 1, 0])
+        categories = {page: [span.category for span, _ in resolved] for page, resolved in results}
+        self.assertEqual(categories[3], ['financial'])
+        self.assertEqual(categories[1], [])
+        self.assertEqual(categories[0], ['target', 'target'])
+
+    def test_analyze_all_pages(self):
+        results = analyze_document_pages(self.data)
+        self.assertEqual([page for page, _ in results], list(range(len(PAGES))))
+
+    def test_analyze_document_pages_from_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'report.pdf')
+            with open(path, 'wb') as f:
+                f.write(self.data)
+            results = analyze_document_pages(path, [2])
+        self.assertEqual(results[0][1][0][0].category, 'risk')
+
+
+class TestDocumentHighlighter(unittest.TestCase):
+    """DocumentHighlighter 테스트"""
+
+    def setUp(self):
+        self.data = _pdf_bytes(PAGES)
+        self.highlighter = DocumentHighlighter(max_workers=2, pages_per_task=2)
+
+    def tearDown(self):
+        self.highlighter.close()
+
+    def _run(self, first_page=0):
+        pages = []
+        done = threading.Event()
+        job = self.highlighter.start(self.data, len(PAGES),
+                                     lambda page, resolved: pages.append((page, resolved)),
+                                     done.set, first_page=first_page)
+        self.assertIsNotNone(job)
+        self.assertTrue(done.wait(timeout=60))
+        return job, pages
+
+    def test_streams_every_page(self):
+        job, pages = self._run(first_page=3)
+        self.assertEqual(sorted(page for page, _ in pages), list(range(len(PAGES))))
+        self.assertTrue(self.highlighter.is_current(job))
+        self.assertFalse(self.highlighter.running)
+
+        expected = dict(analyze_document_pages(self.data, range(len(PAGES))))
+        for page, resolved in pages:
+            self.assertEqual([span.snippet for span, _ in resolved],
+                             [span.snippet for span, _ in expected[page]])
+
+    def test_cancel_discards_results(self):
+        pages = []
+        done = threading.Event()
+        job = self.highlighter.start(self.data, len(PAGES),
+                                     lambda page, resolved: pages.append(page), done.set)
+        self.highlighter.cancel()
+        self.assertFalse(self.highlighter.is_current(job))
+        self.highlighter.wait(timeout=60)
+        self.assertFalse(done.wait(timeout=0.5))
+        self.assertFalse(self.highlighter.running)
+
+    def test_restart_replaces_job(self):
+        first = self.highlighter.start(self.data, len(PAGES), lambda page, resolved: None)
+        second, pages = self._run()
+        self.assertNotEqual(first, second)
+        self.assertFalse(self.highlighter.is_current(first))
+        self.assertEqual(len(pages), len(PAGES))
+
+    def test_only_requested_pages(self):
+        pages = []
+        done = threading.Event()
+        job = self.highlighter.start(self.data, len(PAGES),
+                                     lambda page, resolved: pages.append(page), done.set,
+                                     first_page=3, pages=[0, 4])
+        self.assertIsNotNone(job)
+        self.assertTrue(done.wait(timeout=60))
+        self.assertEqual(sorted(pages), [0, 4])
+        self.assertIsNone(self.highlighter.start(self.data, len(PAGES),
+                                                 lambda page, resolved: None, pages=[]))
+
+    def test_empty_and_closed(self):
+        self.assertIsNone(self.highlighter.start(self.data, 0, lambda page, resolved: None))
+        self.highlighter.close()
+        self.assertIsNone(self.highlighter.start(self.data, len(PAGES),
+                                                 lambda page, resolved: None))
+
+
+class TestBatchAnalyze(unittest.TestCase):
+    """batch_analyze / PackedHighlights 테스트"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.paths = []
+        for i, pages in enumerate([PAGES, PAGES[2:], [["자료: 리서치센터"]]]):
+            path = os.path.join(self.tmp.name, f'report{i}.pdf')
+            with open(path, 'wb') as f:
+                f.write(_pdf_bytes(pages))
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_pack_roundtrip(self):
+        expected = analyze_document_pages(self.paths[0])
+        packed = PackedHighlights.from_pages(self.paths[0], expected)
+        self.assertEqual(packed.page_count, len(PAGES))
+        self.assertEqual(packed.span_count, sum(len(resolved) for _, resolved in expected))
+
+        # 좌표까지 원래 결과와 정확히 같아야 함 (어노테이션 중복 검사가 좌표를 그대로 비교)
+        self.assertEqual(pickle.loads(pickle.dumps(packed)).unpack(), expected)
+
+    def test_batch_results_cached_and_reapplied(self):
+        # 화면에서 분석해 적용한 결과를 일괄 분석 결과로 캐시에 덮어쓴 뒤 다시 적용해도 중복되지 않아야 함
+        # (float32로 반올림되는 좌표 사용)
+        rect = (20.1, 38.7, 180.3, 52.9)
+        span = HighlightSpan(category='target', snippet='목표주가 95,000원으로 상향',
+                             color=AUTO_HIGHLIGHT_CATEGORY_COLORS['target'],
+                             alpha=AUTO_HIGHLIGHT_ALPHA, bbox=rect)
+        live = [(0, [(span, [rect])]), (1, [])]
+
+        handler = PDFHandler()
+        handler._open_document(fitz.open(self.paths[0]), 'abc')
+        cache = HighlightCache(':memory:')
+        try:
+            self.assertEqual(len(handler.add_resolved_highlights(0, live[0][1], 1.0)), 1)
+
+            packed = pickle.loads(pickle.dumps(PackedHighlights.from_pages(self.paths[0], live)))
+            cache.put_pages('abc', packed.unpack(), page_count=packed.page_count)
+            for _ in range(2):
+                for page, resolved in cache.get_document('abc').items():
+                    self.assertEqual(handler.add_resolved_highlights(page, resolved, 1.0), [])
+            self.assertEqual(len(handler.get_annotations(0)), 1)
+        finally:
+            cache.close()
+            handler.reset()
+
+    def test_batch_matches_single_file_analysis(self):
+        results = batch_analyze(self.paths, max_workers=2)
+        self.assertEqual([packed.path for packed in results], self.paths)
+        inline = batch_analyze(self.paths, max_workers=1)
+        for packed, single in zip(results, inline):
+            self.assertIsNone(packed.error)
+            self.assertEqual(packed.snippets, single.snippets)
+            self.assertEqual(packed.rects, single.rects)
+        self.assertEqual(results[1].page_count, 3)
+        self.assertEqual(results[2].span_count, 0)
+
+    def test_bad_file_does_not_stop_batch(self):
+        bad = os.path.join(self.tmp.name, 'broken.pdf')
+        with open(bad, 'wb') as f:
+            f.write(b'not a pdf')
+        results = batch_analyze([bad, self.paths[0]], max_workers=2)
+        self.assertIsNotNone(results[0].error)
+        self.assertEqual(results[0].unpack(), [])
+        self.assertIsNone(results[1].error)
+        self.assertEqual(batch_analyze([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+"""
+http_cache.py 단위 테스트
+"""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from src.http_cache import HTTPCache, CachingSession
+
+LIST_URL = "https://finance.naver.com/research/company_list.naver?&page=1"
+READ_URL = "https://finance.naver.com/research/company_read.naver?nid=1"
+OTHER_URL = "https://finance.naver.com/other"
+
+
+def _response(status=200, body=b"<html>ok</html>", headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers or {'Content-Type': 'text/html; charset=utf-8'})
+    return response
+
+
+class TestHTTPCache(unittest.TestCase):
+    """HTTPCache 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = HTTPCache(
+            self._tmp.name,
+            ttl_rules=[(r'company_read\.naver', None), (r'company_list\.naver', 60)],
+            default_ttl=0,
+        )
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_ttl_rules(self):
+        self.assertIsNone(self.cache.ttl_for(READ_URL))
+        self.assertEqual(self.cache.ttl_for(LIST_URL), 60)
+        self.assertEqual(self.cache.ttl_for(OTHER_URL), 0)
+
+    def test_store_and_lookup(self):
+        self.cache.store(LIST_URL, _response(headers={'ETag': '"abc"'}))
+        entry = self.cache.lookup(LIST_URL)
+        self.assertIsNotNone(entry)
+        self.assertEqual(entry.etag, '"abc"')
+        self.assertEqual(entry.to_response().content, b"<html>ok</html>")
+
+    def test_lookup_missing(self):
+        self.assertIsNone(self.cache.lookup(LIST_URL))
+
+    def test_cached_response_keeps_encoding(self):
+        self.cache.store(LIST_URL, _response(headers={'Content-Type': 'text/html; charset=euc-kr'}))
+        response = self.cache.lookup(LIST_URL).to_response()
+        self.assertEqual(response.encoding, 'euc-kr')
+
+    def test_discard(self):
+        self.cache.store(READ_URL, _response())
+        self.cache.discard(READ_URL)
+        self.assertIsNone(self.cache.lookup(READ_URL))
+        self.assertEqual(os.listdir(self._tmp.name), [])
+        self.cache.discard(READ_URL)  # 없는 항목은 무시
+
+    def test_prune_removes_oldest(self):
+        cache = HTTPCache(self._tmp.name, max_bytes=10)
+        cache.store(LIST_URL, _response(body=b"x" * 8))
+        old_body = cache._paths(LIST_URL)[1]
+        os.utime(old_body, (time.time() - 100, time.time() - 100))
+        cache.store(READ_URL, _response(body=b"y" * 8))
+
+        cache.prune()
+
+        self.assertIsNone(cache.lookup(LIST_URL))
+        self.assertIsNotNone(cache.lookup(READ_URL))
+
+    def test_store_enforces_max_bytes(self):
+        cache = HTTPCache(self._tmp.name, max_bytes=20)
+        for i in range(10):
+            url = f"{OTHER_URL}/{i}"
+            cache.store(url, _response(body=b"z" * 8))
+            os.utime(cache._paths(url)[1], (time.time() - 100 + i, time.time() - 100 + i))
+
+        bodies = [n for n in os.listdir(self._tmp.name) if n.endswith('.body')]
+        self.assertLessEqual(len(bodies) * 8, 20)
+        # 가장 최근 항목은 남음
+        self.assertIsNotNone(cache.lookup(f"{OTHER_URL}/9"))
+        self.assertIsNone(cache.lookup(f"{OTHER_URL}/0"))
+
+
+class TestCachingSession(unittest.TestCase):
+    """CachingSession 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = HTTPCache(
+            self._tmp.name,
+            ttl_rules=[(r'company_read\.naver', None), (r'company_list\.naver', 60)],
+            default_ttl=0,
+        )
+        self.session = CachingSession(self.cache)
+
+    def tearDown(self):
+        self.session.close()
+        self._tmp.cleanup()
+
+    @patch.object(requests.Session, 'get')
+    def test_detail_page_cached_permanently(self, mock_get):
+        mock_get.return_value = _response(body=b"detail")
+
+        first = self.session.get(READ_URL, timeout=10)
+        second = self.session.get(READ_URL, timeout=10)
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(second.content, b"detail")
+        self.assertEqual(first.content, second.content)
+        self.assertEqual(self.cache.stats, {'hits': 1, 'revalidated': 0, 'misses': 1, 'errors': 0})
+
+    @patch.object(requests.Session, 'get')
+    def test_conditional_request_after_ttl(self, mock_get):
+        mock_get.return_value = _response(
+            body=b"list", headers={'ETag': '"v1"', 'Last-Modified': 'Mon, 02 Feb 2026 00:00:00 GMT'}
+        )
+        self.session.get(OTHER_URL, timeout=10)
+
+        mock_get.return_value = _response(status=304, body=b"")
+        response = self.session.get(OTHER_URL, timeout=10)
+
+        headers = mock_get.call_args.kwargs['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+        self.assertEqual(headers['If-Modified-Since'], 'Mon, 02 Feb 2026 00:00:00 GMT')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b"list")
+        self.assertEqual(self.cache.revalidated, 1)
+
+    @patch.object(requests.Session, 'get')
+    def test_changed_content_replaces_entry(self, mock_get):
+        mock_get.return_value = _response(body=b"v1", headers={'ETag': '"v1"'})
+        self.session.get(OTHER_URL, timeout=10)
+
+        mock_get.return_value = _response(body=b"v2", headers={'ETag': '"v2"'})
+        response = self.session.get(OTHER_URL, timeout=10)
+
+        self.assertEqual(response.content, b"v2")
+        self.assertEqual(self.cache.lookup(OTHER_URL).etag, '"v2"')
+        self.assertEqual(self.cache.misses, 2)
+
+    @patch.object(requests.Session, 'get')
+    def test_error_responses_not_cached(self, mock_get):
+        mock_get.return_value = _response(status=500, body=b"error")
+        self.session.get(READ_URL, timeout=10)
+        self.assertIsNone(self.cache.lookup(READ_URL))
+        self.assertEqual(self.cache.misses, 0)
+        self.assertEqual(self.cache.errors, 1)
+
+    @patch.object(requests.Session, 'get')
+    def test_listing_ttl_expiry(self, mock_get):
+        mock_get.return_value = _response(body=b"list")
+        self.session.get(LIST_URL, timeout=10)
+        self.session.get(LIST_URL, timeout=10)
+        self.assertEqual(mock_get.call_count, 1)
+
+        # TTL 경과 후에는 다시 요청
+        with patch('src.http_cache.time.time', return_value=time.time() + 120):
+            self.session.get(LIST_URL, timeout=10)
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch.object(requests.Session, 'get')
+    def test_no_cache_passthrough(self, mock_get):
+        session = CachingSession(None)
+        mock_get.return_value = _response(body=b"plain")
+        session.get(READ_URL, timeout=10)
+        session.get(READ_URL, timeout=10)
+        self.assertEqual(mock_get.call_count, 2)
+        session.close()
+
+    @patch.object(requests.Session, 'get')
+    def test_stream_requests_bypass_cache(self, mock_get):
+        mock_get.return_value = _response(body=b"stream")
+        self.session.get(READ_URL, stream=True)
+        self.assertIsNone(self.cache.lookup(READ_URL))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -127,6 +127,31 @@ class TestAnnotation(unittest.TestCase):
         self.assertEqual(ann.to_dict(), restored.to_dict())
 
 
+    def test_id_and_kind(self):
+        ann = Annotation.from_dict({'type': 'highlight', 'coords': (0, 0, 1, 1),
+                                    'id': 7, 'kind': 'search'})
+        self.assertEqual(ann.id, 7)
+        self.assertEqual(ann.kind, 'search')
+        self.assertEqual(Annotation.from_dict(ann.to_dict()).to_dict(), ann.to_dict())
+
+    def test_default_id_and_kind(self):
+        ann = Annotation(type='line', coords=(0, 0, 1, 1))
+        self.assertEqual(ann.id, 0)
+        self.assertEqual(ann.kind, 'user')
+
+    def test_slots(self):
+        ann = Annotation(type='highlight', coords=(0, 0, 1, 1))
+        self.assertFalse(hasattr(ann, '__dict__'))
+        with self.assertRaises(AttributeError):
+            ann.extra = 1
+
+    def test_identity_equality(self):
+        a = Annotation(type='highlight', coords=(0, 0, 1, 1))
+        b = Annotation(type='highlight', coords=(0, 0, 1, 1))
+        self.assertNotEqual(a, b)
+        self.assertEqual(a, a)
+        self.assertEqual(len({a, b}), 2)
+
 class TestUndoAction(unittest.TestCase):
     """UndoAction 테스트"""
 
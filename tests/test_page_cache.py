@@ -0,0 +1,132 @@
+"""
+page_cache.py 단위 테스트
+"""
+
+import unittest
+
+from PIL import Image
+
+from src.page_cache import PageImageCache, image_nbytes
+
+
+def _img(color=(255, 255, 255), size=(10, 10)):
+    return Image.new('RGB', size, color)
+
+
+PAGE_BYTES = 10 * 10 * 3
+
+
+class TestPageImageCache(unittest.TestCase):
+    """PageImageCache 테스트"""
+
+    def test_image_nbytes(self):
+        self.assertEqual(image_nbytes(_img()), PAGE_BYTES)
+        self.assertEqual(image_nbytes(Image.new('RGBA', (4, 5))), 80)
+
+    def test_hit_and_miss_stats(self):
+        cache = PageImageCache(max_bytes=PAGE_BYTES * 4, compress_format=None)
+        img = _img()
+        cache.put((0, 100), img)
+
+        self.assertIs(cache.get((0, 100)), img)
+        self.assertIsNone(cache.get((1, 100)))
+        stats = cache.stats
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertEqual(stats['hot_bytes'], PAGE_BYTES)
+
+    def test_lru_eviction_by_bytes(self):
+        cache = PageImageCache(max_bytes=PAGE_BYTES * 2, compress_format=None, radius=0)
+        cache.put((0, 100), _img())
+        cache.put((1, 100), _img())
+        cache.get((0, 100))  # 0을 최근 사용으로
+        cache.put((2, 100), _img())
+
+        self.assertIn((0, 100), cache)
+        self.assertNotIn((1, 100), cache)
+        self.assertEqual(cache.stats['evictions'], 1)
+
+    def test_large_images_count_more(self):
+        cache = PageImageCache(max_bytes=PAGE_BYTES * 4, compress_format=None)
+        cache.put((0, 100), _img())
+        cache.put((0, 200), _img(size=(20, 20)))  # 4배 크기
+
+        self.assertEqual(len(cache), 1)
+        self.assertIn((0, 200), cache)
+
+    def test_direction_bias_keeps_pages_ahead(self):
+        cache = PageImageCache(max_bytes=PAGE_BYTES * 3, compress_format=None, radius=2)
+        cache.set_position(4, 100)
+        cache.set_position(5, 100)  # 다음 페이지 방향으로 이동 중
+
+        # 앞쪽 페이지(6, 7)가 LRU상 더 오래됐어도 뒤쪽(4)을 먼저 교체
+        cache.put((6, 100), _img())
+        cache.put((7, 100), _img())
+        cache.put((4, 100), _img())
+        cache.put((5, 100), _img())
+
+        self.assertNotIn((4, 100), cache)
+        for page in (5, 6, 7):
+            self.assertIn((page, 100), cache)
+
+    def test_backward_direction(self):
+        cache = PageImageCache(max_bytes=PAGE_BYTES * 2, compress_format=None, radius=2)
+        cache.set_position(5, 100)
+        cache.set_position(4, 100)  # 이전 페이지 방향
+
+        cache.put((3, 100), _img())
+        cache.put((5, 100), _img())
+        cache.put((4, 100), _img())
+
+        self.assertIn((3, 100), cache)
+        self.assertNotIn((5, 100), cache)
+
+    def test_other_zoom_not_protected(self):
+        cache = PageImageCache(max_bytes=PAGE_BYTES * 2, compress_format=None, radius=2)
+        cache.set_position(0, 200)
+        cache.put((1, 200), _img())
+        cache.put((1, 100), _img())
+        cache.put((2, 200), _img())
+
+        self.assertNotIn((1, 100), cache)
+
+    def test_compressed_tier(self):
+        cache = PageImageCache(max_bytes=PAGE_BYTES, compressed_max_bytes=10_000,
+                               compress_format='PNG', radius=0)
+        red = _img((255, 0, 0))
+        cache.put((0, 100), red)
+        cache.put((1, 100), _img())
+
+        # 밀려난 페이지는 압축 계층에 남아 있다가 조회 시 복원
+        self.assertIn((0, 100), cache)
+        self.assertGreater(cache.stats['compressed_bytes'], 0)
+
+        restored = cache.get((0, 100))
+        self.assertEqual(restored.mode, 'RGB')
+        self.assertEqual(restored.getpixel((0, 0)), (255, 0, 0))
+        self.assertEqual(cache.stats['compressed_hits'], 1)
+
+    def test_compressed_tier_budget(self):
+        cache = PageImageCache(max_bytes=PAGE_BYTES, compressed_max_bytes=1,
+                               compress_format='PNG', radius=0)
+        cache.put((0, 100), _img())
+        cache.put((1, 100), _img())
+        self.assertNotIn((0, 100), cache)
+        self.assertEqual(cache.stats['compressed_bytes'], 0)
+
+    def test_jpeg_tier(self):
+        cache = PageImageCache(max_bytes=PAGE_BYTES, compressed_max_bytes=10_000,
+                               compress_format='JPEG', radius=0)
+        cache.put((0, 100), _img())
+        cache.put((1, 100), _img())
+        self.assertIsNotNone(cache.get((0, 100)))
+
+    def test_clear(self):
+        cache = PageImageCache(max_bytes=PAGE_BYTES * 4)
+        cache.put((0, 100), _img())
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats['hot_bytes'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+"""
+pdf_cache.py 단위 테스트
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+
+import fitz
+
+from src.pdf_cache import PDFCache
+from src.pdf_handler import PDFHandler
+
+PDF_URL = "https://ssl.pstatic.net/imgstock/upload/research/company/1.pdf"
+OTHER_URL = "https://ssl.pstatic.net/imgstock/upload/research/company/2.pdf"
+
+
+def _make_pdf(pages=2, text="테스트"):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"{text} {i}")
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+class TestPDFCache(unittest.TestCase):
+    """PDFCache 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = PDFCache(self._tmp.name, max_bytes=1000)
+
+    def tearDown(self):
+        self.cache.close()
+        self._tmp.cleanup()
+
+    def test_stale_part_files_removed_on_open(self):
+        stale = self.cache.temp_path()
+        fresh = self.cache.temp_path()
+        old = time.time() - 2 * 60 * 60
+        os.utime(stale, (old, old))
+        self.cache.close()
+
+        self.cache = PDFCache(self._tmp.name, max_bytes=1000, stale_part_age=60 * 60)
+
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(fresh))
+
+    def test_miss(self):
+        self.assertIsNone(self.cache.get(PDF_URL))
+        self.assertIsNone(self.cache.content_hash(PDF_URL))
+
+    def test_put_and_get(self):
+        data = b"%PDF-1.4 test"
+        path = self.cache.put(PDF_URL, data)
+
+        self.assertEqual(self.cache.get(PDF_URL), path)
+        self.assertEqual(self.cache.content_hash(PDF_URL), hashlib.sha256(data).hexdigest())
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), data)
+
+    def test_same_content_shares_file(self):
+        data = b"%PDF-1.4 shared"
+        path1 = self.cache.put(PDF_URL, data)
+        path2 = self.cache.put(OTHER_URL, data)
+
+        self.assertEqual(path1, path2)
+        self.assertEqual(self.cache.total_bytes(), len(data))
+
+    def test_lru_eviction(self):
+        self.cache.put(PDF_URL, b"a" * 600)
+        self.cache.put(OTHER_URL, b"b" * 600)
+
+        # 용량 초과 시 오래 사용하지 않은 항목 삭제, 방금 저장한 항목은 유지
+        self.assertIsNone(self.cache.get(PDF_URL))
+        self.assertIsNotNone(self.cache.get(OTHER_URL))
+        self.assertLessEqual(self.cache.total_bytes(), 1000)
+
+    def test_recent_access_protects_entry(self):
+        third = "https://ssl.pstatic.net/imgstock/upload/research/company/3.pdf"
+        cache = PDFCache(self._tmp.name, max_bytes=1300)
+        with patch('src.pdf_cache.time.time', side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.put(PDF_URL, b"a" * 600)
+            cache.put(OTHER_URL, b"b" * 600)
+            cache.get(PDF_URL)  # PDF_URL을 최근 사용으로 갱신
+            cache.put(third, b"c" * 600)
+
+        self.assertIsNotNone(cache.get(PDF_URL))
+        self.assertIsNone(cache.get(OTHER_URL))
+        cache.close()
+
+    def test_missing_file_is_miss(self):
+        path = self.cache.put(PDF_URL, b"%PDF-1.4 gone")
+        os.remove(path)
+        self.assertIsNone(self.cache.get(PDF_URL))
+        self.assertIsNone(self.cache.content_hash(PDF_URL))
+
+    def test_discard(self):
+        path = self.cache.put(PDF_URL, b"%PDF-1.4 bad")
+        self.cache.discard(PDF_URL)
+        self.assertIsNone(self.cache.get(PDF_URL))
+        self.assertFalse(os.path.exists(path))
+
+    def test_persists_across_instances(self):
+        self.cache.put(PDF_URL, b"%PDF-1.4 keep")
+        self.cache.close()
+
+        self.cache = PDFCache(self._tmp.name, max_bytes=1000)
+        self.assertIsNotNone(self.cache.get(PDF_URL))
+
+
+class TestPDFHandlerCache(unittest.TestCase):
+    """PDFHandler 디스크 캐시 연동 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = PDFCache(self._tmp.name)
+        self.handler = PDFHandler(pdf_cache=self.cache)
+        self.pdf_bytes = _make_pdf()
+
+    def tearDown(self):
+        self.handler.reset()
+        self.cache.close()
+        self._tmp.cleanup()
+
+    def _response(self):
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {'Content-Length': str(len(self.pdf_bytes))}
+        response.iter_content.return_value = [self.pdf_bytes]
+        return response
+
+    @patch('src.pdf_handler.requests.get')
+    def test_second_load_uses_cache(self, mock_get):
+        mock_get.return_value = self._response()
+
+        self.assertTrue(self.handler.load_pdf(PDF_URL))
+        self.assertTrue(self.handler.load_pdf(PDF_URL))
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(self.handler.total_pages, 2)
+        self.assertEqual(self.handler.content_hash, hashlib.sha256(self.pdf_bytes).hexdigest())
+
+    @patch('src.pdf_handler.requests.get')
+    def test_cached_document_opened_from_file(self, mock_get):
+        mock_get.return_value = self._response()
+        self.handler.load_pdf(PDF_URL)
+
+        # 임시 다운로드 파일은 캐시로 이동되어 남지 않음
+        self.assertIsNone(self.handler._temp_path)
+        self.assertEqual(self.handler._pdf_doc.name, self.cache.get(PDF_URL))
+        self.assertFalse([n for n in os.listdir(self._tmp.name) if n.endswith('.part')])
+
+    @patch('src.pdf_handler.requests.get')
+    def test_restart_uses_cache(self, mock_get):
+        mock_get.return_value = self._response()
+        self.handler.load_pdf(PDF_URL)
+
+        other = PDFHandler(pdf_cache=PDFCache(self._tmp.name))
+        self.assertTrue(other.load_pdf(PDF_URL))
+        self.assertEqual(mock_get.call_count, 1)
+        other.reset()
+
+    @patch('src.pdf_handler.requests.get')
+    def test_corrupt_cache_file_redownloads(self, mock_get):
+        mock_get.return_value = self._response()
+        path = self.cache.put(PDF_URL, b"not a pdf")
+
+        self.assertTrue(self.handler.load_pdf(PDF_URL))
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.handler.total_pages, 2)
+
+    @patch('src.pdf_handler.requests.get')
+    def test_without_cache_uses_temp_file(self, mock_get):
+        mock_get.return_value = self._response()
+        handler = PDFHandler()
+
+        self.assertTrue(handler.load_pdf(PDF_URL))
+        temp_path = handler._temp_path
+        self.assertTrue(os.path.exists(temp_path))
+        self.assertEqual(handler.content_hash, hashlib.sha256(self.pdf_bytes).hexdigest())
+
+        handler.reset()
+        self.assertFalse(os.path.exists(temp_path))
+        self.assertIsNone(handler.content_hash)
+
+    def test_put_file_moves_download(self):
+        fd, path = tempfile.mkstemp(dir=self.cache.cache_dir)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(self.pdf_bytes)
+
+        cached = self.cache.put_file(PDF_URL, path)
+
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(self.cache.get(PDF_URL), cached)
+        self.assertEqual(self.cache.content_hash(PDF_URL),
+                         hashlib.sha256(self.pdf_bytes).hexdigest())
+
+
+if __name__ == '__main__':
+    unittest.main()
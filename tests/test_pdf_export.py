@@ -0,0 +1,239 @@
+"""
+pdf_export.py 단위 테스트
+"""
+
+import os
+import tempfile
+import unittest
+
+import fitz
+
+from src.config import PDF_RENDER_SCALE
+from src.models import Annotation
+from src.pdf_export import add_pdf_annotations, batch_export, export_annotated_pdf
+from src.pdf_handler import PDFHandler
+
+
+def _write_pdf(path, pages=2, text="Revenue grew"):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page(width=300, height=200)
+        page.insert_text((20, 50), f"{text} {i}")
+    doc.save(path)
+    doc.close()
+
+
+def _highlight(x0, y0, x1, y1, zoom=1.0, **kwargs):
+    s = PDF_RENDER_SCALE * zoom
+    return Annotation(type='highlight', coords=(x0 * s, y0 * s, x1 * s, y1 * s),
+                      color='#FF0000', alpha=128, zoom=zoom, **kwargs)
+
+
+class TestAddPDFAnnotations(unittest.TestCase):
+    """add_pdf_annotations 테스트 (메모리 문서)"""
+
+    def setUp(self):
+        self.doc = fitz.open()
+        for _ in range(2):
+            self.doc.new_page(width=300, height=200)
+
+    def tearDown(self):
+        self.doc.close()
+
+    def test_types_rects_and_skipped_kinds(self):
+        line = Annotation(type='line', coords=(30, 30, 150, 90), color='#00FF00', width=4, zoom=1.0)
+        count = add_pdf_annotations(self.doc, {
+            0: [_highlight(10, 40, 120, 60, zoom=2.0),
+                _highlight(10, 80, 60, 90, kind='search'),
+                line],
+            5: [_highlight(0, 0, 10, 10)],  # 없는 페이지는 건너뜀
+        })
+        self.assertEqual(count, 2)
+
+        page = self.doc[0]  # 주석은 페이지 객체가 살아 있는 동안만 사용 가능
+        annots = list(page.annots())
+        self.assertEqual(sorted(a.type[1] for a in annots), ['Highlight', 'Ink'])
+        self.assertEqual(list(self.doc[1].annots()), [])
+
+        highlight = next(a for a in annots if a.type[1] == 'Highlight')
+        rect = fitz.Quad(highlight.vertices).rect
+        for got, want in zip((rect.x0, rect.y0, rect.x1, rect.y1), (10, 40, 120, 60)):
+            self.assertAlmostEqual(got, want, delta=0.01)
+        self.assertEqual(tuple(highlight.colors['stroke']), (1.0, 0.0, 0.0))
+
+        ink = next(a for a in annots if a.type[1] == 'Ink')
+        (p1, p2), = ink.vertices
+        s = PDF_RENDER_SCALE
+        self.assertAlmostEqual(p1[0], 30 / s, delta=0.01)
+        self.assertAlmostEqual(p2[1], 90 / s, delta=0.01)
+        self.assertEqual(tuple(ink.colors['stroke']), (0.0, 1.0, 0.0))
+
+
+class TestExportAnnotatedPDF(unittest.TestCase):
+    """export_annotated_pdf 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.src = os.path.join(self._tmp.name, 'src.pdf')
+        self.dest = os.path.join(self._tmp.name, 'out', 'annotated.pdf')
+        _write_pdf(self.src)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_writes_native_annotations(self):
+        line = Annotation(type='line', coords=(30, 30, 150, 90), color='#0000FF', width=3, zoom=2.0)
+        count = export_annotated_pdf(self.src, self.dest, {
+            0: [_highlight(10, 40, 120, 60, zoom=1.25)],
+            1: [line],
+        })
+        self.assertEqual(count, 2)
+
+        with fitz.open(self.dest) as doc:
+            page0, page1 = doc[0], doc[1]
+            annots = list(page0.annots())
+            self.assertEqual([a.type[1] for a in annots], ['Highlight'])
+            # 뷰어 좌표 -> PDF 포인트
+            rect = fitz.Quad(annots[0].vertices).rect
+            self.assertAlmostEqual(rect.x0, 10, delta=0.01)
+            self.assertAlmostEqual(rect.y0, 40, delta=0.01)
+            self.assertAlmostEqual(rect.x1, 120, delta=0.01)
+            self.assertAlmostEqual(rect.y1, 60, delta=0.01)
+            self.assertAlmostEqual(annots[0].opacity, 128 / 255, places=2)
+
+            ink = list(page1.annots())
+            self.assertEqual([a.type[1] for a in ink], ['Ink'])
+            self.assertAlmostEqual(ink[0].vertices[0][0][0], 30 / (PDF_RENDER_SCALE * 2), delta=0.5)
+
+            # 본문 텍스트는 그대로 (검색 가능)
+            self.assertIn("Revenue grew 0", page0.get_text())
+
+    def test_incremental_save_keeps_original_bytes(self):
+        with open(self.src, 'rb') as f:
+            original = f.read()
+        export_annotated_pdf(self.src, self.dest, {0: [_highlight(10, 40, 120, 60)]})
+
+        with open(self.dest, 'rb') as f:
+            exported = f.read()
+        # 증분 저장: 원본 뒤에 변경분만 덧붙음
+        self.assertTrue(exported.startswith(original))
+        self.assertFalse(os.path.exists(self.dest + '.part'))
+
+    def test_source_untouched(self):
+        export_annotated_pdf(self.src, self.dest, {0: [_highlight(10, 40, 120, 60)]})
+        with fitz.open(self.src) as doc:
+            page = doc[0]
+            self.assertEqual(list(page.annots()), [])
+
+    def test_search_highlights_skipped(self):
+        count = export_annotated_pdf(self.src, self.dest, {
+            0: [_highlight(10, 40, 120, 60, kind='search'), _highlight(0, 0, 5, 5)],
+            9: [_highlight(0, 0, 5, 5)],  # 없는 페이지
+        })
+        self.assertEqual(count, 1)
+
+    def test_from_bytes(self):
+        with open(self.src, 'rb') as f:
+            data = f.read()
+        self.assertEqual(export_annotated_pdf(data, self.dest, {0: [_highlight(0, 0, 50, 20)]}), 1)
+        with fitz.open(self.dest) as doc:
+            page = doc[0]
+            self.assertEqual(len(list(page.annots())), 1)
+
+    def test_failure_leaves_no_partial_file(self):
+        with self.assertRaises(Exception):
+            export_annotated_pdf(os.path.join(self._tmp.name, 'missing.pdf'), self.dest, {})
+        self.assertFalse(os.path.exists(self.dest))
+        self.assertFalse(os.path.exists(self.dest + '.part'))
+
+    def test_rotated_page(self):
+        doc = fitz.open(self.src)
+        doc[0].set_rotation(90)
+        rotated = os.path.join(self._tmp.name, 'rotated.pdf')
+        doc.save(rotated)
+        doc.close()
+
+        # 회전된 페이지의 화면 좌표 (세로 200 x 가로 300으로 보임)
+        export_annotated_pdf(rotated, self.dest, {0: [_highlight(10, 10, 60, 30)]})
+        with fitz.open(self.dest) as out:
+            page = out[0]
+            annot = next(page.annots())
+            shown = fitz.Quad(annot.vertices).rect * page.rotation_matrix
+            self.assertAlmostEqual(shown.x0, 10, delta=0.01)
+            self.assertAlmostEqual(shown.y0, 10, delta=0.01)
+            self.assertAlmostEqual(shown.x1, 60, delta=0.01)
+            self.assertAlmostEqual(shown.y1, 30, delta=0.01)
+
+
+class TestHandlerSource(unittest.TestCase):
+    """PDFHandler.document_source 테스트"""
+
+    def test_source_path_or_bytes(self):
+        handler = PDFHandler()
+        self.assertIsNone(handler.document_source())
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'doc.pdf')
+            _write_pdf(path)
+            handler._open_document(fitz.open(path), None)
+            self.assertEqual(handler.document_source(), path)
+
+            with open(path, 'rb') as f:
+                handler._open_document(fitz.open(stream=f.read(), filetype="pdf"), None)
+            self.assertTrue(handler.document_source().startswith(b'%PDF'))
+            handler.reset()
+
+    def test_temp_file_source_is_bytes(self):
+        # 임시 파일은 리포트를 바꾸면 삭제되므로 백그라운드 작업에는 바이트를 넘김
+        handler = PDFHandler()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'download.part')
+            _write_pdf(path)
+            handler._open_document(fitz.open(path), None, temp_path=path)
+            source = handler.document_source()
+            self.assertIsInstance(source, bytes)
+            handler.reset()
+            self.assertFalse(os.path.exists(path))
+        with fitz.open(stream=source, filetype="pdf") as doc:
+            self.assertEqual(len(doc), 2)
+
+
+class TestBatchExport(unittest.TestCase):
+    """batch_export 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.jobs = []
+        for i in range(3):
+            src = os.path.join(self._tmp.name, f'src{i}.pdf')
+            _write_pdf(src)
+            dest = os.path.join(self._tmp.name, 'out', f'out{i}.pdf')
+            self.jobs.append((src, dest, {0: [_highlight(0, 0, 10 + i, 10)] * (i + 1)}))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_process_pool(self):
+        results = batch_export(self.jobs, max_workers=2)
+        self.assertEqual([(r[1], r[2]) for r in results], [(1, None), (2, None), (3, None)])
+        for _, dest, _ in self.jobs:
+            self.assertTrue(os.path.exists(dest))
+
+    def test_inline(self):
+        results = batch_export(self.jobs, max_workers=1)
+        self.assertEqual([r[1] for r in results], [1, 2, 3])
+
+    def test_failure_reported_per_job(self):
+        self.jobs[1] = (os.path.join(self._tmp.name, 'missing.pdf'),) + self.jobs[1][1:]
+        results = batch_export(self.jobs, max_workers=2)
+        self.assertIsNone(results[1][1])
+        self.assertTrue(results[1][2])
+        self.assertEqual(results[0][1], 1)
+        self.assertEqual(results[2][1], 3)
+
+    def test_empty(self):
+        self.assertEqual(batch_export([]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
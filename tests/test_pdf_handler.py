@@ -2,11 +2,22 @@
 pdf_handler.py 단위 테스트
 """
 
+import os
+import tempfile
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
-from io import BytesIO
 
-from src.pdf_handler import parse_hex_color, PDFHandler
+import fitz
+from PIL import Image
+
+from src.config import PDF_RENDER_SCALE, TILED_RENDER_MIN_ZOOM, ZOOM_STEP
+from src.models import Annotation
+from src.page_cache import PageImageCache
+from src.text_cache import PageText
+from src.pdf_handler import (
+    parse_hex_color, PDFHandler, PDFDownloadCancelled, download_pdf, validate_pdf_url
+)
 
 
 class TestParseHexColor(unittest.TestCase):
@@ -81,7 +92,7 @@ class TestPDFHandler(unittest.TestCase):
         self.handler.total_pages = 10
         self.handler.current_page = 5
         self.handler.zoom_level = 1.5
-        self.handler.annotations = {0: [{'type': 'highlight'}]}
+        self.handler.add_highlight(0, (0, 0, 10, 10), '#FFFF00', 77, 1.0)
 
         self.handler.reset()
 
@@ -95,9 +106,9 @@ class TestPDFHandler(unittest.TestCase):
             page_num=0, coords=(10, 20, 100, 50),
             color='#FFFF00', alpha=77, zoom=1.0
         )
-        self.assertEqual(ann['type'], 'highlight')
-        self.assertEqual(ann['coords'], (10, 20, 100, 50))
-        self.assertEqual(ann['color'], '#FFFF00')
+        self.assertEqual(ann.type, 'highlight')
+        self.assertEqual(ann.coords, (10, 20, 100, 50))
+        self.assertEqual(ann.color, '#FFFF00')
         self.assertIn(0, self.handler.annotations)
         self.assertEqual(len(self.handler.annotations[0]), 1)
 
@@ -106,8 +117,8 @@ class TestPDFHandler(unittest.TestCase):
             page_num=1, coords=(0, 0, 100, 100),
             color='#FF0000', width=3, zoom=1.0
         )
-        self.assertEqual(ann['type'], 'line')
-        self.assertEqual(ann['width'], 3)
+        self.assertEqual(ann.type, 'line')
+        self.assertEqual(ann.width, 3)
         self.assertIn(1, self.handler.annotations)
 
     def test_add_multiple_annotations(self):
@@ -124,7 +135,7 @@ class TestPDFHandler(unittest.TestCase):
         self.assertEqual(len(self.handler.annotations[0]), 0)
 
     def test_remove_annotation_not_found(self):
-        fake_ann = {'type': 'highlight', 'coords': (0, 0, 1, 1)}
+        fake_ann = Annotation(type='highlight', coords=(0, 0, 1, 1))
         result = self.handler.remove_annotation(0, fake_ann)
         self.assertFalse(result)
 
@@ -149,7 +160,7 @@ class TestPDFHandler(unittest.TestCase):
         self.handler.add_highlight(0, (10, 10, 100, 50), '#FFFF00', 77, 1.0)
         found = self.handler.find_annotation_at_point(0, 50, 30, 1.0)
         self.assertIsNotNone(found)
-        self.assertEqual(found['type'], 'highlight')
+        self.assertEqual(found.type, 'highlight')
 
     def test_find_annotation_at_point_outside(self):
         self.handler.add_highlight(0, (10, 10, 100, 50), '#FFFF00', 77, 1.0)
@@ -171,10 +182,55 @@ class TestPDFHandler(unittest.TestCase):
         found = self.handler.find_annotation_at_point(0, 0, 100, 1.0, threshold=5)
         self.assertIsNone(found)
 
+    def test_find_annotation_at_other_zoom(self):
+        self.handler.add_highlight(0, (10, 10, 100, 50), '#FFFF00', 77, 1.0)
+        # 줌 2.0에서는 좌표도 두 배
+        self.assertIsNotNone(self.handler.find_annotation_at_point(0, 150, 90, 2.0))
+        self.assertIsNone(self.handler.find_annotation_at_point(0, 150, 90, 1.0))
+
+    def test_find_returns_first_added(self):
+        first = self.handler.add_highlight(0, (0, 0, 100, 100), '#FFFF00', 77, 1.0)
+        self.handler.add_highlight(0, (0, 0, 100, 100), '#FF0000', 77, 1.0)
+        self.assertIs(self.handler.find_annotation_at_point(0, 50, 50, 1.0), first)
+
+    def test_index_follows_remove_and_restore(self):
+        ann = self.handler.add_highlight(0, (10, 10, 100, 50), '#FFFF00', 77, 1.0)
+        self.handler.remove_annotation(0, ann)
+        self.assertIsNone(self.handler.find_annotation_at_point(0, 50, 30, 1.0))
+
+        self.handler.restore_annotation(0, ann)
+        self.assertIs(self.handler.find_annotation_at_point(0, 50, 30, 1.0), ann)
+        self.assertEqual(self.handler.get_annotations(0), [ann])
+
+    def test_remove_identical_annotation_by_identity(self):
+        first = self.handler.add_highlight(0, (0, 0, 10, 10), '#FFFF00', 77, 1.0)
+        second = self.handler.add_highlight(0, (0, 0, 10, 10), '#FFFF00', 77, 1.0)
+        self.handler.remove_annotation(0, second)
+        self.assertEqual(self.handler.get_annotations(0), [first])
+        self.assertIs(self.handler.find_annotation_at_point(0, 5, 5, 1.0), first)
+
+    def test_index_follows_clear(self):
+        self.handler.add_highlight(0, (10, 10, 100, 50), '#FFFF00', 77, 1.0)
+        self.handler.clear_annotations(0)
+        self.assertIsNone(self.handler.find_annotation_at_point(0, 50, 30, 1.0))
+
+        self.handler.add_search_highlight(0, (10, 10, 100, 50))
+        self.handler.clear_search_highlights()
+        self.assertIsNone(self.handler.find_annotation_at_point(0, 50, 30, 1.0))
+
+    def test_find_annotations_in_rect(self):
+        a = self.handler.add_highlight(0, (0, 0, 20, 20), '#FFFF00', 77, 1.0)
+        b = self.handler.add_line(0, (100, 100, 200, 120), '#FF0000', 3, 1.0)
+        self.handler.add_highlight(0, (300, 300, 320, 320), '#FFFF00', 77, 1.0)
+
+        self.assertEqual(self.handler.find_annotations_in_rect(0, (10, 10, 150, 150), 1.0), [a, b])
+        self.assertEqual(self.handler.find_annotations_in_rect(0, (20, 20, 300, 300), 2.0), [a, b])
+        self.assertEqual(self.handler.find_annotations_in_rect(1, (0, 0, 500, 500), 1.0), [])
+
     def test_add_search_highlight(self):
         ann = self.handler.add_search_highlight(0, (10, 20, 30, 40))
-        self.assertEqual(ann['alpha'], 100)
-        self.assertEqual(ann['type'], 'highlight')
+        self.assertEqual(ann.alpha, 100)
+        self.assertEqual(ann.type, 'highlight')
 
     def test_clear_search_highlights(self):
         # 일반 형광펜 (alpha=77)
@@ -188,8 +244,36 @@ class TestPDFHandler(unittest.TestCase):
         self.handler.clear_search_highlights()
 
         # 일반 형광펜만 남아야 함
-        self.assertEqual(len(self.handler.annotations[0]), 1)
-        self.assertEqual(self.handler.annotations[0][0]['alpha'], 77)
+        remaining = self.handler.get_annotations(0)
+        self.assertEqual(len(remaining), 1)
+        self.assertEqual(remaining[0].kind, 'user')
+
+    def test_search_highlight_kind_not_alpha(self):
+        # 사용자가 alpha 100으로 그린 형광펜은 검색 하이라이트가 아님
+        user = self.handler.add_highlight(0, (0, 0, 10, 10), '#FFFF00', 100, 1.0)
+        search = self.handler.add_search_highlight(1, (20, 20, 30, 30))
+        self.assertEqual(search.kind, 'search')
+
+        self.handler.clear_search_highlights()
+        self.assertEqual(self.handler.get_annotations(0), [user])
+        self.assertEqual(self.handler.get_annotations(1), [])
+
+    def test_annotation_ids_unique_and_stable(self):
+        a = self.handler.add_highlight(0, (0, 0, 10, 10), '#FFFF00', 77, 1.0)
+        b = self.handler.add_line(1, (0, 0, 10, 10), '#FF0000', 3, 1.0)
+        self.assertNotEqual(a.id, b.id)
+        self.assertGreater(a.id, 0)
+
+        self.handler.remove_annotation(0, a)
+        self.handler.restore_annotation(0, a)
+        self.assertIs(self.handler.annotations[0][a.id], a)
+
+    def test_remove_annotation_id_collision(self):
+        # 같은 id라도 다른 객체면 제거하지 않음
+        ann = self.handler.add_highlight(0, (0, 0, 10, 10), '#FFFF00', 77, 1.0)
+        impostor = Annotation(type='highlight', coords=(0, 0, 10, 10), id=ann.id)
+        self.assertFalse(self.handler.remove_annotation(0, impostor))
+        self.assertEqual(self.handler.get_annotations(0), [ann])
 
     def test_search_text_no_pdf(self):
         results = self.handler.search_text("test")
@@ -207,17 +291,18 @@ class TestPDFHandler(unittest.TestCase):
         text = self.handler.get_page_text(-1)
         self.assertEqual(text, "")
 
-    def test_cleanup_with_bytesio(self):
-        """BytesIO가 명시적으로 닫히는지 확인"""
-        mock_bytesio = MagicMock(spec=BytesIO)
-        self.handler._pdf_data = mock_bytesio
+    def test_cleanup_removes_temp_file(self):
+        """캐시 없이 받은 임시 PDF 파일이 정리 시 삭제되는지 확인"""
+        fd, path = tempfile.mkstemp(suffix='.part')
+        os.close(fd)
+        self.handler._temp_path = path
         self.handler._cleanup()
-        mock_bytesio.close.assert_called_once()
-        self.assertIsNone(self.handler._pdf_data)
+        self.assertFalse(os.path.exists(path))
+        self.assertIsNone(self.handler._temp_path)
 
-    def test_cleanup_without_bytesio(self):
-        """BytesIO 없이 cleanup 호출 시 오류 없음"""
-        self.handler._pdf_data = None
+    def test_cleanup_without_temp_file(self):
+        """임시 파일 없이 cleanup 호출 시 오류 없음"""
+        self.handler._temp_path = None
         self.handler._cleanup()  # should not raise
 
     def test_save_page_image_no_pdf(self):
@@ -246,5 +331,334 @@ class TestPDFHandlerURLValidation(unittest.TestCase):
             self.handler.load_pdf("javascript:alert(1)")
 
 
+def _open_test_pdf(handler, pages=3):
+    """메모리에서 만든 PDF를 핸들러에 로드"""
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page(width=200, height=100)
+        page.insert_text((20, 50), f"Page {i}")
+    handler._open_document(fitz.open(stream=doc.tobytes(), filetype="pdf"), None)
+    doc.close()
+
+
+class TestPDFHandlerRendering(unittest.TestCase):
+    """줌 배율 렌더링 및 페이지 캐시 테스트"""
+
+    def setUp(self):
+        self.handler = PDFHandler()
+        _open_test_pdf(self.handler)
+
+    def tearDown(self):
+        self.handler.reset()
+
+    def test_renders_at_target_zoom(self):
+        img = self.handler.render_page(0, zoom=2.0)
+        self.assertEqual(img.size, (int(200 * PDF_RENDER_SCALE * 2), int(100 * PDF_RENDER_SCALE * 2)))
+
+        img = self.handler.render_page(0, zoom=0.5)
+        self.assertEqual(img.size, (int(200 * PDF_RENDER_SCALE * 0.5), int(100 * PDF_RENDER_SCALE * 0.5)))
+
+    def test_cache_keyed_by_page_and_zoom(self):
+        first = self.handler.render_page(0, zoom=1.25)
+        again = self.handler.render_page(0, zoom=1.25)
+        other_zoom = self.handler.render_page(0, zoom=1.5)
+
+        self.assertIs(first, again)
+        self.assertIsNot(first, other_zoom)
+        self.assertIn((0, 125), self.handler._page_cache)
+        self.assertIn((0, 150), self.handler._page_cache)
+
+    def test_no_resize_on_render(self):
+        self.handler.render_page(0, zoom=1.0)
+        with patch.object(Image.Image, 'resize') as mock_resize, \
+                patch.object(Image.Image, 'copy') as mock_copy:
+            self.handler.render_page(0, zoom=1.0)
+            self.handler.render_page(1, zoom=1.75)
+        mock_resize.assert_not_called()
+        mock_copy.assert_not_called()
+
+    def test_annotations_do_not_modify_cache(self):
+        clean = self.handler.render_page(0, zoom=1.0)
+        pixel = clean.getpixel((5, 5))
+
+        self.handler.add_highlight(0, (0, 0, 50, 50), '#FF0000', 200, 1.0)
+        annotated = self.handler.render_page(0, zoom=1.0)
+
+        self.assertIsNot(annotated, clean)
+        self.assertNotEqual(annotated.getpixel((5, 5)), pixel)
+        self.assertEqual(self.handler.render_page(0, zoom=1.0, apply_annotations=False).getpixel((5, 5)), pixel)
+
+    def test_annotation_sprite_matches_composite(self):
+        self.handler.add_highlight(0, (10, 10, 60, 40), '#FF0000', 120, 1.0)
+        self.handler.add_line(0, (20, 50, 150, 80), '#0000FF', 4, 1.0)
+
+        layered = self.handler.render_page(0, zoom=1.5, apply_annotations=False).convert('RGBA')
+        for ann in self.handler.get_annotations(0):
+            x, y, sprite = self.handler.render_annotation(ann, 1.5)
+            layered.alpha_composite(sprite, (x, y))
+
+        composited = self.handler.render_page(0, zoom=1.5)
+        self.assertEqual(layered.convert('RGB').tobytes(), composited.tobytes())
+
+    def test_annotation_sprite_is_bbox_sized(self):
+        ann = self.handler.add_highlight(0, (10, 20, 30, 25), '#FFFF00', 77, 1.0)
+        x, y, sprite = self.handler.render_annotation(ann, 2.0)
+        self.assertEqual((x, y), (20, 40))
+        self.assertEqual(sprite.size, (41, 11))
+        self.assertEqual(sprite.mode, 'RGBA')
+
+    def test_cache_respects_byte_budget(self):
+        page_bytes = int(200 * PDF_RENDER_SCALE) * int(100 * PDF_RENDER_SCALE) * 3
+        self.handler._page_cache = PageImageCache(max_bytes=page_bytes * 2, compress_format=None)
+
+        for page in range(3):
+            self.handler.render_page(page, zoom=1.0)
+
+        self.assertEqual(len(self.handler._page_cache), 2)
+        self.assertEqual(self.handler._page_cache.stats['evictions'], 1)
+
+
+
+@patch('src.pdf_handler.TILE_SIZE', 128)
+class TestPDFHandlerTiles(unittest.TestCase):
+    """타일 렌더링 테스트 (TILE_SIZE=128)"""
+
+    def setUp(self):
+        self.handler = PDFHandler()
+        _open_test_pdf(self.handler)
+
+    def tearDown(self):
+        self.handler.reset()
+
+    def test_use_tiles_threshold(self):
+        self.assertFalse(PDFHandler.use_tiles(TILED_RENDER_MIN_ZOOM - ZOOM_STEP))
+        self.assertTrue(PDFHandler.use_tiles(TILED_RENDER_MIN_ZOOM))
+
+    def test_tile_grid(self):
+        # 200x100 * 1.5 * 2.0 = 600x300 -> 128px 타일 5열 3행
+        self.assertEqual(self.handler.page_pixel_size(0, 2.0), (600, 300))
+        self.assertEqual(self.handler.tile_grid(0, 2.0), (5, 3))
+        self.assertIsNone(self.handler.tile_grid(5, 2.0))
+
+    def test_tiles_match_full_page(self):
+        full = self.handler.render_page(0, zoom=2.0, apply_annotations=False)
+        cols, rows = self.handler.tile_grid(0, 2.0)
+
+        stitched = Image.new('RGB', full.size)
+        for ty in range(rows):
+            for tx in range(cols):
+                tile = self.handler.render_tile(0, tx, ty, zoom=2.0)
+                stitched.paste(tile, (tx * 128, ty * 128))
+
+        # 마지막 열/행 타일은 페이지 경계에서 잘림
+        self.assertEqual(self.handler.render_tile(0, 4, 2, zoom=2.0).size, (600 - 512, 300 - 256))
+        self.assertEqual(stitched.tobytes(), full.tobytes())
+
+    def test_tiles_cached_independently(self):
+        first = self.handler.render_tile(0, 1, 0, zoom=2.0)
+        self.assertIs(self.handler.render_tile(0, 1, 0, zoom=2.0), first)
+        self.assertIn((0, 200, 'tile', 1, 0), self.handler._page_cache)
+        self.assertNotIn((0, 200, 'tile', 0, 0), self.handler._page_cache)
+        self.assertNotIn((0, 200), self.handler._page_cache)
+
+    def test_tile_out_of_range(self):
+        self.assertIsNone(self.handler.render_tile(0, 5, 0, zoom=2.0))
+        self.assertIsNone(self.handler.render_tile(0, -1, 0, zoom=2.0))
+
+    def test_tile_annotations_offset(self):
+        # 페이지 좌표 (130, 10)-(150, 20) (줌 1.0 기준) -> 줌 2.0에서 (260, 20)-(300, 40)
+        self.handler.add_highlight(0, (130, 10, 150, 20), '#FF0000', 255, 1.0)
+        tile = self.handler.render_tile(0, 2, 0, zoom=2.0)
+        clean = self.handler.render_tile(0, 2, 0, zoom=2.0, apply_annotations=False)
+
+        self.assertEqual(tile.getpixel((260 - 256 + 2, 25)), (255, 0, 0))
+        self.assertEqual(tile.getpixel((100, 100)), clean.getpixel((100, 100)))
+
+    def test_prerender_fills_first_tile_row(self):
+        self.assertTrue(self.handler.prerender_page(1, 2.0, self.handler.document_generation))
+        self.assertTrue(self.handler.is_page_cached(1, 2.0))
+        self.assertIn((1, 200, 'tile', 4, 0), self.handler._page_cache)
+        self.assertNotIn((1, 200, 'tile', 0, 1), self.handler._page_cache)
+        self.assertNotIn((1, 200), self.handler._page_cache)
+
+class TestPDFHandlerText(unittest.TestCase):
+    """텍스트 캐시 기반 검색/추출 테스트"""
+
+    def setUp(self):
+        self.handler = PDFHandler()
+        doc = fitz.open()
+        for i in range(3):
+            page = doc.new_page(width=300, height=200)
+            page.insert_text((20, 50), f"Target price raised {i}\nMargin outlook")
+        self.handler._open_document(fitz.open(stream=doc.tobytes(), filetype="pdf"), None)
+        doc.close()
+
+    def tearDown(self):
+        self.handler.reset()
+
+    def test_page_extracted_once(self):
+        with patch('src.pdf_handler.PageText.from_rawdict',
+                   wraps=PageText.from_rawdict) as extract:
+            self.handler.search_text("price")
+            self.handler.search_text("margin")
+            self.handler.get_page_text(0)
+            self.handler.get_page_blocks(1)
+            self.handler.get_page_words(2)
+        self.assertEqual(extract.call_count, 3)
+
+    def test_search_text_scaled_rects(self):
+        results = self.handler.search_text("target PRICE")
+        self.assertEqual([r['page'] for r in results], [0, 1, 2])
+        with self.handler._doc_lock:
+            expected = self.handler._pdf_doc[0].search_for("target PRICE")[0]
+        self.assertEqual(results[0]['rects'][0], (
+            int(expected.x0 * PDF_RENDER_SCALE), int(expected.y0 * PDF_RENDER_SCALE),
+            int(expected.x1 * PDF_RENDER_SCALE), int(expected.y1 * PDF_RENDER_SCALE),
+        ))
+        self.assertEqual(self.handler.search_text("raised 1", page_num=1)[0]['count'], 1)
+        self.assertEqual(self.handler.search_text("raised 1", page_num=0), [])
+
+    def test_text_and_blocks(self):
+        self.assertEqual(self.handler.get_page_text(0), "Target price raised 0\nMargin outlook\n")
+        self.assertEqual(self.handler.get_page_blocks(0), ["Target price raised 0\nMargin outlook\n"])
+        self.assertEqual([w[4] for w in self.handler.get_page_words(0)],
+                         ["Target", "price", "raised", "0", "Margin", "outlook"])
+        self.assertEqual(self.handler.get_page_text(5), "")
+        self.assertEqual(self.handler.get_page_blocks(-1), [])
+
+    def test_add_auto_highlights_uses_cache(self):
+        span = MagicMock(snippet="Margin outlook", color='#FF0000', alpha=80, bbox=None)
+        added = self.handler.add_auto_highlights(0, [span], zoom=2.0)
+        self.assertEqual(len(added), 1)
+        self.assertEqual(added[0].kind, 'auto')
+        with self.handler._doc_lock:
+            rect = self.handler._pdf_doc[0].search_for("Margin outlook")[0]
+        self.assertAlmostEqual(added[0].coords[0], rect.x0 * PDF_RENDER_SCALE)
+        self.assertAlmostEqual(added[0].coords[3], rect.y1 * PDF_RENDER_SCALE)
+
+    def test_add_auto_highlights_uses_line_box(self):
+        span = MagicMock(snippet="Margin outlook", color='#FF0000', alpha=80, bbox=(1, 2, 3, 4))
+        with patch('src.pdf_handler.PageText.search') as search:
+            added = self.handler.add_auto_highlights(0, [span], zoom=1.0)
+        search.assert_not_called()
+        self.assertEqual(added[0].coords, tuple(v * PDF_RENDER_SCALE for v in (1, 2, 3, 4)))
+
+    def test_add_resolved_highlights(self):
+        span = MagicMock(color='#00FF00', alpha=90)
+        added = self.handler.add_resolved_highlights(1, [(span, [(10, 20, 30, 40), (10, 45, 20, 55)])],
+                                                     zoom=1.0)
+        self.assertEqual([a.coords for a in added],
+                         [tuple(v * PDF_RENDER_SCALE for v in (10, 20, 30, 40)),
+                          tuple(v * PDF_RENDER_SCALE for v in (10, 45, 20, 55))])
+        self.assertTrue(all(a.kind == 'auto' and a.color == '#00FF00' for a in added))
+        self.assertEqual(len(self.handler.get_annotations(1)), 2)
+        self.assertEqual(self.handler.add_resolved_highlights(7, [(span, [(0, 0, 1, 1)])], 1.0), [])
+
+    def test_add_resolved_highlights_idempotent(self):
+        span = MagicMock(color='#00FF00', alpha=90)
+        resolved = [(span, [(10, 20, 30, 40)])]
+        self.assertEqual(len(self.handler.add_resolved_highlights(1, resolved, zoom=1.0)), 1)
+        self.assertEqual(self.handler.add_resolved_highlights(1, resolved, zoom=1.0), [])
+        other = MagicMock(color='#FF0000', alpha=90)
+        self.assertEqual(len(self.handler.add_resolved_highlights(1, [(other, [(10, 20, 30, 40)])],
+                                                                  zoom=1.0)), 1)
+        self.assertEqual(len(self.handler.get_annotations(1)), 2)
+
+    def test_cache_cleared_on_new_document(self):
+        self.handler.get_page_text(0)
+        self.assertIn(0, self.handler._text_cache)
+        _open_test_pdf(self.handler)
+        self.assertNotIn(0, self.handler._text_cache)
+        self.assertEqual(self.handler.get_page_text(0), "Page 0\n")
+
+
+class TestDownloadPDF(unittest.TestCase):
+    """스트리밍 다운로드 테스트"""
+
+    URL = "https://ssl.pstatic.net/imgstock/upload/research/company/1.pdf"
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.part')
+        os.close(fd)
+
+    def tearDown(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def _response(self, chunks, status=200, length=True):
+        response = MagicMock()
+        response.status_code = status
+        response.headers = {'Content-Length': str(sum(map(len, chunks)))} if length else {}
+        response.iter_content.return_value = iter(chunks)
+        return response
+
+    @patch('src.pdf_handler.requests.get')
+    def test_streams_to_file_with_progress(self, mock_get):
+        mock_get.return_value = self._response([b"a" * 10, b"b" * 5])
+        progress = []
+
+        download_pdf(self.URL, self.path, lambda d, t: progress.append((d, t)))
+
+        self.assertTrue(mock_get.call_args.kwargs['stream'])
+        self.assertEqual(progress, [(10, 15), (15, 15)])
+        with open(self.path, 'rb') as f:
+            self.assertEqual(f.read(), b"a" * 10 + b"b" * 5)
+        mock_get.return_value.close.assert_called_once()
+
+    @patch('src.pdf_handler.requests.get')
+    def test_unknown_length(self, mock_get):
+        mock_get.return_value = self._response([b"abc"], length=False)
+        progress = []
+        download_pdf(self.URL, self.path, lambda d, t: progress.append((d, t)))
+        self.assertEqual(progress, [(3, None)])
+
+    @patch('src.pdf_handler.requests.get')
+    def test_cancel_stops_download(self, mock_get):
+        cancel = threading.Event()
+        chunks_read = []
+
+        def chunks():
+            for i in range(5):
+                chunks_read.append(i)
+                if i == 1:
+                    cancel.set()
+                yield b"x"
+
+        response = self._response([])
+        response.iter_content.return_value = chunks()
+        mock_get.return_value = response
+
+        with self.assertRaises(PDFDownloadCancelled):
+            download_pdf(self.URL, self.path, cancel_event=cancel)
+        self.assertEqual(len(chunks_read), 2)
+        response.close.assert_called_once()
+
+    @patch('src.pdf_handler.requests.get')
+    def test_http_error(self, mock_get):
+        mock_get.return_value = self._response([], status=404)
+        with self.assertRaises(Exception) as ctx:
+            download_pdf(self.URL, self.path)
+        self.assertIn("404", str(ctx.exception))
+
+    @patch('src.pdf_handler.requests.get')
+    def test_cancelled_load_removes_temp_file(self, mock_get):
+        cancel = threading.Event()
+        cancel.set()
+        mock_get.return_value = self._response([b"x"])
+        handler = PDFHandler()
+
+        with patch('src.pdf_handler.tempfile.mkstemp', return_value=(os.open(self.path, os.O_RDWR), self.path)):
+            with self.assertRaises(PDFDownloadCancelled):
+                handler.load_pdf(self.URL, cancel_event=cancel)
+
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(handler.total_pages, 0)
+
+    def test_validate_pdf_url(self):
+        validate_pdf_url(self.URL)
+        with self.assertRaises(ValueError):
+            validate_pdf_url("https://evil.com/a.pdf")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,157 @@
+"""
+prefetcher.py 단위 테스트
+"""
+
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch, MagicMock
+
+from src.pdf_cache import PDFCache
+from src.prefetcher import PDFPrefetcher
+
+
+def _url(n):
+    return f"https://ssl.pstatic.net/imgstock/upload/research/company/{n}.pdf"
+
+
+def _response(body=b"%PDF-1.4 test", length=True):
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {'Content-Length': str(len(body))} if length else {}
+    response.iter_content.return_value = [body]
+    return response
+
+
+class TestPDFPrefetcher(unittest.TestCase):
+    """PDFPrefetcher 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = PDFCache(self._tmp.name)
+        self.prefetcher = PDFPrefetcher(self.cache, max_workers=1, byte_budget=1000)
+
+    def tearDown(self):
+        self.prefetcher.close()
+        self.cache.close()
+        self._tmp.cleanup()
+
+    @patch('src.pdf_handler.requests.get')
+    def test_prefetch_fills_cache(self, mock_get):
+        mock_get.side_effect = lambda url, **kw: _response(url.encode())
+
+        self.prefetcher.prefetch([_url(1), _url(2)])
+        self.prefetcher.wait(timeout=5)
+
+        self.assertIsNotNone(self.cache.get(_url(1)))
+        self.assertIsNotNone(self.cache.get(_url(2)))
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch('src.pdf_handler.requests.get')
+    def test_cached_urls_skipped(self, mock_get):
+        self.cache.put(_url(1), b"%PDF-1.4 cached")
+        mock_get.side_effect = lambda url, **kw: _response(url.encode())
+
+        self.prefetcher.prefetch([_url(1), _url(2)])
+        self.prefetcher.wait(timeout=5)
+
+        self.assertEqual([c.args[0] for c in mock_get.call_args_list], [_url(2)])
+
+    @patch('src.pdf_handler.requests.get')
+    def test_on_downloaded_callback(self, mock_get):
+        mock_get.side_effect = lambda url, **kw: _response(url.encode())
+        done = []
+        self.prefetcher.on_downloaded = lambda url, sha256: done.append((url, sha256))
+
+        self.prefetcher.prefetch([_url(1)])
+        self.prefetcher.wait(timeout=5)
+
+        self.assertEqual(done, [(_url(1), self.cache.content_hash(_url(1)))])
+
+    @patch('src.pdf_handler.requests.get')
+    def test_invalid_urls_skipped(self, mock_get):
+        self.prefetcher.prefetch(["https://evil.com/a.pdf", ""])
+        self.prefetcher.wait(timeout=5)
+        mock_get.assert_not_called()
+
+    @patch('src.pdf_handler.requests.get')
+    def test_byte_budget(self, mock_get):
+        mock_get.side_effect = lambda url, **kw: _response(b"x" * 600)
+
+        self.prefetcher.prefetch([_url(1), _url(2), _url(3)])
+        self.prefetcher.wait(timeout=5)
+
+        # 첫 파일 후 남은 예산(400)으로는 다음 파일(600)을 받지 않음
+        self.assertIsNotNone(self.cache.get(_url(1)))
+        self.assertIsNone(self.cache.get(_url(2)))
+        self.assertIsNone(self.cache.get(_url(3)))
+
+    @patch('src.pdf_handler.requests.get')
+    def test_budget_without_content_length(self, mock_get):
+        mock_get.side_effect = lambda url, **kw: _response(b"x" * 1200, length=False)
+
+        self.prefetcher.prefetch([_url(1)])
+        self.prefetcher.wait(timeout=5)
+
+        self.assertIsNone(self.cache.get(_url(1)))
+
+    @patch('src.pdf_handler.requests.get')
+    def test_paused_while_user_download_runs(self, mock_get):
+        mock_get.side_effect = lambda url, **kw: _response(url.encode())
+
+        self.prefetcher.pause()
+        self.prefetcher.prefetch([_url(1)])
+        self.prefetcher.wait(timeout=0.2)
+        mock_get.assert_not_called()
+
+        self.prefetcher.resume()
+        self.prefetcher.wait(timeout=5)
+        self.assertIsNotNone(self.cache.get(_url(1)))
+
+    @patch('src.pdf_handler.requests.get')
+    def test_pause_interrupts_and_retries(self, mock_get):
+        started = threading.Event()
+        paused = threading.Event()
+        calls = []
+
+        def slow_chunks():
+            yield b"x"
+            started.set()
+            paused.wait(timeout=5)
+            yield b"y"
+
+        def fake_get(url, **kw):
+            calls.append(url)
+            response = _response()
+            if len(calls) == 1:
+                response.iter_content.return_value = slow_chunks()
+            return response
+
+        mock_get.side_effect = fake_get
+
+        self.prefetcher.prefetch([_url(1)])
+        self.assertTrue(started.wait(timeout=5))
+        self.prefetcher.pause()
+        paused.set()
+        self.prefetcher.resume()
+        self.prefetcher.wait(timeout=5)
+
+        # 일시정지로 끊긴 다운로드는 재개 후 처음부터 다시 받음
+        self.assertEqual(calls, [_url(1), _url(1)])
+        self.assertIsNotNone(self.cache.get(_url(1)))
+
+    @patch('src.pdf_handler.requests.get')
+    def test_new_round_drops_stale_work(self, mock_get):
+        mock_get.side_effect = lambda url, **kw: _response(url.encode())
+
+        self.prefetcher.pause()
+        self.prefetcher.prefetch([_url(1), _url(2)])
+        self.prefetcher.prefetch([_url(3)])
+        self.prefetcher.resume()
+        self.prefetcher.wait(timeout=5)
+
+        self.assertEqual([c.args[0] for c in mock_get.call_args_list], [_url(3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+"""
+render_worker.py 단위 테스트
+"""
+
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import fitz
+
+from src.pdf_handler import PDFHandler
+from src.render_worker import PageRenderWorker
+
+
+def _load(handler, pages=8):
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page(width=200, height=100)
+        page.insert_text((20, 50), f"Page {i}")
+    handler._open_document(fitz.open(stream=doc.tobytes(), filetype="pdf"), None)
+    doc.close()
+
+
+class TestPageRenderWorker(unittest.TestCase):
+    """PageRenderWorker 테스트"""
+
+    def setUp(self):
+        self.handler = PDFHandler()
+        _load(self.handler)
+        self.worker = PageRenderWorker(self.handler, radius=2)
+
+    def tearDown(self):
+        self.worker.stop()
+        self.handler.reset()
+
+    def test_prerenders_neighbours(self):
+        self.handler.current_page = 3
+        self.worker.schedule(3, 1.0)
+        self.assertTrue(self.worker.wait_idle(timeout=5))
+
+        for page in (1, 2, 4, 5):
+            self.assertTrue(self.handler.is_page_cached(page, 1.0), page)
+        self.assertFalse(self.handler.is_page_cached(0, 1.0))
+        self.assertFalse(self.handler.is_page_cached(6, 1.0))
+
+    def test_clamped_to_document(self):
+        self.worker.schedule(0, 1.0)
+        self.assertTrue(self.worker.wait_idle(timeout=5))
+        self.assertEqual(sorted(p for p, _ in self.handler._page_cache.keys()), [1, 2])
+
+    def test_forward_pages_first(self):
+        order = []
+        original = self.handler.prerender_page
+
+        def record(page_num, zoom, doc_generation):
+            order.append(page_num)
+            return original(page_num, zoom, doc_generation)
+
+        with patch.object(self.handler, 'prerender_page', side_effect=record):
+            self.worker.schedule(4, 1.0)
+            self.assertTrue(self.worker.wait_idle(timeout=5))
+        self.assertEqual(order, [5, 3, 6, 2])
+
+    def test_uses_current_zoom(self):
+        self.worker.schedule(3, 1.5)
+        self.assertTrue(self.worker.wait_idle(timeout=5))
+        self.assertTrue(self.handler.is_page_cached(4, 1.5))
+        self.assertFalse(self.handler.is_page_cached(4, 1.0))
+
+    def test_document_change_skips_stale_work(self):
+        gate = threading.Event()
+        original = self.handler.prerender_page
+
+        def blocked(page_num, zoom, doc_generation):
+            gate.wait(timeout=5)
+            return original(page_num, zoom, doc_generation)
+
+        with patch.object(self.handler, 'prerender_page', side_effect=blocked):
+            self.worker.schedule(3, 1.0)
+            # 작업자가 첫 페이지에서 대기하는 동안 새 문서 로드
+            _load(self.handler, pages=8)
+            gate.set()
+            self.assertTrue(self.worker.wait_idle(timeout=5))
+
+        self.assertEqual(len(self.handler._page_cache), 0)
+
+    def test_cancel_drops_pending(self):
+        gate = threading.Event()
+        calls = []
+
+        def blocked(page_num, zoom, doc_generation):
+            calls.append(page_num)
+            gate.wait(timeout=5)
+            return True
+
+        with patch.object(self.handler, 'prerender_page', side_effect=blocked):
+            self.worker.schedule(3, 1.0)
+            while not calls:
+                time.sleep(0.01)
+            self.worker.cancel()
+            gate.set()
+            self.assertTrue(self.worker.wait_idle(timeout=5))
+
+        self.assertEqual(calls, [4])
+
+    def test_concurrent_ui_rendering(self):
+        """작업자와 UI 스레드가 동시에 렌더링해도 문서 락으로 직렬화"""
+        for page in range(8):
+            self.worker.schedule(page, 1.25)
+            img = self.handler.render_page(page, zoom=1.25)
+            self.assertIsNotNone(img)
+        self.assertTrue(self.worker.wait_idle(timeout=5))
+
+
+if __name__ == '__main__':
+    unittest.main()
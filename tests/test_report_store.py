@@ -0,0 +1,118 @@
+"""
+report_store.py 단위 테스트
+"""
+
+import os
+import tempfile
+import unittest
+
+from src.models import ReportData
+from src.report_store import ReportStore
+
+
+def _report(nid, stock="삼성전자", firm="미래에셋증권", date="26.02.02", **kwargs):
+    return ReportData(
+        stock=stock, title=f"리포트 {nid}", firm=firm, date=date,
+        link=f"https://finance.naver.com/research/company_read.naver?nid={nid}",
+        pdf_link=f"https://ssl.pstatic.net/imgstock/upload/research/company/{nid}.pdf",
+        **kwargs,
+    )
+
+
+class TestReportStore(unittest.TestCase):
+    """ReportStore 테스트"""
+
+    def setUp(self):
+        self.store = ReportStore(':memory:')
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_empty_store(self):
+        self.assertEqual(self.store.get_reports(), [])
+        self.assertEqual(self.store.count(), 0)
+        self.assertIsNone(self.store.get_report("https://example.com"))
+
+    def test_save_and_get_preserves_listing_order(self):
+        reports = [_report(3), _report(2), _report(1)]
+        self.store.save_reports(reports)
+
+        stored = self.store.get_reports(date="26.02.02")
+        self.assertEqual([r.link for r in stored], [r.link for r in reports])
+
+    def test_newer_reports_listed_first(self):
+        self.store.save_reports([_report(2), _report(1)])
+        # 새로고침으로 새 리포트가 목록 맨 위에 추가됨
+        self.store.save_reports([_report(3), _report(2), _report(1)])
+
+        stored = self.store.get_reports(date="26.02.02")
+        self.assertEqual([r.title for r in stored], ["리포트 3", "리포트 2", "리포트 1"])
+        self.assertEqual(self.store.count(), 3)
+
+    def test_upsert_keeps_fetched_meta(self):
+        report = _report(1)
+        self.store.save_reports([report])
+
+        report.opinion = "매수"
+        report.target = "80,000"
+        self.store.save_meta(report)
+
+        # 목록 재수집 시 기본값('-')으로 덮어쓰지 않아야 함
+        self.store.save_reports([_report(1, views="999")])
+
+        stored = self.store.get_report(report.link)
+        self.assertEqual(stored.opinion, "매수")
+        self.assertEqual(stored.target, "80,000")
+        self.assertEqual(stored.views, "999")
+
+    def test_has_meta(self):
+        report = _report(1)
+        self.store.save_reports([report])
+        self.assertFalse(self.store.has_meta(report.link))
+
+        self.store.save_meta(report)
+        self.assertTrue(self.store.has_meta(report.link))
+
+    def test_save_meta_inserts_unknown_report(self):
+        report = _report(7, opinion="중립")
+        self.store.save_meta(report)
+        self.assertEqual(self.store.get_report(report.link).opinion, "중립")
+
+    def test_filters(self):
+        self.store.save_reports([
+            _report(1, stock="삼성전자", firm="KB증권"),
+            _report(2, stock="SK하이닉스", firm="KB증권"),
+            _report(3, stock="삼성전자", firm="NH투자증권", date="26.02.01"),
+        ])
+
+        self.assertEqual(len(self.store.get_reports(date="26.02.02")), 2)
+        self.assertEqual(len(self.store.get_reports(stock="삼성전자")), 2)
+        self.assertEqual(len(self.store.get_reports(firm="KB증권")), 2)
+        self.assertEqual(len(self.store.get_reports(stock="삼성전자", firm="KB증권")), 1)
+
+    def test_get_links(self):
+        self.store.save_reports([_report(1), _report(2, date="26.02.01")])
+        self.assertEqual(len(self.store.get_links()), 2)
+        self.assertEqual(self.store.get_links(date="26.02.01"), {_report(2).link})
+
+    def test_indexes_created(self):
+        rows = self.store._conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'reports'"
+        ).fetchall()
+        names = {row[0] for row in rows}
+        self.assertTrue({'idx_reports_date', 'idx_reports_stock', 'idx_reports_firm'} <= names)
+
+    def test_persists_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'sub', 'reports.db')
+            store = ReportStore(path)
+            store.save_reports([_report(1)])
+            store.close()
+
+            reopened = ReportStore(path)
+            self.assertEqual(reopened.count(), 1)
+            reopened.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
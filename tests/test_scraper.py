@@ -2,14 +2,23 @@
 scraper.py 단위 테스트
 """
 
+import glob
+import os
+import tempfile
+import threading
+import time
 import unittest
 from unittest.mock import patch, MagicMock, PropertyMock
 import requests
 
-from src.scraper import NaverReportScraper
+from src.scraper import NaverReportScraper, lxml_html
+from src.http_cache import HTTPCache
 from src.models import ReportData
+from src.report_store import ReportStore
 
 
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
 # 테스트용 HTML 페이지 생성
 SAMPLE_HTML = """
 <html>
@@ -271,6 +280,468 @@ class TestNaverReportScraperParsing(unittest.TestCase):
         self.assertEqual(result.target, "-")
 
 
+def _make_listing_html(rows):
+    """(stock, nid, date) 튜플 리스트로 목록 페이지 HTML 생성"""
+    trs = []
+    for stock, nid, date in rows:
+        trs.append(f"""
+        <tr>
+            <td><a href="/item/main.naver?code=000000">{stock}</a></td>
+            <td><a href="/research/company_read.naver?nid={nid}">{stock} 리포트</a></td>
+            <td>테스트증권</td>
+            <td><a href="https://ssl.pstatic.net/imgstock/upload/research/company/{nid}.pdf">PDF</a></td>
+            <td>{date}</td>
+            <td>10</td>
+        </tr>""")
+    return f'<html><body><table class="type_1">{"".join(trs)}</table></body></html>'
+
+
+def _page_number(url):
+    return int(url.rsplit('page=', 1)[1])
+
+
+def _mock_response(html):
+    response = MagicMock()
+    response.status_code = 200
+    response.text = html
+    response.encoding = 'utf-8'
+    response.raise_for_status = MagicMock()
+    return response
+
+
+class TestNaverReportScraperConcurrentFetch(unittest.TestCase):
+    """목록 페이지 병렬 수집 테스트"""
+
+    def setUp(self):
+        self.scraper = NaverReportScraper()
+        self.pages = {
+            1: _make_listing_html([(f"종목{i}", 100 - i, "26.02.02") for i in range(3)]),
+            2: _make_listing_html([(f"종목{i}", 100 - i, "26.02.02") for i in range(3, 6)]),
+            3: _make_listing_html([("종목6", 94, "26.02.02"), ("어제종목", 93, "26.02.01")]),
+            4: _make_listing_html([("어제종목2", 92, "26.02.01")]),
+            5: _make_listing_html([("어제종목3", 91, "26.02.01")]),
+        }
+
+    def tearDown(self):
+        self.scraper.close()
+
+    def _fake_get(self, url, timeout=None):
+        return _mock_response(self.pages[_page_number(url)])
+
+    @patch.object(requests.Session, 'get')
+    def test_concurrent_merges_in_page_order(self, mock_get):
+        mock_get.side_effect = self._fake_get
+
+        reports = self.scraper.fetch_reports(date="26.02.02", max_workers=3)
+
+        self.assertEqual([r.stock for r in reports], [f"종목{i}" for i in range(7)])
+
+    @patch.object(requests.Session, 'get')
+    def test_concurrent_matches_sequential(self, mock_get):
+        mock_get.side_effect = self._fake_get
+
+        sequential = self.scraper.fetch_reports(date="26.02.02", max_workers=1)
+        concurrent = self.scraper.fetch_reports(date="26.02.02", max_workers=4)
+
+        self.assertEqual([r.link for r in sequential], [r.link for r in concurrent])
+
+    @patch.object(requests.Session, 'get')
+    def test_concurrent_stops_dispatch_after_old_date(self, mock_get):
+        mock_get.side_effect = self._fake_get
+
+        self.scraper.fetch_reports(date="26.02.02", max_workers=2)
+
+        requested = sorted(_page_number(c.args[0]) for c in mock_get.call_args_list)
+        # 3페이지에서 이전 날짜 발견 → 최대 4페이지까지만 요청 (5페이지는 요청하지 않음)
+        self.assertNotIn(5, requested)
+
+    @patch.object(requests.Session, 'get')
+    def test_concurrent_consecutive_error_cutoff(self, mock_get):
+        mock_get.side_effect = requests.ConnectionError("Connection refused")
+
+        reports = self.scraper.fetch_reports(date="26.02.02", max_workers=2)
+
+        self.assertEqual(reports, [])
+        # 연속 오류 3회에서 중단 → 마지막 페이지까지 모두 요청하지 않음
+        self.assertLess(mock_get.call_count, 5)
+
+    @patch.object(requests.Session, 'get')
+    def test_error_counter_resets_after_success(self, mock_get):
+        def fake_get(url, timeout=None):
+            page = _page_number(url)
+            if page in (1, 2):
+                raise requests.Timeout("timeout")
+            return _mock_response(self.pages[page])
+        mock_get.side_effect = fake_get
+
+        reports = self.scraper.fetch_reports(date="26.02.02", max_workers=3)
+
+        self.assertEqual([r.stock for r in reports], ["종목6"])
+
+    @patch.object(requests.Session, 'get')
+    def test_duplicate_rows_across_pages_merged_once(self, mock_get):
+        # 수집 중 새 리포트가 올라와 2페이지 첫 행이 1페이지 마지막 행과 중복되는 경우
+        self.pages[2] = _make_listing_html(
+            [("종목2", 98, "26.02.02"), ("종목3", 97, "26.02.02"), ("어제종목", 93, "26.02.01")]
+        )
+        mock_get.side_effect = self._fake_get
+
+        reports = self.scraper.fetch_reports(date="26.02.02", max_workers=3)
+
+        self.assertEqual([r.stock for r in reports], ["종목0", "종목1", "종목2", "종목3"])
+
+    @patch.object(requests.Session, 'get')
+    def test_concurrent_progress_callback_in_order(self, mock_get):
+        mock_get.side_effect = self._fake_get
+        callback = MagicMock()
+
+        self.scraper.fetch_reports(date="26.02.02", progress_callback=callback, max_workers=3)
+
+        pages = [c.args[0] for c in callback.call_args_list]
+        self.assertEqual(pages, sorted(pages))
+        self.assertEqual(pages[0], 1)
+
+
+class TestNaverReportScraperIncrementalFetch(unittest.TestCase):
+    """증분 수집 테스트"""
+
+    def setUp(self):
+        self.scraper = NaverReportScraper()
+        self.pages = {
+            page: _make_listing_html(
+                [(f"종목{n}", 200 - n, "26.02.02") for n in range((page - 1) * 3, page * 3)]
+            )
+            for page in range(1, 6)
+        }
+
+    def tearDown(self):
+        self.scraper.close()
+
+    def _fake_get(self, url, timeout=None):
+        return _mock_response(self.pages[_page_number(url)])
+
+    @staticmethod
+    def _link(nid):
+        return f"https://finance.naver.com/research/company_read.naver?nid={nid}"
+
+    @patch.object(requests.Session, 'get')
+    def test_returns_only_delta(self, mock_get):
+        mock_get.side_effect = self._fake_get
+        known = {self._link(200 - n) for n in range(1, 15)}
+
+        reports = self.scraper.fetch_reports(date="26.02.02", known_links=known)
+
+        self.assertEqual([r.stock for r in reports], ["종목0"])
+
+    @patch.object(requests.Session, 'get')
+    def test_single_request_when_delta_on_first_page(self, mock_get):
+        mock_get.side_effect = self._fake_get
+        known = {self._link(200 - n) for n in range(1, 15)}
+
+        self.scraper.fetch_reports(date="26.02.02", known_links=known, max_workers=4)
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch.object(requests.Session, 'get')
+    def test_delta_spanning_pages(self, mock_get):
+        mock_get.side_effect = self._fake_get
+        known = {self._link(200 - n) for n in range(4, 15)}
+
+        reports = self.scraper.fetch_reports(date="26.02.02", known_links=known)
+
+        self.assertEqual([r.stock for r in reports], ["종목0", "종목1", "종목2", "종목3"])
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch.object(requests.Session, 'get')
+    def test_no_new_reports(self, mock_get):
+        mock_get.side_effect = self._fake_get
+        known = {self._link(200)}
+
+        reports = self.scraper.fetch_reports(date="26.02.02", known_links=known)
+
+        self.assertEqual(reports, [])
+        self.assertEqual(mock_get.call_count, 1)
+
+    @patch.object(requests.Session, 'get')
+    def test_fetch_new_reports_uses_store_links(self, mock_get):
+        mock_get.side_effect = self._fake_get
+        store = ReportStore(':memory:')
+        try:
+            # 이전 수집 이후 종목0, 종목1이 새로 올라온 상황
+            store.save_reports(self.scraper.fetch_reports(date="26.02.02", max_workers=1)[2:])
+            self.scraper.store = store
+            mock_get.reset_mock()
+
+            reports = self.scraper.fetch_new_reports(date="26.02.02")
+
+            self.assertEqual([r.stock for r in reports], ["종목0", "종목1"])
+            self.assertEqual(mock_get.call_count, 1)
+            # 새 리포트도 저장소에 기록되어 목록 맨 위에 위치
+            self.assertEqual(store.get_reports(date="26.02.02")[0].stock, "종목0")
+        finally:
+            store.close()
+
+
+class TestNaverReportScraperMetaMany(unittest.TestCase):
+    """상세 정보 일괄 요청 테스트"""
+
+    def setUp(self):
+        self.scraper = NaverReportScraper()
+        self.reports = [
+            ReportData(
+                stock=f"종목{i}", title="리포트", firm="증권사", date="26.02.02",
+                link=f"https://finance.naver.com/research/company_read.naver?nid={i}"
+            )
+            for i in range(6)
+        ]
+
+    def tearDown(self):
+        self.scraper.close()
+
+    @patch.object(requests.Session, 'get')
+    def test_fetches_all_and_streams_callback(self, mock_get):
+        mock_get.return_value = _mock_response(SAMPLE_META_HTML)
+        callback = MagicMock()
+
+        fetched = self.scraper.fetch_report_meta_many(
+            self.reports, callback=callback, max_workers=3, rate_limit=0
+        )
+
+        self.assertEqual(len(fetched), 6)
+        self.assertEqual(callback.call_count, 6)
+        self.assertTrue(all(r.opinion == "매수" for r in self.reports))
+
+    @patch.object(requests.Session, 'get')
+    def test_failed_reports_not_returned(self, mock_get):
+        failed_link = self.reports[2].link
+
+        def get(url, **kwargs):
+            if url == failed_link:
+                raise requests.Timeout("timeout")
+            return _mock_response(SAMPLE_META_HTML)
+
+        mock_get.side_effect = get
+        callback = MagicMock()
+
+        fetched = self.scraper.fetch_report_meta_many(
+            self.reports, callback=callback, max_workers=3, rate_limit=0
+        )
+
+        self.assertEqual(len(fetched), 5)
+        self.assertNotIn(self.reports[2], fetched)
+        self.assertEqual(callback.call_count, 5)
+        self.assertNotIn(self.reports[2], [c.args[0] for c in callback.call_args_list])
+
+    @patch.object(requests.Session, 'get')
+    def test_skips_reports_with_meta(self, mock_get):
+        mock_get.return_value = _mock_response(SAMPLE_META_HTML)
+        self.reports[0].opinion = "중립"
+        self.reports[1].target = "50,000"
+
+        fetched = self.scraper.fetch_report_meta_many(self.reports, rate_limit=0)
+
+        self.assertEqual(len(fetched), 4)
+        self.assertEqual(mock_get.call_count, 4)
+        self.assertEqual(self.reports[0].opinion, "중립")
+
+    @patch.object(requests.Session, 'get')
+    def test_skips_reports_cached_in_store(self, mock_get):
+        mock_get.return_value = _mock_response(SAMPLE_META_HTML)
+        store = ReportStore(':memory:')
+        self.scraper.store = store
+        try:
+            cached = ReportData.from_dict(self.reports[0].to_dict())
+            cached.opinion = "중립"
+            store.save_meta(cached)
+            callback = MagicMock()
+
+            self.scraper.fetch_report_meta_many(self.reports, callback=callback, rate_limit=0)
+
+            self.assertEqual(mock_get.call_count, 5)
+            # 저장소 값이 객체에 채워지고 콜백으로도 전달됨
+            self.assertEqual(self.reports[0].opinion, "중립")
+            self.assertEqual(callback.call_count, 6)
+        finally:
+            store.close()
+
+    @patch.object(requests.Session, 'get')
+    def test_cancel_event_stops_requests(self, mock_get):
+        mock_get.return_value = _mock_response(SAMPLE_META_HTML)
+        cancel_event = threading.Event()
+        cancel_event.set()
+
+        fetched = self.scraper.fetch_report_meta_many(self.reports, cancel_event=cancel_event)
+
+        self.assertEqual(fetched, [])
+        mock_get.assert_not_called()
+
+    @patch.object(requests.Session, 'get')
+    def test_rate_limit_spaces_requests(self, mock_get):
+        mock_get.return_value = _mock_response(SAMPLE_META_HTML)
+
+        start = time.monotonic()
+        self.scraper.fetch_report_meta_many(self.reports[:4], max_workers=4, rate_limit=20)
+        elapsed = time.monotonic() - start
+
+        # 초당 20회 → 4개 요청에 최소 3 간격(0.15초)
+        self.assertGreaterEqual(elapsed, 0.14)
+
+
+class TestNaverReportScraperStore(unittest.TestCase):
+    """로컬 저장소 연동 테스트"""
+
+    def setUp(self):
+        self.store = ReportStore(':memory:')
+        self.scraper = NaverReportScraper(store=self.store)
+
+    def tearDown(self):
+        self.scraper.close()
+        self.store.close()
+
+    @patch.object(requests.Session, 'get')
+    def test_fetch_reports_saved_to_store(self, mock_get):
+        mock_get.return_value = _mock_response(SAMPLE_HTML)
+
+        reports = self.scraper.fetch_reports(date="26.02.02")
+
+        stored = self.store.get_reports(date="26.02.02")
+        self.assertEqual([r.link for r in stored], [r.link for r in reports])
+
+    @patch.object(requests.Session, 'get')
+    def test_fetch_report_meta_saved_to_store(self, mock_get):
+        mock_get.return_value = _mock_response(SAMPLE_META_HTML)
+        report = ReportData(
+            stock="삼성전자", title="리포트", firm="증권사",
+            date="26.02.02", link="https://finance.naver.com/research/company_read.naver?nid=1"
+        )
+
+        self.scraper.fetch_report_meta(report)
+
+        self.assertTrue(self.store.has_meta(report.link))
+        self.assertEqual(self.store.get_report(report.link).opinion, "매수")
+
+    @patch.object(requests.Session, 'get')
+    def test_fetch_report_meta_failure_not_saved(self, mock_get):
+        mock_get.side_effect = requests.Timeout("timeout")
+        report = ReportData(
+            stock="삼성전자", title="리포트", firm="증권사",
+            date="26.02.02", link="https://finance.naver.com/research/company_read.naver?nid=1"
+        )
+
+        self.scraper.fetch_report_meta(report)
+
+        self.assertFalse(self.store.has_meta(report.link))
+
+    @patch.object(requests.Session, 'get')
+    def test_fetch_report_meta_without_table_not_saved(self, mock_get):
+        # 200 응답이지만 상세 정보 표가 없는 안내/오류 페이지 — 다음에 다시 요청해야 함
+        mock_get.return_value = _mock_response("<html><body>잠시 후 다시 시도해 주세요</body></html>")
+        report = ReportData(
+            stock="삼성전자", title="리포트", firm="증권사",
+            date="26.02.02", link="https://finance.naver.com/research/company_read.naver?nid=1"
+        )
+
+        self.scraper.fetch_report_meta(report)
+
+        self.assertFalse(self.store.has_meta(report.link))
+        self.assertFalse(self.scraper.has_cached_meta(report))
+
+
+
+class TestNaverReportScraperHTTPCache(unittest.TestCase):
+    """HTTP 캐시 연동 테스트"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.store = ReportStore(':memory:')
+        self.scraper = NaverReportScraper(store=self.store, http_cache=HTTPCache(self._tmp.name))
+
+    def tearDown(self):
+        self.scraper.close()
+        self.store.close()
+        self._tmp.cleanup()
+
+    @staticmethod
+    def _response(html):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = html.encode('utf-8')
+        response.headers = requests.structures.CaseInsensitiveDict(
+            {'Content-Type': 'text/html; charset=utf-8'})
+        response.encoding = 'utf-8'
+        return response
+
+    @patch.object(requests.Session, 'get')
+    def test_page_without_table_refetched(self, mock_get):
+        # 상세 페이지는 영구 캐시 대상 — 표가 없는 응답이 캐시에 남으면 다시 시도해도 채워지지 않음
+        report = ReportData(
+            stock="삼성전자", title="리포트", firm="증권사",
+            date="26.02.02", link="https://finance.naver.com/research/company_read.naver?nid=1"
+        )
+        mock_get.return_value = self._response("<html><body>서비스 점검 중</body></html>")
+        self.assertEqual(self.scraper.fetch_report_meta_many([report], rate_limit=0), [])
+
+        mock_get.return_value = self._response(SAMPLE_META_HTML)
+        fetched = self.scraper.fetch_report_meta_many([report], rate_limit=0)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(fetched, [report])
+        self.assertEqual(report.opinion, "매수")
+        self.assertTrue(self.store.has_meta(report.link))
+
+@unittest.skipIf(lxml_html is None, "lxml 미설치")
+class TestListingParsers(unittest.TestCase):
+    """lxml 목록 파서와 BeautifulSoup 파서 결과 일치 테스트"""
+
+    def setUp(self):
+        self.scraper = NaverReportScraper()
+
+    def tearDown(self):
+        self.scraper.close()
+
+    def _assert_same(self, html):
+        bs4_reports = self.scraper._parse_listing_page_bs4(html)
+        lxml_reports = self.scraper._parse_listing_page_lxml(html)
+        if bs4_reports is None:
+            self.assertIsNone(lxml_reports)
+            return
+        self.assertEqual([r.to_dict() for r in lxml_reports],
+                         [r.to_dict() for r in bs4_reports])
+
+    def test_fixture_pages_match(self):
+        paths = sorted(glob.glob(os.path.join(FIXTURE_DIR, 'company_list_page*.html')))
+        self.assertTrue(paths)
+        for path in paths:
+            with open(path, encoding='utf-8') as f:
+                html = f.read()
+            with self.subTest(path=os.path.basename(path)):
+                self._assert_same(html)
+
+    def test_fixture_page_contents(self):
+        with open(os.path.join(FIXTURE_DIR, 'company_list_page1.html'), encoding='utf-8') as f:
+            reports = self.scraper._parse_listing_page_lxml(f.read())
+        self.assertEqual(len(reports), 30)
+        self.assertTrue(all(r.link.startswith("https://finance.naver.com/research/") for r in reports))
+        # PDF가 없는 행은 빈 문자열
+        self.assertTrue(any(r.pdf_link == "" for r in reports))
+
+    def test_sample_pages_match(self):
+        for html in (SAMPLE_HTML, SAMPLE_HTML_NO_TABLE):
+            self._assert_same(html)
+
+    def test_no_table_returns_none(self):
+        self.assertIsNone(self.scraper._parse_listing_page_lxml(SAMPLE_HTML_NO_TABLE))
+
+    @patch.object(requests.Session, 'get')
+    def test_bs4_fallback_path(self, mock_get):
+        mock_get.return_value = _mock_response(SAMPLE_HTML)
+        self.scraper.listing_parser = 'bs4'
+
+        reports = self.scraper.fetch_reports(date="26.02.02")
+
+        self.assertEqual([r.stock for r in reports], ["삼성전자", "SK하이닉스"])
+
+
 class TestNaverReportScraperContextManager(unittest.TestCase):
     """컨텍스트 매니저 테스트"""
 
@@ -0,0 +1,187 @@
+"""
+search_index.py 단위 테스트
+"""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import fitz
+
+from src.config import PDF_RENDER_SCALE
+from src.models import ReportData
+from src.pdf_handler import PDFHandler
+from src.search_index import ReportSearchIndex, SearchIndexer, extract_search_pages
+
+
+def _pdf_bytes(lines_per_page):
+    doc = fitz.open()
+    for lines in lines_per_page:
+        page = doc.new_page(width=400, height=300)
+        page.insert_text((20, 50), "\n".join(lines), fontname="korea", fontsize=11)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _report(stock, date):
+    return ReportData(stock=stock, title=f"{stock} 리포트", firm="A증권", date=date,
+                      link=f"https://finance.naver.com/{stock}", pdf_link=f"https://pdf/{stock}.pdf")
+
+
+class TestReportSearchIndex(unittest.TestCase):
+    """ReportSearchIndex 테스트"""
+
+    def setUp(self):
+        self.index = ReportSearchIndex(':memory:')
+        self.samsung = _pdf_bytes([["HBM 수요 증가", "목표주가 상향"], ["실적 리뷰"]])
+        self.hynix = _pdf_bytes([["메모리 업황"], ["HBM3E 공급 확대", "목표주가 유지"]])
+        self.index.add_document('h-samsung', _report('삼성전자', '24.05.13'),
+                                extract_search_pages(self.samsung))
+        self.index.add_document('h-hynix', _report('SK하이닉스', '24.04.30'),
+                                extract_search_pages(self.hynix))
+
+    def tearDown(self):
+        self.index.close()
+
+    def test_fts_enabled(self):
+        self.assertTrue(self.index.fts_enabled)
+
+    def test_search_across_reports(self):
+        hits = self.index.search("hbm")
+        self.assertEqual([(h.report.stock, h.page) for h in hits],
+                         [('삼성전자', 0), ('SK하이닉스', 1)])
+        self.assertEqual(hits[0].report.pdf_link, "https://pdf/삼성전자.pdf")
+        self.assertEqual(hits[0].count, 1)
+
+    def test_hit_rects_match_pdf(self):
+        hit = self.index.search("목표주가 상향")[0]
+        with fitz.open(stream=self.samsung, filetype="pdf") as doc:
+            page = doc[0]
+            rect = page.search_for("목표주가 상향")[0]
+        self.assertEqual(hit.rects, [(
+            int(rect.x0 * PDF_RENDER_SCALE), int(rect.y0 * PDF_RENDER_SCALE),
+            int(rect.x1 * PDF_RENDER_SCALE), int(rect.y1 * PDF_RENDER_SCALE),
+        )])
+
+    def test_phrase_does_not_match_separate_words(self):
+        self.assertEqual(self.index.search("상향 목표주가"), [])
+
+    def test_short_query(self):
+        hits = self.index.search("상향")
+        self.assertEqual([(h.content_hash, h.page) for h in hits], [('h-samsung', 0)])
+        self.assertEqual(len(self.index.search("목표")), 2)
+
+    def test_date_prefix(self):
+        self.assertEqual(len(self.index.search("목표주가", date_prefix='24.05.')), 1)
+        self.assertEqual(len(self.index.search("목표주가", date_prefix='24.04.30')), 1)
+        self.assertEqual(self.index.search("목표주가", date_prefix='24.06.'), [])
+
+    def test_limit(self):
+        self.assertEqual(len(self.index.search("목표주가", limit=1)), 1)
+
+    def test_empty_and_quote_queries(self):
+        self.assertEqual(self.index.search("  "), [])
+        self.assertEqual(self.index.search('"HBM'), [])
+
+    def test_replace_and_remove(self):
+        self.assertTrue(self.index.is_indexed('h-samsung'))
+        self.index.add_document('h-samsung', None, extract_search_pages(_pdf_bytes([["D램 가격"]])))
+        self.assertEqual(self.index.count(), 2)
+        self.assertEqual(self.index.search("목표주가 상향"), [])
+        self.assertEqual(self.index.search("d램")[0].report.stock, '')
+
+        self.index.remove_document('h-samsung')
+        self.assertFalse(self.index.is_indexed('h-samsung'))
+        self.assertEqual(self.index.count(), 1)
+
+    def test_persists_on_disk(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'sub', 'search.db')
+            index = ReportSearchIndex(path)
+            index.add_document('h1', _report('삼성전자', '24.05.13'), extract_search_pages(self.samsung))
+            index.close()
+
+            index = ReportSearchIndex(path)
+            self.assertEqual(len(index.search("HBM")), 1)
+            index.close()
+
+
+class TestReportSearchIndexPlain(unittest.TestCase):
+    """FTS5를 쓸 수 없는 경우 일반 테이블 검색"""
+
+    def test_fallback(self):
+        with patch('src.search_index._FTS_SCHEMA', "CREATE VIRTUAL TABLE page_text USING nope(text);"):
+            index = ReportSearchIndex(':memory:')
+        self.assertFalse(index.fts_enabled)
+
+        index.add_document('h1', _report('삼성전자', '24.05.13'),
+                           extract_search_pages(_pdf_bytes([["HBM 수요 증가"]])))
+        self.assertEqual(len(index.search("hbm 수요")), 1)
+        self.assertEqual(len(index.search("수요")), 1)
+        self.assertEqual(index.search("공급"), [])
+        index.close()
+
+
+class TestSearchIndexer(unittest.TestCase):
+    """SearchIndexer 테스트 (텍스트 추출은 작업 프로세스)"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.index = ReportSearchIndex(':memory:')
+        self.indexer = SearchIndexer(self.index)
+
+    def tearDown(self):
+        self.indexer.close()
+        self.index.close()
+        self._tmp.cleanup()
+
+    def test_indexes_path_and_bytes(self):
+        path = os.path.join(self._tmp.name, 'a.pdf')
+        with open(path, 'wb') as f:
+            f.write(_pdf_bytes([["HBM 수요"]]))
+
+        self.assertTrue(self.indexer.submit('h1', path, _report('삼성전자', '24.05.13')))
+        self.assertTrue(self.indexer.submit('h2', _pdf_bytes([["HBM 공급"]])))
+        self.indexer.wait(timeout=30)
+
+        self.assertEqual(self.index.count(), 2)
+        self.assertEqual({h.content_hash for h in self.index.search("HBM")}, {'h1', 'h2'})
+
+    def test_indexes_temp_file_document_after_switch(self):
+        # 캐시 없이 받은 임시 파일은 리포트를 바꾸면 삭제됨 — 색인은 그 뒤에 실행돼도 성공해야 함
+        path = os.path.join(self._tmp.name, 'download.part')
+        with open(path, 'wb') as f:
+            f.write(_pdf_bytes([["HBM 수요"]]))
+        handler = PDFHandler()
+        handler._open_document(fitz.open(path), 'h1', temp_path=path)
+        source = handler.document_source()
+        handler.reset()
+        self.assertFalse(os.path.exists(path))
+
+        self.assertTrue(self.indexer.submit('h1', source))
+        self.indexer.wait(timeout=30)
+        self.assertTrue(self.index.is_indexed('h1'))
+
+    def test_skips_indexed_and_duplicates(self):
+        data = _pdf_bytes([["HBM 수요"]])
+        self.index.add_document('h1', None, extract_search_pages(data))
+        with patch('src.search_index.ReportSearchIndex.add_document') as add:
+            self.indexer.submit('h1', data)
+            self.indexer.wait(timeout=30)
+        add.assert_not_called()
+        self.assertFalse(self.indexer.submit('', data))
+
+    def test_failure_is_logged(self):
+        self.indexer.submit('bad', os.path.join(self._tmp.name, 'missing.pdf'))
+        self.indexer.wait(timeout=30)
+        self.assertFalse(self.index.is_indexed('bad'))
+
+    def test_closed_ignores_submit(self):
+        self.indexer.close()
+        self.assertFalse(self.indexer.submit('h1', b'%PDF'))
+
+
+if __name__ == '__main__':
+    unittest.main()
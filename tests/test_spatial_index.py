@@ -0,0 +1,100 @@
+"""
+spatial_index.py 단위 테스트
+"""
+
+import random
+import unittest
+
+from src.spatial_index import GridIndex
+
+
+class TestGridIndex(unittest.TestCase):
+    """GridIndex 테스트"""
+
+    def setUp(self):
+        self.index = GridIndex(cell_size=10)
+
+    def test_point_query(self):
+        self.index.insert('a', (0, 0, 15, 15))
+        self.index.insert('b', (30, 30, 40, 40))
+
+        self.assertEqual(self.index.query_point(5, 5), ['a'])
+        self.assertEqual(self.index.query_point(35, 35), ['b'])
+        self.assertEqual(self.index.query_point(20, 20), [])
+
+    def test_margin(self):
+        self.index.insert('a', (0, 0, 10, 10))
+        self.assertEqual(self.index.query_point(14, 5), [])
+        self.assertEqual(self.index.query_point(14, 5, margin=5), ['a'])
+
+    def test_rect_query(self):
+        self.index.insert('a', (0, 0, 10, 10))
+        self.index.insert('b', (50, 50, 60, 60))
+        self.index.insert('c', (100, 0, 110, 10))
+
+        self.assertEqual(self.index.query_rect((5, 5, 55, 55)), ['a', 'b'])
+        self.assertEqual(self.index.query_rect((70, 70, 90, 90)), [])
+
+    def test_results_in_insertion_order(self):
+        for key in ('c', 'a', 'b'):
+            self.index.insert(key, (0, 0, 30, 30))
+        self.assertEqual(self.index.query_point(15, 15), ['c', 'a', 'b'])
+
+    def test_values(self):
+        value = {'type': 'highlight'}
+        self.index.insert(id(value), (0, 0, 5, 5), value)
+        self.assertIs(self.index.query_point(1, 1)[0], value)
+
+    def test_unordered_bbox(self):
+        self.index.insert('a', (20, 20, 0, 0))
+        self.assertEqual(self.index.query_point(10, 10), ['a'])
+
+    def test_negative_coordinates(self):
+        self.index.insert('a', (-25, -25, -5, -5))
+        self.assertEqual(self.index.query_point(-10, -10), ['a'])
+
+    def test_remove(self):
+        self.index.insert('a', (0, 0, 100, 100))
+        self.assertTrue(self.index.remove('a'))
+        self.assertFalse(self.index.remove('a'))
+        self.assertEqual(self.index.query_point(50, 50), [])
+        self.assertEqual(len(self.index), 0)
+        self.assertEqual(self.index._cells, {})
+
+    def test_reinsert_replaces(self):
+        self.index.insert('a', (0, 0, 5, 5))
+        self.index.insert('a', (50, 50, 55, 55))
+        self.assertEqual(self.index.query_point(1, 1), [])
+        self.assertEqual(self.index.query_point(52, 52), ['a'])
+        self.assertEqual(len(self.index), 1)
+
+    def test_clear(self):
+        self.index.insert('a', (0, 0, 5, 5))
+        self.index.clear()
+        self.assertNotIn('a', self.index)
+        self.assertEqual(self.index.query_point(1, 1), [])
+
+    def test_invalid_cell_size(self):
+        with self.assertRaises(ValueError):
+            GridIndex(cell_size=0)
+
+    def test_matches_linear_scan(self):
+        rng = random.Random(42)
+        boxes = {}
+        for i in range(300):
+            x, y = rng.uniform(0, 500), rng.uniform(0, 700)
+            boxes[i] = (x, y, x + rng.uniform(1, 80), y + rng.uniform(1, 30))
+            self.index.insert(i, boxes[i])
+        for i in range(0, 300, 3):
+            self.index.remove(i)
+            del boxes[i]
+
+        for _ in range(200):
+            px, py = rng.uniform(0, 550), rng.uniform(0, 750)
+            expected = [k for k, (x0, y0, x1, y1) in boxes.items()
+                        if x0 <= px <= x1 and y0 <= py <= y1]
+            self.assertEqual(self.index.query_point(px, py), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+text_cache.py 단위 테스트
+"""
+
+import threading
+import unittest
+
+import fitz
+
+from src.text_cache import PageText, TextCache
+
+
+def _make_page(doc):
+    page = doc.new_page(width=400, height=300)
+    page.insert_text((20, 50), "Revenue grew 12%\nyear over  year", fontsize=11)
+    page.insert_text((20, 150), "목표주가 50,000원 유지 목표", fontname="korea", fontsize=11)
+    page.insert_textbox(fitz.Rect(200, 50, 380, 200),
+                        "Operating margin improved to fifteen percent in the quarter", fontsize=10)
+    return page
+
+
+class TestPageText(unittest.TestCase):
+    """PageText 테스트 (MuPDF 직접 추출 결과와 비교)"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.doc = fitz.open()
+        cls.page = _make_page(cls.doc)
+        cls.text = PageText.from_rawdict(cls.page.get_text("rawdict", flags=fitz.TEXTFLAGS_TEXT))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.doc.close()
+
+    def test_text_matches_get_text(self):
+        self.assertEqual(self.text.text, self.page.get_text())
+
+    def test_blocks_match_get_text_blocks(self):
+        expected = [b[4] for b in self.page.get_text("blocks") if b[6] == 0 and b[4].strip()]
+        self.assertEqual(self.text.blocks, expected)
+
+    def test_line_boxes_match_line_search(self):
+        self.assertEqual(len(self.text.line_boxes), len(self.text.blocks))
+        for block, boxes in zip(self.text.blocks, self.text.line_boxes):
+            lines = block.split('\n')[:-1]
+            self.assertEqual(len(boxes), len(lines))
+            for line, box in zip(lines, boxes):
+                with self.subTest(line=line):
+                    # 페이지에 한 번만 나오는 라인은 검색 결과 첫 사각형과 같음
+                    self.assertEqual(box, self.text.search(line.strip())[0])
+
+    def test_words_match_get_text_words(self):
+        self.assertEqual(self.text.words, [tuple(w) for w in self.page.get_text("words")])
+
+    def test_search_matches_search_for(self):
+        for query in ("year over year", "REVENUE", "50,000원", "목표", "fifteen percent", "e", "r"):
+            with self.subTest(query=query):
+                expected = [tuple(r) for r in self.page.search_for(query)]
+                self.assertEqual(self.text.search(query), expected)
+
+    def test_search_across_lines(self):
+        rects = self.text.search("fifteen   percent")
+        self.assertEqual(len(rects), 2)
+        self.assertLess(rects[0][1], rects[1][1])
+
+    def test_search_miss_and_empty(self):
+        self.assertEqual(self.text.search("xyz"), [])
+        self.assertEqual(self.text.search(""), [])
+        self.assertEqual(self.text.search("   "), [])
+
+    def test_count(self):
+        self.assertEqual(self.text.count("목표"), 2)
+        self.assertEqual(self.text.count("YEAR"), 2)
+        self.assertEqual(self.text.count(""), 0)
+
+    def test_pack_roundtrip(self):
+        search_text, geometry = self.text.pack()
+        restored = PageText.from_packed(search_text, geometry)
+        for query in ("year over year", "목표", "fifteen percent", "e"):
+            with self.subTest(query=query):
+                expected = self.text.search(query)
+                actual = restored.search(query)
+                self.assertEqual(len(actual), len(expected))
+                for a, b in zip(actual, expected):
+                    for x, y in zip(a, b):
+                        self.assertAlmostEqual(x, y, places=3)
+        self.assertEqual(restored.text, "")
+        self.assertEqual(restored.line_boxes, [])
+
+    def test_empty_page(self):
+        empty = PageText.from_rawdict({'blocks': []})
+        self.assertEqual(empty.text, "")
+        self.assertEqual(empty.blocks, [])
+        self.assertEqual(empty.search("a"), [])
+
+
+class TestTextCache(unittest.TestCase):
+    """TextCache 테스트"""
+
+    def setUp(self):
+        self.calls = []
+
+        def loader(page_num):
+            self.calls.append(page_num)
+            if page_num < 0:
+                return None
+            return PageText.from_rawdict({'blocks': []})
+
+        self.cache = TextCache(loader)
+
+    def test_loads_once(self):
+        first = self.cache.get(1)
+        self.assertIs(self.cache.get(1), first)
+        self.assertEqual(self.calls, [1])
+        self.assertIn(1, self.cache)
+        self.assertEqual(len(self.cache), 1)
+
+    def test_failed_load_not_cached(self):
+        self.assertIsNone(self.cache.get(-1))
+        self.assertIsNone(self.cache.get(-1))
+        self.assertEqual(self.calls, [-1, -1])
+        self.assertEqual(len(self.cache), 0)
+
+    def test_clear(self):
+        self.cache.get(0)
+        self.cache.clear()
+        self.assertNotIn(0, self.cache)
+        self.cache.get(0)
+        self.assertEqual(self.calls, [0, 0])
+
+    def test_clear_during_load_discards_result(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_loader(page_num):
+            started.set()
+            release.wait(timeout=5)
+            return PageText.from_rawdict({'blocks': []})
+
+        cache = TextCache(slow_loader)
+        thread = threading.Thread(target=cache.get, args=(0,))
+        thread.start()
+        self.assertTrue(started.wait(timeout=5))
+        cache.clear()  # 문서 교체
+        release.set()
+        thread.join(timeout=5)
+
+        self.assertNotIn(0, cache)
+
+
+if __name__ == '__main__':
+    unittest.main()